@@ -5,7 +5,7 @@ import copy
 import random
 import yaml
 from typing import Any, Dict, List, Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Depends, Security
+from fastapi import FastAPI, HTTPException, Request, Depends, Security
 from fastapi.security.api_key import APIKeyHeader
 from pydantic import BaseModel, Field
 
@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from core.brain import VirtualBrain
 from decision.decision_engine import DecisionEngine
+from memory.checkpoint_writer import CheckpointWriter
 from memory.memory_manager import MemoryManager
 from utils.logger import BrainLogger
 
@@ -42,6 +43,7 @@ logger = BrainLogger()
 # Global state
 brain: Optional[VirtualBrain] = None
 memory_manager: Optional[MemoryManager] = None
+checkpoint_writer: Optional[CheckpointWriter] = None
 
 # =====================================================
 # REQUEST SCHEMAS
@@ -147,6 +149,12 @@ class ToolRegistrationRequest(BaseModel):
 class SleepRequest(BaseModel):
     duration: Optional[int] = 5
 
+class TickManyRequest(BaseModel):
+    ticks: int = Field(default=10, ge=0, le=100000)
+
+class AdvanceIdleRequest(BaseModel):
+    ticks: int = Field(default=1000, ge=0)
+
 class ChemicalModulationRequest(BaseModel):
     chemical: str
     value: Optional[float] = None
@@ -166,7 +174,7 @@ class ResetRequest(BaseModel):
 # =====================================================
 
 def init_brain(deterministic: bool = False):
-    global brain, memory_manager
+    global brain, memory_manager, checkpoint_writer
 
     # Seed the global RNG before brain construction so deterministic servers
     # are reproducible across restarts (matches main.py / tests seed).
@@ -196,13 +204,29 @@ def init_brain(deterministic: bool = False):
     except Exception as e:
         logger.warning(f"Failed to load brain config: {e}. Using defaults.")
 
+    engine_config = {}
+    try:
+        with open("config/engine.yaml", "r") as f:
+            payload = yaml.safe_load(f) or {}
+            engine_config = payload.get("engine", payload)
+    except Exception as e:
+        logger.warning(f"Failed to load engine config: {e}. Using defaults.")
+
     # 2. Memory Paths
     data_dir = os.getenv("BRAIN_DATA_DIR", ".")
     os.makedirs(data_dir, exist_ok=True)
     memory_store_path = os.path.join(data_dir, "memory_store.json")
     memory_events_path = os.path.join(data_dir, "memory_events.json")
 
-    memory_manager = MemoryManager(storage_path=memory_store_path)
+    persistence = engine_config.get("persistence") or {}
+    memory_manager = MemoryManager(storage_path=memory_store_path, persistence=persistence)
+    # Autosaves go through one writer thread that coalesces them to the
+    # newest state instead of serializing the brain once per request.
+    checkpoint_writer = CheckpointWriter(
+        memory_manager.save,
+        min_interval=persistence.get("writer_min_interval", 0.5),
+        max_staleness=persistence.get("writer_max_staleness", 5.0),
+    )
     loaded_state = None
     if os.path.exists(memory_store_path):
         try:
@@ -225,6 +249,7 @@ def init_brain(deterministic: bool = False):
         decision_engine=decision_engine,
         deterministic=deterministic,
         brain_config=brain_config,
+        engine_config=engine_config,
         memory_storage_path=memory_events_path,
     )
 
@@ -369,15 +394,15 @@ def post_perceive_hearing(req: HearingSignalRequest):
     return {"status": "success", "message": "Ingested hearing signal"}
 
 @app.post("/tick")
-def post_tick(background_tasks: BackgroundTasks):
+def post_tick():
     if not brain:
         raise HTTPException(status_code=500, detail="Brain not initialized")
 
     decision = brain.tick()
     
     # Auto-save state in background to avoid blocking API response
-    if memory_manager:
-        background_tasks.add_task(memory_manager.save, brain.get_state())
+    if checkpoint_writer:
+        checkpoint_writer.submit(brain.get_state())
 
     return {
         "status": "success",
@@ -394,12 +419,72 @@ def post_tick(background_tasks: BackgroundTasks):
         "step_counter": brain.step_counter
     }
 
+@app.post("/tick_many")
+def post_tick_many(req: TickManyRequest):
+    if not brain:
+        raise HTTPException(status_code=500, detail="Brain not initialized")
+
+    summary = brain.tick_many(req.ticks)
+
+    # One autosave for the whole batch instead of one per tick
+    if checkpoint_writer:
+        checkpoint_writer.submit(brain.get_state())
+
+    return {
+        "status": "success",
+        "asleep": getattr(brain, "sleeping", False),
+        "summary": summary,
+        "step_counter": brain.step_counter
+    }
+
+@app.post("/advance_idle")
+def post_advance_idle(req: AdvanceIdleRequest):
+    if not brain:
+        raise HTTPException(status_code=500, detail="Brain not initialized")
+
+    summary = brain.advance_idle(req.ticks)
+
+    if checkpoint_writer:
+        checkpoint_writer.submit(brain.get_state())
+
+    return {
+        "status": "success",
+        "summary": summary,
+        "step_counter": brain.step_counter
+    }
+
 @app.get("/state")
 def get_state():
     if not brain:
         raise HTTPException(status_code=500, detail="Brain not initialized")
     return brain.get_state()
 
+@app.get("/metrics/stages")
+def get_stage_metrics():
+    if not brain:
+        raise HTTPException(status_code=500, detail="Brain not initialized")
+    instrumentation = brain.instrumentation
+    return {
+        "enabled": instrumentation.enabled,
+        "window": instrumentation.window,
+        "stages": instrumentation.snapshot(),
+    }
+
+@app.get("/metrics/checkpoints")
+def get_checkpoint_metrics():
+    if not checkpoint_writer:
+        raise HTTPException(status_code=500, detail="Brain not initialized")
+    return checkpoint_writer.stats()
+
+@app.on_event("shutdown")
+def flush_checkpoints():
+    # Write the newest pending state and the last batch of episodic
+    # memories before the process exits.
+    if checkpoint_writer:
+        checkpoint_writer.close()
+    if brain:
+        brain.memory_manager.flush_pending()
+
 @app.post("/regulate_speech")
 def post_regulate_speech(req: SpeechRegulationRequest):
     if not brain:
@@ -670,15 +755,16 @@ def post_reset(req: ResetRequest):
         
     if req.hard_reset:
         logger.info("Performing hard reset...")
-        data_dir = os.getenv("BRAIN_DATA_DIR", ".")
-        memory_store_path = os.path.join(data_dir, "memory_store.json")
-        memory_events_path = os.path.join(data_dir, "memory_events.json")
-        for file_path in [memory_store_path, memory_events_path]:
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    logger.warning(f"Could not delete {file_path}: {e}")
+        # Drop any pending autosave so it cannot recreate the deleted files.
+        if checkpoint_writer:
+            checkpoint_writer.close(flush=False)
+        # Each storage deletes everything it owns in its persistence mode:
+        # the checkpoint plus any WAL log or section files and segments.
+        for storage in (memory_manager.storage, brain.memory_manager.storage):
+            try:
+                storage.reset()
+            except OSError as e:
+                logger.warning(f"Could not delete {storage.file_path}: {e}")
         init_brain(deterministic=getattr(brain, "deterministic", False))
         return {"status": "success", "message": "Hard reset completed. Brain reinitialized fresh."}
     else:
@@ -0,0 +1,236 @@
+"""Appraisal cache benchmark: hit rate and error by quantization grid.
+
+Usage:
+    python benchmarks/appraisal_cache.py --ticks 300 --quanta 0 0.0001 0.1 1 5
+
+A deterministic brain is ticked ``--ticks`` times over a stream of
+perceptions while every ``predict_emotion``, ``update_emotional_learning``
+and ``record_event_profile`` call it makes is recorded. The trace is then
+replayed into an uncached ``AppraisalEngine`` and, for each grid size in
+``--quanta``, one with the prediction cache, auditing every hit:
+
+* ``brain`` profiles are the ``{"chemicals", "identity"}`` profiles the
+  brain records, which ``predict_emotion`` does not blend in, so every
+  grid must reproduce the uncached predictions exactly;
+* ``flat`` profiles hand the similarity matches back as flat chemical
+  dicts, which ``predict_emotion`` blends in.
+
+The brain learns from every perception right after appraising it, which
+invalidates that type's entries, so its hits come from repeated action
+appraisals. A ``drift`` workload therefore follows the trace with
+``--drift-steps`` steps of a random walk from the last perceived state
+(``--sigma`` chemical units per step), appraising every perception type
+at each step and learning from one every ``--update-every`` steps. There,
+coarse grids trade error for hits.
+
+The report gives the hit rate, the mean and largest absolute error of the
+cached predictions against the uncached ones, the error the cache's own
+audits measured, and the microseconds per prediction (best of three replays). The script exits
+with status 1 if an exact grid (0) or the brain trace shows any error, if
+the audits disagree with the measured error, or if a brain with the cache
+ends in a different state than one without.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+from learning.appraisal_engine import AppraisalEngine
+from learning.similarity_engine import SimilarityEngine
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome", "valence": 0.6, "intensity": 0.5},
+    {"modality": "hearing", "category": "praise", "content": "Good job trying", "valence": 0.8, "intensity": 0.6},
+    {"modality": "hearing", "category": "criticism", "content": "That was wrong", "valence": -0.7, "intensity": 0.7},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise", "valence": -0.8, "intensity": 0.8},
+    {"modality": "hearing", "category": "success", "content": "Task completed", "valence": 0.8, "intensity": 0.6},
+    {"modality": "hearing", "category": "ignored", "content": "No answer", "valence": -0.5, "intensity": 0.4},
+]
+
+
+class FlatSimilarityEngine(SimilarityEngine):
+    """Hands matches back as flat chemical dicts, which predict_emotion blends."""
+
+    def find_similar_profiles(self, event_type, current_state, top_k=5):
+        return [profile["chemicals"] for profile in super().find_similar_profiles(event_type, current_state, top_k)]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, name, appraisal):
+    random.seed(42)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    brain_config = load_yaml("brain.yaml")
+    brain_config["appraisal"] = appraisal
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, name, "brain.json"),
+        brain_config=brain_config,
+    )
+
+
+def run_brain(workdir, name, appraisal, ticks, seed, trace=None):
+    """Tick a brain over seeded perceptions; return its end state."""
+    brain = build_brain(workdir, name, appraisal)
+    if trace is not None:
+        record(brain, trace)
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(ticks):
+            if rng.random() < 0.7:
+                event = dict(rng.choice(EVENTS), source=rng.choice(["simulated", "ada"]))
+                event["valence"] = round(event["valence"] * rng.uniform(0.5, 1.0), 3)
+                brain.perceive(event)
+            brain.tick()
+        brain.memory_manager.flush_pending()
+    return {
+        "chemicals": {name: chem["value"] for name, chem in brain.chemicals.items()},
+        "identity": brain.identity.get_snapshot(),
+        "q_table": brain.decision_engine.q_table,
+        "step_counter": brain.step_counter,
+    }
+
+
+def record(brain, trace):
+    appraisal, similarity = brain.appraisal_engine, brain.similarity_engine
+    predict, learn, profile = (appraisal.predict_emotion, appraisal.update_emotional_learning,
+                               similarity.record_event_profile)
+
+    def predict_emotion(event_type, current_state=None):
+        trace.append(("predict", event_type, dict(current_state or {})))
+        return predict(event_type, current_state)
+
+    def update_emotional_learning(event_type, chemical_delta, outcome_value):
+        trace.append(("learn", event_type, dict(chemical_delta), outcome_value))
+        return learn(event_type, chemical_delta, outcome_value)
+
+    def record_event_profile(event_type, chemical_delta, identity_snapshot):
+        trace.append(("profile", event_type, dict(chemical_delta), dict(identity_snapshot)))
+        return profile(event_type, chemical_delta, identity_snapshot)
+
+    appraisal.predict_emotion = predict_emotion
+    appraisal.update_emotional_learning = update_emotional_learning
+    similarity.record_event_profile = record_event_profile
+
+
+def replay(trace, similarity_type, **cache):
+    """Replay ``trace``; return the predictions, seconds spent predicting
+    and the engine."""
+    engine = AppraisalEngine(similarity_engine=similarity_type(), **cache)
+    predictions = []
+    seconds = 0.0
+    for op in trace:
+        if op[0] == "predict":
+            start = time.perf_counter()
+            predictions.append(engine.predict_emotion(op[1], op[2]))
+            seconds += time.perf_counter() - start
+        elif op[0] == "learn":
+            engine.update_emotional_learning(*op[1:])
+        else:
+            engine.similarity_engine.record_event_profile(*op[1:])
+    return predictions, seconds, engine
+
+
+def best_seconds(ops, similarity_type, repeat=3, **cache):
+    return min(replay(ops, similarity_type, **cache)[1] for _ in range(repeat))
+
+
+def drift_ops(trace, steps, sigma, update_every, rng):
+    types = sorted({op[1] for op in trace if op[0] == "profile"})
+    learned = [op for op in trace if op[0] == "learn" and op[1] in types]
+    state = next(op[2] for op in reversed(trace) if op[0] == "predict" and op[1] in types)
+    ops = []
+    for step in range(steps):
+        state = {
+            key: value + rng.gauss(0, sigma / 100 if key.startswith("identity_") else sigma)
+            if isinstance(value, float) and not key.startswith("development_") else value
+            for key, value in state.items()
+        }
+        ops.extend(("predict", event_type, state) for event_type in types)
+        if update_every and step % update_every == update_every - 1:
+            ops.append(rng.choice(learned))
+    return ops
+
+
+def errors(predictions, reference):
+    return [max((abs(p.get(k, 0.0) - r[k]) for k in r), default=0.0) for p, r in zip(predictions, reference)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--quanta", type=float, nargs="+", default=[0.0, 0.0001, 0.1, 1.0, 5.0])
+    parser.add_argument("--drift-steps", type=int, default=400)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--update-every", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=4)
+    args = parser.parse_args()
+
+    trace = []
+    defaults = load_yaml("brain.yaml")["appraisal"]
+    with tempfile.TemporaryDirectory() as workdir:
+        cached_state = run_brain(workdir, "cached", defaults, args.ticks, args.seed, trace)
+        plain_state = run_brain(workdir, "plain", dict(defaults, cache_size=0), args.ticks, args.seed)
+    checks = {"brain state with and without cache": cached_state == plain_state,
+              "exact grid and brain profiles": True, "audits match measured error": True}
+
+    drift = trace + drift_ops(trace, args.drift_steps, args.sigma, args.update_every, random.Random(args.seed))
+    rows = []
+    for label, ops, similarity_type in (("brain", trace, SimilarityEngine), ("flat", trace, FlatSimilarityEngine),
+                                        ("drift", drift, FlatSimilarityEngine)):
+        reference, _, _ = replay(ops, similarity_type)
+        uncached_seconds = best_seconds(ops, similarity_type)
+        for quantum in args.quanta:
+            predictions, _, engine = replay(ops, similarity_type, cache_quantum=quantum,
+                                            cache_size=4096, cache_audit_every=1)
+            # timed without audits, which recompute every hit
+            seconds = best_seconds(ops, similarity_type, cache_quantum=quantum, cache_size=4096)
+            stats = engine.cache_stats()
+            measured = errors(predictions, reference)
+            mean_error = sum(measured) / len(measured)
+            if quantum == 0 or label != "drift":
+                checks["exact grid and brain profiles"] &= max(measured) == 0.0
+            # Misses are computed fresh, so the audited hits carry all the error.
+            hit_error = sum(measured) / stats["hits"] if stats["hits"] else 0.0
+            checks["audits match measured error"] &= (
+                abs(stats["mean_abs_error"] - hit_error) <= 1e-9 and stats["max_abs_error"] == max(measured)
+            )
+            rows.append((label, quantum, stats["hit_rate"], mean_error, max(measured), stats["mean_abs_error"],
+                         seconds / len(predictions), uncached_seconds / len(predictions)))
+
+    print(f"{len(trace)} recorded calls, {sum(op[0] == 'predict' for op in trace)} predictions")
+    print(f"{'workload':>9}{'quantum':>9}{'hit rate':>10}{'mean err':>11}{'max err':>10}{'audit err':>11}"
+          f"{'cached us':>11}{'uncached us':>13}")
+    for label, quantum, hit_rate, mean_error, max_error, audit_error, cached, uncached in rows:
+        print(f"{label:>9}{quantum:>9g}{hit_rate:>10.1%}{mean_error:>11.2e}{max_error:>10.2e}{audit_error:>11.2e}"
+              f"{cached * 1e6:>11.1f}{uncached * 1e6:>13.1f}")
+    print()
+    failed = False
+    for label, ok in checks.items():
+        print(f"{label:<40}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
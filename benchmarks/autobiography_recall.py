@@ -0,0 +1,157 @@
+"""Autobiography benchmark: per-call rescans vs the insert-time indexes.
+
+Usage:
+    python benchmarks/autobiography_recall.py --events 5000 --max-events 500 --seed 3
+
+A seeded stream of ``--events`` events (system ``cycle_step``/``tick``
+records, repeated perceptions, a few metadata categories, tied saliences)
+is recorded into an ``AutobiographicalMemory`` capped at ``--max-events``.
+After every event:
+
+* ``_select_recall_event`` is compared with the old method, which filters
+  and sorts the 120 most recent non-system events on every call;
+* ``replayable_events(60)`` is compared with the old
+  ``generate_spontaneous`` scan of the whole deque, and the state patterns
+  it reads from the log's columns with the ones it built per event (the
+  events carry partial snapshots, so defaults are exercised too);
+* now and then the events are reassigned, as a state restore does, and
+  ``events_by_category``/``events_by_kind`` are compared with a filter.
+
+The report gives the mean time per recall selection and per replay
+pattern matrix for both, the old ones scanning a deque of event dicts. The script exits with status 1 if any selection differs.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+
+from cognition.autobiographical_memory import AutobiographicalMemory
+from core.internal_thoughts import STATE_CHEMICALS, STATE_TRAITS, _get_state_vector
+
+DESCRIPTIONS = [
+    "cycle_step", "cycle_step", "cycle_step", "tick_marker", "internal_process_cleanup", "belief_update",
+    "perceived_hello", "perceived_praise", "perceived_criticism", "perceived_threat_detected",
+    "perceived_ignored", "worldview_success", "worldview_failure", "perceived_good job",
+]
+CATEGORIES = [None, "praise", "criticism", "failure", "threat_detected", "ignored", "loneliness", "success", "Greeted"]
+
+
+def legacy_select(memory, events, last):
+    if not events:
+        return None, last
+    candidates = [ev for ev in reversed(events) if not memory._is_system_event(ev.get("description", ""))]
+    if not candidates:
+        return events[-1], last
+    scored = sorted(candidates[:120], key=memory._event_salience, reverse=True)
+    selected = scored[0]
+    for ev in scored:
+        if ev.get("description", "") != last:
+            selected = ev
+            break
+    return selected, str(selected.get("description", ""))
+
+
+def legacy_replay(events):
+    candidates = [
+        ev for ev in events
+        if ev.get("description") != "cycle_step" and "cycle_step" not in str(ev.get("description", ""))
+    ]
+    return candidates[-60:]
+
+
+def legacy_patterns(events):
+    return np.array([
+        _get_state_vector(ev.get("chemicals", {}), ev.get("identity", {}))
+        for ev in legacy_replay(events)
+    ]) >= 0.5
+
+
+def indexed_patterns(memory):
+    recent = memory.replayable_seqs(60)
+    return np.hstack([
+        memory.events.snapshot_matrix(recent, "chemicals", STATE_CHEMICALS, 50.0) / 100.0,
+        memory.events.snapshot_matrix(recent, "identity", STATE_TRAITS, 0.5),
+    ]) >= 0.5
+
+
+def event_args(rng):
+    metadata = {}
+    if rng.random() < 0.8:
+        metadata = {
+            "valence": rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0, round(rng.uniform(-1, 1), 2)]),
+            "intensity": rng.choice([0.0, 0.5, 1.0, round(rng.random(), 2)]),
+            "category": rng.choice(CATEGORIES),
+        }
+    chemicals = {name: rng.random() * 100 for name in rng.sample(STATE_CHEMICALS, rng.randint(3, 5))}
+    identity = {name: rng.random() for name in rng.sample(STATE_TRAITS, rng.randint(2, 4))}
+    return rng.choice(DESCRIPTIONS), chemicals, identity, metadata
+
+
+def mean_seconds(fn, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--max-events", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    memory = AutobiographicalMemory(max_events=args.max_events)
+    last = ""
+    checks = {"recall selection": True, "replay window": True, "replay state patterns": True,
+              "category and kind indexes": True}
+    for step in range(args.events):
+        memory.record_event(*event_args(rng))
+        expected, last = legacy_select(memory, list(memory.events), last)
+        checks["recall selection"] &= memory._select_recall_event() == expected
+        plain = list(memory.events)
+        checks["replay window"] &= memory.replayable_events(60) == legacy_replay(plain)
+        if legacy_replay(plain):
+            checks["replay state patterns"] &= np.array_equal(indexed_patterns(memory), legacy_patterns(plain))
+        if rng.random() < 0.01:
+            events = list(memory.events)
+            memory.events = deque(events[rng.randrange(len(events)):], maxlen=memory.events.maxlen)
+            for category in CATEGORIES:
+                wanted = [ev for ev in memory.events
+                          if str((ev["metadata"] or {}).get("category", "") or "").lower() == str(category or "").lower()]
+                checks["category and kind indexes"] &= memory.events_by_category(category, 50) == wanted[-50:]
+            for kind in ("threat", "failure", "social_pain", "positive", "neutral"):
+                wanted = [ev for ev in memory.events if memory._classify_recall_event(ev) == kind]
+                checks["category and kind indexes"] &= memory.events_by_kind(kind, 50) == wanted[-50:]
+
+    # The old methods scanned a deque of event dicts.
+    plain = deque(memory.events)
+    legacy_recall = mean_seconds(lambda: legacy_select(memory, plain, ""))
+    indexed_recall = mean_seconds(memory._select_recall_event)
+    legacy_window = mean_seconds(lambda: legacy_patterns(plain))
+    indexed_window = mean_seconds(lambda: indexed_patterns(memory))
+
+    print(f"{'operation':>16}{'legacy us':>11}{'indexed us':>12}{'speedup':>9}")
+    for label, legacy, indexed in (("recall select", legacy_recall, indexed_recall),
+                                   ("replay patterns", legacy_window, indexed_window)):
+        print(f"{label:>16}{legacy * 1e6:>11.1f}{indexed * 1e6:>12.1f}{legacy / indexed:>8.1f}x")
+    print()
+    failed = False
+    for label, ok in checks.items():
+        print(f"{label:<40}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Autobiography storage benchmark: a deque of event dicts vs the columnar log.
+
+Usage:
+    python benchmarks/autobiography_storage.py --sizes 500 5000
+
+For each retention window in ``--sizes`` the same brain-shaped events (nine
+chemicals, four identity traits, half of them with perception metadata)
+are kept:
+
+* ``dicts``: the old ``deque(maxlen=...)`` of event dicts, each with its
+  own chemicals and identity dict;
+* ``columns``: ``AutobiographicalMemory`` with its ``EventLog`` and
+  indexes.
+
+The report gives the resident memory of each (``tracemalloc``), the
+microseconds per ``record_event`` and per event read, and the bytes the
+events take in a JSON and in a binary checkpoint, which keep the old
+layout and are the same for both. The script exits with status 1 unless
+every event reads back equal to the dict it was recorded from.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cognition.autobiographical_memory import AutobiographicalMemory
+from memory import binary_checkpoint
+
+CHEMICALS = ["dopamine", "cortisol", "oxytocin", "serotonin", "norepinephrine",
+             "adrenaline", "acetylcholine", "melatonin", "endorphins"]
+TRAITS = ["competence", "social_value", "resilience", "intelligence"]
+PERCEPTIONS = [("hearing", "praise", "Well done today"), ("hearing", "criticism", "You should not have"),
+               ("vision", "environment_scan", "Objects scanned"), ("hearing", "ignored", "Silence again")]
+
+
+def event_args(rng, count):
+    args = []
+    for i in range(count):
+        chemicals = {name: rng.uniform(0, 100) for name in CHEMICALS}
+        identity = {name: round(rng.uniform(0, 2), 4) for name in TRAITS}
+        if i % 2:
+            modality, category, content = rng.choice(PERCEPTIONS)
+            metadata = {"modality": modality, "category": category, "content": content,
+                        "valence": round(rng.uniform(-1, 1), 2), "intensity": round(rng.random(), 2),
+                        "source": "simulated"}
+            args.append((f"perceived_{modality}_{category}: {content}", chemicals, identity, metadata))
+        else:
+            args.append(("cycle_step", chemicals, identity, None))
+    return args
+
+
+def legacy_record(events, description, chemicals, identity_snapshot, metadata=None):
+    events.append({
+        "timestamp": time.time(),
+        "description": description,
+        "chemicals": chemicals.copy(),
+        "identity": identity_snapshot.copy(),
+        "metadata": metadata or {},
+    })
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(build):
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    exact = True
+    for size in args.sizes:
+        # Record twice the window so both stores have evicted. The snapshots
+        # are built inside the traced region, as the brain builds them per
+        # call, so only what a store keeps is counted.
+        count = 2 * size
+
+        def build_dicts():
+            events = deque(maxlen=size)
+            for event in event_args(random.Random(args.seed), count):
+                legacy_record(events, *event)
+            return events
+
+        def build_columns():
+            memory = AutobiographicalMemory(max_events=size)
+            for event in event_args(random.Random(args.seed), count):
+                memory.record_event(*event)
+            return memory
+
+        dicts, dict_bytes = traced(build_dicts)
+        memory, column_bytes = traced(build_columns)
+        dict_seconds = timed(build_dicts)
+        column_seconds = timed(build_columns)
+        start = time.perf_counter()
+        events = list(memory.events)
+        read_seconds = time.perf_counter() - start
+        exact &= len(events) == len(dicts) and all(
+            {**a, "timestamp": 0.0} == {**b, "timestamp": 0.0} for a, b in zip(events, dicts)
+        )
+        json_bytes = len(json.dumps(events, separators=(",", ":")))
+        binary_bytes = len(binary_checkpoint.dumps(events))
+        rows.append((size, dict_bytes, column_bytes, dict_seconds / count, column_seconds / count,
+                     read_seconds / len(events), json_bytes, binary_bytes))
+
+    print(f"{'window':>7}{'dicts KiB':>11}{'columns KiB':>13}{'ratio':>7}{'record us':>11}{'columnar':>10}"
+          f"{'read us':>9}{'json KiB':>10}{'binary KiB':>12}")
+    for size, dict_bytes, column_bytes, dict_record, column_record, read, json_bytes, binary_bytes in rows:
+        print(
+            f"{size:>7}{dict_bytes / 1024:>11.0f}{column_bytes / 1024:>13.0f}{dict_bytes / column_bytes:>6.1f}x"
+            f"{dict_record * 1e6:>11.1f}{column_record * 1e6:>10.1f}{read * 1e6:>9.1f}"
+            f"{json_bytes / 1024:>10.0f}{binary_bytes / 1024:>12.0f}"
+        )
+    print()
+    print(f"{'events read back as recorded':<40}{'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Checkpoint format benchmark: indented JSON vs the binary format, by brain age.
+
+Usage:
+    python benchmarks/checkpoint_format.py --ages 100 500 1000 --repeats 5
+
+A deterministic brain perceives one event and ticks once per step. At each
+age in ``--ages`` its state is saved through ``MemoryStorage`` in both
+formats. The report gives the file size, save time (serialize and write) and
+load time (read and parse, the server's startup path) as the best of
+``--repeats`` runs.
+
+The script exits with status 1 unless, at every age:
+
+* the binary checkpoint loads to the same state as the JSON one;
+* a storage configured for ``binary`` still reads the JSON checkpoint;
+* ``memory.convert_checkpoint`` turns the JSON checkpoint, plus a pending
+  write-ahead log, into a binary one holding the same state.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+from memory.convert_checkpoint import convert
+from memory.storage import MemoryStorage
+from memory.wal import WalStorage
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome back", "valence": 0.6, "intensity": 0.5, "source": "user"},
+    {"modality": "hearing", "category": "praise", "content": "Good job on the garden plan", "valence": 0.8, "intensity": 0.6, "source": "user"},
+    {"modality": "hearing", "category": "criticism", "content": "That answer about trains was wrong", "valence": -0.7, "intensity": 0.7, "source": "user"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise in the hallway", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed on time", "valence": 0.8, "intensity": 0.6, "source": "user"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(path, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=path,
+    )
+
+
+def step(brain, i):
+    event = dict(EVENTS[i % len(EVENTS)])
+    event["content"] = f"{event['content']} #{i % 97}"
+    brain.perceive(event)
+    brain.tick()
+
+
+def best(fn, repeats):
+    seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        seconds = min(seconds, time.perf_counter() - start)
+    return seconds
+
+
+def measure(path, fmt, state, repeats):
+    storage = MemoryStorage(path, format=fmt)
+    storage.memories = state
+    save_seconds = best(storage.save, repeats)
+    load_seconds = best(lambda: MemoryStorage(path, format=fmt), repeats)
+    return os.path.getsize(path), save_seconds, load_seconds
+
+
+def checks(workdir, json_path, binary_path, state, previous):
+    expected = json.loads(json.dumps(state))
+    results = [
+        ("binary loads the same state", MemoryStorage(binary_path, format="binary").get_all() == expected),
+        ("binary storage reads JSON", MemoryStorage(json_path, format="binary").get_all() == expected),
+    ]
+
+    # A WAL checkpoint whose snapshot is one save behind and whose log holds
+    # the latest save, converted in place.
+    target = os.path.join(workdir, "convert", "store.json")
+    wal = WalStorage(target)
+    wal.update_all(previous)
+    wal.save()
+    wal.update_all(state)
+    convert(target, to="binary")
+    with open(target, "rb") as f:
+        is_binary = f.read(4) == b"VBCK"
+    converted = MemoryStorage(target).get_all()
+    results.append(("convert JSON + log to binary", is_binary and converted == expected and not os.path.exists(f"{target}.wal")))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ages", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, "json", "store.json")
+        binary_path = os.path.join(workdir, "binary", "store.ckpt")
+        with contextlib.redirect_stdout(io.StringIO()):
+            brain = build_brain(os.path.join(workdir, "brain", "events.json"))
+        age = 0
+        for target in sorted(args.ages):
+            with contextlib.redirect_stdout(io.StringIO()):
+                while age < target:
+                    step(brain, age)
+                    age += 1
+                previous = json.loads(json.dumps(brain.get_state()))
+                step(brain, age)
+                age += 1
+                state = brain.get_state()
+            json_row = measure(json_path, "json", state, args.repeats)
+            binary_row = measure(binary_path, "binary", state, args.repeats)
+            results = checks(os.path.join(workdir, f"age{target}"), json_path, binary_path, state, previous)
+            failed |= not all(ok for _, ok in results)
+            rows.append((target, json_row, binary_row, results))
+
+    print(f"{'age':>6}{'json KiB':>10}{'save ms':>9}{'load ms':>9}{'binary KiB':>12}{'save ms':>9}{'load ms':>9}{'size':>7}{'save':>7}{'load':>7}")
+    for target, (j_size, j_save, j_load), (b_size, b_save, b_load), _ in rows:
+        print(
+            f"{target:>6}{j_size / 1024:>10.1f}{j_save * 1e3:>9.2f}{j_load * 1e3:>9.2f}"
+            f"{b_size / 1024:>12.1f}{b_save * 1e3:>9.2f}{b_load * 1e3:>9.2f}"
+            f"{j_size / b_size:>6.1f}x{j_save / b_save:>6.1f}x{j_load / b_load:>6.1f}x"
+        )
+    print()
+    for target, _, _, results in rows:
+        for label, ok in results:
+            print(f"age {target:>5}: {label:<32}{'ok' if ok else 'FAILED'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
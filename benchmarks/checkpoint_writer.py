@@ -0,0 +1,129 @@
+"""Autosave benchmark: a save per tick vs the coalescing checkpoint writer.
+
+Usage:
+    python benchmarks/checkpoint_writer.py --warmup 300 --ticks 200 --min-interval 0.5 --max-staleness 5
+
+A deterministic brain is aged ``--warmup`` ticks, then runs ``--ticks`` more
+ticks twice from the same starting point, autosaving after each one:
+
+* ``inline``: ``MemoryManager.save(brain.get_state())`` on the tick path,
+  as live mode used to;
+* ``writer``: ``CheckpointWriter.submit(brain.get_state())``, with the save
+  done on the writer thread and coalesced to the newest state.
+
+The report gives ticks per second, checkpoints written and saves skipped.
+After ``close()`` the writer's checkpoint must equal the last submitted state,
+otherwise the script exits with status 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+from memory.checkpoint_writer import CheckpointWriter
+from memory.memory_manager import MemoryManager
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome back", "valence": 0.6, "intensity": 0.5, "source": "user"},
+    {"modality": "hearing", "category": "praise", "content": "Good job on the garden plan", "valence": 0.8, "intensity": 0.6, "source": "user"},
+    {"modality": "hearing", "category": "criticism", "content": "That answer about trains was wrong", "valence": -0.7, "intensity": 0.7, "source": "user"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise in the hallway", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed on time", "valence": 0.8, "intensity": 0.6, "source": "user"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(path, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=path,
+    )
+
+
+def step(brain, i):
+    event = dict(EVENTS[i % len(EVENTS)])
+    event["content"] = f"{event['content']} #{i % 97}"
+    brain.perceive(event)
+    brain.tick()
+
+
+def aged_brain(workdir, name, warmup):
+    brain = build_brain(os.path.join(workdir, name, "events.json"))
+    for i in range(warmup):
+        step(brain, i)
+    return brain
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--warmup", type=int, default=300)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--min-interval", type=float, default=0.5)
+    parser.add_argument("--max-staleness", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            brain = aged_brain(workdir, "inline", args.warmup)
+            manager = MemoryManager(storage_path=os.path.join(workdir, "inline", "store.json"))
+            start = time.perf_counter()
+            for i in range(args.warmup, args.warmup + args.ticks):
+                step(brain, i)
+                manager.save(brain.get_state())
+            inline_seconds = time.perf_counter() - start
+
+            brain = aged_brain(workdir, "writer", args.warmup)
+            path = os.path.join(workdir, "writer", "store.json")
+            manager = MemoryManager(storage_path=path)
+            writer = CheckpointWriter(manager.save, min_interval=args.min_interval, max_staleness=args.max_staleness)
+            start = time.perf_counter()
+            for i in range(args.warmup, args.warmup + args.ticks):
+                step(brain, i)
+                last = brain.get_state()
+                writer.submit(last)
+            writer_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            writer.close()
+            close_seconds = time.perf_counter() - start
+            expected = json.loads(json.dumps(last))
+
+        with open(path) as f:
+            recovered = json.load(f)
+    stats = writer.stats()
+
+    print(f"{'mode':>8}{'ticks/s':>10}{'written':>9}{'skipped':>9}")
+    print(f"{'inline':>8}{args.ticks / inline_seconds:>10.1f}{args.ticks:>9}{0:>9}")
+    print(f"{'writer':>8}{args.ticks / writer_seconds:>10.1f}{stats['written']:>9}{stats['skipped']:>9}")
+    print()
+    print(f"writer: slowest save {stats['max_write_seconds'] * 1e3:.1f} ms, close() flushed in {close_seconds * 1e3:.1f} ms")
+    ok = recovered == expected
+    print(f"final checkpoint matches last submitted state: {'ok' if ok else 'FAILED'}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
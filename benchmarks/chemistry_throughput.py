@@ -0,0 +1,156 @@
+"""Ticks-per-second benchmark: per-dict BrainEngine vs VectorBrainEngine.
+
+Usage:
+    python benchmarks/chemistry_throughput.py --ticks 20000 --brain-ticks 300
+
+The first table times the live nine-chemical brain (chemistry stage alone,
+then full ``VirtualBrain.tick()``); the second times standalone engines over
+synthetic registries of growing size, where the per-chemical Python loop
+and the fixed NumPy dispatch cost trade places.
+
+Before timing, both engines are run side by side from identical state in
+deterministic mode and the resulting chemistry is compared, so a speedup is
+only reported for a vector path that still matches the reference.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from chemicals.registry import ChemicalRegistry
+from core.brain import VirtualBrain
+from core.engine import BrainEngine
+from core.interactions import Interactions
+from core.vector_engine import VectorBrainEngine
+from decision.decision_engine import DecisionEngine
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, engine, deterministic=True, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=deterministic),
+        deterministic=deterministic,
+        memory_storage_path=os.path.join(workdir, f"{engine}.json"),
+        brain_config={"chemistry": {"engine": engine}},
+    )
+
+
+def chemistry(brain):
+    return {name: (chem.value, chem.sensitivity) for name, chem in brain.chemicals.items()}
+
+
+def max_difference(left, right):
+    return max(
+        max(abs(left[name][0] - right[name][0]), abs(left[name][1] - right[name][1]))
+        for name in left
+    )
+
+
+def check_equivalence(workdir, ticks, tolerance):
+    reference = build_brain(workdir, "dict")
+    vector = build_brain(workdir, "vector")
+    # Push chemistry away from baseline so clamps and receptor paths engage.
+    for brain in (reference, vector):
+        brain.chemicals["cortisol"]["value"] = 95.0
+        brain.chemicals["dopamine"]["value"] = 3.0
+        brain.chemicals["adrenaline"]["value"] = 70.0
+        brain._step_perception_valences = [-0.4]
+
+    worst = 0.0
+    for _ in range(ticks):
+        for brain in (reference, vector):
+            brain._apply_chemistry()
+            brain._engine.update_receptor_dynamics()
+        worst = max(worst, max_difference(chemistry(reference), chemistry(vector)))
+    if worst > tolerance:
+        raise SystemExit(f"vector engine diverged from reference: max |diff| = {worst:.3e}")
+    return worst
+
+
+def time_engine(brain, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        brain._apply_chemistry()
+        brain._engine.update_receptor_dynamics()
+    return ticks / (time.perf_counter() - start)
+
+
+def time_brain(brain, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        brain.tick()
+    return ticks / (time.perf_counter() - start)
+
+
+def synthetic_engine(engine_cls, size, seed=7):
+    """Standalone engine over ``size`` synthetic chemicals with a dense-ish interaction table."""
+    rng = random.Random(seed)
+    configs = {
+        f"chem_{i}": {"min": 0, "max": 100, "baseline": rng.uniform(10, 70), "decay": rng.uniform(0.01, 0.2), "noise": 0.3}
+        for i in range(size)
+    }
+    names = list(configs)
+    matrix = {
+        source: {target: rng.uniform(-0.001, 0.001) for target in rng.sample(names, min(size, 6))}
+        for source in names
+    }
+    return engine_cls(state=ChemicalRegistry(configs), interactions=Interactions(matrix))
+
+
+def time_standalone(engine, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.tick()
+    return ticks / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chemistry engine throughput benchmark")
+    parser.add_argument("--ticks", type=int, default=20000, help="Chemistry-only ticks per engine")
+    parser.add_argument("--brain-ticks", type=int, default=300, help="Full VirtualBrain.tick() calls per engine")
+    parser.add_argument("--tolerance", type=float, default=1e-9, help="Max allowed |dict - vector| difference")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[9, 32, 128], help="Synthetic registry sizes for the scaling table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        worst = check_equivalence(workdir, 500, args.tolerance)
+        print(f"equivalence: 500 deterministic ticks, max |dict - vector| = {worst:.3e}")
+
+        print(f"{'engine':<8} {'chem ticks/s':>14} {'brain ticks/s':>14}")
+        results = {}
+        for engine in ("dict", "vector"):
+            brain = build_brain(workdir, engine, deterministic=False)
+            chem_rate = time_engine(brain, args.ticks)
+            brain_rate = time_brain(brain, args.brain_ticks)
+            results[engine] = chem_rate
+            print(f"{engine:<8} {chem_rate:>14.0f} {brain_rate:>14.1f}")
+        print(f"chemistry speedup: {results['vector'] / results['dict']:.2f}x")
+
+    print()
+    print(f"{'chemicals':>9} {'dict ticks/s':>14} {'vector ticks/s':>15} {'speedup':>8}")
+    for size in args.sizes:
+        ticks = max(200, args.ticks * 9 // max(size, 9))
+        dict_rate = time_standalone(synthetic_engine(BrainEngine, size), ticks)
+        vector_rate = time_standalone(synthetic_engine(VectorBrainEngine, size), ticks)
+        print(f"{size:>9} {dict_rate:>14.0f} {vector_rate:>15.0f} {vector_rate / dict_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Concept memory soak benchmark: unbounded vs bounded growth.
+
+Usage:
+    python benchmarks/concept_soak.py --steps 20000 --every 2000 --capacity 5000
+
+Simulates a long-lived brain that keeps meeting new vocabulary. Each step
+learns one perception made of a few recurring words (a fixed 300-word
+vocabulary, Zipf-like) plus one word never seen before. It goes through
+the same ``_learn_from_perception`` path ``perceive()`` uses, and
+``step_counter`` advances as if one tick ran per perception. Every
+``--every`` steps the report samples:
+
+* the number of concepts held;
+* the approximate in-memory size of the concept store;
+* the size of the ``concept_memory`` section in ``get_state()`` as JSON;
+* the time to write a full checkpoint (``memory_manager.save``).
+
+The run is repeated with ``concept_capacity: 0`` (the old unbounded dict
+behaviour) and with ``--capacity``. The bounded curve should flatten once it
+reaches capacity, while the unbounded one keeps growing linearly.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, name, capacity, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, f"{name}.json"),
+        brain_config={"development": {"concept_capacity": capacity}},
+    )
+
+
+def word(rng, length=7):
+    return "".join(rng.choice(LETTERS) for _ in range(length))
+
+
+def deep_size(value, seen=None):
+    seen = seen if seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif hasattr(value, "__slots__"):
+        size += sum(deep_size(getattr(value, slot), seen) for slot in value.__slots__ if hasattr(value, slot))
+    elif hasattr(value, "__dict__"):
+        size += deep_size(vars(value), seen)
+    return size
+
+
+def soak(brain, steps, every):
+    rng = random.Random(7)
+    vocabulary = [word(rng) for _ in range(300)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    samples = []
+    for step in range(1, steps + 1):
+        common = rng.choices(vocabulary, weights=weights, k=3)
+        content = " ".join(common + [word(rng, 9)])
+        brain._learn_from_perception("hearing", content, "user", scene={}, category="conversation")
+        brain.step_counter += 1
+        if step % every == 0:
+            section = brain.get_state()["concept_memory"]
+            start = time.perf_counter()
+            brain.memory_manager.save(brain.get_state())
+            save_seconds = time.perf_counter() - start
+            samples.append((
+                step,
+                len(brain.concept_memory),
+                deep_size(brain.concept_memory),
+                len(json.dumps(section)),
+                save_seconds,
+            ))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--every", type=int, default=2000)
+    parser.add_argument("--capacity", type=int, default=5000)
+    args = parser.parse_args()
+
+    runs = {}
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        for label, capacity in (("unbounded", 0), (f"capacity {args.capacity}", args.capacity)):
+            brain = build_brain(workdir, label.replace(" ", "_"), capacity)
+            runs[label] = (soak(brain, args.steps, args.every), brain.concept_memory.evicted)
+
+    for label, (samples, evicted) in runs.items():
+        print(f"{label} ({evicted} evicted)")
+        print(f"{'step':>8}{'concepts':>10}{'store KiB':>12}{'section KiB':>13}{'save ms':>10}")
+        for step, concepts, store_bytes, section_bytes, save_seconds in samples:
+            print(f"{step:>8}{concepts:>10}{store_bytes / 1024:>12.0f}{section_bytes / 1024:>13.0f}{save_seconds * 1e3:>10.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Embedding benchmark: per-token/per-keyword loops vs the vectorized hasher.
+
+Usage:
+    python benchmarks/embedding.py --texts 5000 --repeat-share 0.5
+
+A corpus of ``--texts`` synthetic memory and query texts (keyword heavy,
+with punctuation around ``c++``, ``c#``, ``node.js`` ...) is embedded by:
+
+* ``legacy``: the original ``HashedEmbeddingFunction._embed`` (md5 per
+  token, one regex per keyword);
+* ``no cache``: ``HashedEmbeddingFunction(cache_size=0)`` (memoized token
+  buckets, NumPy accumulation, one combined keyword scan);
+* ``cached``: the default function, where ``--repeat-share`` of the texts
+  are repeats (recurring queries, re-stored records) served from the LRU.
+
+The report gives texts per second. Every vector from both
+``memory/vector_store.py`` and ``chatbot/local_vector_store.py`` must be
+bit-identical to the legacy one, otherwise the script exits with status 1.
+"""
+import argparse
+import hashlib
+import os
+import random
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+
+from chatbot import local_vector_store
+from memory import vector_store
+from memory.vector_store import ALL_KEYWORDS, EMBEDDING_DIM, STOPWORDS, _lang_pattern
+
+FILLER = (
+    "hello welcome back garden plan trains wrong noise hallway task completed time memory brain praise "
+    "the a of and with about friend music rain morning coffee project deadline Build an app for me"
+).split()
+PUNCTUATION = [" ", " ", " ", ", ", ". ", "-", "/", "(", ") ", "\n"]
+
+
+def legacy_embed(text, dim=EMBEDDING_DIM):
+    vec = np.zeros(dim, dtype=np.float32)
+    lowered = (text or "").lower()
+    for word in re.findall(r"[a-zA-Z0-9+#.]+", lowered):
+        if word in STOPWORDS:
+            continue
+        vec[int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16) % dim] += 1.0
+    for kw in ALL_KEYWORDS:
+        if re.search(_lang_pattern(kw), lowered):
+            vec[int(hashlib.md5(kw.encode("utf-8")).hexdigest(), 16) % dim] += 2.0
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec = vec / norm
+    return vec
+
+
+def corpus(count, repeat_share, seed=5):
+    rng = random.Random(seed)
+    words = FILLER + sorted(ALL_KEYWORDS) + ["C++", "C#", "Node.js", "ReactJS", "scikit-learn", "R&D", "GO,"]
+    texts = []
+    for _ in range(count):
+        if texts and rng.random() < repeat_share:
+            texts.append(rng.choice(texts))
+        else:
+            texts.append("".join(rng.choice(words) + rng.choice(PUNCTUATION) for _ in range(rng.randint(3, 30))))
+    return texts
+
+
+def rate(fn, texts):
+    start = time.perf_counter()
+    result = fn(texts)
+    return len(texts) / (time.perf_counter() - start), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--repeat-share", type=float, default=0.5)
+    args = parser.parse_args()
+
+    texts = corpus(args.texts, args.repeat_share)
+    legacy_rate, expected = rate(lambda batch: np.array([legacy_embed(text) for text in batch]), texts)
+    rows = [("legacy", legacy_rate, True)]
+    for module in (vector_store, local_vector_store):
+        label = module.__name__.split(".")[0]
+        uncached_rate, uncached = rate(module.HashedEmbeddingFunction(cache_size=0).embed_many, texts)
+        function = module.HashedEmbeddingFunction()
+        cached_rate, cached = rate(function.embed_many, texts)
+        rows.append((f"{label} no cache", uncached_rate, np.array_equal(uncached, expected)))
+        rows.append((f"{label} cached", cached_rate, np.array_equal(cached, expected)))
+
+    print(f"{'mode':>18}{'texts/s':>11}{'speedup':>9}{'vectors':>10}")
+    failed = False
+    for label, texts_per_second, exact in rows:
+        print(f"{label:>18}{texts_per_second:>11.0f}{texts_per_second / legacy_rate:>8.1f}x{'exact' if exact else 'DIFF':>10}")
+        failed |= not exact
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Hopfield benchmark: nested-list loops vs the array-backed network.
+
+Usage:
+    python benchmarks/hopfield.py --sizes 9 64 256 --patterns 200 --probes 64
+
+For each pattern dimension in ``--sizes`` the report times:
+
+* Hebbian learning of ``--patterns`` random bipolar patterns, once with the
+  old nested-list double loop and once with ``HopfieldNetwork.learn``;
+* recall of ``--probes`` noisy probes over 5 iterations, looped one probe at
+  a time in pure Python and as one batched ``HopfieldNetwork.recall`` call.
+
+The learned weights must match the list implementation exactly and the recalled
+patterns must agree, otherwise the script exits with status 1.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+
+from core.hopfield import HopfieldNetwork
+
+ITERATIONS = 5
+
+
+def list_learn(weights, pattern, rate):
+    n = len(pattern)
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                weights[i][j] += float(pattern[i] * pattern[j]) * rate
+
+
+def list_recall(weights, probe):
+    n = len(probe)
+    x = list(probe)
+    for _ in range(ITERATIONS):
+        x = [1 if sum(weights[i][j] * x[j] for j in range(n)) >= 0.0 else -1 for i in range(n)]
+    return x
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 64, 256])
+    parser.add_argument("--patterns", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=64)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rows = []
+    mismatch = False
+    for size in args.sizes:
+        patterns = [[rng.choice((-1, 1)) for _ in range(size)] for _ in range(args.patterns)]
+        rates = [0.3 + 1.2 * rng.random() for _ in range(args.patterns)]
+        probes = [
+            [-v if rng.random() < 0.1 else v for v in patterns[rng.randrange(args.patterns)]]
+            for _ in range(args.probes)
+        ]
+
+        weights = [[0.0] * size for _ in range(size)]
+        start = time.perf_counter()
+        for pattern, rate in zip(patterns, rates):
+            list_learn(weights, pattern, rate)
+        list_learn_seconds = time.perf_counter() - start
+
+        network = HopfieldNetwork(size)
+        start = time.perf_counter()
+        for pattern, rate in zip(patterns, rates):
+            network.learn(pattern, rate)
+        array_learn_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        looped = [list_recall(weights, probe) for probe in probes]
+        list_recall_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = network.recall(probes, iterations=ITERATIONS)
+        array_recall_seconds = time.perf_counter() - start
+
+        exact = network.to_list() == weights
+        agree = int(np.count_nonzero(np.all(batched == np.array(looped), axis=1)))
+        mismatch |= not exact or agree != len(probes)
+        rows.append((size, list_learn_seconds, array_learn_seconds, list_recall_seconds, array_recall_seconds, exact, agree))
+
+    print(f"{'size':>6}{'learn list ms':>15}{'learn array ms':>16}{'recall loop ms':>16}{'recall batch ms':>17}{'weights':>9}{'agree':>8}")
+    for size, ll, al, lr, ar, exact, agree in rows:
+        print(
+            f"{size:>6}{ll * 1e3:>15.2f}{al * 1e3:>16.2f}{lr * 1e3:>16.2f}{ar * 1e3:>17.2f}"
+            f"{'exact' if exact else 'DIFF':>9}{agree:>5}/{args.probes}"
+        )
+    if mismatch:
+        print("array-backed network diverged from the list implementation")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
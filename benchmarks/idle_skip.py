@@ -0,0 +1,121 @@
+"""Idle catch-up benchmark: closed-form ``advance_idle(n)`` vs stepping.
+
+Usage:
+    python benchmarks/idle_skip.py --ticks 100 1000 10000 100000
+
+A deterministic brain is warmed up on a fixed event stream and its chemistry
+is pushed away from baseline (high cortisol, low dopamine and oxytocin), so
+the idle stretch starts in the clamped homeostasis regime. For each
+``--ticks`` value the report compares:
+
+* stepping the chemistry engine ``n`` times (the per-tick chemistry work a
+  quiet ``tick()`` does), and
+* ``IdleChemistry.advance`` (what ``advance_idle`` uses),
+
+reporting both timings and the largest absolute difference between the two
+end states. Jump and exact-step counts show how the closed form split the
+stretch. A final row times the whole ``brain.advance_idle(n)`` call.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+import yaml
+
+from core.brain import VirtualBrain
+from core.idle import IdleChemistry
+from core.interactions import Interactions
+from core.vector_engine import VectorBrainEngine
+from decision.decision_engine import DecisionEngine
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome", "valence": 0.6, "intensity": 0.5, "source": "simulated"},
+    {"modality": "hearing", "category": "criticism", "content": "That was wrong", "valence": -0.7, "intensity": 0.7, "source": "simulated"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise detected", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, "idle.json"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--warmup", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        brain = build_brain(workdir)
+        for i in range(args.warmup):
+            brain.perceive(EVENTS[i % len(EVENTS)])
+            brain.tick()
+        brain._step_perception_valences = []
+        engine = VectorBrainEngine(
+            state=brain.chemicals,
+            interactions=Interactions(brain.interaction_matrix),
+            deterministic=True,
+            brain=brain,
+        )
+        start_values = engine.values()
+        for name, value in (("cortisol", 90.0), ("dopamine", 10.0), ("oxytocin", 20.0)):
+            if name in engine.index:
+                start_values[engine.index[name]] = value
+
+        rows = []
+        for ticks in args.ticks:
+            chemistry = IdleChemistry(engine, deterministic=True)
+            begin = time.perf_counter()
+            stepped = start_values.copy()
+            for _ in range(ticks):
+                stepped = chemistry.step(stepped)
+            step_seconds = time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            closed = chemistry.advance(start_values, ticks)
+            closed_seconds = time.perf_counter() - begin
+            rows.append((ticks, step_seconds, closed_seconds, float(np.max(np.abs(closed - stepped))), chemistry))
+
+        begin = time.perf_counter()
+        summary = brain.advance_idle(max(args.ticks))
+        brain_seconds = time.perf_counter() - begin
+
+    print(f"{'ticks':>8}{'stepped ms':>13}{'closed ms':>12}{'speedup':>10}{'max |diff|':>13}{'jumps':>7}{'exact':>7}")
+    for ticks, step_seconds, closed_seconds, diff, chemistry in rows:
+        print(
+            f"{ticks:>8}{step_seconds * 1e3:>13.2f}{closed_seconds * 1e3:>12.2f}"
+            f"{step_seconds / closed_seconds:>9.1f}x{diff:>13.2e}{chemistry.jumps:>7}{chemistry.exact_steps:>7}"
+        )
+    print()
+    print(
+        f"brain.advance_idle({max(args.ticks)}): {brain_seconds * 1e3:.2f}ms, "
+        f"{summary['slow_wave_ticks']} slow-wave ticks of Q pruning"
+    )
+
+
+if __name__ == "__main__":
+    main()
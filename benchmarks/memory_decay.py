@@ -0,0 +1,183 @@
+"""Memory decay benchmark: per-record decay passes vs read-time decay.
+
+Usage:
+    python benchmarks/memory_decay.py --sizes 200 1000 2000
+
+For each store size in ``--sizes`` two identical episodic stores and two
+identical user-fact stores are filled, with ages spread over 60 days, and
+one decay pass is timed on each pair:
+
+* ``legacy``: the old ``MemoryManager.decay_memories`` and
+  ``UserMemory.decay``, which read every record and write each one back
+  with its own update call (re-embedding user facts);
+* ``compact``: the new ``decay_memories()``/``decay()``, which compute the
+  read-time decay and persist it with one bulk metadata update (plus one
+  bulk delete for forgotten facts).
+
+The tick path no longer runs either pass; scoring applies the decay when a
+memory is read. The script exits with status 1 unless:
+
+* one ``decay_period`` of read-time decay equals one legacy episodic pass;
+* after compaction, every memory's effective importance is unchanged;
+* compaction forgets exactly the user facts the legacy pass deleted, and
+  ``recall`` already left those facts out before compaction.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from memory.memory_manager import MemoryManager
+from memory.user_memory import RETENTION_FLOOR, UserMemory
+
+WORDS = "garden plan trains noise hallway task coffee music rain friend river kitchen puzzle story".split()
+
+
+def episodic_records(size, now, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"m{i}",
+            "memory_type": "perception",
+            "content": " ".join(rng.choice(WORDS) for _ in range(6)),
+            "importance": round(rng.uniform(0.1, 1.0), 4),
+            "decay_rate": rng.choice([0.001, 0.005, 0.01]),
+            "created_at": now - rng.uniform(0, 60) * 86400,
+            "last_accessed": 0.0,
+        }
+        for i in range(size)
+    ]
+
+
+def user_facts(size, now, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"f{i}",
+            "content": " ".join(rng.choice(WORDS) for _ in range(5)),
+            "fact_type": "preference",
+            "importance": round(rng.uniform(0.16, 0.9), 3),
+            "timestamp": (now - datetime.timedelta(days=rng.uniform(0, 60))).isoformat(timespec="seconds"),
+        }
+        for i in range(size)
+    ]
+
+
+def legacy_decay_memories(manager):
+    for mem in manager.vector_store.items:
+        decay_rate = float(mem.get("decay_rate", 0.001))
+        importance = float(mem.get("importance", 1.0)) - float(mem.get("importance", 1.0)) * decay_rate
+        if importance < 0:
+            importance = 0
+        mem["importance"] = importance
+        manager.vector_store.update(mem)
+
+
+def legacy_user_decay(memory, half_life_days=90):
+    now = datetime.datetime.now()
+    removed = []
+    for f in memory.store.items:
+        importance = float(f.get("importance", 0.6))
+        ts = datetime.datetime.fromisoformat(f["timestamp"])
+        age_days = max(0.0, (now - ts).total_seconds() / 86400.0)
+        if importance >= 1.0:
+            continue
+        decayed = importance * 0.5 ** (age_days / max(1.0, half_life_days * importance))
+        if decayed < RETENTION_FLOOR:
+            if memory.store.delete(f["id"]):
+                removed.append(f["id"])
+        elif abs(decayed - importance) > 1e-9:
+            f["importance"] = round(decayed, 3)
+            memory.store.update(f)
+    return removed
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def close(a, b):
+    return abs(a - b) <= 1e-9 * max(1.0, abs(a), abs(b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 2000])
+    args = parser.parse_args()
+
+    rows = []
+    checks = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            now = time.time()
+            managers = []
+            for label in ("legacy", "compact"):
+                manager = MemoryManager(storage_path=os.path.join(workdir, f"{size}-{label}", "store.json"))
+                manager.vector_store.store_many(episodic_records(size, now, seed=size))
+                managers.append(manager)
+            legacy, lazy = managers
+
+            before = {mem["id"]: mem for mem in lazy.vector_store.items}
+            one_pass = all(
+                close(lazy.effective_importance(mem, mem["created_at"] + lazy.decay_period),
+                      mem["importance"] * (1 - mem["decay_rate"]))
+                for mem in before.values()
+            )
+            checks.setdefault("one decay_period equals one legacy pass", []).append(one_pass)
+
+            legacy_episodic, _ = timed(lambda: legacy_decay_memories(legacy))
+            compact_at = time.time()
+            compact_episodic, _ = timed(lambda: lazy.decay_memories(now=compact_at))
+            later = compact_at + 7 * 86400
+            after = {mem["id"]: mem for mem in lazy.vector_store.items}
+            stable = len(after) == len(before) and all(
+                close(lazy.effective_importance(after[key], later), lazy.effective_importance(mem, later))
+                for key, mem in before.items()
+            )
+            checks.setdefault("compaction keeps effective importance", []).append(stable)
+
+            stamp = datetime.datetime.now()
+            facts = user_facts(size, stamp, seed=size + 1)
+            memories = []
+            for label in ("legacy", "compact"):
+                memory = UserMemory(path=os.path.join(workdir, f"{size}-{label}-user"))
+                memory.store.store_many([dict(fact) for fact in facts])
+                memories.append(memory)
+            legacy_user, lazy_user = memories
+
+            retained = {fact["id"] for fact in lazy_user.facts()}
+            legacy_seconds, removed = timed(lambda: legacy_user_decay(legacy_user))
+            compact_seconds, _ = timed(lambda: lazy_user.decay())
+            remaining = {fact["id"] for fact in lazy_user.store.items}
+            expected = {fact["id"] for fact in facts} - set(removed)
+            checks.setdefault("user compaction forgets the same facts", []).append(remaining == expected)
+            checks.setdefault("recall hides forgotten facts before compaction", []).append(retained == expected)
+            rows.append((size, legacy_episodic, compact_episodic, legacy_seconds, compact_seconds, len(removed)))
+
+    print(f"{'size':>6}{'episodic legacy s':>19}{'compact s':>11}{'speedup':>9}{'user legacy s':>15}{'compact s':>11}{'speedup':>9}{'forgotten':>11}")
+    for size, legacy_episodic, compact_episodic, legacy_user, compact_user, forgotten in rows:
+        print(
+            f"{size:>6}{legacy_episodic:>19.3f}{compact_episodic:>11.3f}{legacy_episodic / compact_episodic:>8.1f}x"
+            f"{legacy_user:>15.3f}{compact_user:>11.3f}{legacy_user / compact_user:>8.1f}x{forgotten:>11}"
+        )
+    print()
+    failed = False
+    for label, results in checks.items():
+        ok = all(results)
+        print(f"{label:<50}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
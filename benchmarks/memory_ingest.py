@@ -0,0 +1,100 @@
+"""Episodic memory ingestion benchmark: per-record vs bulk vector-store writes.
+
+Usage:
+    python benchmarks/memory_ingest.py --memories 1000 --batch-sizes 1 25 250
+
+Each run creates ``--memories`` episodic memories through a fresh
+``MemoryManager`` (its own Chroma directory):
+
+* ``per-record``: the old flush path, ``VectorStore.store`` once per pending
+  record (one embedding call and one Chroma ``add`` each);
+* ``batch N``: ``flush_size: N``, so ``create_memory`` triggers a bulk
+  ``VectorStore.store_many`` flush (one embedding pass, one ``add``) every
+  ``N`` records; the remainder is flushed at the end.
+
+The report gives memories ingested per second. Every run must end with all
+memories in the collection, and a probe query must return the same records
+with the same similarities as the per-record store, otherwise the script
+exits with status 1.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from memory.memory_manager import MemoryManager
+
+WORDS = (
+    "hello welcome garden plan trains wrong noise hallway task completed time python loop "
+    "memory brain praise criticism friend music rain morning coffee project deadline"
+).split()
+PROBES = ["garden plan praise", "noise in the hallway", "python loop task", "rain morning coffee"]
+
+
+def memories(count, seed=7):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (
+            rng.choice(["perception", "reflection", "worldview"]),
+            {"text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 16))), "index": i},
+            {"valence": round(rng.uniform(-1, 1), 3), "source": rng.choice(["user", "simulated"])},
+        )
+
+
+def ingest(workdir, name, count, batch_size):
+    manager = MemoryManager(
+        storage_path=os.path.join(workdir, name, "store.json"),
+        flush_config={"flush_size": batch_size or count, "flush_max_age": float("inf")},
+    )
+    store = manager.vector_store  # Open Chroma outside the timed region.
+    start = time.perf_counter()
+    if batch_size:
+        for memory_type, content, metadata in memories(count):
+            manager.create_memory(memory_type, content, metadata)
+        manager.flush_pending()
+    else:
+        for memory_type, content, metadata in memories(count):
+            manager.create_memory(memory_type, content, metadata)
+            for record in manager.pending_memories:
+                store.store(record)
+            manager.pending_memories = []
+    seconds = time.perf_counter() - start
+    probes = [
+        sorted((hit["memory_type"], hit["content"], round(hit["_sim"], 6)) for hit in store.search(query, limit=10))
+        for query in PROBES
+    ]
+    return seconds, len(store), probes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=1000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 25, 250])
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        baseline = ingest(workdir, "per-record", args.memories, 0)
+        rows.append(("per-record", *baseline))
+        for size in args.batch_sizes:
+            rows.append((f"batch {size}", *ingest(workdir, f"batch-{size}", args.memories, size)))
+
+    print(f"{'mode':>12}{'memories/s':>12}{'stored':>9}{'probes':>9}")
+    failed = False
+    for label, seconds, stored, probes in rows:
+        same = probes == baseline[2]
+        ok = stored == args.memories and same
+        failed |= not ok
+        print(f"{label:>12}{args.memories / seconds:>12.0f}{stored:>9}{'same' if same else 'DIFF':>9}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
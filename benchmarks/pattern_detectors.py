@@ -0,0 +1,243 @@
+"""Pattern detector benchmark: per-extraction rescans vs streaming detectors.
+
+Usage:
+    python benchmarks/pattern_detectors.py --events 3000 --brain-ticks 300 --seed 11
+
+A seeded stream of ``--events`` events (runs of criticism, task outcomes,
+rejection and support, threats and novelty among neutral records, with
+odd casing, empty categories and metadata-less events) is recorded into an
+``AutobiographicalMemory`` and fed to two ``EnhancedBeliefEngine``s:
+
+* ``batch``: every detector rescans the extraction window with
+  ``detect_pattern``, as before;
+* ``streaming``: the detectors read the counters a ``PatternWindow`` keeps
+  as ``observe_event`` feeds it each recorded event.
+
+After every event the streaming results are compared with
+``detect_pattern`` over the window, and after every extraction the belief
+updates, beliefs and ``pattern_log`` of both engines (clock readings
+aside). Now and then the events are reassigned, as a state restore does,
+so the streaming window has to rebuild. A brain with the enhanced
+worldview is then ticked ``--brain-ticks`` times over perceptions and a
+state restore, and its streaming results must match the batch ones without
+a rebuild outside the restore.
+
+The report gives the mean time per extraction for both and the cost of
+feeding one event. The script exits with status 1 if any comparison differs.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import deque
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from cognition.autobiographical_memory import AutobiographicalMemory
+from cognition.enhanced_belief_engine import EnhancedBeliefEngine
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+
+RUNS = [
+    ["criticism", "Criticism ", "correction", "reprimand", "negative_feedback"],
+    ["success", "task_completed", "failure", "mistake", "achievement", "setback"],
+    ["ignored", "loneliness", "rejection", "praise", "greeted", "welcome"],
+    ["threat_detected", "loud_noise", "danger", "alarm"],
+    ["novelty", "face_unknown", "success", "unknown_sound", "accomplishment"],
+    [None, "", "environment_scan", "hello", None],
+]
+PERCEPTIONS = [
+    ("hearing", "criticism", "That was wrong", -0.7),
+    ("hearing", "success", "Task completed", 0.8),
+    ("hearing", "failure", "That did not work", -0.6),
+    ("hearing", "ignored", "No answer", -0.5),
+    ("hearing", "praise", "Good job trying", 0.8),
+    ("vision", "threat_detected", "Loud noise detected", -0.8),
+    ("vision", "face_unknown", "A new face", 0.1),
+    ("vision", "environment_scan", "Objects scanned", 0.0),
+]
+TIME_KEYS = {"detected_at", "last_updated", "updated_at", "timestamp"}
+
+
+class BatchWindow:
+    """The old extraction path: every detector rescans the window."""
+
+    def __init__(self, detectors):
+        self.detectors = detectors
+        self.window = []
+
+    def push(self, event):
+        pass
+
+    def matches(self, events):
+        self.window = events
+        return True
+
+    def results(self):
+        return {name: detector.detect_pattern(self.window) for name, detector in self.detectors.items()}
+
+
+def batch_engine(config):
+    engine = EnhancedBeliefEngine(config)
+    engine.pattern_window = BatchWindow(engine.pattern_detectors)
+    return engine
+
+
+def event_args(rng):
+    run = rng.choice(RUNS)
+    for _ in range(rng.randint(1, 6)):
+        category = rng.choice(run)
+        roll = rng.random()
+        if roll < 0.05:
+            metadata = None
+        elif roll < 0.1:
+            metadata = {"valence": 0.0}
+        else:
+            metadata = {"category": category, "valence": round(rng.uniform(-1, 1), 2)}
+        yield f"perceived_{category}", {"dopamine": rng.uniform(0, 100)}, {"competence": rng.random()}, metadata
+
+
+def untimed(value):
+    """``value`` without clock readings, serialized so key order counts."""
+    def strip(item):
+        if isinstance(item, dict):
+            return {k: strip(v) for k, v in item.items() if k not in TIME_KEYS}
+        if isinstance(item, (list, tuple, deque)):
+            return [strip(v) for v in item]
+        return item
+    return json.dumps(strip(value))
+
+
+def engine_state(engine, result):
+    return untimed([result, engine.beliefs, engine.pattern_log, engine.last_pattern_summary])
+
+
+def batch_results(engine, events):
+    window = list(events)[-engine.event_window:]
+    return untimed({name: detector.detect_pattern(window) for name, detector in engine.pattern_detectors.items()})
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, name):
+    random.seed(42)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, name, "brain.json"),
+        worldview_config={"engine": "enhanced"},
+    )
+
+
+def check_brain(ticks, rng):
+    with tempfile.TemporaryDirectory() as workdir:
+        brain = build_brain(workdir, "streaming")
+        worldview = brain.worldview
+        in_step = True
+        for tick in range(ticks):
+            modality, category, content, valence = rng.choice(PERCEPTIONS)
+            brain.perceive({"modality": modality, "category": category, "content": content,
+                            "valence": valence, "intensity": 0.6, "source": "simulated"})
+            brain.tick()
+            if tick == ticks // 2:
+                restored = build_brain(workdir, "restored")
+                restored.set_state(brain.get_state())
+                brain, worldview = restored, restored.worldview
+            window = brain.autobiography.get_recent_events(worldview.event_window)
+            if worldview.pattern_window.matches(window):
+                in_step &= untimed(worldview.pattern_window.results()) == batch_results(worldview, window)
+            else:
+                worldview.pattern_window.reset(window)
+                worldview.pattern_window_rebuilds += 1
+        brain.memory_manager.flush_pending()
+        return in_step, worldview.pattern_window_rebuilds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=3000)
+    parser.add_argument("--brain-ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    config = {"engine": "enhanced", "extraction_interval": 1}
+    memory = AutobiographicalMemory(max_events=500)
+    streaming = EnhancedBeliefEngine(config)
+    batch = batch_engine(config)
+    checks = {"detector results": True, "belief updates and pattern log": True, "rebuild after restore": True}
+    step = 0
+    streaming_seconds = batch_seconds = 0.0
+    extractions = 0
+    while step < args.events:
+        for description, chemicals, identity, metadata in event_args(rng):
+            streaming.observe_event(memory.record_event(description, chemicals, identity, metadata))
+            step += 1
+            window = memory.get_recent_events(streaming.event_window)
+            checks["detector results"] &= untimed(streaming.pattern_window.results()) == batch_results(streaming, window)
+            if step % 12:
+                continue
+            start = time.perf_counter()
+            batch_result = batch.extract_beliefs(window, step, reflection_depth=3.0)
+            batch_seconds += time.perf_counter() - start
+            start = time.perf_counter()
+            streaming_result = streaming.extract_beliefs(window, step, reflection_depth=3.0)
+            streaming_seconds += time.perf_counter() - start
+            extractions += 1
+            checks["belief updates and pattern log"] &= (
+                engine_state(streaming, streaming_result) == engine_state(batch, batch_result)
+            )
+        if rng.random() < 0.02:
+            events = list(memory.events)
+            memory.events = deque(events[rng.randrange(len(events)):], maxlen=memory.events.maxlen)
+            window = memory.get_recent_events(streaming.event_window)
+            # Only a restore that changed the window leaves the stream stale.
+            expected = streaming.pattern_window_rebuilds + (list(window) != streaming.pattern_window.events())
+            step += 12 - step % 12
+            streaming_result = streaming.extract_beliefs(window, step, reflection_depth=3.0)
+            batch_result = batch.extract_beliefs(window, step, reflection_depth=3.0)
+            checks["rebuild after restore"] &= streaming.pattern_window_rebuilds == expected
+            checks["belief updates and pattern log"] &= (
+                engine_state(streaming, streaming_result) == engine_state(batch, batch_result)
+            )
+
+    start = time.perf_counter()
+    probe = EnhancedBeliefEngine(config)
+    events = list(memory.events)
+    for event in events:
+        probe.observe_event(event)
+    feed_seconds = (time.perf_counter() - start) / len(events)
+
+    in_step, brain_rebuilds = check_brain(args.brain_ticks, rng)
+    checks["brain streaming results"] = in_step
+    checks["brain rebuilds only after restore"] = brain_rebuilds <= 1
+
+    print(f"{'extractions':>12}{'batch us':>10}{'streaming us':>14}{'speedup':>9}{'feed us/event':>15}")
+    print(f"{extractions:>12}{batch_seconds / extractions * 1e6:>10.1f}"
+          f"{streaming_seconds / extractions * 1e6:>14.1f}{batch_seconds / streaming_seconds:>8.1f}x"
+          f"{feed_seconds * 1e6:>15.1f}")
+    print()
+    failed = False
+    for label, ok in checks.items():
+        print(f"{label:<40}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Planner benchmark: per-node recursion vs layered lookahead.
+
+Usage:
+    python benchmarks/planner.py --states 40 --depths 1 2 3 4
+
+A deterministic brain is warmed up on a fixed event stream. ``--states``
+chemistry snapshots are then drawn around its state. For each depth in
+``--depths`` the report gives decisions per second for three planners:
+
+* ``recursive``: the original ``_simulate_future`` recursion, kept below as
+  the reference. It copies the state dict and calls
+  ``ProbabilityModel.compute`` at every node.
+* ``layered``: ``LookaheadEngine`` with its transposition table disabled, so
+  every decision expands the full tree as array operations.
+* ``layered+tt``: the same engine with the transposition table enabled, as
+  ``StrategicPlanner`` runs it. The snapshots are evaluated twice, so repeated
+  states hit the table across decisions.
+
+The layered scores must equal the recursive scores exactly, otherwise the
+script exits with status 1.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+from decision.lookahead import LookaheadEngine
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome", "valence": 0.6, "intensity": 0.5, "source": "simulated"},
+    {"modality": "hearing", "category": "criticism", "content": "That was wrong", "valence": -0.7, "intensity": 0.7, "source": "simulated"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise detected", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed", "valence": 0.8, "intensity": 0.6, "source": "simulated"},
+]
+PLANNED = ["dopamine", "cortisol", "oxytocin", "serotonin"]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, "planner.json"),
+    )
+
+
+def legacy_simulate(brain, current_state, action, depth):
+
+    if depth == 0:
+        return 0.0
+
+    # Execute hypothetical action
+    decision_output = brain.decision_engine.execute_action(
+        action,
+        current_state
+    ) if brain.decision_engine else {}
+
+    feedback = decision_output.get("feedback", {})
+
+    # Retrieve active goal from goal system to scale utility weights
+    active_goal = None
+    if hasattr(brain, "goal_system") and brain.goal_system:
+        active_goal = brain.goal_system.get_active_goal()
+
+    w_dopamine = 1.0
+    w_serotonin = 1.0
+    w_oxytocin = 1.0
+    w_cortisol = -1.0
+
+    if active_goal == "safety":
+        w_cortisol = -2.5
+        w_oxytocin = 0.5
+        w_dopamine = 0.5
+    elif active_goal == "task_mastery":
+        w_dopamine = 2.0
+        w_cortisol = -0.5
+    elif active_goal == "social_bond":
+        w_oxytocin = 2.0
+        w_serotonin = 1.5
+        w_cortisol = -0.8
+
+    # Scale rewards if Love Emotion is active (love_score > 0.5)
+    love_score = float(current_state.get("love_score", 0.0))
+    if love_score > 0.5:
+        w_oxytocin = 3.0
+        w_cortisol = w_cortisol / 3.0
+
+    reward_score = (
+        feedback.get("dopamine", 0.0) * w_dopamine +
+        feedback.get("serotonin", 0.0) * w_serotonin +
+        feedback.get("oxytocin", 0.0) * w_oxytocin +
+        feedback.get("cortisol", 0.0) * w_cortisol
+    )
+
+    # Transition chemical state based on feedback
+    next_chemicals = current_state.get("neurochemicals", {}).copy()
+    feedback_multiplier = getattr(brain, "feedback_multiplier", 1.0)
+    decision_feedback_scale = getattr(brain, "decision_feedback_scale", 0.45)
+
+    for chem, delta in feedback.items():
+        if chem in next_chemicals and chem in brain.chemicals:
+            chem_def = brain.chemicals[chem]
+            val = next_chemicals[chem]
+            span = max(1e-6, chem_def["max"] - chem_def["min"])
+
+            bounded = max(-3.0, min(3.0, delta * feedback_multiplier * decision_feedback_scale))
+            if chem == "cortisol":
+                bounded = max(-0.6, min(0.6, bounded))
+
+            # Saturation scaling
+            if bounded >= 0:
+                headroom = (chem_def["max"] - val) / span
+            else:
+                headroom = (val - chem_def["min"]) / span
+            scale = max(0.15, min(1.0, headroom * 1.8))
+
+            new_val = val + bounded * scale
+            # Clamp
+            new_val = max(chem_def["min"], min(new_val, chem_def["max"]))
+            if chem == "cortisol":
+                new_val = min(100.0, new_val)
+
+            next_chemicals[chem] = new_val
+
+    # Create transitioned state dictionary for next lookahead steps
+    temp_state = current_state.copy()
+    temp_state["neurochemicals"] = next_chemicals
+    for chem, val in next_chemicals.items():
+        temp_state[chem] = val  # update flattened values
+
+    # Next state probabilities modulated by receptor sensitivities
+    if brain.decision_engine and brain.decision_engine.model:
+        effective_next = {}
+        for name, val in next_chemicals.items():
+            sens = 1.0
+            if name in brain.chemicals:
+                sens = brain.chemicals[name].sensitivity
+            effective_next[name] = val * sens
+        next_probabilities = brain.decision_engine.model.compute(effective_next)
+        action_bias = temp_state.get("decision_action_bias", {})
+        if isinstance(action_bias, dict):
+            for act, delta in action_bias.items():
+                if act in next_probabilities:
+                    next_probabilities[act] += float(delta)
+        # Clamp and normalize
+        min_prob = getattr(brain.decision_engine.model, "min_prob", 0.0)
+        max_prob = getattr(brain.decision_engine.model, "max_prob", 1.0)
+        for act in next_probabilities:
+            next_probabilities[act] = max(min_prob, min(max_prob, next_probabilities[act]))
+        total = sum(next_probabilities.values())
+        if total > 0:
+            for act in next_probabilities:
+                next_probabilities[act] /= total
+    else:
+        actions = ["support", "challenge", "suggest", "refuse", "neutral"]
+        next_probabilities = {act: 1.0 / len(actions) for act in actions}
+
+    future_score = 0.0
+
+    for next_action, prob in next_probabilities.items():
+        future_score += (
+            prob *
+            legacy_simulate(
+                brain,
+                temp_state,
+                next_action,
+                depth - 1
+            )
+        )
+
+    return reward_score + 0.5 * future_score
+
+
+def snapshots(brain, count, seed=7):
+    rng = random.Random(seed)
+    base = brain.get_decision_view()
+    states = []
+    for _ in range(count):
+        state = dict(base)
+        chemicals = dict(base["neurochemicals"])
+        for name in PLANNED:
+            if name in chemicals:
+                chemicals[name] = min(100.0, max(0.0, chemicals[name] + rng.uniform(-25.0, 25.0)))
+        state["neurochemicals"] = chemicals
+        state.update(chemicals)
+        states.append(state)
+    return states
+
+
+def timed(fn, states):
+    start = time.perf_counter()
+    scores = [fn(state) for state in states]
+    return scores, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--states", type=int, default=40)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--warmup", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        brain = build_brain(workdir)
+        for i in range(args.warmup):
+            brain.perceive(EVENTS[i % len(EVENTS)])
+            brain.tick()
+        actions = list(brain.decision_engine.model.actions)
+        states = snapshots(brain, args.states)
+
+        rows = []
+        mismatch = False
+        for depth in args.depths:
+            recursive, recursive_seconds = timed(
+                lambda state: [legacy_simulate(brain, state, action, depth) for action in actions], states
+            )
+            untabled = LookaheadEngine(table_size=0)
+            layered, layered_seconds = timed(
+                lambda state: list(untabled.evaluate(brain, state, actions, depth)[0].values()), states
+            )
+            tabled = LookaheadEngine()
+            _, tabled_seconds = timed(
+                lambda state: tabled.evaluate(brain, state, actions, depth), states + states
+            )
+            mismatch |= layered != recursive
+            rows.append((depth, recursive_seconds, layered_seconds, tabled_seconds, tabled, layered == recursive))
+
+    decisions = len(states)
+    print(f"{'depth':>6}{'nodes':>7}{'recursive/s':>13}{'layered/s':>11}{'layered+tt/s':>14}{'tt hit rate':>13}{'scores':>8}")
+    for depth, recursive_seconds, layered_seconds, tabled_seconds, tabled, exact in rows:
+        nodes = sum(len(actions) ** level for level in range(1, depth + 1))
+        hit_rate = tabled.hits / max(1, tabled.hits + tabled.misses)
+        print(
+            f"{depth:>6}{nodes:>7}{decisions / recursive_seconds:>13.0f}{decisions / layered_seconds:>11.0f}"
+            f"{2 * decisions / tabled_seconds:>14.0f}{hit_rate:>13.1%}{'exact' if exact else 'DIFF':>8}"
+        )
+    if mismatch:
+        print("layered lookahead diverged from the recursive planner")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
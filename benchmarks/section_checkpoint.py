@@ -0,0 +1,163 @@
+"""Checkpoint benchmark: full JSON rewrite vs per-section delta checkpoints.
+
+Usage:
+    python benchmarks/section_checkpoint.py --ages 100 500 1000 --samples 30 --perceive-every 3
+
+A deterministic brain ticks once per step and perceives an event on every
+``--perceive-every``-th step, so most checkpoints follow a quiet tick. At
+each age in ``--ages`` the next ``--samples`` checkpoints go to two
+managers:
+
+* ``snapshot``: the default ``MemoryStorage`` (whole state as indented JSON);
+* ``sections``: ``SectionStorage``, which rewrites only the sections that
+  changed plus the manifest.
+
+The report gives mean save latency, bytes written per save and, for
+``sections``, the number of section files written per save.
+
+The script exits with status 1 unless the last section checkpoint loads to
+the saved state, and two fresh brains restored with ``set_state`` from the
+JSON and the section checkpoints report the same state.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+from memory.memory_manager import MemoryManager
+from memory.sections import SectionStorage
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome back", "valence": 0.6, "intensity": 0.5, "source": "user"},
+    {"modality": "hearing", "category": "praise", "content": "Good job on the garden plan", "valence": 0.8, "intensity": 0.6, "source": "user"},
+    {"modality": "hearing", "category": "criticism", "content": "That answer about trains was wrong", "valence": -0.7, "intensity": 0.7, "source": "user"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise in the hallway", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed on time", "valence": 0.8, "intensity": 0.6, "source": "user"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(path, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=path,
+    )
+
+
+def step(brain, i, perceive_every):
+    if i % perceive_every == 0:
+        event = dict(EVENTS[(i // perceive_every) % len(EVENTS)])
+        event["content"] = f"{event['content']} #{i % 97}"
+        brain.perceive(event)
+    brain.tick()
+
+
+def plain(state):
+    return json.loads(json.dumps(state))
+
+
+def restored(path, state):
+    with contextlib.redirect_stdout(io.StringIO()):
+        brain = build_brain(path)
+        brain.set_state(state)
+        return plain(brain.get_state())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ages", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--perceive-every", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot_path = os.path.join(workdir, "snapshot", "store.json")
+        sections_path = os.path.join(workdir, "sections", "store.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            brain = build_brain(os.path.join(workdir, "brain", "events.json"))
+            snapshot = MemoryManager(storage_path=snapshot_path)
+            sections = MemoryManager(storage_path=sections_path, persistence={"mode": "sections"})
+            storage = sections.storage
+
+            age = 0
+            state = None
+            for target in sorted(args.ages):
+                while age < target:
+                    step(brain, age, args.perceive_every)
+                    age += 1
+                timings = {"snapshot": [], "sections": []}
+                files = 0
+                for _ in range(args.samples):
+                    step(brain, age, args.perceive_every)
+                    age += 1
+                    state = brain.get_state()
+
+                    start = time.perf_counter()
+                    snapshot.save(state)
+                    timings["snapshot"].append((time.perf_counter() - start, os.path.getsize(snapshot_path)))
+
+                    before, written = storage.bytes_written, storage.sections_written
+                    start = time.perf_counter()
+                    sections.save(state)
+                    timings["sections"].append((time.perf_counter() - start, storage.bytes_written - before))
+                    files += storage.sections_written - written
+                rows.append((target, timings, files / args.samples))
+
+        expected = plain(state)
+        from_sections = SectionStorage(sections_path).get_all()
+        checks = [("section checkpoint loads the saved state", plain(from_sections) == expected)]
+        with open(snapshot_path) as f:
+            from_json = json.load(f)
+        checks.append((
+            "set_state matches the JSON restore",
+            restored(os.path.join(workdir, "a", "events.json"), from_json)
+            == restored(os.path.join(workdir, "b", "events.json"), from_sections),
+        ))
+
+    print(f"{'age':>6}{'snapshot ms':>13}{'KiB/save':>10}{'sections ms':>13}{'KiB/save':>10}{'files/save':>12}{'speedup':>9}")
+    for target, timings, files in rows:
+        cells = []
+        for mode in ("snapshot", "sections"):
+            seconds = sum(s for s, _ in timings[mode]) / len(timings[mode])
+            size = sum(b for _, b in timings[mode]) / len(timings[mode])
+            cells.append((seconds, size))
+        (s_mean, s_size), (d_mean, d_size) = cells
+        print(
+            f"{target:>6}{s_mean * 1e3:>13.2f}{s_size / 1024:>10.1f}{d_mean * 1e3:>13.2f}{d_size / 1024:>10.1f}"
+            f"{files:>12.1f}{s_mean / d_mean:>8.1f}x"
+        )
+    print()
+    failed = False
+    for label, ok in checks:
+        print(f"{label:<44}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
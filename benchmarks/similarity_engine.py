@@ -0,0 +1,201 @@
+"""Similarity engine benchmark: per-profile dict scans vs the ring matrices.
+
+Usage:
+    python benchmarks/similarity_engine.py --profiles 300 --records 2000 --seed 9
+
+Brain-shaped profiles (nine chemical deltas, four identity traits) are
+recorded for a few event types into the old ``SimilarityEngine`` (a list per
+event type trimmed with ``pop(0)``, dict-based distances) and the current
+one (a circular float matrix per event type), capped at ``--profiles``.
+One event type also gets profiles with missing and extra keys, and some
+profiles are recorded twice so similarities tie. Every few
+records both are queried with random decision-view states:
+
+* ``find_similar_profiles`` must return the same profiles in the same order;
+* ``blended_emotional_prediction`` must agree to 1e-12;
+* the ``_many`` forms must agree with one call per state.
+
+The report gives the mean microseconds per nearest-neighbour query, per
+blended prediction, per ``AppraisalEngine.predict_emotion`` (what every
+perception pays) and per state in an eight-state batch. The script exits
+with status 1 if any comparison differs.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from learning.appraisal_engine import AppraisalEngine
+from learning.similarity_engine import SimilarityEngine
+
+CHEMICALS = ["dopamine", "cortisol", "oxytocin", "serotonin", "norepinephrine",
+             "adrenaline", "acetylcholine", "melatonin", "endorphins"]
+TRAITS = ["competence", "social_value", "resilience", "intelligence"]
+EVENT_TYPES = ["praise", "criticism", "failure", "success", "threat_detected"]
+
+
+class LegacySimilarityEngine:
+    """The old engine: a list of profile dicts per event type."""
+
+    def __init__(self, max_profiles):
+        self.event_profiles = defaultdict(list)
+        self.max_profiles_per_event = max_profiles
+        self.similarity_threshold = 0.4
+        self.identity_weight = 0.6
+        self.chemical_weight = 0.4
+
+    def record_event_profile(self, event_type, chemical_delta, identity_snapshot):
+        self.event_profiles[event_type].append({"chemicals": chemical_delta.copy(),
+                                                "identity": identity_snapshot.copy()})
+        if len(self.event_profiles[event_type]) > self.max_profiles_per_event:
+            self.event_profiles[event_type].pop(0)
+
+    def _vector_distance(self, v1, v2):
+        keys = set(v1.keys()).union(v2.keys())
+        return math.sqrt(sum((v1.get(k, 0) - v2.get(k, 0)) ** 2 for k in keys))
+
+    def _compute_similarity(self, profile, current_state):
+        chemical_state = {k: current_state.get(k, 0) for k in profile["chemicals"].keys()}
+        identity_state = {k: current_state.get(f"identity_{k}", 0) for k in profile["identity"].keys()}
+        chem_sim = 1 / (1 + self._vector_distance(chemical_state, profile["chemicals"]))
+        id_sim = 1 / (1 + self._vector_distance(identity_state, profile["identity"]))
+        return chem_sim * self.chemical_weight + id_sim * self.identity_weight
+
+    def find_similar_profiles(self, event_type, current_state, top_k=5):
+        scored = []
+        for profile in self.event_profiles.get(event_type, []):
+            sim = self._compute_similarity(profile, current_state)
+            if sim >= self.similarity_threshold:
+                scored.append((sim, profile))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [p for _, p in scored[:top_k]]
+
+    def blended_emotional_prediction(self, event_type, current_state):
+        similar = self.find_similar_profiles(event_type, current_state)
+        if not similar:
+            return {}
+        blended = defaultdict(float)
+        total_weight = 0
+        for profile in similar:
+            sim = self._compute_similarity(profile, current_state)
+            for chem, value in profile["chemicals"].items():
+                blended[chem] += value * sim
+            total_weight += sim
+        if total_weight == 0:
+            return {}
+        for chem in blended:
+            blended[chem] /= total_weight
+        return dict(blended)
+
+
+def profile_args(rng, mixed):
+    chemicals = {name: rng.gauss(0, 0.6) for name in CHEMICALS}
+    identity = {name: rng.uniform(0.2, 1.4) for name in TRAITS}
+    if mixed:
+        for name in rng.sample(CHEMICALS, rng.randint(0, 4)):
+            del chemicals[name]
+        if rng.random() < 0.1:
+            chemicals[f"trace_{rng.randint(0, 3)}"] = rng.gauss(0, 0.4)
+        if rng.random() < 0.2:
+            del identity[rng.choice(TRAITS)]
+    return chemicals, identity
+
+
+def state(rng):
+    view = {name: rng.gauss(0, 0.5) for name in CHEMICALS}
+    view.update({f"identity_{name}": rng.uniform(0.2, 1.4) for name in TRAITS})
+    view.update({f"development_{name}": rng.random() for name in ("maturity", "stage_index", "reflection")})
+    view.update({"attachment_value": rng.random(), "mood_valence": rng.uniform(-1, 1), "love_score": rng.random()})
+    return view
+
+
+def close(a, b):
+    return a.keys() == b.keys() and all(math.isclose(a[k], b[k], rel_tol=1e-12, abs_tol=1e-12) for k in a)
+
+
+def mean_seconds(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=300)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=9)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    legacy = LegacySimilarityEngine(args.profiles)
+    engine = SimilarityEngine()
+    engine.max_profiles_per_event = args.profiles
+    checks = {"nearest profiles": True, "blended prediction": True, "batch queries": True, "profile counts": True}
+    event_types = EVENT_TYPES + ["mixed"]
+    last = {}
+    for step in range(args.records):
+        event_type = rng.choice(event_types)
+        if event_type in last and rng.random() < 0.1:
+            chemicals, identity = last[event_type]
+        else:
+            chemicals, identity = last[event_type] = profile_args(rng, event_type == "mixed")
+        legacy.record_event_profile(event_type, chemicals, identity)
+        engine.record_event_profile(event_type, chemicals, identity)
+        if step % 5:
+            continue
+        states = [state(rng) for _ in range(4)]
+        for event_type in event_types + ["unseen"]:
+            expected = [legacy.find_similar_profiles(event_type, s) for s in states]
+            blends = [legacy.blended_emotional_prediction(event_type, s) for s in states]
+            checks["nearest profiles"] &= [engine.find_similar_profiles(event_type, s) for s in states] == expected
+            checks["blended prediction"] &= all(
+                close(engine.blended_emotional_prediction(event_type, s), b) for s, b in zip(states, blends)
+            )
+            checks["batch queries"] &= engine.find_similar_profiles_many(event_type, states) == expected
+            checks["batch queries"] &= all(
+                close(a, b) for a, b in zip(engine.blended_emotional_prediction_many(event_type, states), blends)
+            )
+    checks["profile counts"] = (
+        engine.get_memory_snapshot() == {k: len(v) for k, v in legacy.event_profiles.items()}
+        and engine.event_profiles == dict(legacy.event_profiles)
+    )
+
+    probe = state(rng)
+    batch = [state(rng) for _ in range(8)]
+    repeat = 300
+    rows = []
+    for label, old, new in (
+        ("nearest", lambda: legacy.find_similar_profiles("praise", probe),
+         lambda: engine.find_similar_profiles("praise", probe)),
+        ("blended", lambda: legacy.blended_emotional_prediction("praise", probe),
+         lambda: engine.blended_emotional_prediction("praise", probe)),
+        ("predict_emotion", lambda: AppraisalEngine(legacy).predict_emotion("praise", probe),
+         lambda: AppraisalEngine(engine).predict_emotion("praise", probe)),
+        ("batch of 8", lambda: [legacy.find_similar_profiles("praise", s) for s in batch],
+         lambda: engine.find_similar_profiles_many("praise", batch)),
+    ):
+        scale = 8 if label == "batch of 8" else 1
+        rows.append((label, mean_seconds(old, repeat) / scale, mean_seconds(new, repeat) / scale))
+
+    print(f"{'query':>16}{'legacy us':>11}{'ring us':>9}{'speedup':>9}")
+    for label, old, new in rows:
+        print(f"{label:>16}{old * 1e6:>11.1f}{new * 1e6:>9.1f}{old / new:>8.0f}x")
+    print()
+    failed = False
+    for label, ok in checks.items():
+        print(f"{label:<40}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Cold-start benchmark: import and construction cost per subsystem.
+
+Usage:
+    python benchmarks/startup.py --repeat 5
+
+Import times are measured in a fresh interpreter per module, so every row is
+a cold import (shared dependencies included). Construction times are
+measured in-process after the imports, as best-of ``--repeat``:
+
+* each heavy subsystem on its own (the Chroma-backed vector store, the code
+  engine, the app builder, the tool connector, the sleep manager);
+* ``VirtualBrain(...)``, which now defers the vector store, the code engine
+  and the app builder to first use, i.e. the API ``/reset`` path. The brain
+  is built non-deterministic, as the API builds it by default; a
+  deterministic brain opens the episodic vector store up front;
+* the first ``tick()``. Episodic memories are buffered, so the vector store
+  opens later, at the first bulk flush, rather than in this tick.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+MODULES = [
+    "core.brain",
+    "memory.vector_store",
+    "cognition.app_builder",
+    "cognition.code_engine",
+    "core.tool_connector",
+    "core.sleep_manager",
+]
+
+
+def cold_import(module):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    imports = [(module, cold_import(module)) for module in MODULES]
+
+    import yaml
+
+    from cognition.app_builder import AppBuilder
+    from cognition.code_engine import CodeEngine
+    from cognition.language_cortex import LanguageCortex
+    from core.brain import VirtualBrain
+    from core.sleep_manager import SleepManager
+    from core.tool_connector import ToolConnector
+    from decision.decision_engine import DecisionEngine
+    from memory.vector_store import VectorStore
+
+    with open(os.path.join(PROJECT_ROOT, "config", "chemicals.yaml")) as f:
+        chemicals = yaml.safe_load(f)
+    with open(os.path.join(PROJECT_ROOT, "config", "decision.yaml")) as f:
+        decision = yaml.safe_load(f) or {}
+
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        counter = [0]
+
+        def fresh_dir():
+            counter[0] += 1
+            path = os.path.join(workdir, str(counter[0]))
+            os.makedirs(path)
+            return path
+
+        def build_brain():
+            random.seed(42)
+            return VirtualBrain(
+                chemical_configs=chemicals["chemicals"],
+                interaction_matrix=chemicals.get("interactions"),
+                decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=False),
+                deterministic=False,
+                memory_storage_path=os.path.join(fresh_dir(), "brain.json"),
+            )
+
+        def first_tick():
+            brain = build_brain()
+            start = time.perf_counter()
+            brain.tick()
+            first_tick.seconds = min(getattr(first_tick, "seconds", float("inf")), time.perf_counter() - start)
+
+        construction = [
+            ("VectorStore (Chroma client)", best_of(lambda: VectorStore(path=fresh_dir(), collection="startup"), args.repeat)),
+            ("CodeEngine", best_of(CodeEngine, args.repeat)),
+            ("AppBuilder", best_of(lambda: AppBuilder(LanguageCortex()), args.repeat)),
+            ("ToolConnector", best_of(ToolConnector, args.repeat)),
+            ("SleepManager", best_of(SleepManager, args.repeat)),
+            ("VirtualBrain (lazy subsystems)", best_of(build_brain, args.repeat)),
+        ]
+        for _ in range(args.repeat):
+            first_tick()
+        construction.append(("first tick()", first_tick.seconds))
+
+    print(f"{'cold import':<34}{'ms':>10}")
+    for module, seconds in imports:
+        print(f"{module:<34}{seconds * 1e3:>10.1f}")
+    print()
+    print(f"{'construction (best of ' + str(args.repeat) + ')':<34}{'ms':>10}")
+    for label, seconds in construction:
+        print(f"{label:<34}{seconds * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""State snapshot benchmark: cached sections vs full rebuilds.
+
+Usage:
+    python benchmarks/state_snapshots.py --warmup 200 --calls 500
+
+A brain is warmed up on a fixed event stream so the Q-table, concept memory,
+Hopfield weights and autobiography are populated, then three calls are
+timed:
+
+* ``get_state()`` with an empty snapshot cache, i.e. every section frozen
+  from scratch (the cost of the old deep-copying payload);
+* ``get_state()`` with warm caches, where unchanged sections are shared;
+* ``get_decision_view()``, the lightweight view used on the decision path.
+
+A final row times ``perceive()`` + ``tick()`` + ``get_state()`` per step, the
+pattern the simulator and the ``/tick`` autosave follow.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from core.snapshot import StateSnapshots
+from decision.decision_engine import DecisionEngine
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome", "valence": 0.6, "intensity": 0.5, "source": "simulated"},
+    {"modality": "hearing", "category": "praise", "content": "Good job trying", "valence": 0.8, "intensity": 0.6, "source": "simulated"},
+    {"modality": "hearing", "category": "criticism", "content": "That was wrong", "valence": -0.7, "intensity": 0.7, "source": "simulated"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise detected", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed", "valence": 0.8, "intensity": 0.6, "source": "simulated"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, "snapshots.json"),
+    )
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--warmup", type=int, default=200, help="ticks run before timing")
+    parser.add_argument("--calls", type=int, default=500, help="timed calls per row")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        brain = build_brain(workdir)
+        for i in range(args.warmup):
+            brain.perceive(EVENTS[i % len(EVENTS)])
+            brain.tick()
+
+        def cold_state():
+            brain._snapshots = StateSnapshots()
+            brain.get_state()
+
+        cold = per_call(cold_state, args.calls)
+        brain.get_state()
+        warm = per_call(brain.get_state, args.calls)
+        view = per_call(brain.get_decision_view, args.calls)
+
+        step_index = [0]
+
+        def step():
+            brain.perceive(EVENTS[step_index[0] % len(EVENTS)])
+            step_index[0] += 1
+            brain.tick()
+            brain.get_state()
+
+        brain._snapshots.hits = brain._snapshots.misses = 0
+        stepped = per_call(step, max(1, args.calls // 5))
+        hits, misses = brain._snapshots.hits, brain._snapshots.misses
+
+    print(f"{'call':<34}{'us/call':>12}{'vs cold':>10}")
+    for label, seconds in [
+        ("get_state() cold cache", cold),
+        ("get_state() warm cache", warm),
+        ("get_decision_view()", view),
+    ]:
+        print(f"{label:<34}{seconds * 1e6:>12.1f}{cold / seconds:>9.1f}x")
+    print(f"{'perceive + tick + get_state()':<34}{stepped * 1e6:>12.1f}")
+    print(f"section cache during stepping: {hits} hits, {misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Fast-forward benchmark: ``tick_many(n)`` vs ``n`` calls to ``tick()``.
+
+Usage:
+    python benchmarks/tick_many.py --warmup 40 --ticks 1000
+
+Two deterministic brains are warmed up on the same event stream. One then
+advances ``--ticks`` idle ticks with a ``tick()`` loop and the other with a
+single ``tick_many()`` call, which coalesces the episodic memory writes into
+one flush, creates the per-tick autobiography memories in one bulk call and
+shares the spontaneous replay search between ticks that ask the same
+question. The default run covers a sleep episode and the awake ticks after
+it. The report gives ticks per second for each path and the replay searches
+run and reused, and checks the equivalence contract: chemistry, Q-values,
+identity, step counter and episodic memory count must match exactly.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome", "valence": 0.6, "intensity": 0.5, "source": "simulated"},
+    {"modality": "hearing", "category": "praise", "content": "Good job trying", "valence": 0.8, "intensity": 0.6, "source": "simulated"},
+    {"modality": "hearing", "category": "criticism", "content": "That was wrong", "valence": -0.7, "intensity": 0.7, "source": "simulated"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise detected", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed", "valence": 0.8, "intensity": 0.6, "source": "simulated"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(workdir, name, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=os.path.join(workdir, name, "brain.json"),
+    )
+
+
+def warm_up(brain, ticks):
+    for i in range(ticks):
+        brain.perceive(EVENTS[i % len(EVENTS)])
+        brain.tick()
+    brain.memory_manager.flush_pending()
+
+
+def fingerprint(brain):
+    return {
+        "chemicals": {name: chem["value"] for name, chem in brain.chemicals.items()},
+        "q_table": brain.decision_engine.q_table,
+        "identity": brain.identity.get_snapshot(),
+        "step_counter": brain.step_counter,
+        "sleeping": brain.sleeping,
+        "memories": len(brain.memory_manager.vector_store) + len(brain.memory_manager.pending_memories),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--warmup", type=int, default=40, help="perceive + tick steps before timing")
+    parser.add_argument("--ticks", type=int, default=1000, help="idle ticks to advance")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        os.makedirs(os.path.join(workdir, "loop"))
+        os.makedirs(os.path.join(workdir, "batch"))
+        looped = build_brain(workdir, "loop")
+        warm_up(looped, args.warmup)
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            looped.tick()
+        loop_seconds = time.perf_counter() - start
+
+        batched = build_brain(workdir, "batch")
+        warm_up(batched, args.warmup)
+        start = time.perf_counter()
+        summary = batched.tick_many(args.ticks)
+        batch_seconds = time.perf_counter() - start
+
+        expected, actual = fingerprint(looped), fingerprint(batched)
+
+    print(f"{'path':<24}{'ticks/s':>12}{'speedup':>10}")
+    print(f"{'tick() loop':<24}{args.ticks / loop_seconds:>12.1f}{1.0:>9.2f}x")
+    print(f"{'tick_many()':<24}{args.ticks / batch_seconds:>12.1f}{loop_seconds / batch_seconds:>9.2f}x")
+    print()
+    print(
+        f"batch summary: {summary['decisions']} decisions, {summary['sleep_ticks']} sleeping ticks, "
+        f"{summary['memories_flushed']} memories flushed once, "
+        f"{summary['replay_searches']} replay searches for {summary['replay_searches'] + summary['replay_reuses']} replays"
+    )
+    mismatched = [key for key in expected if expected[key] != actual[key]]
+    print("equivalence: " + ("OK" if not mismatched else "MISMATCH in " + ", ".join(mismatched)))
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
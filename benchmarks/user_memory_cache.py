@@ -0,0 +1,169 @@
+"""User memory cache benchmark: store reads vs the write-through mirror.
+
+Usage:
+    python benchmarks/user_memory_cache.py --facts 2000 --ops 200 --snapshots 50
+
+A ``UserMemory`` is filled with ``--facts`` facts and then put through
+``--ops`` random operations: ``remember``, ``forget``, ``consolidate``,
+``decay``, ``load_state`` of a partly overlapping state, and writes made
+directly through its ``VectorStore`` (which the mirror must notice). After
+every operation ``facts()``, ``profile()`` and ``to_state()`` are compared
+with the same values recomputed from ``store.items``; a second
+``UserMemory`` on the same path, which has never cached anything, must
+agree as well.
+
+The report gives the mean time of one ``profile()`` + ``to_state()`` pair
+(what a brain state snapshot costs) when both read the store, as before,
+and when both read the mirror. The script exits with status 1 if any
+comparison differs.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from memory.user_memory import UserMemory
+
+WORDS = "garden plan trains noise hallway task coffee music rain friend river kitchen puzzle story".split()
+TYPES = ["preference", "relationship", "history", "trait", "general"]
+
+
+def fact(rng, now):
+    return {
+        "id": uuid.UUID(int=rng.getrandbits(128)).hex[:12],
+        "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))),
+        "fact_type": rng.choice(TYPES),
+        "importance": round(rng.uniform(0.16, 1.0), 3),
+        "timestamp": (now - datetime.timedelta(days=rng.uniform(0, 120))).isoformat(timespec="seconds"),
+    }
+
+
+def store_profile(memory):
+    facts = memory.store.items
+    types = {}
+    for f in facts:
+        t = f.get("fact_type", "general")
+        types[t] = types.get(t, 0) + 1
+    return {
+        "user_name": memory.user_name,
+        "total_facts": len(facts),
+        "fact_types": types,
+        "last_updated": facts[0]["timestamp"] if facts else None,
+    }
+
+
+def store_state(memory):
+    return {
+        "user_name": memory.user_name,
+        "facts": [
+            {
+                "id": f.get("id"),
+                "content": f.get("content"),
+                "fact_type": f.get("fact_type", "general"),
+                "importance": f.get("importance"),
+                "timestamp": f.get("timestamp"),
+            }
+            for f in memory.store.items
+        ],
+    }
+
+
+def consistent(memory, fresh):
+    fresh.user_name = memory.user_name
+    fresh.half_life_days = memory.half_life_days
+    fresh.invalidate()
+    expected_facts = memory._retained(memory.store.items)
+    return (
+        memory.facts() == expected_facts
+        and memory.profile() == store_profile(memory)
+        and memory.to_state() == store_state(memory)
+        and fresh.profile() == memory.profile()
+        and fresh.to_state() == memory.to_state()
+    )
+
+
+def operation(rng, memory, now):
+    kind = rng.choice(["remember", "remember", "forget", "consolidate", "decay", "load_state", "external"])
+    if kind == "remember":
+        memory.remember(" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))),
+                        fact_type=rng.choice(TYPES), importance=round(rng.uniform(0.2, 0.95), 2))
+    elif kind == "forget":
+        facts = memory.facts()
+        if facts:
+            target = rng.choice(facts)
+            memory.forget(fact_type=target["fact_type"], fact=target["content"])
+    elif kind == "consolidate":
+        memory.consolidate()
+    elif kind == "decay":
+        memory.decay(half_life_days=rng.choice([90, 180, 365]))
+    elif kind == "load_state":
+        state = memory.to_state()
+        kept = rng.sample(state["facts"], min(len(state["facts"]), 5))
+        memory.load_state({"user_name": rng.choice(["ada", "lin", None]),
+                           "facts": kept + [fact(rng, now) for _ in range(3)]})
+    else:
+        items = memory.store.items
+        if items and rng.random() < 0.5:
+            memory.store.delete(rng.choice(items)["id"])
+        else:
+            memory.store.store(fact(rng, now))
+    return kind
+
+
+def mean_seconds(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--facts", type=int, default=2000)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--snapshots", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    now = datetime.datetime.now()
+    failures = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "user_db")
+        memory = UserMemory(path=path, user_name="Ada")
+        memory.load_state({"user_name": "ada", "facts": [fact(rng, now) for _ in range(args.facts)]})
+        fresh = UserMemory(path=path)
+        if not consistent(memory, fresh):
+            failures["initial load"] = 1
+        for _ in range(args.ops):
+            kind = operation(rng, memory, now)
+            if not consistent(memory, fresh):
+                failures[kind] = failures.get(kind, 0) + 1
+
+        uncached = mean_seconds(lambda: (store_profile(memory), store_state(memory)), args.snapshots)
+        loads = memory.mirror_loads
+        cached = mean_seconds(lambda: (memory.profile(), memory.to_state()), args.snapshots)
+        reloads = memory.mirror_loads - loads
+        count = len(memory.store)
+
+    print(f"{'facts':>7}{'store ms':>10}{'mirror ms':>11}{'speedup':>9}{'reloads':>9}")
+    print(f"{count:>7}{uncached * 1e3:>10.2f}{cached * 1e3:>11.3f}{uncached / cached:>8.0f}x{reloads:>9}")
+    print()
+    kinds = ["initial load", "remember", "forget", "consolidate", "decay", "load_state", "external"]
+    for kind in kinds:
+        ok = not failures.get(kind)
+        print(f"{'mirror matches store after ' + kind:<50}{'ok' if ok else 'FAILED'}")
+    if failures or reloads:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
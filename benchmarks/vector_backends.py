@@ -0,0 +1,131 @@
+"""Vector store backend benchmark: Chroma vs the in-process NumPy collection.
+
+Usage:
+    python benchmarks/vector_backends.py --sizes 1000 10000 100000 --queries 50 --limit 5 --ivf-lists 128 --ivf-probes 24
+
+For each collection size in ``--sizes`` the same synthetic memories are
+written with ``VectorStore.store_many`` to three stores:
+
+* ``chroma``: ``backend="chroma"`` (ChromaDB ``PersistentClient``, HNSW);
+* ``numpy``: ``backend="numpy"`` (exact matrix-vector top-k);
+* ``numpy ivf``: ``backend="numpy"`` with ``ivf_lists``/``ivf_probes``. Below
+  ``IVF_MIN_PER_LIST`` rows per list it searches exactly.
+
+The report gives the time to ingest, to reopen the store from disk and run
+the first query (which trains the IVF index), and the mean ``search`` time
+over ``--queries`` probes. ``agree`` is the share of queries whose top-k
+similarities match the exact NumPy ranking; ties in the hashed embedding
+make ids alone ambiguous. The script exits with status 1 if Chroma and the
+exact backend agree on fewer than ``--min-agreement`` of the queries, or if
+a reopened NumPy store answers differently from the one that wrote it.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from memory.vector_index import IVF_MIN_PER_LIST
+from memory.vector_store import VectorStore
+
+WORDS = (
+    "hello welcome garden plan trains wrong noise hallway task completed time python loop memory "
+    "brain praise criticism friend music rain morning coffee project deadline river mountain letter "
+    "kitchen window market lesson puzzle story dream engine bridge harbor signal winter summer"
+).split()
+TYPES = ["perception", "reflection", "worldview"]
+
+
+def records(size, seed):
+    rng = random.Random(seed)
+    now = time.time()
+    return [
+        {
+            "id": f"m{i}",
+            "memory_type": TYPES[i % len(TYPES)],
+            "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 14))),
+            "importance": round(rng.random(), 4),
+            "created_at": now - rng.random() * 86400,
+        }
+        for i in range(size)
+    ]
+
+
+def open_store(path, options):
+    return VectorStore(path=path, collection="bench_memory", **options)
+
+
+def ranking(hits):
+    return sorted(round(hit["_sim"], 4) for hit in hits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--ivf-lists", type=int, default=128)
+    parser.add_argument("--ivf-probes", type=int, default=24)
+    parser.add_argument("--min-agreement", type=float, default=0.9)
+    args = parser.parse_args()
+
+    backends = [
+        ("chroma", {"backend": "chroma"}),
+        ("numpy", {"backend": "numpy"}),
+        ("numpy ivf", {"backend": "numpy", "ivf_lists": args.ivf_lists, "ivf_probes": args.ivf_probes}),
+    ]
+    rng = random.Random(11)
+    queries = [" ".join(rng.choice(WORDS) for _ in range(3)) for _ in range(args.queries)]
+    rows = []
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            data = records(size, seed=size)
+            results = {}
+            for label, options in backends:
+                path = os.path.join(workdir, f"{size}-{label.replace(' ', '-')}")
+                store = open_store(path, options)
+                start = time.perf_counter()
+                store.store_many([dict(record) for record in data])
+                ingest = time.perf_counter() - start
+                written = [ranking(store.search(query, limit=args.limit)) for query in queries[:5]]
+                del store
+
+                start = time.perf_counter()
+                store = open_store(path, options)
+                store.search(queries[0], limit=args.limit)
+                reopen = time.perf_counter() - start
+
+                start = time.perf_counter()
+                found = [ranking(store.search(query, limit=args.limit)) for query in queries]
+                search = (time.perf_counter() - start) / len(queries)
+                results[label] = found
+                reloaded = found[:5] == written
+                rows.append([size, label, ingest, reopen, search, None, reloaded])
+                del store
+            for row in rows[-len(backends):]:
+                row[5] = sum(a == b for a, b in zip(results[row[1]], results["numpy"])) / len(queries)
+                if row[1] == "chroma":
+                    failed |= row[5] < args.min_agreement
+                else:
+                    failed |= not row[6]
+
+    print(f"{'size':>8}{'backend':>13}{'ingest s':>10}{'reopen ms':>11}{'search ms':>11}{'agree':>8}{'reload':>8}")
+    for size, label, ingest, reopen, search, agree, reloaded in rows:
+        if label == "numpy ivf" and size < args.ivf_lists * IVF_MIN_PER_LIST:
+            label = "ivf (exact)"
+        print(
+            f"{size:>8}{label:>13}{ingest:>10.2f}{reopen * 1e3:>11.1f}{search * 1e3:>11.2f}"
+            f"{agree:>8.0%}{'same' if reloaded else 'DIFF':>8}"
+        )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Recall latency benchmark: whole-collection ranking vs top-k search.
+
+Usage:
+    python benchmarks/vector_recall.py --sizes 1000 10000 100000 --queries 50 --limit 5
+
+For each collection size in ``--sizes`` a fresh episodic store is filled with
+synthetic memories (bulk ``store_many``) and ``--queries`` probe queries are
+timed three ways:
+
+* ``full``: the old ``VectorStore.search``, which asks Chroma for every
+  record (``n_results=count()``) and ranks them all in Python;
+* ``top-k``: ``VectorStore.search(limit=...)``, which fetches only
+  ``limit * overfetch`` nearest candidates;
+* ``retrieve``: ``MemoryManager.retrieve``, which re-scores the bounded
+  candidate set with the importance/recency/similarity weights, once without
+  and once with a ``where`` metadata filter.
+
+The ``agree`` column is the share of queries whose top-k ids match the full
+ranking. ``full`` is reported as failed where Chroma rejects a
+whole-collection query (``too many SQL variables``, around 100k records);
+the old ``search`` swallowed that error and recalled nothing. The script
+exits with status 1 if ``agree`` falls below ``--min-agreement`` or a
+filtered recall returns a memory the filter excludes.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from memory.memory_manager import MemoryManager
+from memory.vector_store import COSINE_THRESHOLD
+
+WORDS = (
+    "hello welcome garden plan trains wrong noise hallway task completed time python loop memory "
+    "brain praise criticism friend music rain morning coffee project deadline river mountain letter "
+    "kitchen window market lesson puzzle story dream engine bridge harbor signal winter summer"
+).split()
+TYPES = ["perception", "reflection", "worldview"]
+
+
+def fill(manager, size, rng, chunk=5000):
+    store = manager.vector_store
+    now = time.time()
+    for start in range(0, size, chunk):
+        records = []
+        for i in range(start, min(size, start + chunk)):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 14)))
+            records.append({
+                "id": f"m{i}",
+                "memory_type": TYPES[i % len(TYPES)],
+                "content": text,
+                "importance": round(rng.random(), 4),
+                "created_at": now - rng.random() * 86400,
+            })
+        store.store_many(records)
+
+
+def full_search(store, query, limit):
+    """The pre-top-k ``VectorStore.search``: rank the whole collection.
+
+    Returns None where the old code's query failed (and it returned no hits).
+    """
+    try:
+        result = store._collection.query(
+            query_texts=[query],
+            n_results=max(store._collection.count(), 1),
+            include=["metadatas", "documents", "distances"],
+        )
+    except Exception:
+        return None
+    hits = []
+    for i, item_id in enumerate(result["ids"][0]):
+        similarity = 1.0 - result["distances"][0][i]
+        if similarity >= COSINE_THRESHOLD:
+            item = store._item_from_result(item_id, result["metadatas"][0][i], result["documents"][0][i])
+            item["_sim"] = similarity
+            hits.append(item)
+    hits.sort(key=lambda it: (-it.get("_sim", 0.0), -int(it.get("times_recalled", 0))))
+    return hits[:limit]
+
+
+def timed(fn, queries):
+    start = time.perf_counter()
+    results = [fn(query) for query in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--min-agreement", type=float, default=0.9)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    queries = [" ".join(rng.choice(WORDS) for _ in range(3)) for _ in range(args.queries)]
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            manager = MemoryManager(storage_path=os.path.join(workdir, str(size), "store.json"))
+            fill(manager, size, random.Random(size))
+            store = manager.vector_store
+            limit = args.limit
+
+            full_seconds, full = timed(lambda q: full_search(store, q, limit), queries)
+            topk_seconds, topk = timed(lambda q: store.search(q, limit=limit), queries)
+            retrieve_seconds, _ = timed(lambda q: manager.retrieve({"query": q}, limit=limit), queries)
+            where_seconds, filtered = timed(
+                lambda q: manager.retrieve({"query": q}, limit=limit, where={"memory_type": "reflection"}), queries
+            )
+            if any(result is None for result in full):
+                # Whole-collection queries fail outright at this size.
+                full_seconds = agree = None
+            else:
+                agree = sum(
+                    [hit["id"] for hit in a] == [hit["id"] for hit in b] for a, b in zip(full, topk)
+                ) / len(queries)
+            filtered_ok = all(mem["memory_type"] == "reflection" for result in filtered for mem in result)
+            rows.append((size, full_seconds, topk_seconds, retrieve_seconds, where_seconds, agree, filtered_ok))
+
+    print(f"{'size':>8}{'full ms':>10}{'top-k ms':>10}{'retrieve ms':>13}{'+where ms':>11}{'speedup':>9}{'agree':>8}")
+    failed = False
+    for size, full_s, topk_s, retrieve_s, where_s, agree, filtered_ok in rows:
+        if full_s is None:
+            full_cells = f"{'failed':>10}"
+            tail_cells = f"{'-':>9}{'-':>8}"
+        else:
+            full_cells = f"{full_s * 1e3:>10.2f}"
+            tail_cells = f"{full_s / topk_s:>8.1f}x{agree:>8.0%}"
+        print(f"{size:>8}{full_cells}{topk_s * 1e3:>10.2f}{retrieve_s * 1e3:>13.2f}{where_s * 1e3:>11.2f}{tail_cells}")
+        failed |= (agree is not None and agree < args.min_agreement) or not filtered_ok
+        if not filtered_ok:
+            print(f"{size:>8}: where filter returned memories of another type")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Checkpoint benchmark: full JSON rewrite vs write-ahead log, by brain age.
+
+Usage:
+    python benchmarks/wal_checkpoint.py --ages 100 500 1000 2000 --samples 20
+
+A deterministic brain perceives one event and ticks once per step, so its
+autobiography, concept memory and language state grow with age. At each age
+in ``--ages`` the next ``--samples`` checkpoints go to two managers:
+
+* ``snapshot``: the default ``MemoryStorage``, which rewrites the whole
+  checkpoint as indented JSON on every save;
+* ``wal``: ``WalStorage``, which appends one compact record of the changed
+  sections and compacts into a snapshot now and then (the compaction cost
+  is included in the mean).
+
+The report gives mean and worst save latency plus the bytes written per save.
+
+The run finishes with crash-recovery checks on the WAL checkpoint. Each
+case must reload the exact state of the last completed save, otherwise the
+script exits with status 1:
+
+* clean reopen (snapshot plus replayed log);
+* torn tail: half of a record appended after the last complete one;
+* corrupt tail: a record whose checksum does not match;
+* crash during compaction: new snapshot written, old log not yet truncated;
+* the recovered state loads into a fresh brain through ``set_state``.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import yaml
+
+from core.brain import VirtualBrain
+from decision.decision_engine import DecisionEngine
+from memory.memory_manager import MemoryManager
+from memory.wal import WalStorage
+
+EVENTS = [
+    {"modality": "hearing", "category": "greeted", "content": "Hello, welcome back", "valence": 0.6, "intensity": 0.5, "source": "user"},
+    {"modality": "hearing", "category": "praise", "content": "Good job on the garden plan", "valence": 0.8, "intensity": 0.6, "source": "user"},
+    {"modality": "hearing", "category": "criticism", "content": "That answer about trains was wrong", "valence": -0.7, "intensity": 0.7, "source": "user"},
+    {"modality": "vision", "category": "threat_detected", "content": "Loud noise in the hallway", "valence": -0.8, "intensity": 0.8, "source": "simulated"},
+    {"modality": "hearing", "category": "success", "content": "Task completed on time", "valence": 0.8, "intensity": 0.6, "source": "user"},
+]
+
+
+def load_yaml(name):
+    with open(os.path.join(PROJECT_ROOT, "config", name)) as f:
+        return yaml.safe_load(f) or {}
+
+
+def build_brain(path, seed=42):
+    random.seed(seed)
+    chemicals = load_yaml("chemicals.yaml")
+    decision = load_yaml("decision.yaml")
+    return VirtualBrain(
+        chemical_configs=chemicals["chemicals"],
+        interaction_matrix=chemicals.get("interactions"),
+        decision_engine=DecisionEngine(decision_config=decision.get("decision", decision), deterministic=True),
+        deterministic=True,
+        memory_storage_path=path,
+    )
+
+
+def step(brain, i):
+    event = dict(EVENTS[i % len(EVENTS)])
+    event["content"] = f"{event['content']} #{i % 97}"
+    brain.perceive(event)
+    brain.tick()
+
+
+def plain(state):
+    return json.loads(json.dumps(state))
+
+
+def timed_save(manager, state):
+    """Seconds spent in ``manager.save(state)`` and bytes it wrote."""
+    storage = manager.storage
+    before = getattr(storage, "bytes_written", 0)
+    start = time.perf_counter()
+    manager.save(state)
+    seconds = time.perf_counter() - start
+    if isinstance(storage, WalStorage):
+        return seconds, storage.bytes_written - before
+    return seconds, os.path.getsize(storage.file_path)
+
+
+def recovery_checks(workdir, path, state, brain_path):
+    expected = plain(state)
+    results = []
+
+    def reopen(label, target):
+        recovered = WalStorage(target).get_all()
+        results.append((label, plain(recovered) == expected))
+        return recovered
+
+    def clone(name):
+        target = os.path.join(workdir, name, "store.json")
+        os.makedirs(os.path.dirname(target))
+        shutil.copy(path, target)
+        if os.path.exists(f"{path}.wal"):
+            shutil.copy(f"{path}.wal", f"{target}.wal")
+        return target
+
+    recovered = reopen("clean reopen", clone("clean"))
+
+    target = clone("torn")
+    with open(f"{path}.wal", "rb") as f:
+        lines = f.read().splitlines(keepends=True)
+    partial = lines[-1][: len(lines[-1]) // 2] if lines else b"0000"
+    with open(f"{target}.wal", "ab") as f:
+        f.write(partial)
+    reopen("torn tail", target)
+
+    target = clone("corrupt")
+    with open(f"{target}.wal", "ab") as f:
+        f.write(b'00000000 [["set","step_counter",0]]\n')
+    reopen("corrupt tail", target)
+
+    target = clone("compaction")
+    with open(f"{target}.wal", "rb") as f:
+        old_log = f.read()
+    storage = WalStorage(target)
+    storage.save()
+    with open(f"{target}.wal", "wb") as f:
+        f.write(old_log)
+    reopen("crash during compaction", target)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        fresh = build_brain(brain_path)
+        fresh.set_state(recovered)
+    results.append(("set_state of recovered state", plain(fresh.get_state())["step_counter"] == expected["step_counter"]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ages", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot_path = os.path.join(workdir, "snapshot", "store.json")
+        wal_path = os.path.join(workdir, "wal", "store.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            brain = build_brain(os.path.join(workdir, "brain", "events.json"))
+            snapshot = MemoryManager(storage_path=snapshot_path)
+            wal = MemoryManager(storage_path=wal_path, persistence={"mode": "wal"})
+
+            age = 0
+            state = None
+            for target in sorted(args.ages):
+                while age < target:
+                    step(brain, age)
+                    age += 1
+                timings = {"snapshot": [], "wal": []}
+                for _ in range(args.samples):
+                    step(brain, age)
+                    age += 1
+                    state = brain.get_state()
+                    timings["snapshot"].append(timed_save(snapshot, state))
+                    timings["wal"].append(timed_save(wal, state))
+                rows.append((target, timings, wal.storage.compactions))
+
+        checks = recovery_checks(workdir, wal_path, state, os.path.join(workdir, "fresh", "events.json"))
+
+    print(f"{'age':>6}{'snapshot ms':>13}{'max':>8}{'KiB/save':>10}{'wal ms':>9}{'max':>8}{'KiB/save':>10}{'speedup':>9}{'compactions':>13}")
+    for target, timings, compactions in rows:
+        cells = []
+        for mode in ("snapshot", "wal"):
+            seconds = [s for s, _ in timings[mode]]
+            size = sum(b for _, b in timings[mode]) / len(timings[mode])
+            cells.append((sum(seconds) / len(seconds), max(seconds), size))
+        (s_mean, s_max, s_size), (w_mean, w_max, w_size) = cells
+        print(
+            f"{target:>6}{s_mean * 1e3:>13.2f}{s_max * 1e3:>8.2f}{s_size / 1024:>10.1f}"
+            f"{w_mean * 1e3:>9.2f}{w_max * 1e3:>8.2f}{w_size / 1024:>10.1f}{s_mean / w_mean:>8.1f}x{compactions:>13}"
+        )
+    print()
+    failed = False
+    for label, ok in checks:
+        print(f"recovery: {label:<32}{'ok' if ok else 'FAILED'}")
+        failed |= not ok
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import os
 import re
+import math
 import json
 import uuid
 import hashlib
 import datetime
-from collections import Counter
+from collections import Counter, OrderedDict
+from functools import lru_cache
 
 import numpy as np
 import chromadb
@@ -14,6 +16,7 @@ KNOWLEDGE_STORE_PATH = "knowledge_db"
 KNOWLEDGE_COLLECTION = "aashu_knowledge"
 EMBEDDING_DIM = 384
 COSINE_THRESHOLD = 0.15
+SEARCH_OVERFETCH = 3
 
 STOPWORDS = {
     "the", "a", "an", "and", "or", "but", "is", "are", "was", "were", "be", "been",
@@ -87,33 +90,82 @@ def extract_topics(text, limit=5):
     return [w for w, _ in counts.most_common(limit)]
 
 
+TOKEN_RE = re.compile(r"[a-zA-Z0-9+#.]+")
+# Keyword matching in one scan. An alphanumeric keyword's _lang_pattern
+# (word boundaries on both sides) matches exactly when the text contains a
+# maximal run of word characters equal to it; the others (c++, c#,
+# scikit-learn) are matched without boundaries, i.e. as substrings.
+WORD_RUN_RE = re.compile(r"\w+")
+WORD_KEYWORDS = frozenset(kw for kw in ALL_KEYWORDS if re.fullmatch(r"[a-zA-Z0-9]+", kw))
+SYMBOL_KEYWORDS = tuple(sorted(ALL_KEYWORDS - WORD_KEYWORDS))
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_bucket(token, dim):
+    return int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16) % dim
+
+
 class HashedEmbeddingFunction(EmbeddingFunction):
     """Deterministic, offline, local embedding: hashed bag-of-words with
-    keyword boosts, normalized to unit length. No external model needed."""
+    keyword boosts, normalized to unit length. No external model needed.
+
+    Token buckets are memoized, counts are accumulated with NumPy and all
+    keywords are found in one scan of the text. Whole-text embeddings are kept
+    in an LRU cache of ``cache_size`` entries keyed by a hash of the text.
+    The vectors are bit-identical to the per-token, per-keyword original."""
 
-    def __init__(self, dim=EMBEDDING_DIM):
+    def __init__(self, dim=EMBEDDING_DIM, cache_size=2048):
         self.dim = dim
+        self.cache_size = max(0, int(cache_size))
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def __call__(self, input):
-        return [self._embed(text) for text in input]
+        return self.embed_many(input).tolist()
+
+    def embed_many(self, texts):
+        """Embed a batch of texts into one ``(n, dim)`` float32 matrix."""
+        texts = list(texts)
+        matrix = np.empty((len(texts), self.dim), dtype=np.float32)
+        cache = self._cache
+        for row, text in enumerate(texts):
+            text = text or ""
+            key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                self.cache_hits += 1
+                matrix[row] = cached
+                continue
+            self.cache_misses += 1
+            vec = self._vector(text)
+            matrix[row] = vec
+            if self.cache_size:
+                cache[key] = vec
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return matrix
 
     def _embed(self, text):
-        vec = np.zeros(self.dim, dtype=np.float32)
-        lowered = (text or "").lower()
-        for word in re.findall(r"[a-zA-Z0-9+#.]+", lowered):
-            if word in STOPWORDS:
-                continue
-            vec[self._bucket(word)] += 1.0
-        for kw in ALL_KEYWORDS:
-            if re.search(_lang_pattern(kw), lowered):
-                vec[self._bucket(kw)] += 2.0
+        return self.embed_many([text])[0].tolist()
+
+    def _vector(self, text):
+        lowered = text.lower()
+        dim = self.dim
+        buckets = [_token_bucket(word, dim) for word in TOKEN_RE.findall(lowered) if word not in STOPWORDS]
+        vec = np.bincount(buckets, minlength=dim).astype(np.float32) if buckets else np.zeros(dim, dtype=np.float32)
+        keywords = set(WORD_RUN_RE.findall(lowered)) & WORD_KEYWORDS
+        keywords.update(kw for kw in SYMBOL_KEYWORDS if kw in lowered)
+        for kw in keywords:
+            vec[_token_bucket(kw, dim)] += 2.0
         norm = float(np.linalg.norm(vec))
         if norm > 0:
             vec = vec / norm
-        return vec.tolist()
+        return vec
 
     def _bucket(self, token):
-        return int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16) % self.dim
+        return _token_bucket(token, self.dim)
 
 
 class VectorStore:
@@ -193,18 +245,35 @@ class VectorStore:
             items.append(self._item_from_result(item_id, metadatas[i], documents[i]))
         return items
 
+    def head(self, limit=5, where=None):
+        """Up to ``limit`` items in storage order, without reading the rest."""
+        try:
+            result = self._collection.get(limit=limit, where=where or None)
+            return self._result_items(result["ids"], result["metadatas"], result["documents"])
+        except Exception:
+            return []
+
     @property
     def items(self):
         result = self._collection.get()
         return self._result_items(result["ids"], result["metadatas"], result["documents"])
 
-    def search(self, query, limit=5):
-        if not query:
+    def search(self, query, limit=5, where=None, overfetch=SEARCH_OVERFETCH):
+        """Top-``limit`` items by cosine similarity to ``query``.
+
+        Only ``limit * overfetch`` nearest candidates are fetched from the
+        index (filtered by the Chroma metadata filter ``where``, if given).
+        They are thresholded and ordered by similarity, then recall count,
+        so the cost depends on ``limit`` and not on the collection size.
+        """
+        if not query or limit <= 0:
             return []
+        candidates = max(limit, int(math.ceil(limit * max(1.0, overfetch))))
         try:
             result = self._collection.query(
                 query_texts=[query],
-                n_results=max(self._collection.count(), 1),
+                n_results=candidates,
+                where=where or None,
                 include=["metadatas", "documents", "distances"],
             )
         except Exception:
@@ -222,8 +291,8 @@ class VectorStore:
         hits.sort(key=lambda it: (-it.get("_sim", 0.0), -int(it.get("times_recalled", 0))))
         return hits[:limit]
 
-    def recall(self, query, limit=5):
-        results = self.search(query, limit=limit)
+    def recall(self, query, limit=5, where=None):
+        results = self.search(query, limit=limit, where=where)
         for item in results:
             new_count = self._bump_recall(item["id"])
             if new_count is not None:
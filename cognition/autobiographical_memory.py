@@ -1,15 +1,337 @@
-from collections import deque
+from collections import defaultdict, deque
+from heapq import heapify, heappop, heappush
+from itertools import islice
+import sys
 import time
 
+import numpy as np
+
 from core.attention import GlobalWorkspace, Thought
 
+# Recall picks the most salient of this many most recent non-system events.
+RECALL_WINDOW = 120
+
+EVENT_KEYS = ("timestamp", "description", "chemicals", "identity", "metadata")
+
+
+class _FloatColumns:
+    """Ring rows of ``{str: float}`` snapshots: one float64 column per key
+    ever seen, plus the key order of each row (interned as a shape id)."""
+
+    def __init__(self, rows):
+        self.values = np.zeros((rows, 0))
+        self.row_shape = np.zeros(rows, dtype=np.int32)
+        self._columns = {}
+        self._shapes = []
+        self._shape_columns = []
+        self._shape_ids = {}
+        self._present = np.zeros((0, 0), dtype=bool)
+
+    def _shape(self, keys):
+        shape = self._shape_ids.get(keys)
+        if shape is None:
+            for key in keys:
+                if key not in self._columns:
+                    self._columns[sys.intern(key)] = len(self._columns)
+            if len(self._columns) > self.values.shape[1]:
+                grown = np.zeros((self.values.shape[0], len(self._columns)))
+                grown[:, :self.values.shape[1]] = self.values
+                self.values = grown
+            shape = self._shape_ids[keys] = len(self._shapes)
+            self._shapes.append(tuple(sys.intern(key) for key in keys))
+            self._shape_columns.append(np.array([self._columns[key] for key in keys], dtype=np.intp))
+            self._present = np.zeros((len(self._shapes), len(self._columns)), dtype=bool)
+            for i, columns in enumerate(self._shape_columns):
+                self._present[i, columns] = True
+        return shape
+
+    def write(self, row, mapping):
+        shape = self._shape(tuple(mapping))
+        self.row_shape[row] = shape
+        self.values[row, self._shape_columns[shape]] = list(mapping.values())
+
+    def read(self, row):
+        shape = self.row_shape[row]
+        return dict(zip(self._shapes[shape], self.values[row, self._shape_columns[shape]].tolist()))
+
+    def read_many(self, rows):
+        """``read`` for each of ``rows``, with one gather per key order."""
+        if not self._shapes:
+            return [None] * len(rows)  # only events kept as given so far
+        shapes = self.row_shape[rows]
+        if len(rows) and (shapes == shapes[0]).all():
+            shape = shapes[0]
+            keys = self._shapes[shape]
+            return [dict(zip(keys, values)) for values in self.values[rows][:, self._shape_columns[shape]].tolist()]
+        return [self.read(row) for row in rows]
+
+    def gather(self, rows, keys, default):
+        """``len(rows) x len(keys)`` values; keys a row lacks read as
+        ``default``."""
+        matrix = np.full((len(rows), len(keys)), float(default))
+        known = [(j, self._columns[key]) for j, key in enumerate(keys) if key in self._columns]
+        if known and len(rows):
+            targets, columns = (np.array(part, dtype=np.intp) for part in zip(*known))
+            present = self._present[self.row_shape[rows][:, None], columns]
+            matrix[:, targets] = np.where(present, self.values[rows[:, None], columns], float(default))
+        return matrix
+
+
+def _columnar(event):
+    """True if ``event`` has the shape ``record_event`` writes, with only
+    float snapshot values, so the columns reproduce it exactly."""
+    if not isinstance(event, dict) or tuple(event) != EVENT_KEYS:
+        return False
+    if type(event["timestamp"]) is not float or type(event["description"]) is not str:
+        return False
+    if not isinstance(event["metadata"], dict):
+        return False
+    for part in ("chemicals", "identity"):
+        snapshot = event[part]
+        if not isinstance(snapshot, dict):
+            return False
+        for key, value in snapshot.items():
+            if type(key) is not str or type(value) is not float:
+                return False
+    return True
+
+
+class EventLog:
+    """Fixed-capacity ring of autobiographical events stored in columns.
+
+    Timestamps and the chemical and identity snapshots live in preallocated
+    float64 arrays (float64, not float32, so every value reads back exactly
+    as recorded); descriptions and snapshot keys are interned strings.
+    Metadata is kept as one tuple of an interned key order id and its values
+    (strings interned), and not at all when empty. An event dict is built only
+    when a caller reads one, so each read returns a new dict with equal
+    content. Events of another shape (restored from an old or hand-edited
+    state) are kept as given.
+
+    Events are addressed by position like a ``deque`` (``len``, indexing,
+    slicing, iteration) or by sequence number: the oldest live event is
+    ``first_seq``, and numbers keep increasing across evictions, so they
+    identify an event for as long as it is live."""
+
+    def __init__(self, maxlen=500, first_seq=0):
+        self.maxlen = maxlen
+        self.first_seq = first_seq
+        self._len = 0
+        self._start = 0
+        self._timestamps = np.zeros(maxlen)
+        self._descriptions = [None] * maxlen
+        self._metadata = [None] * maxlen
+        self._metadata_shapes = []
+        self._metadata_shape_ids = {}
+        self._raw = {}
+        self._snapshots = {"chemicals": _FloatColumns(maxlen), "identity": _FloatColumns(maxlen)}
+
+    @property
+    def next_seq(self):
+        return self.first_seq + self._len
+
+    def __len__(self):
+        return self._len
+
+    def _row(self, seq):
+        return (self._start + seq - self.first_seq) % self.maxlen
+
+    def append(self, event):
+        """Store ``event``, evicting the oldest one when full. Returns its
+        sequence number."""
+        if self._len == self.maxlen:
+            self._raw.pop(self._start, None)
+            self._start = (self._start + 1) % self.maxlen
+            self.first_seq += 1
+            self._len -= 1
+        seq = self.next_seq
+        row = self._row(seq)
+        self._len += 1
+        if not _columnar(event):
+            self._raw[row] = event
+            self._descriptions[row] = None
+            self._metadata[row] = None
+            return seq
+        self._timestamps[row] = event["timestamp"]
+        self._descriptions[row] = sys.intern(event["description"])
+        self._metadata[row] = self._pack_metadata(event["metadata"]) if event["metadata"] else None
+        for part, columns in self._snapshots.items():
+            columns.write(row, event[part])
+        return seq
+
+    def get(self, seq):
+        """The event with sequence number ``seq``, as a new dict."""
+        row = self._row(seq)
+        raw = self._raw.get(row)
+        if raw is not None:
+            return raw
+        return {
+            "timestamp": float(self._timestamps[row]),
+            "description": self._descriptions[row],
+            "chemicals": self._snapshots["chemicals"].read(row),
+            "identity": self._snapshots["identity"].read(row),
+            "metadata": self._unpack_metadata(self._metadata[row]),
+        }
+
+    def get_many(self, seqs):
+        """The events with sequence numbers ``seqs``, as new dicts, reading
+        each column once for all of them."""
+        rows = (self._start + np.asarray(seqs, dtype=np.intp) - self.first_seq) % self.maxlen
+        chemicals = self._snapshots["chemicals"].read_many(rows)
+        identity = self._snapshots["identity"].read_many(rows)
+        timestamps = self._timestamps[rows].tolist()
+        events = []
+        for i, row in enumerate(rows.tolist()):
+            raw = self._raw.get(row)
+            if raw is not None:
+                events.append(raw)
+                continue
+            events.append({
+                "timestamp": timestamps[i],
+                "description": self._descriptions[row],
+                "chemicals": chemicals[i],
+                "identity": identity[i],
+                "metadata": self._unpack_metadata(self._metadata[row]),
+            })
+        return events
+
+    def _pack_metadata(self, metadata):
+        keys = tuple(metadata)
+        shape = self._metadata_shape_ids.get(keys)
+        if shape is None:
+            shape = self._metadata_shape_ids[keys] = len(self._metadata_shapes)
+            self._metadata_shapes.append(tuple(sys.intern(key) if type(key) is str else key for key in keys))
+        return (shape,) + tuple(sys.intern(value) if type(value) is str else value for value in metadata.values())
+
+    def _unpack_metadata(self, packed):
+        if packed is None:
+            return {}
+        return dict(zip(self._metadata_shapes[packed[0]], packed[1:]))
+
+    def description(self, seq):
+        row = self._row(seq)
+        raw = self._raw.get(row)
+        return raw.get("description", "") if raw is not None else self._descriptions[row]
+
+    def seqs(self):
+        return range(self.first_seq, self.next_seq)
+
+    def snapshot_matrix(self, seqs, part, keys, default):
+        """``len(seqs) x len(keys)`` float64 matrix of snapshot values
+        (``part`` is ``"chemicals"`` or ``"identity"``), read straight from
+        the columns. Missing keys read as ``default``; in events kept as
+        given, a dict value reads as its ``"value"`` entry."""
+        rows = (self._start + np.asarray(seqs, dtype=np.intp) - self.first_seq) % self.maxlen
+        matrix = self._snapshots[part].gather(rows, keys, default)
+        for i, row in enumerate(rows.tolist() if self._raw else ()):
+            raw = self._raw.get(row)
+            if raw is None:
+                continue
+            snapshot = raw.get(part, {})
+            for j, key in enumerate(keys):
+                value = snapshot.get(key, default)
+                if isinstance(value, dict):
+                    value = value.get("value", default)
+                matrix[i, j] = float(value)
+        return matrix
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.get_many(range(self.first_seq, self.next_seq)[index])
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("event index out of range")
+        return self.get(self.first_seq + index)
+
+    def __iter__(self):
+        return iter(self.get_many(self.seqs()))
+
+    def __reversed__(self):
+        return iter(self.get_many(self.seqs()[::-1]))
+
 
 class AutobiographicalMemory:
+    """Bounded log of life events with secondary indexes.
+
+    ``events`` is an :class:`EventLog`: the events are kept in columns and
+    materialized as dicts only when read. Every event has a sequence
+    number, so an index entry is stale exactly when its number is below
+    ``events.first_seq``. Indexes kept as events are appended: the most
+    recent non-system events (``RECALL_WINDOW`` of them) with a max-heap on
+    salience for recall selection, the events that are not ``cycle_step``
+    records (for associative replay), and the events per metadata category
+    and per recall kind (:meth:`_classify_recall_event`). The system-event
+    check and the salience are computed once per event. Assigning
+    ``events`` (state restore) rebuilds the log and the indexes; sequence
+    numbers carry on from the previous log."""
+
     SYSTEM_EVENT_KEYS = {"cycle_step", "internal_process", "tick", "update"}
 
     def __init__(self, max_events=500):
-        self.events = deque(maxlen=max_events)
         self._last_recalled_description = ""
+        self.version = 0
+        self.events = EventLog(maxlen=max_events)
+
+    @property
+    def events(self):
+        return self._events
+
+    @events.setter
+    def events(self, events):
+        previous = getattr(self, "_events", None)
+        if not isinstance(events, EventLog):
+            maxlen = getattr(events, "maxlen", None) or (previous.maxlen if previous else 500)
+            log = EventLog(maxlen=maxlen, first_seq=previous.next_seq if previous else 0)
+            for event in events:
+                log.append(event)
+            events = log
+        self._events = events
+        self._categories = deque(maxlen=events.maxlen)
+        self._kinds = deque(maxlen=events.maxlen)
+        self._recallable = deque(maxlen=RECALL_WINDOW)
+        self._salience_heap = []
+        self._replayable = deque()
+        self._by_category = defaultdict(deque)
+        self._by_kind = defaultdict(deque)
+        for seq in events.seqs():
+            self._index(seq, events.get(seq))
+
+    def _index(self, seq, event):
+        description = event.get("description", "")
+        metadata = event.get("metadata", {}) or {}
+        category = sys.intern(str(metadata.get("category", "") or "").lower())
+        kind = self._classify_recall_event(event)
+        self._categories.append(category)
+        self._kinds.append(kind)
+        self._by_category[category].append(seq)
+        self._by_kind[kind].append(seq)
+        if "cycle_step" not in str(description):
+            self._replayable.append(seq)
+        if not self._is_system_event(description):
+            self._recallable.append(seq)
+            heappush(self._salience_heap, (-self._event_salience(event), -seq))
+            if len(self._salience_heap) > 4 * RECALL_WINDOW:
+                floor = self._recallable[0]
+                self._salience_heap = [entry for entry in self._salience_heap if -entry[1] >= floor]
+                heapify(self._salience_heap)
+
+    def _evict_oldest(self):
+        seq = self._events.first_seq
+        category, kind = self._categories[0], self._kinds[0]
+        for index in (self._by_category[category], self._by_kind[kind], self._replayable, self._recallable):
+            if index and index[0] == seq:
+                index.popleft()
+        if not self._by_category[category]:
+            del self._by_category[category]
+        if not self._by_kind[kind]:
+            del self._by_kind[kind]
+
+    def _recent_seqs(self, seqs, n):
+        return list(islice(reversed(seqs), n))[::-1]
+
+    def _recent(self, seqs, n):
+        return self._events.get_many(self._recent_seqs(seqs, n))
 
     def record_event(self, description, chemicals, identity_snapshot, metadata=None):
         event = {
@@ -19,10 +341,35 @@ class AutobiographicalMemory:
             "identity": identity_snapshot.copy(),
             "metadata": metadata or {},
         }
-        self.events.append(event)
+        if len(self._events) == self._events.maxlen:
+            self._evict_oldest()
+        self._index(self._events.append(event), event)
+        self.version += 1
+        return event
 
     def get_recent_events(self, n=50):
-        return list(self.events)[-n:]
+        return self._events[-n:]
+
+    def replayable_events(self, n=60):
+        """The ``n`` most recent events that are not ``cycle_step`` records,
+        oldest first."""
+        return self._recent(self._replayable, n)
+
+    def replayable_seqs(self, n=60):
+        """Sequence numbers of :meth:`replayable_events`, for reading their
+        snapshots with ``events.snapshot_matrix`` without building dicts."""
+        return self._recent_seqs(self._replayable, n)
+
+    def events_by_category(self, category, n=50):
+        """The ``n`` most recent events whose metadata category is
+        ``category`` (case-insensitive), oldest first."""
+        return self._recent(self._by_category.get(str(category or "").lower(), ()), n)
+
+    def events_by_kind(self, kind, n=50):
+        """The ``n`` most recent events of a recall kind (``threat``,
+        ``failure``, ``social_pain``, ``positive`` or ``neutral``), oldest
+        first."""
+        return self._recent(self._by_kind.get(kind, ()), n)
 
     @classmethod
     def _is_system_event(cls, description: str) -> bool:
@@ -30,21 +377,32 @@ class AutobiographicalMemory:
         return any(key in text for key in cls.SYSTEM_EVENT_KEYS)
 
     def _select_recall_event(self):
-        if not self.events:
+        """Most salient of the ``RECALL_WINDOW`` most recent non-system
+        events (newest first on ties), skipping the last recalled
+        description when another event is available. Falls back to the
+        latest event when every event is a system event."""
+        if not self._events:
             return None
-        latest = self.events[-1]
-        candidates = [ev for ev in reversed(self.events) if not self._is_system_event(ev.get("description", ""))]
-        if candidates:
-            recent_candidates = candidates[:120]
-            scored = sorted(recent_candidates, key=self._event_salience, reverse=True)
-            selected = scored[0]
-            for ev in scored:
-                if ev.get("description", "") != self._last_recalled_description:
-                    selected = ev
-                    break
-            self._last_recalled_description = str(selected.get("description", ""))
-            return selected
-        return latest
+        if not self._recallable:
+            return self._events[-1]
+        floor = self._recallable[0]
+        heap = self._salience_heap
+        popped = []
+        selected = None
+        while heap:
+            entry = heappop(heap)
+            if -entry[1] < floor:
+                continue  # left the recall window; never comes back
+            popped.append(entry)
+            if self._events.description(-entry[1]) != self._last_recalled_description:
+                selected = self._events.get(-entry[1])
+                break
+        for entry in popped:
+            heappush(heap, entry)
+        if selected is None:
+            selected = self._events.get(-popped[0][1])
+        self._last_recalled_description = str(selected.get("description", ""))
+        return selected
 
     @staticmethod
     def _classify_recall_event(event: dict) -> str:
@@ -12,7 +12,7 @@ from collections import deque
 from typing import Any
 
 from cognition.belief_engine import BeliefEngine, _clamp
-from cognition.pattern_detectors import PatternDetector, build_default_detectors
+from cognition.pattern_detectors import PatternDetector, PatternWindow, build_default_detectors
 
 
 class EnhancedBeliefEngine(BeliefEngine):
@@ -29,6 +29,14 @@ class EnhancedBeliefEngine(BeliefEngine):
                 self.pattern_detectors[name] = detector
         self.pattern_log: deque[dict[str, Any]] = deque(maxlen=200)
         self.last_pattern_summary: list[dict[str, Any]] = []
+        # Fed by observe_event; rebuilt from the extraction window whenever
+        # it does not hold that window (e.g. after the events were restored).
+        self.pattern_window = PatternWindow(self.event_window, self.pattern_detectors)
+        self.pattern_window_rebuilds = 0
+
+    def observe_event(self, event: dict) -> None:
+        """Feed a newly recorded event to the streaming pattern detectors."""
+        self.pattern_window.push(event)
 
     def extract_beliefs(
         self,
@@ -55,8 +63,13 @@ class EnhancedBeliefEngine(BeliefEngine):
         smooth = self.confidence_smoothing * (1.0 + min(0.3, max(0.0, reflection_depth) / 25.0))
         smooth = _clamp(smooth, 0.08, 0.8)
 
+        if not self.pattern_window.matches(window):
+            self.pattern_window.reset(window)
+            self.pattern_window_rebuilds += 1
+        patterns = self.pattern_window.results()
+
         for name, detector in self.pattern_detectors.items():
-            pattern = detector.detect_pattern(window)
+            pattern = patterns[name]
             if not pattern.get("detected"):
                 continue
 
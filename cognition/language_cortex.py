@@ -2,7 +2,6 @@ import re
 from collections import Counter
 
 from cognition.language_grammar import LANGUAGES as GRAMMAR_LANGUAGES, get_language as get_grammar_language
-from cognition.code_engine import CodeEngine
 
 LANGUAGE_ALIASES = {
     "py": "python", "python3": "python", "python2": "python",
@@ -335,7 +334,17 @@ class LanguageCortex:
 
     def __init__(self):
         self.languages = {}
-        self.code_engine = CodeEngine()
+        self._code_engine = None
+        self.version = 0
+
+    @property
+    def code_engine(self):
+        # Built on the first code generation; most brains never generate code.
+        if self._code_engine is None:
+            from cognition.code_engine import CodeEngine
+
+            self._code_engine = CodeEngine()
+        return self._code_engine
 
     def knows(self, language):
         return normalize_language(language) in self.languages
@@ -347,6 +356,7 @@ class LanguageCortex:
         lang = normalize_language(language)
         entry = self.languages.setdefault(lang, {"snippets": [], "source": source, "entries": 0})
         entry["entries"] = int(entry.get("entries", 0)) + 1
+        self.version += 1
         if source and entry["source"] == "learning":
             entry["source"] = source
         snippet = (content or "").strip()
@@ -496,3 +506,4 @@ class LanguageCortex:
             }
             for lang, entry in state.items()
         }
+        self.version += 1
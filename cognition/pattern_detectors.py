@@ -3,11 +3,16 @@
 Each detector scans a window of lived events and reports whether a recurring
 pattern is present, how strongly, and how much evidence supports it. Detectors
 are deterministic and side-effect free so they can be unit-tested in isolation.
+
+The default detectors can also run streaming: a :class:`PatternWindow` feeds
+them each event as it is recorded and each event as it leaves the window, and
+they keep the counts and tallies ``detect_pattern`` would compute, so reading
+a result costs O(1) instead of a rescan of the window.
 """
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, deque
 from typing import Any
 
 CRITICISM_CATEGORIES = {"criticism", "negative_feedback", "correction", "reprimand"}
@@ -90,14 +95,194 @@ def _preceding_categories(events: list[dict], match_indices: set[int]) -> dict[s
     return {cat: round(times / total, 4) for cat, times in preceded.items()}
 
 
+class _MatchTally:
+    """Streaming form of the per-match statistics over a :class:`PatternWindow`.
+
+    Keeps the number of matching events, the adjacent matching pairs behind
+    ``_temporal_density`` and, with ``context``, the (match, prior event)
+    pairs behind ``_preceding_categories`` and the matches with a task event
+    among their 3 prior events.
+    """
+
+    def __init__(self, categories: set[str], context: bool = False) -> None:
+        self.categories = categories
+        self.context = context
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.adjacent = 0
+        # category -> (match position, prior position) pairs in window order
+        self.preceded: dict[str, deque[tuple[int, int]]] = {}
+        self.tasks_before: dict[int, int] = {}
+        self.task_preceded = 0
+
+    def push(self, window: PatternWindow, pos: int, category: str) -> None:
+        if category not in self.categories:
+            return
+        self.count += 1
+        if pos > window.start and window.category(pos - 1) in self.categories:
+            self.adjacent += 1
+        if not self.context:
+            return
+        tasks = 0
+        for prior in range(max(window.start, pos - 3), pos):
+            prior_category = window.category(prior)
+            if prior_category:
+                self.preceded.setdefault(prior_category, deque()).append((pos, prior))
+            if prior_category in TASK_CATEGORIES:
+                tasks += 1
+        self.tasks_before[pos] = tasks
+        if tasks:
+            self.task_preceded += 1
+
+    def evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        # ``pos`` is the oldest event; everything before it has already gone.
+        end = window.end
+        if category in self.categories:
+            self.count -= 1
+            if pos + 1 < end and window.category(pos + 1) in self.categories:
+                self.adjacent -= 1
+            self.tasks_before.pop(pos, None)
+        if not self.context:
+            return
+        for match in range(pos + 1, min(pos + 4, end)):
+            if window.category(match) not in self.categories:
+                continue
+            if category:
+                pairs = self.preceded[category]
+                pairs.remove((match, pos))
+                if not pairs:
+                    del self.preceded[category]
+            if category in TASK_CATEGORIES:
+                self.tasks_before[match] -= 1
+                if not self.tasks_before[match]:
+                    self.task_preceded -= 1
+
+    def temporal_density(self) -> float:
+        if self.count < 2:
+            return 1.0
+        return min(1.0, (self.adjacent + 1) / self.count)
+
+    def preceding_categories(self, window: PatternWindow) -> dict[str, float]:
+        # A match at the start of the window has no prior events to count.
+        count = self.count - (1 if len(window) and window.category(window.start) in self.categories else 0)
+        if count == 0:
+            return {}
+        total = sum(len(pairs) for pairs in self.preceded.values()) or 1
+        # Categories in the order the batch scan first meets them.
+        ordered = sorted(self.preceded.items(), key=lambda item: item[1][0])
+        return {cat: round(len(pairs) / total, 4) for cat, pairs in ordered}
+
+
+class PatternWindow:
+    """Sliding window of the last ``size`` events feeding streaming detectors.
+
+    :meth:`push` costs O(1) per detector. :meth:`results` returns what each
+    detector's ``detect_pattern`` would return for :meth:`events`.
+    Detectors without streaming support are run in batch over the window.
+    """
+
+    def __init__(self, size: int, detectors: dict[str, PatternDetector]) -> None:
+        self.size = max(1, int(size))
+        self.detectors = detectors
+        self.reset()
+
+    def reset(self, events: list[dict] | None = None) -> None:
+        """Empty the window, then push ``events`` (oldest first)."""
+        self._events: deque[dict] = deque()
+        self._categories: deque[str] = deque()
+        self.start = 0
+        for detector in self.detectors.values():
+            detector.reset_stream()
+        for event in list(events or [])[-self.size:]:
+            self.push(event)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self._categories)
+
+    def category(self, pos: int) -> str:
+        """Category of the event at absolute position ``pos``."""
+        return self._categories[pos - self.start]
+
+    def events(self) -> list[dict]:
+        return list(self._events)
+
+    def push(self, event: dict) -> None:
+        if len(self._events) == self.size:
+            self._evict()
+        category = _category(event)
+        pos = self.end
+        self._events.append(event)
+        self._categories.append(category)
+        for detector in self.detectors.values():
+            detector.stream_push(self, pos, category)
+
+    def _evict(self) -> None:
+        pos = self.start
+        category = self._categories[0]
+        for detector in self.detectors.values():
+            detector.stream_evict(self, pos, category)
+        self._events.popleft()
+        self._categories.popleft()
+        self.start += 1
+
+    def matches(self, events: list[dict]) -> bool:
+        """Whether the window holds ``events``: the same number of events,
+        each with the timestamp, description and category of its counterpart.
+
+        Events still shared with the recording memory compare by identity,
+        so the usual check costs one pointer comparison per event.
+        """
+        if len(events) != len(self._events):
+            return False
+        return all(_same_event(a, b) for a, b in zip(events, self._events))
+
+    def results(self) -> dict[str, dict[str, Any]]:
+        return {name: detector.stream_result(self) for name, detector in self.detectors.items()}
+
+
+def _same_event(a: dict, b: dict) -> bool:
+    if a is b:
+        return True
+    if not isinstance(a, dict) or not isinstance(b, dict):
+        return False
+    return (
+        a.get("timestamp") == b.get("timestamp")
+        and a.get("description") == b.get("description")
+        and _category(a) == _category(b)
+    )
+
+
 class PatternDetector:
-    """Base class for detecting recurring patterns in lived events."""
+    """Base class for detecting recurring patterns in lived events.
+
+    Subclasses implement ``detect_pattern``; to run streaming they also
+    implement the ``reset_stream``/``stream_push``/``stream_evict``/
+    ``stream_result`` hooks, which by default fall back to a batch scan.
+    """
 
     min_evidence: int = 1
 
     def detect_pattern(self, events: list[dict]) -> dict[str, Any]:
         raise NotImplementedError
 
+    def reset_stream(self) -> None:
+        pass
+
+    def stream_push(self, window: PatternWindow, pos: int, category: str) -> None:
+        pass
+
+    def stream_evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        pass
+
+    def stream_result(self, window: PatternWindow) -> dict[str, Any]:
+        return self.detect_pattern(window.events())
+
     @staticmethod
     def calculate_confidence(pattern_strength: float, evidence_count: int) -> float:
         base_confidence = min(0.9, max(0.0, float(pattern_strength)) * 2.0)
@@ -120,20 +305,54 @@ class CriticismPatternDetector(PatternDetector):
         if len(criticism_indices) < self.min_evidence or total == 0:
             return self._undetected(len(criticism_indices))
 
-        temporal_density = _temporal_density(criticism_indices)
-        context = _preceding_categories(events, set(criticism_indices))
         attempt_preceded = sum(
             1
             for idx in criticism_indices
             if any(_is_task(e) for e in events[max(0, idx - 3): idx])
         )
-        context_bonus = attempt_preceded / max(1, len(criticism_indices))
+        return self._result(
+            len(criticism_indices),
+            total,
+            _temporal_density(criticism_indices),
+            _preceding_categories(events, set(criticism_indices)),
+            attempt_preceded,
+        )
+
+    def reset_stream(self) -> None:
+        self._tally = _MatchTally(CRITICISM_CATEGORIES, context=True)
+
+    def stream_push(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._tally.push(window, pos, category)
+
+    def stream_evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._tally.evict(window, pos, category)
+
+    def stream_result(self, window: PatternWindow) -> dict[str, Any]:
+        tally = self._tally
+        if tally.count < self.min_evidence or len(window) == 0:
+            return self._undetected(tally.count)
+        return self._result(
+            tally.count,
+            len(window),
+            tally.temporal_density(),
+            tally.preceding_categories(window),
+            tally.task_preceded,
+        )
 
-        pattern_strength = (len(criticism_indices) / total) * temporal_density * (0.6 + 0.4 * context_bonus)
+    def _result(
+        self,
+        count: int,
+        total: int,
+        temporal_density: float,
+        context: dict[str, float],
+        attempt_preceded: int,
+    ) -> dict[str, Any]:
+        context_bonus = attempt_preceded / max(1, count)
+        pattern_strength = (count / total) * temporal_density * (0.6 + 0.4 * context_bonus)
         return {
             "detected": pattern_strength > 0.15,
             "strength": round(pattern_strength, 4),
-            "evidence_count": len(criticism_indices),
+            "evidence_count": count,
             "temporal_density": round(temporal_density, 4),
             "context_patterns": context,
             "belief_statement": "Criticism often follows my attempts.",
@@ -152,16 +371,78 @@ class SuccessFailurePatternDetector(PatternDetector):
         if len(task_events) < self.min_evidence:
             return self._undetected(len(task_events))
 
-        successes = sum(1 for _, e in task_events if _is_success(e))
-        failures = sum(1 for _, e in task_events if _is_failure(e))
-        success_rate = successes / len(task_events)
-        failure_rate = failures / len(task_events)
-
         midpoint = len(task_events) // 2
         first_half = task_events[:max(1, midpoint)]
         second_half = task_events[midpoint:]
-        first_rate = sum(1 for _, e in first_half if _is_success(e)) / len(first_half)
-        second_rate = sum(1 for _, e in second_half if _is_success(e)) / len(second_half)
+        return self._result(
+            len(task_events),
+            sum(1 for _, e in task_events if _is_success(e)),
+            sum(1 for _, e in task_events if _is_failure(e)),
+            sum(1 for _, e in first_half if _is_success(e)),
+            sum(1 for _, e in second_half if _is_success(e)),
+        )
+
+    def reset_stream(self) -> None:
+        # Outcome of each task event in the window (True for a success), the
+        # totals, and the successes among the first ``max(1, n // 2)``.
+        self._outcomes: deque[bool] = deque()
+        self._successes = 0
+        self._failures = 0
+        self._head = 0
+        self._head_successes = 0
+
+    def stream_push(self, window: PatternWindow, pos: int, category: str) -> None:
+        if category not in TASK_CATEGORIES:
+            return
+        success = category in SUCCESS_CATEGORIES
+        self._outcomes.append(success)
+        self._successes += success
+        self._failures += category in FAILURE_CATEGORIES
+        self._move_midpoint()
+
+    def stream_evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        if category not in TASK_CATEGORIES:
+            return
+        success = self._outcomes.popleft()
+        self._successes -= success
+        self._failures -= category in FAILURE_CATEGORIES
+        self._head -= 1
+        self._head_successes -= success
+        self._move_midpoint()
+
+    def _move_midpoint(self) -> None:
+        # The first half changes by at most one event per push or eviction.
+        target = max(1, len(self._outcomes) // 2) if self._outcomes else 0
+        while self._head < target:
+            self._head_successes += self._outcomes[self._head]
+            self._head += 1
+        while self._head > target:
+            self._head -= 1
+            self._head_successes -= self._outcomes[self._head]
+
+    def stream_result(self, window: PatternWindow) -> dict[str, Any]:
+        total = len(self._outcomes)
+        if total < self.min_evidence:
+            return self._undetected(total)
+        # The second half starts at ``n // 2``, which is the first half's end
+        # unless a single event makes up both.
+        second_successes = self._successes - (self._head_successes if total // 2 == self._head else 0)
+        return self._result(total, self._successes, self._failures, self._head_successes, second_successes)
+
+    def _result(
+        self,
+        total: int,
+        successes: int,
+        failures: int,
+        first_successes: int,
+        second_successes: int,
+    ) -> dict[str, Any]:
+        success_rate = successes / total
+        failure_rate = failures / total
+
+        midpoint = total // 2
+        first_rate = first_successes / max(1, midpoint)
+        second_rate = second_successes / (total - midpoint)
         learning_trajectory = second_rate - first_rate
 
         pattern_strength = abs(success_rate - failure_rate)
@@ -172,12 +453,12 @@ class SuccessFailurePatternDetector(PatternDetector):
             statement = "Persistent effort helps me solve challenges."
             category = "task"
         else:
-            return self._undetected(len(task_events))
+            return self._undetected(total)
 
         return {
             "detected": pattern_strength > 0.2,
             "strength": round(pattern_strength, 4),
-            "evidence_count": len(task_events),
+            "evidence_count": total,
             "success_rate": round(success_rate, 4),
             "failure_rate": round(failure_rate, 4),
             "learning_trajectory": round(learning_trajectory, 4),
@@ -193,18 +474,37 @@ class SocialRejectionPatternDetector(PatternDetector):
 
     def detect_pattern(self, events: list[dict]) -> dict[str, Any]:
         events = list(events or [])
-        rejections = [i for i, e in enumerate(events) if _is_rejection(e)]
-        supports = [i for i, e in enumerate(events) if _is_support(e)]
-        attempts = len(rejections) + len(supports)
+        return self._result(
+            sum(1 for e in events if _is_rejection(e)),
+            sum(1 for e in events if _is_support(e)),
+        )
+
+    def reset_stream(self) -> None:
+        self._rejections = 0
+        self._supports = 0
+
+    def stream_push(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._rejections += category in REJECTION_CATEGORIES
+        self._supports += category in SUPPORT_CATEGORIES
+
+    def stream_evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._rejections -= category in REJECTION_CATEGORIES
+        self._supports -= category in SUPPORT_CATEGORIES
+
+    def stream_result(self, window: PatternWindow) -> dict[str, Any]:
+        return self._result(self._rejections, self._supports)
+
+    def _result(self, rejections: int, supports: int) -> dict[str, Any]:
+        attempts = rejections + supports
         if attempts < self.min_evidence:
             return self._undetected(attempts)
 
-        rejection_ratio = len(rejections) / attempts
+        rejection_ratio = rejections / attempts
         pattern_strength = abs(rejection_ratio - 0.5) * 2.0
         if rejection_ratio > 0.52:
             statement = "Reaching out often leads to rejection."
             category = "social"
-        elif (len(supports) / attempts) > 0.5:
+        elif (supports / attempts) > 0.5:
             statement = "Supportive connections are available to me."
             category = "social"
         else:
@@ -231,13 +531,29 @@ class ThreatPatternDetector(PatternDetector):
         threat_indices = [i for i, e in enumerate(events) if _is_threat(e)]
         if len(threat_indices) < self.min_evidence or total == 0:
             return self._undetected(len(threat_indices))
+        return self._result(len(threat_indices), total, _temporal_density(threat_indices))
 
-        temporal_density = _temporal_density(threat_indices)
-        pattern_strength = (len(threat_indices) / total) * temporal_density
+    def reset_stream(self) -> None:
+        self._tally = _MatchTally(THREAT_CATEGORIES)
+
+    def stream_push(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._tally.push(window, pos, category)
+
+    def stream_evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._tally.evict(window, pos, category)
+
+    def stream_result(self, window: PatternWindow) -> dict[str, Any]:
+        tally = self._tally
+        if tally.count < self.min_evidence or len(window) == 0:
+            return self._undetected(tally.count)
+        return self._result(tally.count, len(window), tally.temporal_density())
+
+    def _result(self, count: int, total: int, temporal_density: float) -> dict[str, Any]:
+        pattern_strength = (count / total) * temporal_density
         return {
             "detected": pattern_strength > 0.12,
             "strength": round(pattern_strength, 4),
-            "evidence_count": len(threat_indices),
+            "evidence_count": count,
             "temporal_density": round(temporal_density, 4),
             "belief_statement": "The environment often feels unsafe.",
             "belief_category": "self",
@@ -251,18 +567,49 @@ class NoveltyAdaptationPatternDetector(PatternDetector):
 
     def detect_pattern(self, events: list[dict]) -> dict[str, Any]:
         events = list(events or [])
-        novelty_count = sum(1 for e in events if _is_novelty(e))
         task_events = [e for e in events if _is_task(e)]
-        if novelty_count < self.min_evidence or len(task_events) < 3:
+        return self._result(
+            sum(1 for e in events if _is_novelty(e)),
+            len(task_events),
+            sum(1 for e in task_events if _is_success(e)),
+            sum(1 for e in task_events if _is_failure(e)),
+            len(events),
+        )
+
+    def reset_stream(self) -> None:
+        self._novelty = 0
+        self._tasks = 0
+        self._successes = 0
+        self._failures = 0
+
+    def stream_push(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._tally(category, 1)
+
+    def stream_evict(self, window: PatternWindow, pos: int, category: str) -> None:
+        self._tally(category, -1)
+
+    def _tally(self, category: str, delta: int) -> None:
+        if category in NOVELTY_CATEGORIES:
+            self._novelty += delta
+        elif category in TASK_CATEGORIES:
+            self._tasks += delta
+            if category in SUCCESS_CATEGORIES:
+                self._successes += delta
+            elif category in FAILURE_CATEGORIES:
+                self._failures += delta
+
+    def stream_result(self, window: PatternWindow) -> dict[str, Any]:
+        return self._result(self._novelty, self._tasks, self._successes, self._failures, len(window))
+
+    def _result(self, novelty_count: int, tasks: int, successes: int, failures: int, total: int) -> dict[str, Any]:
+        if novelty_count < self.min_evidence or tasks < 3:
             return self._undetected(novelty_count)
 
-        successes = sum(1 for e in task_events if _is_success(e))
-        failures = sum(1 for e in task_events if _is_failure(e))
         success_rate = successes / max(1, successes + failures)
         if success_rate < 0.55:
             return self._undetected(novelty_count)
 
-        pattern_strength = (novelty_count / max(1, len(events))) * success_rate
+        pattern_strength = (novelty_count / max(1, total)) * success_rate
         return {
             "detected": pattern_strength > 0.08,
             "strength": round(pattern_strength, 4),
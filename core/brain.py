@@ -14,10 +14,18 @@ from core.autobiographical_memory import AutobiographicalMemory
 from core.consciousness import Consciousness
 from core.development import DynamicDevelopment
 from core.engine import BrainEngine
+from core.vector_engine import VectorBrainEngine
+from core.idle import IdleChemistry
+from core.hopfield import HopfieldNetwork
 from core.identity import DynamicIdentity
 from core.interactions import Interactions
 from core.internal_thoughts import generate_spontaneous
 from core.self_reflection import SelfReflection
+from core.snapshot import StateSnapshots
+from core.concept_store import ConceptEntry, ConceptStore
+from core.tick_batch import TickBatch
+from core.tick_pipeline import TickContext, TickPipeline
+from core.instrumentation import Instrumentation
 from chemicals.registry import ChemicalRegistry
 from bias.bias_engine import BiasEngine
 from development.attachment_system import AttachmentSystem
@@ -85,7 +93,6 @@ from cognition.belief_engine import BeliefEngine
 from cognition.enhanced_belief_engine import EnhancedBeliefEngine
 from cognition.narrative_engine import NarrativeEngine
 from cognition.language_cortex import LanguageCortex
-from cognition.app_builder import AppBuilder
 
 from decision.strategic_planner import StrategicPlanner
 from learning.appraisal_engine import AppraisalEngine
@@ -192,6 +199,9 @@ DEFAULT_BRAIN_CONFIG: dict[str, Any] = {
         "concept_confidence_weight": 0.4,
         "concept_salience_weight": 0.4,
         "concept_relations_max": 20,
+        "concept_capacity": 5000,
+        "concept_recency_half_life": 2000.0,
+        "concept_evict_fraction": 0.1,
         "stage_boundaries": {
             "teen_maturity": 0.45,
             "teen_experience": 3.0,
@@ -244,6 +254,55 @@ DEFAULT_BRAIN_CONFIG: dict[str, Any] = {
         "endorphin_serotonin_boost": 0.1,
     },
     "hopfield": {"neurons": 9, "binarize_threshold": 50.0, "ach_scale_min": 0.3, "ach_scale_max": 1.2},
+    "chemistry": {"engine": "dict"},
+    "planner": {"depth": 2, "time_budget_ms": 0.0, "state_quantum": 0.0001, "table_size": 4096},
+    "appraisal": {"cache_quantum": 0.0001, "cache_size": 4096, "cache_audit_every": 0},
+}
+
+
+# =====================================================
+# DEFAULT ENGINE CONFIG (mirrors config/engine.yaml)
+# =====================================================
+
+CHEMISTRY_STEPS = {
+    "interactions": "apply_interactions",
+    "homeostasis": "apply_homeostasis",
+    "noise": "apply_noise",
+    "clamp": "clamp",
+}
+
+DEFAULT_ENGINE_CONFIG: dict[str, Any] = {
+    "deterministic_mode": False,
+    "update_order": ["interactions", "homeostasis", "noise", "clamp"],
+    "tick_rate": {"mode": "per_event", "interval_ms": 0},
+    "simulation_defaults": {"cycles": 1000, "log_interval": 100},
+    "stability": {"enable_homeostasis": True, "enable_noise": True, "enable_interactions": True},
+    "noise_control": {"global_noise_multiplier": 1.0},
+    "homeostasis_control": {"global_decay_multiplier": 1.0},
+    "debug": {"verbose_logging": False},
+    "pipeline": {"history_size": 100, "stages": {}},
+    "instrumentation": {"enabled": False, "window": 2048},
+    "persistence": {
+        "mode": "snapshot",
+        "format": "json",
+        "wal_compact_records": 1000,
+        "wal_compact_ratio": 2.0,
+        "wal_fsync": False,
+        "section_segment_size": 64,
+        "writer_min_interval": 0.5,
+        "writer_max_staleness": 5.0,
+    },
+    "episodic_memory": {
+        "flush_size": 25,
+        "flush_max_age": 5.0,
+        "vector_backend": "chroma",
+        "ivf_lists": 0,
+        "ivf_probes": 16,
+        "decay_period": 3600.0,
+        "prune_below": 0.0,
+    },
+    "user_memory": {"vector_backend": "chroma", "compact_every": 0},
+    "autobiography": {"max_events": 500},
 }
 
 
@@ -269,10 +328,12 @@ class VirtualBrain:
         worldview_config: dict | None = None,
         global_workspace: Any = None,
         brain_config: dict | None = None,
+        engine_config: dict | None = None,
     ):
         self.deterministic = deterministic
         self.feedback_multiplier = feedback_multiplier
         self.brain_config = _deep_merge(DEFAULT_BRAIN_CONFIG, brain_config)
+        self.engine_config = _deep_merge(DEFAULT_ENGINE_CONFIG, engine_config)
         self.decision_feedback_scale = float(self.brain_config["decision_feedback"]["scale"])
         self.love_score = 0.0
         self.loved_source = None
@@ -286,7 +347,9 @@ class VirtualBrain:
         self.development = DynamicDevelopment()
         self.consciousness = Consciousness()
 
-        self.autobiography = AutobiographicalMemory()
+        self.autobiography = AutobiographicalMemory(
+            max_events=int(self.engine_config["autobiography"]["max_events"])
+        )
         self.narrative_engine = NarrativeEngine()
         if isinstance(worldview_config, dict) and worldview_config.get("engine") == "enhanced":
             self.worldview = EnhancedBeliefEngine(worldview_config)
@@ -294,11 +357,20 @@ class VirtualBrain:
             self.worldview = BeliefEngine(worldview_config)
 
         self.similarity_engine = SimilarityEngine()
-        self.appraisal_engine = AppraisalEngine(similarity_engine=self.similarity_engine)
+        self.appraisal_engine = AppraisalEngine(
+            similarity_engine=self.similarity_engine,
+            cache_quantum=float(self.brain_config["appraisal"]["cache_quantum"]),
+            cache_size=int(self.brain_config["appraisal"]["cache_size"]),
+            cache_audit_every=int(self.brain_config["appraisal"]["cache_audit_every"]),
+        )
         self.strategic_planner = StrategicPlanner(
             appraisal_engine=self.appraisal_engine,
             similarity_engine=self.similarity_engine,
             identity=self.identity,
+            depth=int(self.brain_config["planner"]["depth"]),
+            time_budget_ms=float(self.brain_config["planner"]["time_budget_ms"]),
+            state_quantum=float(self.brain_config["planner"]["state_quantum"]),
+            table_size=int(self.brain_config["planner"]["table_size"]),
         )
         self.self_reflection = SelfReflection(
             appraisal_engine=self.appraisal_engine,
@@ -311,14 +383,27 @@ class VirtualBrain:
             or os.getenv("BRAIN_MEMORY_PATH")
             or "memory_events.json"
         )
-        self.memory_manager = MemoryManager(storage_path=self.memory_storage_path)
+        self.memory_manager = MemoryManager(
+            storage_path=self.memory_storage_path,
+            persistence=self.engine_config["persistence"],
+            flush_config=self.engine_config["episodic_memory"],
+        )
         # Ensure the persistence file exists on first startup without
         # rewriting (and re-serializing) a large legacy checkpoint every boot.
         if not os.path.exists(self.memory_storage_path):
             self.memory_manager.storage.save()
+        if self.deterministic:
+            # A lazy cold start would land inside a tick, between thoughts
+            # being posted and attention selecting one. Thought.recency is
+            # wall-clock, so the delay would change which thought wins and
+            # seeded brains would diverge.
+            self.memory_manager.open_vector_store()
 
         memory_dir = os.path.dirname(os.path.abspath(self.memory_storage_path)) or "."
-        self.user_memory = UserMemory(path=os.path.join(memory_dir, "brain_user_db"))
+        self.user_memory = UserMemory(
+            path=os.path.join(memory_dir, "brain_user_db"),
+            vector_backend=self.engine_config["user_memory"]["vector_backend"],
+        )
         self._maintenance_ticks = 0
 
         self.current_focus: Thought | None = None
@@ -363,12 +448,14 @@ class VirtualBrain:
         self.sleep_ticks_left = 0
         self.network_mode = "TPN"
         self._hopfield_neurons = int(self.brain_config["hopfield"]["neurons"])
-        self.hopfield_weights = [[0.0 for _ in range(self._hopfield_neurons)] for _ in range(self._hopfield_neurons)]
+        self.hopfield = HopfieldNetwork(self._hopfield_neurons)
+        # Set while tick_many runs: the work its ticks share (core/tick_batch.py).
+        self.tick_batch: TickBatch | None = None
         self.attachment_system = AttachmentSystem()
         self.curiosity_engine = CuriosityEngine()
         self.goal_system = GoalSystem()
         self.language_cortex = LanguageCortex()
-        self.app_builder = AppBuilder(self.language_cortex)
+        self._app_builder = None
         self._social_decay_hold_counter = 0
         self._high_emotion_window = deque(maxlen=10)
         self._decision_debug: dict[str, Any] = {}
@@ -393,7 +480,13 @@ class VirtualBrain:
         self._scene_counts = self.sensory_parser.scene_counts
         self.stopwords = self.text_processor.stopwords
         self.concept_aliases = self.text_processor.concept_aliases
-        self.concept_memory = {}
+        dev_cfg = self.brain_config["development"]
+        self.concept_memory = ConceptStore(
+            capacity=int(dev_cfg["concept_capacity"]),
+            half_life=float(dev_cfg["concept_recency_half_life"]),
+            evict_fraction=float(dev_cfg["concept_evict_fraction"]),
+        )
+        self._snapshots = StateSnapshots()
         self.development_stage = "child"
         self.stage_learning_multipliers = dict(self.brain_config["development"]["stage_learning_multipliers"])
         self.reflection_interval = int(self.brain_config["reflection"]["interval"])
@@ -406,34 +499,240 @@ class VirtualBrain:
 
         self.chemicals = ChemicalRegistry(chemical_configs)
         self._original_baselines = {name: float(config["baseline"]) for name, config in chemical_configs.items()}
-        self._engine = BrainEngine(
+        engine_cls = VectorBrainEngine if self.brain_config["chemistry"]["engine"] == "vector" else BrainEngine
+        self._engine = engine_cls(
             state=self.chemicals,
             interactions=Interactions(self.interaction_matrix),
             deterministic=self.deterministic,
             brain=self,
+            noise_scale=float(self.engine_config["noise_control"]["global_noise_multiplier"]),
         )
+        self._chemistry_steps = self._resolve_chemistry_steps()
         self.bias_engine = BiasEngine(DEFAULT_BIAS_CONFIGS, DEFAULT_BIAS_MAPPING)
         self._last_maturity = self.development.maturity
         self.tool_connector = ToolConnector()
         self.latest_tool_call = None
+        self._last_belief_update: dict[str, Any] = {}
+        instrumentation_cfg = self.engine_config["instrumentation"]
+        self.instrumentation = Instrumentation(
+            enabled=bool(instrumentation_cfg["enabled"]),
+            window=int(instrumentation_cfg["window"]),
+        )
+        self.tick_pipeline = self._build_tick_pipeline()
+
+    @property
+    def app_builder(self):
+        # The app builder (and its template module) is only needed when an
+        # app is actually built, so it is created on first use.
+        if self._app_builder is None:
+            from cognition.app_builder import AppBuilder
+
+            self._app_builder = AppBuilder(self.language_cortex)
+        return self._app_builder
+
+    @property
+    def hopfield_weights(self) -> list[list[float]]:
+        # Nested-list view of the Hopfield weights, the shape checkpoints store.
+        return self.hopfield.to_list()
+
+    @hopfield_weights.setter
+    def hopfield_weights(self, weights: list[list[float]]):
+        self.hopfield = HopfieldNetwork.from_list(weights)
+        self._snapshots.touch("hopfield_weights")
 
     def _run_sleep_cycle(self) -> dict[str, Any]:
         return self.sleep_manager.run_sleep_cycle(self)
 
+    def _build_tick_pipeline(self) -> TickPipeline:
+        """Register the tick stages in their canonical order.
+
+        Cadence overrides come from ``engine_config["pipeline"]["stages"]``;
+        with no overrides every stage runs every tick, in this order.
+        """
+        pipeline_cfg = self.engine_config["pipeline"]
+        pipeline = TickPipeline(
+            history_size=int(pipeline_cfg["history_size"]),
+            instrumentation=self.instrumentation,
+        )
+        stages = [
+            ("user_memory_maintenance", self._stage_user_memory_maintenance, False),
+            ("sleep", self._stage_sleep, True),
+            ("acetylcholine", self._stage_acetylcholine, False),
+            ("chemistry", self._stage_chemistry, True),
+            ("norepinephrine", self._stage_norepinephrine, False),
+            ("receptor_dynamics", self._stage_receptor_dynamics, False),
+            ("stress_counters", self._stage_stress_counters, False),
+            ("mood", self._stage_mood, False),
+            ("resilience", self._stage_resilience, False),
+            ("development", self._stage_development, False),
+            ("autobiography", self._stage_autobiography, False),
+            ("worldview", self._stage_worldview, False),
+            ("network_mode", self._stage_network_mode, False),
+            ("spontaneous_thoughts", self._stage_spontaneous_thoughts, False),
+            ("attention", self._stage_attention, True),
+            ("tool_matching", self._stage_tool_matching, False),
+            ("love", self._stage_love, False),
+            ("decision", self._stage_decision, False),
+            ("reinforcement", self._stage_reinforcement, False),
+            ("stage_transition", self._stage_stage_transition, False),
+            ("consciousness", self._stage_consciousness, False),
+            ("concept_growth", self._stage_concept_growth, False),
+            ("social_decay", self._stage_social_decay, False),
+            ("curiosity", self._stage_curiosity, False),
+            ("goals", self._stage_goals, False),
+            ("memory_flush", self._stage_memory_flush, False),
+            ("end_step", self._stage_end_step, True),
+        ]
+        for index, (name, fn, required) in enumerate(stages):
+            pipeline.register(name, fn, order=(index + 1) * 10, required=required)
+        pipeline.configure(pipeline_cfg["stages"])
+        return pipeline
+
     def tick(self):
+        with self.instrumentation.span("tick"):
+            return self._tick()
+
+    def tick_many(self, n: int) -> dict[str, Any]:
+        """Fast-forward ``n`` ticks, coalescing the work they share.
+
+        Within the batch (see :class:`~core.tick_batch.TickBatch`):
+
+        - episodic memory writes are deferred and go to the vector store in
+          one flush when the batch ends;
+        - the per-tick ``autobiography_cycle`` memories are created in one
+          bulk ``create_memories`` call at the end instead of one
+          ``create_memory`` per tick (the ``cycle_step`` autobiography
+          event itself is still recorded every tick, since later stages of
+          the same tick read it);
+        - the spontaneous replay search behind thought posting runs once
+          per distinct query and is reused while no replayable event
+          arrives and the Hopfield weights do not learn.
+
+        Equivalence contract: the simulated state (chemistry, Q-table,
+        identity, autobiography, worldview, focus, counters) is identical
+        to ``n`` consecutive ``tick()`` calls with no ``perceive()`` in
+        between; thoughts are still posted and selected every tick, since
+        each tick's focus feeds its decision. The same memories are stored
+        once both paths are flushed, but the cycle memories carry the
+        batch end as ``created_at`` and follow the batch's other memories
+        in store order.
+
+        Per-tick return values are not kept: the summary reports the number
+        of ticks, decisions and sleeping ticks, the memories flushed, the
+        replay searches run and reused, and the last tick's result.
+        """
+        n = int(n)
+        if n < 0:
+            raise ValueError(f"tick_many() needs a non-negative tick count, got {n}")
+        summary = {"ticks": n, "decisions": 0, "sleep_ticks": 0, "memories_flushed": 0, "result": None}
+        batch = self.tick_batch = TickBatch()
+        with self.instrumentation.span("tick_many"), self.memory_manager.deferred_flush():
+            try:
+                for _ in range(n):
+                    asleep = self.sleeping
+                    result = self.tick()
+                    if asleep or self.sleeping:
+                        summary["sleep_ticks"] += 1
+                    elif result:
+                        summary["decisions"] += 1
+                    summary["result"] = result
+            finally:
+                self.tick_batch = None
+                self.memory_manager.create_memories(
+                    "autobiography_cycle", batch.cycle_memories, metadata={"source": "brain_tick"}
+                )
+            summary["memories_flushed"] = len(self.memory_manager.pending_memories)
+        summary["replay_searches"] = batch.replay_searches
+        summary["replay_reuses"] = batch.replay_reuses
+        return summary
+
+    def advance_idle(self, n: int) -> dict[str, Any]:
+        """Jump ``n`` quiet ticks ahead in closed form instead of ticking.
+
+        Models the parts of a tick that are plain relaxation when nothing
+        happens:
+
+        - chemistry (interactions, homeostasis, noise, clamp) via
+          :class:`~core.idle.IdleChemistry`, which matches stepping the
+          engine within floating-point tolerance for deterministic brains
+          and adds noise through its aggregate distribution otherwise;
+        - attachment and goal decay, raised to the ``n``-th power;
+        - Q-value pruning for the slow-wave ticks the circadian schedule
+          would have slept in ``n`` ticks.
+
+        This is a model of idle time, not a replay: spontaneous thoughts,
+        attention, decisions, sleep scheduling, autobiography encoding and
+        worldview updates do not run, and fatigue is left as is. Use
+        :meth:`tick_many` for an exact batched replay. The cost does not
+        depend on ``n`` beyond a few matrix squarings.
+        """
+        n = int(n)
+        if n < 0:
+            raise ValueError(f"advance_idle() needs a non-negative tick count, got {n}")
+        engine = self._engine
+        if not isinstance(engine, VectorBrainEngine):
+            engine = VectorBrainEngine(
+                state=self.chemicals,
+                interactions=Interactions(self.interaction_matrix),
+                deterministic=True,
+                brain=self,
+                noise_scale=float(self.engine_config["noise_control"]["global_noise_multiplier"]),
+            )
+        with self.instrumentation.span("advance_idle"):
+            chemistry = IdleChemistry(engine, deterministic=self.deterministic)
+            engine._store(chemistry.advance(engine.values(), n))
+            if hasattr(self, "attachment_system") and self.attachment_system:
+                self.attachment_system.decay(ticks=n)
+            if hasattr(self, "goal_system") and self.goal_system:
+                self.goal_system.decay(ticks=n)
+            slow_wave_ticks = self.sleep_manager.slow_wave_ticks(n)
+            if slow_wave_ticks:
+                self.sleep_manager.prune_q_values(self, ticks=slow_wave_ticks)
+            self.step_counter += n
+        return {
+            "ticks": n,
+            "chemistry_jumps": chemistry.jumps,
+            "chemistry_exact_steps": chemistry.exact_steps,
+            "slow_wave_ticks": slow_wave_ticks,
+        }
+
+    def _tick(self):
         if self.sleeping:
-            return self._run_sleep_cycle()
+            with self.instrumentation.span("tick.sleep_cycle"):
+                return self._run_sleep_cycle()
+
+        ctx = TickContext(
+            self.step_counter,
+            decision_output=None,
+            regret=0.0,
+            prev_maturity=self.development.maturity,
+            belief_update=self._last_belief_update,
+            norepinephrine=self.chemicals.get("norepinephrine", {}).get("value", 50.0),
+            high_emotion_hits=0,
+        )
+        self.tick_pipeline.run(ctx)
+        return ctx.result
 
+    # -----------------------------------------
+    # TICK STAGES
+    # -----------------------------------------
+
+    def _stage_user_memory_maintenance(self, ctx):
         # Periodic memory maintenance: consolidate repeated user facts into
-        # traits and decay stale low-importance facts (every 100 ticks).
+        # traits (every 100 ticks). Forgetting is applied when facts are read;
+        # user_memory.compact_every > 0 also compacts it (persists decayed
+        # importances, deletes forgotten facts) every that many ticks.
         self._maintenance_ticks += 1
-        if self._maintenance_ticks % 100 == 0:
-            try:
+        compact_every = self.engine_config["user_memory"]["compact_every"]
+        try:
+            if self._maintenance_ticks % 100 == 0:
                 self.user_memory.consolidate()
+            if compact_every and self._maintenance_ticks % compact_every == 0:
                 self.user_memory.decay()
-            except Exception:
-                pass
+        except Exception:
+            pass
 
+    def _stage_sleep(self, ctx):
         # 1. Update sleep drives and Process S/Process C dynamics
         self.sleep_manager.update_sleep_drives(self)
 
@@ -441,8 +740,9 @@ class VirtualBrain:
         if self.sleep_manager.should_sleep(self):
             self.sleeping = True
             self.sleep_ticks_left = getattr(self.sleep_manager, "sleep_duration", 5)
-            return self._run_sleep_cycle()
+            ctx.halt(self._run_sleep_cycle())
 
+    def _stage_acetylcholine(self, ctx):
         # 3. Dynamic Acetylcholine (ACh) attention focus tracking
         if "acetylcholine" in self.chemicals:
             streak = getattr(self.global_workspace, "_streak", 0) or getattr(self.global_workspace, "streak", 0)
@@ -455,9 +755,8 @@ class VirtualBrain:
                 ach_lr_mult = float(self.brain_config["acetylcholine"]["learning_rate_multiplier"])
                 self.decision_engine.learning_rate = ach_lr_base + ach_lr_mult * ach_val
 
-        decision_output = None
-        regret = 0.0
-        prev_maturity = self.development.maturity
+    def _stage_chemistry(self, ctx):
+        ctx.prev_maturity = self.development.maturity
 
         for name in self.chemicals.keys():
             self.chemicals[name]["baseline"] = self._original_baselines[name]
@@ -467,11 +766,9 @@ class VirtualBrain:
         self.bias_engine.update_from_conscious(conscious_values, baseline_values)
         self.bias_engine.apply_baseline_shift(self.chemicals)
 
-        self._apply_interactions()
-        self._apply_homeostasis()
-        self._apply_noise()
-        self._clamp()
+        self._apply_chemistry()
 
+    def _stage_norepinephrine(self, ctx):
         if "norepinephrine" in self.chemicals:
             ne_val = self.chemicals["norepinephrine"]["value"]
             ne_baseline = self.chemicals["norepinephrine"]["baseline"]
@@ -483,8 +780,10 @@ class VirtualBrain:
             self.chemicals["norepinephrine"]["value"] = max(0.0, min(100.0, ne_val))
             self._clamp()
 
-        self.chemicals.update_receptor_dynamics()
+    def _stage_receptor_dynamics(self, ctx):
+        self._engine.update_receptor_dynamics()
 
+    def _stage_stress_counters(self, ctx):
         low_serotonin_level = float(self.brain_config["stress"]["low_serotonin_level"])
         high_stress_level = float(self.brain_config["stress"]["high_stress_level"])
         chronic_stress_level = float(self.brain_config["stress"]["chronic_stress_level"])
@@ -503,11 +802,14 @@ class VirtualBrain:
         else:
             self._chronic_stress_steps = max(0, self._chronic_stress_steps - 1)
 
+    def _stage_mood(self, ctx):
         self.worldview.update_mood(self._step_perception_signals)
 
+    def _stage_resilience(self, ctx):
         self._update_resilience()
         self._update_reflection_balance()
 
+    def _stage_development(self, ctx):
         self.development.reflect(self.identity.get("intelligence"))
         self.development.update()
 
@@ -516,19 +818,26 @@ class VirtualBrain:
         self._apply_social_value_decay()
         self._enforce_identity_floors()
 
+    def _stage_autobiography(self, ctx):
         self._encode_autobiography()
-        belief_update = self._update_worldview()
 
+    def _stage_worldview(self, ctx):
+        ctx.belief_update = self._last_belief_update = self._update_worldview()
+
+    def _stage_network_mode(self, ctx):
         # Salience Network updates cognitive mode (TPN vs. DMN)
-        ne_val = self.chemicals.get("norepinephrine", {}).get("value", 50.0)
-        if ne_val > 65.0 or self._step_perception_signals:
+        ctx.norepinephrine = self.chemicals.get("norepinephrine", {}).get("value", 50.0)
+        if ctx.norepinephrine > 65.0 or self._step_perception_signals:
             self.network_mode = "TPN"
         else:
             self.network_mode = "DMN"
 
+    def _stage_spontaneous_thoughts(self, ctx):
         generate_spontaneous(self)
+
+    def _stage_attention(self, ctx):
         self.current_focus = self.global_workspace.select(
-            norepinephrine=ne_val,
+            norepinephrine=ctx.norepinephrine,
             network_mode=self.network_mode,
             curiosity_engine=self.curiosity_engine,
             love_score=self.love_score,
@@ -536,12 +845,13 @@ class VirtualBrain:
             deterministic=self.deterministic,
         )
 
+    def _stage_tool_matching(self, ctx):
         # Match tool connector against current focus
         self.latest_tool_call = None
         if self.current_focus:
             self.latest_tool_call = self.tool_connector.match_thought(self.current_focus.content)
 
-
+    def _stage_love(self, ctx):
         # Calculate active Love Score based on current focus and chemical levels
         love_cfg = self.brain_config["love"]
         attachment_threshold = float(love_cfg["attachment_threshold"])
@@ -558,10 +868,14 @@ class VirtualBrain:
                 if oxt > oxytocin_threshold and da > dopamine_threshold:
                     self.love_score = attach * (oxt / 100.0) * (da / 100.0)
                     self.loved_source = c_source
+
+    def _stage_decision(self, ctx):
+        belief_update = ctx.belief_update
         focus_emotional = float(getattr(self.current_focus, "emotional_weight", 0.0) or 0.0)
         threshold = float(self.brain_config["emotion"]["focus_threshold"])
         self._high_emotion_window.append(bool(self.current_focus and focus_emotional > threshold))
         high_emotion_hits = sum(1 for flag in self._high_emotion_window if flag)
+        ctx.high_emotion_hits = high_emotion_hits
 
         self._decision_debug = {
             "engine_available": bool(self.decision_engine),
@@ -596,8 +910,9 @@ class VirtualBrain:
         if self._step_perception_valences:
             recent_valence_avg = sum(self._step_perception_valences) / len(self._step_perception_valences)
 
+        decision_output = None
         if self.decision_engine and self.current_focus and gate_pass:
-            decision_state = self.get_state()
+            decision_state = self.get_decision_view()
             decision_state["decision_action_bias"] = self.worldview.decision_bias()
             decision_output = self.decision_engine.decide(
                 self.current_focus,
@@ -643,8 +958,9 @@ class VirtualBrain:
                 regret = self.self_reflection.reflect_on_decision(
                     chosen_action=action,
                     available_actions=list(probabilities.keys()),
-                    current_state=self.get_state(),
+                    current_state=self.get_decision_view(),
                 )
+                ctx.regret = regret
                 self.self_reflection.propose_reflection_thought(self, action, regret)
                 self.worldview.record_decision_outcome(
                     action=action,
@@ -665,6 +981,11 @@ class VirtualBrain:
                     self.chemicals["dopamine"]["value"] = max(0.0, min(100.0, self.chemicals["dopamine"]["value"] + dopamine_change))
                     self._clamp()
 
+        ctx.decision_output = decision_output
+        ctx.result = decision_output
+
+    def _stage_reinforcement(self, ctx):
+        regret = ctx.regret
         self._update_cognitive_growth(regret)
 
         # Spike Endorphins on regret resolution and apply physiological buffering
@@ -681,10 +1002,13 @@ class VirtualBrain:
                 self.chemicals["serotonin"]["value"] = min(100.0, self.chemicals["serotonin"]["value"] + endorphin_val * float(reinforcement_cfg["endorphin_serotonin_boost"]))
             self._clamp()
 
+    def _stage_stage_transition(self, ctx):
         stage_changed = self._update_stage_transition()
         self._periodic_reflection()
         if not stage_changed and (self.step_counter % self.narrative_update_interval == 0):
             self._refresh_narrative(force=True)
+
+    def _stage_consciousness(self, ctx):
         self.consciousness.compute_score(self)
         if self._reflection_consciousness_boost > 0.0:
             self.consciousness.score = min(1.0, self.consciousness.score + self._reflection_consciousness_boost)
@@ -692,16 +1016,20 @@ class VirtualBrain:
         self.consciousness.modulate_risk(self, self.consciousness.score)
         self.consciousness.update_narrative(self, self.consciousness.score)
         self._apply_narrative_milestones()
-        self.development.maturity = max(prev_maturity, self.development.maturity)
+
+    def _stage_concept_growth(self, ctx):
+        self.development.maturity = max(ctx.prev_maturity, self.development.maturity)
         self._enforce_identity_floors()
         self._monitor_concept_growth()
 
+    def _stage_social_decay(self, ctx):
         # Decay social attachment and goals
         if hasattr(self, "attachment_system") and self.attachment_system:
             self.attachment_system.decay()
         if hasattr(self, "goal_system") and self.goal_system:
             self.goal_system.decay()
 
+    def _stage_curiosity(self, ctx):
         # Dopaminergic reward for exploring curious thoughts
         if self.current_focus and hasattr(self, "curiosity_engine") and self.curiosity_engine:
             c_topic = self.current_focus.topic or self.current_focus.metadata.get("category") or self.current_focus.source
@@ -711,11 +1039,13 @@ class VirtualBrain:
                     self.chemicals["dopamine"]["value"] += c_bonus * float(self.brain_config["curiosity"]["dopamine_reward"])
                     self._clamp()
 
+    def _stage_goals(self, ctx):
         # Update active goal strength based on chosen action outcome
+        decision_output = ctx.decision_output
         if decision_output and hasattr(self, "goal_system") and self.goal_system:
             action = decision_output.get("action")
             if action:
-                reward = 1.0 - regret
+                reward = 1.0 - ctx.regret
                 if action in {"support", "suggest"}:
                     self.goal_system.create_or_update_goal("social_bond", reward)
                 if action in {"challenge", "suggest"}:
@@ -723,16 +1053,25 @@ class VirtualBrain:
                 if action in {"refuse", "neutral"}:
                     self.goal_system.create_or_update_goal("safety", reward)
 
+    def _stage_memory_flush(self, ctx):
+        if not self.memory_manager.flush_deferred:
+            self.memory_manager.flush_due()
+
+    def _stage_end_step(self, ctx):
         self.step_counter += 1
-        self.memory_manager.flush_pending()
         self._step_perception_valences = []
         self._step_perception_signals = []
         self._step_perception_novelty = 0.0
         self._step_adversity_intensity = 0.0
-        return decision_output
 
     def perceive(self, event: Any) -> None:
         """Process a meaningful experience event generated by the environment."""
+        with self.instrumentation.span("perceive"):
+            self._perceive(event)
+
+    def _perceive(self, event: Any) -> None:
+        span = self.instrumentation.span
+
         def _read(name, default):
             if hasattr(event, "get"):
                 return event.get(name, default)
@@ -742,6 +1081,9 @@ class VirtualBrain:
                 return event.get(name, default)
             return default
 
+        # New input: stages with the on_dirty cadence run on the next tick.
+        self.tick_pipeline.mark_dirty()
+
         if self.sleeping:
             category = str(_read("category", "")).strip().lower()
             intensity = float(_read("intensity", 0.0))
@@ -814,15 +1156,16 @@ class VirtualBrain:
                 valence = valence * (1.0 - self.love_score * 0.7)
                 intensity = intensity * (1.0 - self.love_score * 0.6)
 
-        expected_valence = self.worldview.expected_valence(category or modality)
-        valence, intensity = self.worldview.adjust_appraisal(
-            category=category or modality,
-            content=content,
-            valence=valence,
-            intensity=intensity,
-            modality=modality,
-        )
-        self.worldview.record_prediction(expected_valence=expected_valence, actual_valence=valence)
+        with span("perceive.appraisal"):
+            expected_valence = self.worldview.expected_valence(category or modality)
+            valence, intensity = self.worldview.adjust_appraisal(
+                category=category or modality,
+                content=content,
+                valence=valence,
+                intensity=intensity,
+                modality=modality,
+            )
+            self.worldview.record_prediction(expected_valence=expected_valence, actual_valence=valence)
         self._step_perception_valences.append(valence)
         self._step_perception_signals.append(
             {
@@ -841,12 +1184,13 @@ class VirtualBrain:
             self._social_decay_hold_counter = max(self._social_decay_hold_counter, self.social_gain_hold_steps)
         self._apply_social_value_event_impact(category, intensity)
 
-        scene = self._analyze_perception(
-            modality=modality,
-            content=f"{category} {content}",
-            valence=valence,
-            provided_scene=scene_input,
-        )
+        with span("perceive.analyze"):
+            scene = self._analyze_perception(
+                modality=modality,
+                content=f"{category} {content}",
+                valence=valence,
+                provided_scene=scene_input,
+            )
         self._step_perception_novelty = max(self._step_perception_novelty, float(scene.get("novelty", 0.0)))
         self.recent_perceptions.append(
             {
@@ -869,13 +1213,14 @@ class VirtualBrain:
                 "timestamp": timestamp or time.time(),
             }
         )
-        self._learn_from_perception(
-            modality,
-            f"{category} {content}",
-            source=source,
-            scene=scene,
-            category=category,
-        )
+        with span("perceive.learn_concepts"):
+            self._learn_from_perception(
+                modality,
+                f"{category} {content}",
+                source=source,
+                scene=scene,
+                category=category,
+            )
 
         effects = self._effects_from_event(
             modality=modality,
@@ -884,12 +1229,13 @@ class VirtualBrain:
             intensity=intensity,
         )
 
-        self.inject_event(
-            effects=effects,
-            event_type=category or "experience",
-            source=source,
-            tags=[modality, "perception_event", category or "experience"],
-        )
+        with span("perceive.inject_event"):
+            self.inject_event(
+                effects=effects,
+                event_type=category or "experience",
+                source=source,
+                tags=[modality, "perception_event", category or "experience"],
+            )
 
         metadata = {}
         if hasattr(event, "__dataclass_fields__"):
@@ -897,29 +1243,32 @@ class VirtualBrain:
         elif isinstance(event, dict):
             metadata = dict(event)
 
-        self._record_memory_event(
-            description=f"perceived_{modality}_{category or 'event'}: {content}",
-            chemicals={k: v["value"] for k, v in self.chemicals.items()},
-            identity_snapshot=self.identity.get_snapshot(),
-            metadata=metadata,
-        )
-        self.memory_manager.create_memory(
-            memory_type=f"perception_{modality}",
-            content={
-                "category": category or "event",
-                "content": content,
-                "valence": valence,
-                "intensity": intensity,
-                "source": source,
-                "timestamp": timestamp or time.time(),
-                "scene": scene,
-            },
-            metadata={
-                "development_stage": self.development_stage,
-                "step_counter": self.step_counter,
-            },
-        )
-        self.autobiography.propose_memory_thought(self)
+        with span("perceive.record_memory"):
+            self._record_memory_event(
+                description=f"perceived_{modality}_{category or 'event'}: {content}",
+                chemicals={k: v["value"] for k, v in self.chemicals.items()},
+                identity_snapshot=self.identity.get_snapshot(),
+                metadata=metadata,
+            )
+        with span("perceive.create_memory"):
+            self.memory_manager.create_memory(
+                memory_type=f"perception_{modality}",
+                content={
+                    "category": category or "event",
+                    "content": content,
+                    "valence": valence,
+                    "intensity": intensity,
+                    "source": source,
+                    "timestamp": timestamp or time.time(),
+                    "scene": scene,
+                },
+                metadata={
+                    "development_stage": self.development_stage,
+                    "step_counter": self.step_counter,
+                },
+            )
+        with span("perceive.memory_thought"):
+            self.autobiography.propose_memory_thought(self)
 
         self.development.observe_event(category or modality, {k: v["value"] for k, v in self.chemicals.items()})
 
@@ -1011,13 +1360,14 @@ class VirtualBrain:
         return delta * scale
 
     def inject_event(self, effects: dict, event_type=None, source=None, tags=None):
+        self.tick_pipeline.mark_dirty()
         resilience = max(0.0, float(self.identity.get("resilience")))
         effective_resilience = resilience / (1.0 + resilience)
         maturity = self.development.maturity
 
         predicted = self.appraisal_engine.predict_emotion(
             event_type,
-            current_state=self.get_state(),
+            current_state=self.get_decision_view(),
         )
 
         anticipation_strength = 0.5 + (maturity * 0.5)
@@ -1624,34 +1974,19 @@ class VirtualBrain:
         )
 
         for concept in concepts:
-            entry = self.concept_memory.get(
-                concept,
-                {
-                    "count": 0,
-                    "strength": 0.0,
-                    "first_seen_step": now_step,
-                    "last_seen_step": now_step,
-                    "modalities": {},
-                    "attributes": {},
-                    "relations": [],
-                    "sources": {},
-                },
-            )
-
-            entry["count"] += 1
-            entry["strength"] = min(1.0, entry["strength"] + learning_gain)
-            entry["last_seen_step"] = now_step
-            entry["modalities"][modality] = entry["modalities"].get(modality, 0) + 1
-            entry["sources"][source] = entry["sources"].get(source, 0) + 1
+            entry = self.concept_memory.observe(concept, now_step)
+            entry.count += 1
+            entry.strength = min(1.0, entry.strength + learning_gain)
+            entry.last_seen_step = now_step
+            entry.modalities[modality] = entry.modalities.get(modality, 0) + 1
+            entry.sources[source] = entry.sources.get(source, 0) + 1
             for attr in scene.get("attributes", []):
-                entry["attributes"][attr] = entry["attributes"].get(attr, 0) + 1
+                entry.add_attribute(attr)
             for rel in scene.get("relations", []):
                 if rel["from"] == concept or rel["to"] == concept:
-                    entry["relations"].append(rel)
-                    relations_max = int(dev_cfg["concept_relations_max"])
-                    if len(entry["relations"]) > relations_max:
-                        entry["relations"] = entry["relations"][-relations_max:]
-            self.concept_memory[concept] = entry
+                    entry.add_relation(rel, int(dev_cfg["concept_relations_max"]))
+        evicted = self.concept_memory.enforce_capacity(now_step, protected=set(concepts))
+        self._snapshots.touch("concept_memory", concepts + evicted)
 
     def _compute_development_stage(self):
         m = self.development.maturity
@@ -1676,17 +2011,17 @@ class VirtualBrain:
             return []
         ranked = sorted(
             visible_items,
-            key=lambda kv: (kv[1]["strength"], kv[1]["count"]),
+            key=lambda kv: (kv[1].strength, kv[1].count),
             reverse=True,
         )
         return [
             {
                 "concept": concept,
-                "count": data["count"],
-                "strength": round(data["strength"], 3),
-                "modalities": data["modalities"],
+                "count": data.count,
+                "strength": round(data.strength, 3),
+                "modalities": data.modalities,
                 "top_attributes": sorted(
-                    data.get("attributes", {}).items(),
+                    (data.attributes or {}).items(),
                     key=lambda kv: kv[1],
                     reverse=True,
                 )[:2],
@@ -1695,7 +2030,7 @@ class VirtualBrain:
         ]
 
     def regulate_speech(self, text: str):
-        state = self.get_state()
+        state = self.get_decision_view()
         regulated_text = self.speech_regulator.regulate(
             text=text,
             fatigue=self.fatigue,
@@ -1801,6 +2136,38 @@ class VirtualBrain:
 
         self.identity.traits["resilience"] = round(max(0.0, resilience), 4)
 
+    def _resolve_chemistry_steps(self):
+        """Chemistry sub-steps from ``update_order`` minus disabled ``stability`` flags.
+
+        Returns ``None`` for the default full order, which the engine runs as
+        one fused ``tick()``.
+        """
+        stability = self.engine_config["stability"]
+        enabled = {
+            "interactions": bool(stability["enable_interactions"]),
+            "homeostasis": bool(stability["enable_homeostasis"]),
+            "noise": bool(stability["enable_noise"]),
+            "clamp": True,
+        }
+        order = list(self.engine_config["update_order"])
+        unknown = [step for step in order if step not in CHEMISTRY_STEPS]
+        if unknown:
+            raise ValueError(f"Unknown chemistry steps in update_order: {unknown}; expected {list(CHEMISTRY_STEPS)}")
+        steps = [step for step in order if enabled[step]]
+        if steps == list(CHEMISTRY_STEPS):
+            return None
+        return [getattr(self._engine, CHEMISTRY_STEPS[step]) for step in steps]
+
+    def _apply_chemistry(self):
+        if self._chemistry_steps is None:
+            # interactions -> homeostasis -> noise -> clamp, fused by the engine
+            self._engine.tick()
+        else:
+            for step in self._chemistry_steps:
+                step()
+        if "cortisol" in self.chemicals:
+            self.chemicals["cortisol"]["value"] = min(100.0, self.chemicals["cortisol"]["value"])
+
     def _apply_interactions(self):
         self._engine.apply_interactions()
 
@@ -1853,37 +2220,44 @@ class VirtualBrain:
         hopfield_cfg = self.brain_config["hopfield"]
         update_multiplier = float(hopfield_cfg["ach_scale_min"]) + float(hopfield_cfg["ach_scale_max"]) * ach_scale
 
-        for i in range(self._hopfield_neurons):
-            for j in range(self._hopfield_neurons):
-                if i != j:
-                    self.hopfield_weights[i][j] += float(p[i] * p[j]) * update_multiplier
+        self.hopfield.learn(p, update_multiplier)
+        self._snapshots.touch("hopfield_weights")
 
     def _record_memory_event(self, description: str, chemicals: dict, identity_snapshot: dict, metadata: dict = None):
-        self.autobiography.record_event(
+        event = self.autobiography.record_event(
             description=description,
             chemicals=chemicals,
             identity_snapshot=identity_snapshot,
             metadata=metadata,
         )
+        observe = getattr(self.worldview, "observe_event", None)
+        if observe is not None:
+            observe(event)
         if description != "cycle_step":
             self._project_hebbian_learning(chemicals, identity_snapshot)
 
     def _encode_autobiography(self):
+        chemicals = {k: v["value"] for k, v in self.chemicals.items()}
+        identity_snapshot = self.identity.get_snapshot()
         self._record_memory_event(
             description="cycle_step",
-            chemicals={k: v["value"] for k, v in self.chemicals.items()},
-            identity_snapshot=self.identity.get_snapshot(),
-        )
-        self.memory_manager.create_memory(
-            memory_type="autobiography_cycle",
-            content={
-                "description": "cycle_step",
-                "chemicals": {k: v["value"] for k, v in self.chemicals.items()},
-                "identity": self.identity.get_snapshot(),
-                "step_counter": self.step_counter,
-            },
-            metadata={"source": "brain_tick"},
+            chemicals=chemicals,
+            identity_snapshot=identity_snapshot,
         )
+        content = {
+            "description": "cycle_step",
+            "chemicals": chemicals,
+            "identity": identity_snapshot,
+            "step_counter": self.step_counter,
+        }
+        if self.tick_batch is not None:
+            self.tick_batch.cycle_memories.append(content)
+        else:
+            self.memory_manager.create_memory(
+                memory_type="autobiography_cycle",
+                content=content,
+                metadata={"source": "brain_tick"},
+            )
         self.autobiography.propose_memory_thought(self)
 
         narrative_cfg = self.brain_config["narrative"]
@@ -1916,20 +2290,20 @@ class VirtualBrain:
         latency = base_time + (cognitive_load * 1.2) + maturity_effect
         return max(0.15, min(2.2, latency))
 
-    def get_state(self):
+    def get_decision_view(self) -> dict[str, Any]:
+        """Lightweight state for the per-tick decision path.
+
+        Holds only the fields appraisal, the decision engine, the strategic
+        planner, self-reflection and speech regulation read: chemistry,
+        identity, development, mood, beliefs, attachment and love. Values are
+        identical to the matching ``get_state()`` keys. Returns a fresh plain
+        dict, so callers may annotate it (e.g. ``decision_action_bias``).
+        """
         chemical_values = {name: data["value"] for name, data in self.chemicals.items()}
         effective_chemical_values = {name: data.effective_value for name, data in self.chemicals.items()}
         receptor_sensitivities = {name: data.sensitivity for name, data in self.chemicals.items()}
         identity_snapshot = self.identity.get_snapshot()
         development_snapshot = self.development.get_snapshot()
-        narrative = self.narrative_engine.get_current_narrative()
-        wisdom = self.self_reflection.get_wisdom()
-        consciousness_score = getattr(self.consciousness, "score", 0.0)
-        worldview_state = self.worldview.to_state()
-        consciousness_components = self.worldview.get_consciousness_factors(
-            reflection_depth=self.development.reflection_depth,
-            narrative=narrative,
-        )
 
         # Fetch attachment value of the active focus source
         focus_source = "simulated"
@@ -1950,7 +2324,6 @@ class VirtualBrain:
 
         state.update(
             {
-                # Full nested payload for persistence
                 "neurochemicals": chemical_values,
                 "effective_neurochemicals": effective_chemical_values,
                 "receptor_sensitivities": receptor_sensitivities,
@@ -1958,36 +2331,75 @@ class VirtualBrain:
                 "development_stage": self.development_stage,
                 "experience_points": self.development.experience_points,
                 "maturity": self.development.maturity,
-                "wisdom": wisdom,
+                "wisdom": self.self_reflection.get_wisdom(),
                 "intelligence": self.intelligence,
                 "experience": self.experience,
+                "consciousness_score": getattr(self.consciousness, "score", 0.0),
+                "step_counter": self.step_counter,
+                "fatigue": self.fatigue,
+                "beliefs": list(self.worldview.beliefs.values()),
+                "mood_state": dict(self.worldview.mood_state),
+                "love_score": self.love_score,
+                "loved_source": self.loved_source,
+            }
+        )
+        return state
+
+    def get_state(self):
+        """Full state payload for persistence, the API and the simulator.
+
+        Cheap fields are rebuilt on every call. Expensive sections (Q-table,
+        Hopfield weights, concept memory, autobiography, language cortex and
+        user memory) come from ``self._snapshots``: they are frozen once per
+        version and shared by later calls until their owner changes them.
+        Those sections are read-only; copy them before mutating.
+        """
+        state = self.get_decision_view()
+        narrative = self.narrative_engine.get_current_narrative()
+        worldview_state = self.worldview.to_state()
+        consciousness_components = self.worldview.get_consciousness_factors(
+            reflection_depth=self.development.reflection_depth,
+            narrative=narrative,
+        )
+
+        snapshots = self._snapshots
+        concept_version = snapshots.version("concept_memory")
+        q_table = {}
+        if self.decision_engine and hasattr(self.decision_engine, "q_table"):
+            q_table = snapshots.section("q_table", self.decision_engine.version, lambda: self.decision_engine.q_table)
+        language_version = self.language_cortex.version
+        user_version = self.user_memory.version
+
+        state.update(
+            {
+                # Full nested payload for persistence
                 "self_narrative": narrative,
-                "learned_concepts": self.get_top_concepts(8),
-                "concept_memory": self.concept_memory,
-                "consciousness_score": consciousness_score,
+                "learned_concepts": snapshots.section("learned_concepts", concept_version, lambda: self.get_top_concepts(8)),
+                "concept_memory": snapshots.mapping("concept_memory", self.concept_memory, ConceptEntry.to_dict),
                 "recent_perceptions": list(self.recent_perceptions),
                 "reflection_depth": self.development.reflection_depth,
-                "autobiographical_memory": list(self.autobiography.events),
-                "step_counter": self.step_counter,
+                "autobiographical_memory": snapshots.keyed_records(
+                    "autobiographical_memory",
+                    self.autobiography.version,
+                    self.autobiography.events.seqs(),
+                    self.autobiography.events.get_many,
+                ),
                 "perceptions_since_reflection": self.perceptions_since_reflection,
-                "fatigue": self.fatigue,
                 "decision_debug": dict(self._decision_debug),
-                "beliefs": worldview_state.get("beliefs", []),
-                "mood_state": worldview_state.get("mood_state", {}),
                 "worldview": worldview_state,
                 "consciousness_components": consciousness_components,
                 "bias_state": self.bias_engine.get_bias_state(),
-                "q_table": copy.deepcopy(self.decision_engine.q_table) if self.decision_engine and hasattr(self.decision_engine, "q_table") else {},
-                "hopfield_weights": copy.deepcopy(self.hopfield_weights),
-                "love_score": self.love_score,
-                "loved_source": self.loved_source,
+                "q_table": q_table,
+                "hopfield_weights": snapshots.section(
+                    "hopfield_weights", snapshots.version("hopfield_weights"), lambda: self.hopfield_weights
+                ),
                 "attachments": dict(self.attachment_system.attachments) if hasattr(self, "attachment_system") and self.attachment_system else {},
                 "curiosity_tracker": dict(self.curiosity_engine.novelty_tracker) if hasattr(self, "curiosity_engine") and self.curiosity_engine else {},
                 "goals": dict(self.goal_system.goals) if hasattr(self, "goal_system") and self.goal_system else {},
-                "known_languages": self.language_cortex.known_languages(),
-                "language_cortex": self.language_cortex.to_state(),
-                "user_profile": self.user_memory.profile(),
-                "user_memory": self.user_memory.to_state(),
+                "known_languages": snapshots.section("known_languages", language_version, self.language_cortex.known_languages),
+                "language_cortex": snapshots.section("language_cortex", language_version, self.language_cortex.to_state),
+                "user_profile": snapshots.section("user_profile", user_version, self.user_memory.profile),
+                "user_memory": snapshots.section("user_memory", user_version, self.user_memory.to_state),
             }
         )
 
@@ -2081,7 +2493,10 @@ class VirtualBrain:
 
         concept_memory = state_dict.get("concept_memory")
         if isinstance(concept_memory, dict):
-            self.concept_memory = concept_memory
+            # Entries are rebuilt as fresh records, so read-only snapshot
+            # sections can be loaded directly.
+            self.concept_memory.load(concept_memory)
+            self._snapshots.touch("concept_memory")
 
         autobiographical_memory = state_dict.get("autobiographical_memory")
         if isinstance(autobiographical_memory, list):
@@ -2089,6 +2504,7 @@ class VirtualBrain:
                 autobiographical_memory[-self.autobiography.events.maxlen:],
                 maxlen=self.autobiography.events.maxlen,
             )
+            self.autobiography.version += 1
 
         consciousness_score = state_dict.get("consciousness_score")
         if isinstance(consciousness_score, (int, float)):
@@ -2124,13 +2540,15 @@ class VirtualBrain:
         q_table = state_dict.get("q_table")
         if q_table and self.decision_engine and hasattr(self.decision_engine, "q_table"):
             self.decision_engine.q_table = copy.deepcopy(q_table)
+            self.decision_engine.version += 1
 
         self.love_score = float(state_dict.get("love_score", 0.0))
         self.loved_source = state_dict.get("loved_source")
 
         hopfield = state_dict.get("hopfield_weights")
         if isinstance(hopfield, list):
-            self.hopfield_weights = copy.deepcopy(hopfield)
+            self.hopfield = HopfieldNetwork.from_list(hopfield)
+            self._snapshots.touch("hopfield_weights")
 
         attachments = state_dict.get("attachments")
         if isinstance(attachments, dict) and hasattr(self, "attachment_system") and self.attachment_system:
@@ -2202,7 +2620,8 @@ class VirtualBrain:
         return self.user_memory.consolidate()
 
     def decay_user_memory(self):
-        """Decay stale, low-importance user facts (forgetting curve)."""
+        """Compact the forgetting curve: persist decayed user-fact importances
+        and delete the forgotten facts. Returns the number removed."""
         return self.user_memory.decay()
 
     def resolve_tool(self, text, min_confidence=0.2):
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Iterator
+
+
+class ConceptEntry:
+    """One learned concept, stored as a slotted record.
+
+    Attribute counters and relations are created on first use (most
+    concepts never get either). ``to_dict()`` / ``from_dict()`` convert to
+    and from the nested dict layout used by ``get_state()`` and
+    checkpoints, so persisted brains keep their format.
+    """
+
+    __slots__ = (
+        "count",
+        "strength",
+        "first_seen_step",
+        "last_seen_step",
+        "modalities",
+        "attributes",
+        "relations",
+        "sources",
+    )
+
+    def __init__(self, step: int = 0):
+        self.count = 0
+        self.strength = 0.0
+        self.first_seen_step = step
+        self.last_seen_step = step
+        self.modalities: dict[str, int] = {}
+        self.attributes: dict[str, int] | None = None
+        self.relations: list[dict] | None = None
+        self.sources: dict[str, int] = {}
+
+    def add_attribute(self, attribute: str) -> None:
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[attribute] = self.attributes.get(attribute, 0) + 1
+
+    def add_relation(self, relation: dict, limit: int) -> None:
+        """Append ``relation``, keeping only the most recent ``limit``."""
+        if self.relations is None:
+            self.relations = []
+        self.relations.append(relation)
+        if len(self.relations) > limit:
+            self.relations = self.relations[-limit:]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "strength": self.strength,
+            "first_seen_step": self.first_seen_step,
+            "last_seen_step": self.last_seen_step,
+            "modalities": dict(self.modalities),
+            "attributes": dict(self.attributes or {}),
+            "relations": list(self.relations or []),
+            "sources": dict(self.sources),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ConceptEntry":
+        entry = cls(int(data.get("first_seen_step", 0)))
+        entry.count = int(data.get("count", 0))
+        entry.strength = float(data.get("strength", 0.0))
+        entry.last_seen_step = int(data.get("last_seen_step", entry.first_seen_step))
+        entry.modalities = dict(data.get("modalities", {}) or {})
+        entry.attributes = dict(data["attributes"]) if data.get("attributes") else None
+        entry.relations = [dict(rel) for rel in data["relations"]] if data.get("relations") else None
+        entry.sources = dict(data.get("sources", {}) or {})
+        return entry
+
+
+class ConceptStore:
+    """Bounded concept memory with frequency- and recency-aware eviction.
+
+    Each entry is scored ``count * 0.5 ** (age / half_life)``, where ``age``
+    is the number of steps since the concept was last seen. Concepts seen
+    often keep their place; concepts seen once long ago go first. Once the
+    store holds more than ``capacity`` entries, ``enforce_capacity()``
+    evicts the lowest-scoring ``evict_fraction`` of the capacity in one
+    pass. Eviction is therefore amortised rather than paid on every insert.
+    A ``capacity`` of 0 disables the bound.
+    """
+
+    def __init__(self, capacity: int = 0, half_life: float = 2000.0, evict_fraction: float = 0.1):
+        self.capacity = max(0, int(capacity))
+        self.half_life = max(1.0, float(half_life))
+        self.evict_fraction = min(1.0, max(0.0, float(evict_fraction)))
+        self._entries: dict[str, ConceptEntry] = {}
+        self.evicted = 0
+
+    # -----------------------------------------
+    # MAPPING INTERFACE
+    # -----------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, concept: object) -> bool:
+        return concept in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __getitem__(self, concept: str) -> ConceptEntry:
+        return self._entries[concept]
+
+    def get(self, concept: str, default: Any = None) -> Any:
+        return self._entries.get(concept, default)
+
+    def items(self):
+        return self._entries.items()
+
+    # -----------------------------------------
+    # LEARNING
+    # -----------------------------------------
+
+    def observe(self, concept: str, step: int) -> ConceptEntry:
+        """Entry for ``concept``, created at ``step`` when it is new."""
+        entry = self._entries.get(concept)
+        if entry is None:
+            entry = self._entries[concept] = ConceptEntry(step)
+        return entry
+
+    def score(self, entry: ConceptEntry, step: int) -> float:
+        age = max(0, step - entry.last_seen_step)
+        return entry.count * 0.5 ** (age / self.half_life)
+
+    def enforce_capacity(self, step: int, protected: Any = ()) -> list[str]:
+        """Evict down to capacity when over it; returns the evicted concepts.
+
+        ``protected`` concepts (the ones just observed) are never evicted.
+        """
+        if not self.capacity or len(self._entries) <= self.capacity:
+            return []
+        target = self.capacity - int(self.capacity * self.evict_fraction)
+        excess = len(self._entries) - target
+        candidates = (
+            (self.score(entry, step), entry.last_seen_step, concept)
+            for concept, entry in self._entries.items()
+            if concept not in protected
+        )
+        evicted = [concept for _, _, concept in heapq.nsmallest(excess, candidates)]
+        for concept in evicted:
+            del self._entries[concept]
+        self.evicted += len(evicted)
+        return evicted
+
+    # -----------------------------------------
+    # PERSISTENCE
+    # -----------------------------------------
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {concept: entry.to_dict() for concept, entry in self._entries.items()}
+
+    def load(self, data: dict) -> None:
+        """Replace the contents with a ``to_dict()``-style payload."""
+        self._entries = {
+            concept: ConceptEntry.from_dict(entry)
+            for concept, entry in (data or {}).items()
+            if isinstance(entry, dict)
+        }
@@ -15,15 +15,18 @@ class BrainEngine:
 
     When constructed with a ``brain``, the enhanced config-driven homeostasis
     is used; standalone usage falls back to the naive baseline decay.
+    ``noise_scale`` multiplies every chemical's noise range (the engine
+    config's ``noise_control.global_noise_multiplier``).
     """
 
-    def __init__(self, state=None, interactions=None, deterministic=False, brain=None, chemical_configs=None):
+    def __init__(self, state=None, interactions=None, deterministic=False, brain=None, chemical_configs=None, noise_scale=1.0):
         if state is None:
             state = BrainState(chemical_configs or {})
         self.state = state
         self.interactions = interactions or Interactions({})
         self.deterministic = deterministic
         self.brain = brain
+        self.noise_scale = float(noise_scale)
 
     def apply_interactions(self):
         self.interactions.apply(self.state)
@@ -32,7 +35,7 @@ class BrainEngine:
         Homeostasis.apply(self.state, brain=self.brain)
 
     def apply_noise(self):
-        Noise.apply(self.state, deterministic=self.deterministic)
+        Noise.apply(self.state, deterministic=self.deterministic, scale=self.noise_scale)
 
     def clamp(self):
         for name, data in self.state.chemicals.items():
@@ -42,6 +45,11 @@ class BrainEngine:
 
             data["value"] = max(min_val, min(value, max_val))
 
+    def update_receptor_dynamics(self):
+        updater = getattr(self.state, "update_receptor_dynamics", None)
+        if updater is not None:
+            updater()
+
     def tick(self):
         # Apply chemical interactions
         self.apply_interactions()
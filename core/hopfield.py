@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+
+class HopfieldNetwork:
+    """Array-backed Hopfield associative memory over bipolar (+1/-1) patterns.
+
+    Weights live in a dense ``(size, size)`` float array with a zero
+    diagonal. Hebbian learning adds ``rate * outer(p, p)`` in one vectorized
+    update. Recall runs synchronous sign updates for a single probe or a
+    whole ``(k, size)`` batch of probes at once. A unit whose input is
+    exactly 0 becomes +1. Inputs are summed column by column, in the same
+    order as the nested-list network did, so near-zero inputs round the
+    same way and recall picks the same side of every tie.
+
+    ``to_list()`` / ``from_list()`` use the nested-list shape stored under
+    ``hopfield_weights`` in brain checkpoints. ``version`` counts learning
+    updates, so callers can tell whether a recall could have changed.
+    """
+
+    def __init__(self, size: int = 9, weights: np.ndarray | None = None):
+        self.size = int(size)
+        if weights is None:
+            weights = np.zeros((self.size, self.size), dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.version = 0
+
+    # -----------------------------------------
+    # LEARNING
+    # -----------------------------------------
+
+    def learn(self, pattern: Iterable[int], rate: float = 1.0) -> None:
+        """Hebbian update ``w_ij += rate * p_i * p_j`` for ``i != j``."""
+        p = np.asarray(pattern, dtype=np.float64)
+        update = np.multiply.outer(p, p)
+        np.fill_diagonal(update, 0.0)
+        update *= rate
+        self.weights += update
+        self.version += 1
+
+    def learn_many(self, patterns: Iterable[Iterable[int]], rates: Iterable[float] | float = 1.0) -> None:
+        """Apply several Hebbian updates at once (``P.T @ diag(rates) @ P``)."""
+        p = np.asarray(patterns, dtype=np.float64).reshape(-1, self.size)
+        r = np.broadcast_to(np.asarray(rates, dtype=np.float64), (len(p),))
+        update = (p * r[:, None]).T @ p
+        np.fill_diagonal(update, 0.0)
+        self.weights += update
+        self.version += 1
+
+    # -----------------------------------------
+    # RECALL
+    # -----------------------------------------
+
+    def recall(self, probes: Iterable, iterations: int = 5) -> np.ndarray:
+        """Converge one probe (``(size,)``) or a batch (``(k, size)``) onto attractors."""
+        x = np.asarray(probes, dtype=np.float64)
+        single = x.ndim == 1
+        x = x.reshape(-1, self.size)
+        for _ in range(int(iterations)):
+            # Not x @ W.T: BLAS reorders the sums and can flip a tie
+            inputs = np.zeros_like(x)
+            for j in range(self.size):
+                inputs += x[:, j, None] * self.weights[:, j]
+            x = np.where(inputs >= 0.0, 1.0, -1.0)
+        x = x.astype(np.int64)
+        return x[0] if single else x
+
+    # -----------------------------------------
+    # SERIALIZATION
+    # -----------------------------------------
+
+    def to_list(self) -> list[list[float]]:
+        return self.weights.tolist()
+
+    @classmethod
+    def from_list(cls, weights: list) -> "HopfieldNetwork":
+        array = np.asarray(weights, dtype=np.float64)
+        if array.ndim != 2 or array.shape[0] != array.shape[1]:
+            raise ValueError(f"Hopfield weights must be a square matrix, got shape {array.shape}")
+        return cls(size=array.shape[0], weights=array.copy())
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+
+class IdleChemistry:
+    """Closed-form chemistry for a run of quiet ticks.
+
+    With no perceptions, one chemistry tick is ``clamp(homeostasis(T @ v))``
+    plus noise. Every piece of that map is affine or a clamp, so the tick is
+    piecewise affine: inside one piece it is ``v -> A @ v + c``. ``A`` and
+    ``c`` are recovered from the deterministic kernel of a
+    :class:`~core.vector_engine.VectorBrainEngine` by finite differences.
+    ``n`` ticks inside a piece then cost one power of the augmented matrix
+    ``[[A, c], [0, 1]]``, built by repeated squaring.
+
+    ``advance()`` takes the largest power-of-two jump whose end point is
+    still governed by the same affine map. The map is checked against the
+    real kernel at the end of each jump. Where no jump fits, and for short
+    stretches, it steps the kernel exactly. Clamped homeostasis phases (``max_delta`` drift, the
+    dopamine upward cap) are affine as well, so a long idle stretch
+    typically resolves in a handful of jumps.
+
+    Noise is added in aggregate. A jump of ``m`` ticks contributes
+    ``sum_k A^k e_k``, where each ``e_k`` is uniform in ``+-noise``. That
+    sum is drawn as a single Gaussian with covariance
+    ``sum_k A^k D A^k.T``, where ``D = diag(noise**2 / 3)``. The covariance
+    is built by the same doubling as the powers. Deterministic engines skip
+    noise.
+    """
+
+    EPSILON = 1e-4
+    TOLERANCE = 1e-8
+    # Short stretches, and the ticks after a failed jump, are cheaper to step
+    # than to linearize again.
+    EXACT_STEPS = 16
+
+    def __init__(self, engine, deterministic: bool = False):
+        self.engine = engine
+        self.deterministic = deterministic
+        self._baselines = engine._load("baseline")
+        self._variance = np.diag(engine.noise ** 2 / 3.0)
+        self._rng = None
+        self.jumps = 0
+        self.exact_steps = 0
+
+    # -----------------------------------------
+    # KERNEL
+    # -----------------------------------------
+
+    def step(self, values: np.ndarray, noise: np.ndarray | None = None) -> np.ndarray:
+        """One chemistry tick, noise-free unless ``noise`` is given."""
+        engine = self.engine
+        values = engine._homeostasis(engine._interactions(values), self._baselines.copy())
+        if noise is not None:
+            values = values + noise
+        return engine._clamp(values)
+
+    def _linearize(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n = len(values)
+        base = self.step(values)
+        probes = values + np.eye(n) * self.EPSILON
+        columns = [(self.step(probe) - base) / self.EPSILON for probe in probes]
+        matrix = np.array(columns).T
+        return matrix, base - matrix @ values
+
+    def _holds(self, values: np.ndarray, matrix: np.ndarray, offset: np.ndarray) -> bool:
+        scale = max(1.0, float(np.max(np.abs(values))))
+        return bool(np.max(np.abs(self.step(values) - (matrix @ values + offset))) <= self.TOLERANCE * scale)
+
+    # -----------------------------------------
+    # NOISE
+    # -----------------------------------------
+
+    def _sample(self, covariance: np.ndarray) -> np.ndarray:
+        if self._rng is None:
+            self._rng = np.random.default_rng(random.getrandbits(64))
+        # Covariance can be rank deficient (noise-free chemicals), so sample
+        # through an eigendecomposition instead of a Cholesky factor.
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        eigenvalues = np.clip(eigenvalues, 0.0, None)
+        return eigenvectors @ (np.sqrt(eigenvalues) * self._rng.standard_normal(len(eigenvalues)))
+
+    def _uniform(self) -> np.ndarray:
+        if self._rng is None:
+            self._rng = np.random.default_rng(random.getrandbits(64))
+        return (self._rng.random(len(self.engine.noise)) * 2.0 - 1.0) * self.engine.noise
+
+    # -----------------------------------------
+    # ADVANCE
+    # -----------------------------------------
+
+    def advance(self, values: np.ndarray, ticks: int) -> np.ndarray:
+        """Chemical values after ``ticks`` quiet ticks from ``values``."""
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        remaining = int(ticks)
+        while remaining > 0:
+            if remaining <= self.EXACT_STEPS:
+                values = self._step_exact(values, remaining)
+                break
+            matrix, offset = self._linearize(values)
+            augmented = np.eye(n + 1)
+            augmented[:n, :n] = matrix
+            augmented[:n, n] = offset
+
+            # powers[k] = augmented ** (2 ** k); spreads[k] is the noise
+            # covariance accumulated over those 2 ** k ticks.
+            powers = [augmented]
+            spreads = [self._variance]
+            while 2 ** len(powers) <= remaining:
+                power, spread = powers[-1], spreads[-1]
+                linear = power[:n, :n]
+                powers.append(power @ power)
+                spreads.append(spread + linear @ spread @ linear.T)
+
+            jumped = False
+            for k in range(len(powers) - 1, 0, -1):
+                power = powers[k]
+                landed = power[:n, :n] @ values + power[:n, n]
+                if self._holds(landed, matrix, offset):
+                    if not self.deterministic:
+                        landed = self.engine._clamp(landed + self._sample(spreads[k]))
+                    values = landed
+                    remaining -= 2 ** k
+                    self.jumps += 1
+                    jumped = True
+                    break
+            if not jumped:
+                values = self._step_exact(values, self.EXACT_STEPS)
+                remaining -= self.EXACT_STEPS
+        return values
+
+    def _step_exact(self, values: np.ndarray, ticks: int) -> np.ndarray:
+        for _ in range(ticks):
+            values = self.step(values, None if self.deterministic else self._uniform())
+        self.exact_steps += ticks
+        return values
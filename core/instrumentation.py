@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections import deque
+from typing import Any
+
+
+class LatencyHistogram:
+    """Rolling latency distribution for one named stage.
+
+    Lifetime ``count``/``total``/``max`` are kept exactly; percentiles are
+    computed on read over the most recent ``window`` samples, so they track
+    current behaviour rather than the whole process history.
+    """
+
+    __slots__ = ("samples", "count", "total", "max")
+
+    def __init__(self, window: int = 2048):
+        self.samples: deque = deque(maxlen=max(1, int(window)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @staticmethod
+    def _percentile(ordered: list[float], q: float) -> float:
+        # Nearest-rank percentile over the sorted window.
+        rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> dict[str, float]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"count": 0, "total_ms": 0.0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000.0, 4),
+            "mean_ms": round(self.total / self.count * 1000.0, 4),
+            "p50_ms": round(self._percentile(ordered, 50) * 1000.0, 4),
+            "p95_ms": round(self._percentile(ordered, 95) * 1000.0, 4),
+            "p99_ms": round(self._percentile(ordered, 99) * 1000.0, 4),
+            "max_ms": round(self.max * 1000.0, 4),
+        }
+
+
+class _Span:
+    __slots__ = ("_instrumentation", "_name", "_start")
+
+    def __init__(self, instrumentation: "Instrumentation", name: str):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._instrumentation.record(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Instrumentation:
+    """Per-stage latency histograms for ``tick()`` and ``perceive()``.
+
+    Stage names are dotted (``tick.decision``, ``perceive.analyze``). When
+    ``enabled`` is false, ``span()`` hands back a shared no-op context and
+    the tick pipeline skips timing altogether, so the disabled cost is one
+    attribute check per call site.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 2048):
+        self.enabled = bool(enabled)
+        self.window = int(window)
+        self.histograms: dict[str, LatencyHistogram] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram(self.window)
+        histogram.record(seconds)
+
+    def span(self, name: str):
+        """Context manager timing the enclosed block as ``name``."""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def snapshot(self, prefix: str | None = None) -> dict[str, dict[str, float]]:
+        """Summaries keyed by stage name, optionally limited to a name prefix."""
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self.histograms.items())
+            if prefix is None or name.startswith(prefix)
+        }
+
+    def to_json(self, path: str | None = None, indent: int = 2) -> str:
+        """Export the snapshot as JSON, also writing it to ``path`` when given."""
+        payload = json.dumps(
+            {"enabled": self.enabled, "window": self.window, "stages": self.snapshot()},
+            indent=indent,
+        )
+        if path:
+            with open(path, "w") as f:
+                f.write(payload)
+        return payload
+
+    def report(self, prefix: str | None = None) -> str:
+        """Plain-text table sorted by total time, for logs and benchmarks."""
+        rows = sorted(self.snapshot(prefix).items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+        lines = [f"{'stage':<36}{'count':>8}{'total ms':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+        for name, row in rows:
+            lines.append(
+                f"{name:<36}{row['count']:>8}{row['total_ms']:>12.2f}"
+                f"{row['p50_ms']:>10.3f}{row['p95_ms']:>10.3f}{row['p99_ms']:>10.3f}"
+            )
+        return "\n".join(lines)
@@ -1,7 +1,10 @@
 import random
 import math
 
+import numpy as np
+
 from .attention import GlobalWorkspace, Thought
+from .hopfield import HopfieldNetwork
 
 CURIOSITY_TEMPLATES = [
     "I wonder what would happen if I {verb} the {object}.",
@@ -14,20 +17,20 @@ VERBS = ["examine", "modify", "re-evaluate", "simulate"]
 OBJECTS = ["environment", "memory trace", "chemical balance"]
 EVENTS = ["praise", "failure", "unexpected perception"]
 
+STATE_CHEMICALS = ["dopamine", "cortisol", "oxytocin", "serotonin", "norepinephrine"]
+STATE_TRAITS = ["competence", "social_value", "resilience", "intelligence"]
+
 
 def _get_state_vector(chemicals_dict: dict, identity_dict: dict) -> list[float]:
     # Extract keys and normalize: chemicals / 100.0, identity in [0, 1]
-    chems = ["dopamine", "cortisol", "oxytocin", "serotonin", "norepinephrine"]
-    traits = ["competence", "social_value", "resilience", "intelligence"]
-    
     vec = []
-    for c in chems:
+    for c in STATE_CHEMICALS:
         val = chemicals_dict.get(c, 50.0)
         if isinstance(val, dict):
             val = val.get("value", 50.0)
         vec.append(float(val) / 100.0)
         
-    for t in traits:
+    for t in STATE_TRAITS:
         val = identity_dict.get(t, 0.5)
         vec.append(float(val))
     return vec
@@ -42,6 +45,24 @@ def _cosine_similarity(v1: list[float], v2: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+def _closest_replay(network, events, recent: list[int], query: list[int]) -> tuple[int, int]:
+    """Sequence number of the replayable event closest to the attractor
+    ``query`` converges to, and how many of its 9 dimensions agree."""
+    # Converge query pattern onto Hopfield attractor state (up to 5 iterations)
+    x = network.recall(query, iterations=5)
+
+    # Search autobiography for the event closest to the converged attractor,
+    # reading the state vectors straight from the event log's columns
+    patterns = np.hstack([
+        events.snapshot_matrix(recent, "chemicals", STATE_CHEMICALS, 50.0) / 100.0,
+        events.snapshot_matrix(recent, "identity", STATE_TRAITS, 0.5),
+    ]) >= 0.5
+    matches = np.count_nonzero(patterns == (x > 0), axis=1)
+    best_match_count = int(matches.max())
+    # Ties go to the most recent event
+    return recent[int(np.flatnonzero(matches == best_match_count)[-1])], best_match_count
+
+
 def generate_spontaneous(brain) -> None:
     # 1. Gating check: Suppress spontaneous mind-wandering in Task Positive Network (TPN) mode
     if getattr(brain, "network_mode", None) == "TPN":
@@ -63,44 +84,24 @@ def generate_spontaneous(brain) -> None:
 
     # Scan autobiographical memory using Hopfield Network Attractor dynamics
     if hasattr(brain, "autobiography") and brain.autobiography.events:
-        candidates = [
-            ev for ev in brain.autobiography.events
-            if ev.get("description") != "cycle_step" and "cycle_step" not in str(ev.get("description", ""))
-        ]
-        if candidates:
+        # Indexed on insert: the 60 most recent events that are not cycle_step records
+        recent = brain.autobiography.replayable_seqs(60)
+        if recent:
             # Convert current state to binary query pattern
             x = [1 if v >= 0.5 else -1 for v in curr_vec]
-            w = getattr(brain, "hopfield_weights", [[0.0]*9 for _ in range(9)])
-
-            # Converge query pattern onto Hopfield attractor state (up to 5 iterations)
-            for _ in range(5):
-                new_x = []
-                for i in range(9):
-                    val = sum(w[i][j] * x[j] for j in range(9))
-                    new_x.append(1 if val >= 0.0 else -1)
-                x = new_x
-
-            # Search autobiography for the event closest to the converged attractor
-            best_matches = []
-            best_match_count = -1
-
-            for ev in candidates[-60:]:
-                ev_chems = ev.get("chemicals", {})
-                ev_id = ev.get("identity", {})
-                ev_vec = _get_state_vector(ev_chems, ev_id)
-                ev_pattern = [1 if v >= 0.5 else -1 for v in ev_vec]
-
-                # Calculate matching dimensions
-                matches = sum(1 for a, b in zip(x, ev_pattern) if a == b)
-                if matches > best_match_count:
-                    best_match_count = matches
-                    best_matches = [ev]
-                elif matches == best_match_count:
-                    best_matches.append(ev)
+            network = getattr(brain, "hopfield", None) or HopfieldNetwork(9)
+            events = brain.autobiography.events
+
+            def search():
+                return _closest_replay(network, events, recent, x)
+
+            # Within tick_many, ticks asking the same question share one search
+            batch = getattr(brain, "tick_batch", None)
+            best_seq, best_match_count = batch.replay(network, recent, x, search) if batch else search()
 
             # If matches represent high overlap (at least 7/9 dimensions aligned)
             if best_match_count >= 7:
-                best_event = best_matches[-1]
+                best_event = events.get(best_seq)
                 best_similarity = float(best_match_count) / 9.0
 
     # Replay memory if similarity exceeds cognitive threshold
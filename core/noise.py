@@ -3,11 +3,11 @@ import random
 
 class Noise:
     @staticmethod
-    def apply(state, deterministic=False):
+    def apply(state, deterministic=False, scale=1.0):
         if deterministic:
             return
 
         for name, data in state.chemicals.items():
-            noise_range = data["noise"]
+            noise_range = data["noise"] * scale
             variation = random.uniform(-noise_range, noise_range)
             data["value"] += variation
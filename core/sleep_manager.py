@@ -5,6 +5,36 @@ import yaml
 from typing import Any
 from core.attention import Thought
 
+# The config path is resolved relative to the project root (the directory
+# containing core/) so behavior never depends on the process working directory.
+SLEEP_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "chemicals.yaml")
+
+_sleep_settings_cache: dict[str, Any] = {}
+
+
+def _load_sleep_settings() -> dict:
+    """``sleep_settings`` from chemicals.yaml, parsed once per file modification.
+
+    Every brain (and every API ``/reset``) builds a SleepManager, so the YAML
+    is only re-read when the file changes on disk.
+    """
+    try:
+        mtime = os.path.getmtime(SLEEP_CONFIG_PATH)
+    except OSError:
+        return {}
+    cached = _sleep_settings_cache.get(SLEEP_CONFIG_PATH)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(SLEEP_CONFIG_PATH, "r") as f:
+            config = yaml.safe_load(f) or {}
+        settings = config.get("sleep_settings", {}) or {}
+    except Exception:
+        settings = {}
+    _sleep_settings_cache[SLEEP_CONFIG_PATH] = (mtime, settings)
+    return settings
+
+
 class SleepManager:
 
     def __init__(self, cycle_period: int = 100):
@@ -15,21 +45,13 @@ class SleepManager:
         self.fatigue_recovery_rate = 0.25
 
         # Try to load custom sleep settings from configuration.
-        # The config path is resolved relative to the project root (the
-        # directory containing core/) so behavior never depends on the
-        # process working directory.
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sleep_config_path = os.path.join(project_root, "config", "chemicals.yaml")
-        if os.path.exists(sleep_config_path):
+        sleep_cfg = _load_sleep_settings()
+        if sleep_cfg:
             try:
-                with open(sleep_config_path, "r") as f:
-                    config = yaml.safe_load(f) or {}
-                    sleep_cfg = config.get("sleep_settings", {})
-                    if sleep_cfg:
-                        self.cycle_period = int(sleep_cfg.get("cycle_period", self.cycle_period))
-                        self.sleep_duration = int(sleep_cfg.get("sleep_duration", self.sleep_duration))
-                        self.fatigue_accumulation_rate = float(sleep_cfg.get("fatigue_accumulation_rate", self.fatigue_accumulation_rate))
-                        self.fatigue_recovery_rate = float(sleep_cfg.get("fatigue_recovery_rate", self.fatigue_recovery_rate))
+                self.cycle_period = int(sleep_cfg.get("cycle_period", self.cycle_period))
+                self.sleep_duration = int(sleep_cfg.get("sleep_duration", self.sleep_duration))
+                self.fatigue_accumulation_rate = float(sleep_cfg.get("fatigue_accumulation_rate", self.fatigue_accumulation_rate))
+                self.fatigue_recovery_rate = float(sleep_cfg.get("fatigue_recovery_rate", self.fatigue_recovery_rate))
             except Exception:
                 pass
 
@@ -69,6 +91,29 @@ class SleepManager:
         has_melatonin_trigger = "melatonin" in brain.chemicals and brain.chemicals["melatonin"]["value"] > 80.0
         return sleep_drive > 0.85 or has_melatonin_trigger
 
+    # -----------------------------------------
+    # SYNAPTIC PRUNING
+    # -----------------------------------------
+
+    def prune_q_values(self, brain: Any, ticks: int = 1) -> None:
+        """Decay every Q-value by 2% per slow-wave tick (``ticks`` at once)."""
+        if brain.decision_engine and hasattr(brain.decision_engine, "q_table"):
+            factor = 0.98 ** ticks
+            for tone in brain.decision_engine.q_table:
+                for act in brain.decision_engine.q_table[tone]:
+                    brain.decision_engine.q_table[tone][act] *= factor
+            brain.decision_engine.version += 1
+
+    def slow_wave_ticks(self, ticks: int) -> int:
+        """Expected slow-wave sleep ticks in ``ticks`` of undisturbed time.
+
+        One sleep episode per circadian cycle, of which the last
+        ``sleep_duration // 5`` ticks (at least 2) are REM.
+        """
+        rem_ticks = max(2, self.sleep_duration // 5)
+        per_cycle = max(0, self.sleep_duration - rem_ticks)
+        return int(ticks * per_cycle / max(1, self.cycle_period))
+
     # -----------------------------------------
     # SLEEP CYCLE EXECUTION
     # -----------------------------------------
@@ -122,10 +167,7 @@ class SleepManager:
                             brain.decision_engine.update_q_value(mood_tone, action, reward)
             
             # Synaptic Pruning: Q-table decay
-            if brain.decision_engine and hasattr(brain.decision_engine, "q_table"):
-                for tone in brain.decision_engine.q_table:
-                    for act in brain.decision_engine.q_table[tone]:
-                        brain.decision_engine.q_table[tone][act] *= 0.98
+            self.prune_q_values(brain)
         
         # REM Dream Consolidation Phase
         else:
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import copy
+from collections import deque
+from typing import Any, Callable, Iterable
+
+
+# -----------------------------------------
+# READ-ONLY CONTAINERS
+# -----------------------------------------
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is a read-only snapshot view; "
+        "use .copy() or copy.deepcopy() to get a mutable container"
+    )
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` handed out by snapshot views.
+
+    It is still a real ``dict`` (``isinstance`` checks, ``json.dump`` and
+    FastAPI encoding work unchanged) but every mutator raises ``TypeError``.
+    ``copy()`` returns a plain shallow ``dict``; ``copy.deepcopy`` and pickle
+    return fully plain containers.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def copy(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only ``list`` counterpart of :class:`FrozenDict`."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __iadd__ = __imul__ = _read_only
+
+    def copy(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Deep-copy ``value`` into read-only containers.
+
+    Already frozen containers are returned as-is, so freezing a payload that
+    embeds earlier snapshot sections shares them instead of copying again.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, deque)):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of :func:`freeze`: plain, independently mutable containers."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return copy.deepcopy(value)
+
+
+# -----------------------------------------
+# VERSIONED SECTION CACHE
+# -----------------------------------------
+
+class StateSnapshots:
+    """Per-section version counters and cached frozen views.
+
+    Each expensive section of ``VirtualBrain.get_state()`` is built once per
+    version and then handed out again until its owner reports a change, so
+    repeated snapshots share unchanged sections instead of copying them.
+
+    Sections are versioned in one of two ways:
+
+    * subsystems that own a ``version`` attribute (decision engine, language
+      cortex, user memory, autobiography) pass it to :meth:`section`;
+    * brain-owned containers (concept memory, Hopfield weights) call
+      :meth:`touch` whenever they mutate and read :meth:`version` back.
+
+    Cached views are immutable (:class:`FrozenDict` / :class:`FrozenList`), so
+    a caller can never corrupt the copy another caller is holding.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+        self._dirty: dict[str, set | None] = {}
+        self._cache: dict[str, tuple[Any, Any]] = {}
+        self._records: dict[str, dict[Any, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def touch(self, section: str, keys: Iterable | None = None) -> None:
+        """Mark a brain-owned section as changed.
+
+        ``keys`` narrows the change to specific entries of a mapping section
+        built with :meth:`mapping`; ``None`` invalidates the whole section.
+        """
+        self._versions[section] = self._versions.get(section, 0) + 1
+        if keys is None:
+            self._dirty[section] = None
+            return
+        pending = self._dirty.setdefault(section, set())
+        if pending is not None:
+            pending.update(keys)
+
+    def version(self, section: str) -> int:
+        return self._versions.get(section, 0)
+
+    def _cached(self, section: str, version: Any):
+        entry = self._cache.get(section)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def section(self, section: str, version: Any, build: Callable[[], Any]) -> Any:
+        """Frozen result of ``build()``, rebuilt only when ``version`` changes."""
+        entry = self._cached(section, version)
+        if entry is not None:
+            return entry[1]
+        value = freeze(build())
+        self._cache[section] = (version, value)
+        return value
+
+    def mapping(self, section: str, source: Any, convert: Callable[[Any], Any] | None = None) -> FrozenDict:
+        """Frozen view of a brain-owned mapping, refreezing only touched keys.
+
+        Entries that were not touched since the previous build are shared with
+        the previous view; only dirty keys are copied. ``convert`` turns each
+        value into plain containers first (e.g. a slotted record's
+        ``to_dict``).
+        """
+        version = self.version(section)
+        entry = self._cached(section, version)
+        if entry is not None:
+            return entry[1]
+
+        convert = convert or (lambda value: value)
+        dirty = self._dirty.pop(section, None)
+        previous = self._cache.get(section)
+        if previous is None or dirty is None:
+            view = FrozenDict((key, freeze(convert(value))) for key, value in source.items())
+        else:
+            view = FrozenDict(previous[1])
+            for key in dirty:
+                if key in source:
+                    dict.__setitem__(view, key, freeze(convert(source[key])))
+                elif key in view:
+                    dict.__delitem__(view, key)
+        self._cache[section] = (version, view)
+        return view
+
+    def records(self, section: str, version: Any, items: Iterable) -> FrozenList:
+        """Frozen view of an append-only sequence of never-mutated records.
+
+        Each record is frozen once, the first time it is seen, and reused by
+        identity in later views.
+        """
+        entry = self._cached(section, version)
+        if entry is not None:
+            return entry[1]
+
+        known = self._records.get(section, {})
+        seen = {}
+        frozen = []
+        for item in items:
+            record = known.get(id(item))
+            if record is None or record[0] is not item:
+                record = (item, freeze(item))
+            seen[id(item)] = record
+            frozen.append(record[1])
+        self._records[section] = seen
+        view = FrozenList(frozen)
+        self._cache[section] = (version, view)
+        return view
+
+    def keyed_records(self, section: str, version: Any, keys: Iterable, materialize: Callable[[list], list]) -> FrozenList:
+        """Like :meth:`records`, for records that are stored in another form
+        and built on demand (the autobiography's columnar event log).
+
+        ``keys`` identifies each record for as long as it is in the sequence;
+        ``materialize(missing)`` builds the records for the keys not frozen
+        before, in one call.
+        """
+        entry = self._cached(section, version)
+        if entry is not None:
+            return entry[1]
+
+        keys = list(keys)
+        known = self._records.get(section, {})
+        missing = [key for key in keys if key not in known]
+        if missing:
+            known.update(zip(missing, map(freeze, materialize(missing))))
+        seen = {key: known[key] for key in keys}
+        frozen = list(seen.values())
+        self._records[section] = seen
+        view = FrozenList(frozen)
+        self._cache[section] = (version, view)
+        return view
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+class TickBatch:
+    """Work shared by the ticks of one :meth:`VirtualBrain.tick_many` call.
+
+    - ``cycle_memories``: the content of each tick's ``autobiography_cycle``
+      memory. Nothing in a tick reads the episodic store, so they are
+      created in one bulk ``create_memories`` call when the batch ends
+      instead of one ``create_memory`` per tick.
+    - the spontaneous replay search: converging the current state onto a
+      Hopfield attractor and matching it against the replayable events.
+      Idle ticks only record ``cycle_step`` events, which are never
+      replayed, so the search is done once per distinct query pattern and
+      reused until a new replayable event arrives or the Hopfield weights
+      learn.
+    """
+
+    def __init__(self) -> None:
+        self.cycle_memories: list[dict[str, Any]] = []
+        self.replay_searches = 0
+        self.replay_reuses = 0
+        self._replay_key: tuple | None = None
+        self._replays: dict[tuple, Any] = {}
+
+    def replay(self, network: Any, recent: list[int], query: list[int], search: Callable[[], Any]) -> Any:
+        """``search()`` for ``query``, reused while ``network`` holds the same
+        weights and ``recent`` the same replayable event sequence numbers."""
+        key = (network, network.version, tuple(recent))
+        if key != self._replay_key:
+            self._replay_key = key
+            self._replays = {}
+        query = tuple(query)
+        if query in self._replays:
+            self.replay_reuses += 1
+        else:
+            self._replays[query] = search()
+            self.replay_searches += 1
+        return self._replays[query]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Callable
+
+
+EVERY_TICK = "every_tick"
+EVERY_N = "every_n"
+ON_DIRTY = "on_dirty"
+CADENCES = (EVERY_TICK, EVERY_N, ON_DIRTY)
+
+
+class TickContext:
+    """Per-tick scratch space handed from stage to stage.
+
+    Stages share intermediate results (the decision output, regret, the
+    belief update, ...) as plain attributes. A stage ends the tick early by
+    calling :meth:`halt` with the value ``tick()`` should return.
+    """
+
+    def __init__(self, tick_index: int, **fields: Any):
+        self.tick_index = tick_index
+        self.result = None
+        self.halted = False
+        self.__dict__.update(fields)
+
+    def halt(self, result: Any = None) -> None:
+        self.result = result
+        self.halted = True
+
+
+class TickStage:
+    """One named, ordered step of the tick with its run cadence.
+
+    ``cadence`` is one of:
+
+    - ``every_tick``: runs on every tick;
+    - ``every_n``: runs on ticks where ``tick_index % every == offset``;
+    - ``on_dirty``: runs only on ticks after the stage was marked dirty.
+
+    ``required`` stages keep the brain consistent (chemistry, sleep, the
+    end-of-tick bookkeeping) and must run every tick.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[TickContext], Any],
+        order: int,
+        cadence: str = EVERY_TICK,
+        every: int = 1,
+        offset: int = 0,
+        required: bool = False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.order = order
+        self.required = required
+        self.dirty = False
+        self.set_cadence(cadence, every=every, offset=offset)
+
+    def set_cadence(self, cadence: str, every: int = 1, offset: int = 0) -> None:
+        if cadence not in CADENCES:
+            raise ValueError(f"Unknown cadence {cadence!r} for stage {self.name!r}; expected one of {CADENCES}")
+        every = int(every)
+        if every < 1:
+            raise ValueError(f"Stage {self.name!r}: 'every' must be >= 1, got {every}")
+        if self.required and (cadence != EVERY_TICK and not (cadence == EVERY_N and every == 1)):
+            raise ValueError(f"Stage {self.name!r} is required and must run every tick")
+        self.cadence = cadence
+        self.every = every
+        self.offset = int(offset) % every
+
+    def due(self, tick_index: int) -> bool:
+        if self.cadence == EVERY_TICK:
+            return True
+        if self.cadence == EVERY_N:
+            return tick_index % self.every == self.offset
+        return self.dirty
+
+
+class TickPipeline:
+    """Ordered, cadence-aware list of tick stages.
+
+    ``run()`` executes the due stages in ``order`` and records which ones ran:
+    ``last_ran`` for the latest tick, ``history`` for the recent ones and
+    ``run_counts`` / ``skip_counts`` over the pipeline's lifetime. With an
+    enabled ``instrumentation`` each stage is also timed as
+    ``<prefix><stage name>``.
+    """
+
+    def __init__(self, history_size: int = 100, instrumentation=None, prefix: str = "tick."):
+        self.instrumentation = instrumentation
+        self.prefix = prefix
+        self.stages: list[TickStage] = []
+        self._by_name: dict[str, TickStage] = {}
+        self.ticks = 0
+        self.last_ran: list[str] = []
+        self.history: deque = deque(maxlen=max(1, int(history_size)))
+        self.run_counts: dict[str, int] = {}
+        self.skip_counts: dict[str, int] = {}
+
+    # -----------------------------------------
+    # REGISTRATION
+    # -----------------------------------------
+
+    def register(
+        self,
+        name: str,
+        fn: Callable[[TickContext], Any],
+        order: int,
+        cadence: str = EVERY_TICK,
+        every: int = 1,
+        offset: int = 0,
+        required: bool = False,
+    ) -> TickStage:
+        if name in self._by_name:
+            raise ValueError(f"Tick stage {name!r} is already registered")
+        stage = TickStage(name, fn, order, cadence=cadence, every=every, offset=offset, required=required)
+        stage.metric = self.prefix + name
+        self.stages.append(stage)
+        self.stages.sort(key=lambda s: s.order)
+        self._by_name[name] = stage
+        self.run_counts[name] = 0
+        self.skip_counts[name] = 0
+        return stage
+
+    def configure(self, stage_config: dict | None) -> None:
+        """Apply per-stage overrides: ``{name: {cadence, every, offset, order}}``."""
+        for name, overrides in (stage_config or {}).items():
+            stage = self._by_name.get(name)
+            if stage is None:
+                raise ValueError(f"Unknown tick stage {name!r}; known stages: {self.names()}")
+            overrides = overrides or {}
+            stage.set_cadence(
+                overrides.get("cadence", stage.cadence),
+                every=overrides.get("every", stage.every),
+                offset=overrides.get("offset", stage.offset),
+            )
+            if "order" in overrides:
+                stage.order = int(overrides["order"])
+        self.stages.sort(key=lambda s: s.order)
+
+    def get(self, name: str) -> TickStage:
+        return self._by_name[name]
+
+    def names(self) -> list[str]:
+        return [stage.name for stage in self.stages]
+
+    def mark_dirty(self, *names: str) -> None:
+        """Flag ``on_dirty`` stages to run on the next tick (all of them when no names are given)."""
+        targets = [self._by_name[name] for name in names] if names else self.stages
+        for stage in targets:
+            if stage.cadence == ON_DIRTY:
+                stage.dirty = True
+
+    # -----------------------------------------
+    # EXECUTION
+    # -----------------------------------------
+
+    def run(self, ctx: TickContext) -> TickContext:
+        timer = self.instrumentation
+        if timer is not None and not timer.enabled:
+            timer = None
+        ran = []
+        for stage in self.stages:
+            if ctx.halted:
+                break
+            if not stage.due(ctx.tick_index):
+                self.skip_counts[stage.name] += 1
+                continue
+            stage.dirty = False
+            if timer is None:
+                stage.fn(ctx)
+            else:
+                start = time.perf_counter()
+                stage.fn(ctx)
+                timer.record(stage.metric, time.perf_counter() - start)
+            ran.append(stage.name)
+            self.run_counts[stage.name] += 1
+        self.ticks += 1
+        self.last_ran = ran
+        self.history.append((ctx.tick_index, ran))
+        return ctx
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-stage cadence and lifetime run/skip counts."""
+        return {
+            stage.name: {
+                "order": stage.order,
+                "cadence": stage.cadence,
+                "every": stage.every,
+                "runs": self.run_counts[stage.name],
+                "skipped": self.skip_counts[stage.name],
+            }
+            for stage in self.stages
+        }
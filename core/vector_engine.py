@@ -0,0 +1,217 @@
+import random
+
+import numpy as np
+
+from core.interactions import Interactions
+
+
+class VectorBrainEngine:
+    """Array-backed drop-in replacement for :class:`core.engine.BrainEngine`.
+
+    The interaction table is compiled once into a dense ``(n, n)`` matrix and
+    the per-tick mechanics (interactions, homeostasis, noise and clamp) run
+    as whole-vector NumPy operations, fused into one pass by ``tick()``.
+    The chemical container stays the source of truth: each call gathers the
+    live values into arrays with plain attribute access, applies the math
+    and scatters the results back, so the rest of the brain keeps using the
+    usual ``chemicals[name]["value"]`` protocol.
+
+    Results match the per-dict ``BrainEngine`` path within floating point
+    tolerance. The only intentional difference is noise: samples come from a
+    private ``numpy.random.Generator`` (seeded from the global ``random``
+    stream on first use), so stochastic runs agree in distribution rather
+    than sample for sample. Deterministic runs skip noise on both paths.
+    """
+
+    NOISE_BLOCK = 1024
+
+    def __init__(self, state, interactions=None, deterministic=False, brain=None, noise_scale=1.0):
+        self.state = state
+        self.interactions = interactions or Interactions({})
+        self.deterministic = deterministic
+        self.brain = brain
+        self.noise_scale = float(noise_scale)
+        self._rng = None
+        self._noise_rows = np.empty((0, 0))
+        self._noise_row = 0
+        self.compile()
+
+    # -----------------------------------------
+    # COMPILATION
+    # -----------------------------------------
+
+    def compile(self):
+        """(Re)build the static arrays from the current chemical container.
+
+        Call again after adding chemicals, editing the interaction matrix,
+        changing ``noise_scale`` or changing the brain's homeostasis baselines
+        at runtime.
+        """
+        chemicals = self.state.chemicals
+        self.names = list(chemicals.keys())
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self._items = [chemicals[name] for name in self.names]
+        self._objects = bool(self._items) and all(hasattr(item, "value") for item in self._items)
+
+        n = len(self.names)
+        self.min = np.array([float(self._read(item, "min")) for item in self._items], dtype=np.float64)
+        self.max = np.array([float(self._read(item, "max")) for item in self._items], dtype=np.float64)
+        self.decay = np.array([float(self._read(item, "decay")) for item in self._items], dtype=np.float64)
+        self.noise = np.array([float(self._read(item, "noise")) for item in self._items], dtype=np.float64)
+        self.noise *= self.noise_scale
+
+        # matrix[target, source] = weight, so deltas = matrix @ values and a
+        # whole interaction step is the single product transition @ values.
+        self.matrix = np.zeros((n, n), dtype=np.float64)
+        for source, targets in (self.interactions.matrix or {}).items():
+            if source not in self.index:
+                continue
+            for target, weight in (targets or {}).items():
+                if target in self.index:
+                    self.matrix[self.index[target], self.index[source]] += float(weight)
+        self.transition = np.eye(n) + self.matrix
+
+        self._dopamine = self.index.get("dopamine")
+        self._oxytocin = self.index.get("oxytocin")
+        self._cortisol = self.index.get("cortisol")
+        self._serotonin = self.index.get("serotonin")
+        self._noise_row = len(self._noise_rows)
+
+        brain = self.brain
+        if brain is not None:
+            baselines = getattr(brain, "homeostasis_baselines", {}) or {}
+            self._has_homeostasis_target = np.array([name in baselines for name in self.names], dtype=bool)
+            self._homeostasis_targets = np.array(
+                [float(baselines.get(name, 0.0)) for name in self.names],
+                dtype=np.float64,
+            )
+
+    @staticmethod
+    def _read(item, key):
+        if hasattr(item, key):
+            return getattr(item, key)
+        return item[key]
+
+    # -----------------------------------------
+    # GATHER / SCATTER
+    # -----------------------------------------
+
+    def _load(self, key="value"):
+        if self._objects:
+            return np.array([getattr(item, key) for item in self._items], dtype=np.float64)
+        return np.array([item[key] for item in self._items], dtype=np.float64)
+
+    def _store(self, values, key="value"):
+        if self._objects:
+            for item, value in zip(self._items, values.tolist()):
+                setattr(item, key, value)
+        else:
+            for item, value in zip(self._items, values.tolist()):
+                item[key] = value
+
+    def values(self) -> np.ndarray:
+        """Current chemical values as a vector in ``self.names`` order."""
+        return self._load()
+
+    # -----------------------------------------
+    # VECTOR KERNELS
+    # -----------------------------------------
+
+    def _interactions(self, values):
+        return self.transition @ values
+
+    def _homeostasis(self, values, baselines):
+        brain = self.brain
+        if brain is None:
+            return values + (baselines - values) * self.decay
+
+        homeo = brain.brain_config["homeostasis"]
+        max_delta = brain.homeostasis_max_delta
+
+        # ``baselines`` is a fresh gather, so it can be overwritten in place.
+        np.copyto(baselines, self._homeostasis_targets, where=self._has_homeostasis_target)
+        delta = (baselines - values) * brain.homeostasis_rate
+        np.clip(delta, -max_delta, max_delta, out=delta)
+
+        # Chemical-specific rules touch a single slot each, so they are
+        # applied as scalar corrections rather than extra full-width passes
+        # (NumPy per-call overhead dominates at registry sizes).
+        i = self._dopamine
+        if i is not None and delta.item(i) > 0 and not any(v > 0 for v in brain._step_perception_valences):
+            delta[i] = min(delta.item(i), brain.homeostasis_gentle_upward_max)
+
+        i = self._oxytocin
+        if i is not None and delta.item(i) < 0:
+            oxy_mults = homeo["oxytocin_decay_multipliers"]
+            social_value = float(brain.identity.get("social_value"))
+            if social_value > float(oxy_mults["high_social_value"]):
+                delta[i] *= float(oxy_mults["high_multiplier"])
+            elif social_value > float(oxy_mults["mid_social_value"]):
+                delta[i] *= float(oxy_mults["mid_multiplier"])
+
+        i = self._cortisol
+        if i is not None:
+            excess = max(0.0, values.item(i) - brain.cortisol_decay_baseline)
+            cortisol_delta = delta.item(i) - float(homeo["cortisol_decay_rate"]) * excess
+            delta[i] = max(-max_delta, min(max_delta, cortisol_delta))
+
+        delta += values
+
+        i = self._oxytocin
+        floor = float(homeo["oxytocin_floor"])
+        if i is not None and delta.item(i) < floor:
+            delta[i] += (floor - delta.item(i)) * float(homeo["oxytocin_floor_pull"])
+
+        i = self._serotonin
+        if i is not None:
+            delta[i] += (brain.serotonin_regulation_baseline - delta.item(i)) * float(homeo["serotonin_pull_rate"])
+        return delta
+
+    def _noise(self, values):
+        if self.deterministic:
+            return values
+        if self._noise_row >= len(self._noise_rows):
+            if self._rng is None:
+                self._rng = np.random.default_rng(random.getrandbits(64))
+            # Draw a block of ticks at once; one row is consumed per tick.
+            self._noise_rows = (self._rng.random((self.NOISE_BLOCK, len(self.names))) * 2.0 - 1.0) * self.noise
+            self._noise_row = 0
+        row = self._noise_rows[self._noise_row]
+        self._noise_row += 1
+        return values + row
+
+    def _clamp(self, values):
+        return np.minimum(np.maximum(values, self.min), self.max)
+
+    # -----------------------------------------
+    # BrainEngine INTERFACE
+    # -----------------------------------------
+
+    def apply_interactions(self):
+        self._store(self._interactions(self._load()))
+
+    def apply_homeostasis(self):
+        self._store(self._homeostasis(self._load(), self._load("baseline")))
+
+    def apply_noise(self):
+        if self.deterministic:
+            return
+        self._store(self._noise(self._load()))
+
+    def clamp(self):
+        self._store(self._clamp(self._load()))
+
+    def tick(self):
+        """Fused interactions -> homeostasis -> noise -> clamp in one gather/scatter."""
+        values = self._interactions(self._load())
+        values = self._homeostasis(values, self._load("baseline"))
+        values = self._noise(values)
+        self._store(self._clamp(values))
+
+    def update_receptor_dynamics(self):
+        # Receptor adaptation is per-chemical streak bookkeeping with three
+        # branches; at registry sizes (nine chemicals) NumPy dispatch costs
+        # more than it saves, so this stays on the Chemical objects.
+        updater = getattr(self.state, "update_receptor_dynamics", None)
+        if updater is not None:
+            updater()
@@ -20,6 +20,9 @@ class DecisionEngine:
         for tone in ["distressed", "tense", "calm", "confident", "hopeful", "neutral"]:
             self.q_table[tone] = {act: float(base_probs.get(act, 0.2)) for act in actions}
         self.learning_rate = 0.1
+        # Bumped on every Q-table mutation so state snapshots can reuse an
+        # unchanged copy.
+        self.version = 0
 
     def update_q_value(self, state_tone: str, action: str, reward: float) -> float:
         state_tone = str(state_tone).lower()
@@ -33,6 +36,7 @@ class DecisionEngine:
         rpe = reward - current_q
         # Q-learning update rule with dynamic striatal learning rate
         self.q_table[state_tone][action] = current_q + self.learning_rate * rpe
+        self.version += 1
         return rpe
 
     def decide(self, focus: Thought, state: dict | None = None, recent_valence_avg: float = 0.0, bias_engine: Any = None) -> dict:
@@ -56,6 +60,7 @@ class DecisionEngine:
         mood_tone = str(mood_state.get("tone", "neutral")).lower()
         if mood_tone not in self.q_table:
             self.q_table[mood_tone] = {act: float(self.model.base_probabilities.get(act, 0.2)) for act in self.model.actions}
+            self.version += 1
 
         ne_val = chemical_state.get("norepinephrine", 50.0) / 100.0
         q_influence = max(0.1, 1.2 - ne_val)
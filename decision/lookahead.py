@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_ACTIONS = ["support", "challenge", "suggest", "refuse", "neutral"]
+
+
+class LookaheadEngine:
+    """Expectimax lookahead over the decision model, one tree layer at a time.
+
+    A node's value is ``reward(action) + 0.5 * E[value of the next layer]``,
+    where the expectation runs over the probabilities the decision model
+    assigns in the state the action leads to. Each call expands the tree
+    breadth-first. Every action is applied to every state of a layer as
+    array operations over a ``(states, chemicals)`` matrix. The result is
+    the same arithmetic, in the same order, as the old per-node recursion.
+
+    A transposition table stores the action values of each
+    ``(quantized chemical state, remaining depth)`` pair that is evaluated.
+    States reached by different paths, or seen again on a later tick,
+    reuse those values instead of expanding the subtree again. ``quantum``
+    is the quantization step in chemical units. The table holds at most
+    ``table_size`` entries, least recently used first out, and is cleared
+    whenever the planning context changes (active goal, love weighting,
+    receptor sensitivities, action bias or feedback scaling).
+    """
+
+    def __init__(self, quantum: float = 1e-4, table_size: int = 4096):
+        self.quantum = max(1e-12, float(quantum))
+        self.table_size = max(0, int(table_size))
+        self._table: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._context_key: tuple | None = None
+        self._tables_key: tuple | None = None
+        self.hits = 0
+        self.misses = 0
+        self.nodes = 0
+
+    # -----------------------------------------
+    # PUBLIC API
+    # -----------------------------------------
+
+    def evaluate(
+        self,
+        brain,
+        state: dict,
+        actions: list[str],
+        depth: int,
+        time_budget_ms: float = 0.0,
+    ) -> tuple[dict[str, float], int]:
+        """Lookahead value of each of ``actions`` taken from ``state``.
+
+        With a positive ``time_budget_ms`` the search deepens one layer at a
+        time, from 1 up to ``depth``, and stops once the budget is spent.
+        Returns the values of the deepest completed search and that depth.
+        """
+        depth = max(0, int(depth))
+        if depth == 0 or not actions:
+            return {action: 0.0 for action in actions}, 0
+
+        self._prepare(brain, state, actions)
+        root = self._vector(state.get("neurochemicals", {}))[None, :]
+        root_actions = [self._action_index[action] for action in actions]
+
+        if time_budget_ms and time_budget_ms > 0:
+            deadline = time.perf_counter() + time_budget_ms / 1000.0
+            values, reached = None, 0
+            for level in range(1, depth + 1):
+                values, reached = self._values(root, level, root_actions)[0], level
+                if time.perf_counter() >= deadline:
+                    break
+        else:
+            values, reached = self._values(root, depth, root_actions)[0], depth
+
+        return {action: float(value) for action, value in zip(actions, values)}, reached
+
+    def clear(self) -> None:
+        self._table.clear()
+        self._context_key = None
+        self._tables_key = None
+
+    # -----------------------------------------
+    # MODEL TABLES
+    # -----------------------------------------
+
+    def _prepare(self, brain, state: dict, root_actions: list[str]) -> None:
+        """Refresh the reward, transition and probability tables for this call.
+
+        The tables only depend on the decision model, the active goal, the
+        love weighting and the feedback scaling, so they are rebuilt only
+        when one of those changes.
+        """
+        decision_engine = brain.decision_engine
+        neurochemicals = state.get("neurochemicals", {})
+
+        active_goal = None
+        if hasattr(brain, "goal_system") and brain.goal_system:
+            active_goal = brain.goal_system.get_active_goal()
+        love_score = float(state.get("love_score", 0.0))
+        feedback_multiplier = getattr(brain, "feedback_multiplier", 1.0)
+        decision_feedback_scale = getattr(brain, "decision_feedback_scale", 0.45)
+
+        tables_key = (
+            tuple(neurochemicals),
+            tuple(root_actions),
+            id(decision_engine),
+            active_goal,
+            love_score > 0.5,
+            feedback_multiplier,
+            decision_feedback_scale,
+        )
+        if tables_key != self._tables_key:
+            self._build_tables(brain, state, root_actions, active_goal, love_score, feedback_multiplier, decision_feedback_scale)
+            self._tables_key = tables_key
+
+        self._sensitivity = np.array(
+            [brain.chemicals[name].sensitivity if name in brain.chemicals else 1.0 for name in self._chemicals],
+            dtype=np.float64,
+        )
+        action_bias = state.get("decision_action_bias", {})
+        self._bias = []
+        if isinstance(action_bias, dict):
+            self._bias = [(self._tree_column[act], float(delta)) for act, delta in action_bias.items() if act in self._tree_column]
+
+        context = (tables_key, self._sensitivity.tobytes(), tuple(self._bias))
+        if context != self._context_key:
+            self._table.clear()
+            self._context_key = context
+
+    def _build_tables(self, brain, state, root_actions, active_goal, love_score, feedback_multiplier, decision_feedback_scale) -> None:
+        decision_engine = brain.decision_engine
+        model = decision_engine.model if decision_engine else None
+        self._model = model
+        self._chemicals = list(state.get("neurochemicals", {}))
+        self._column = {name: i for i, name in enumerate(self._chemicals)}
+
+        self._tree_actions = list(model.base_probabilities) if model else list(DEFAULT_ACTIONS)
+        self._tree_column = {action: j for j, action in enumerate(self._tree_actions)}
+        all_actions = list(self._tree_actions)
+        for action in root_actions:
+            if action not in all_actions:
+                all_actions.append(action)
+        self._action_index = {action: i for i, action in enumerate(all_actions)}
+        self._tree = np.array([self._action_index[a] for a in self._tree_actions], dtype=np.intp)
+
+        # Reward weights (constant across the tree)
+        w_dopamine = 1.0
+        w_serotonin = 1.0
+        w_oxytocin = 1.0
+        w_cortisol = -1.0
+
+        if active_goal == "safety":
+            w_cortisol = -2.5
+            w_oxytocin = 0.5
+            w_dopamine = 0.5
+        elif active_goal == "task_mastery":
+            w_dopamine = 2.0
+            w_cortisol = -0.5
+        elif active_goal == "social_bond":
+            w_oxytocin = 2.0
+            w_serotonin = 1.5
+            w_cortisol = -0.8
+
+        # Scale rewards if Love Emotion is active (love_score > 0.5)
+        if love_score > 0.5:
+            w_oxytocin = 3.0
+            w_cortisol = w_cortisol / 3.0
+
+        # Per-action feedback as (actions, chemicals) arrays; a False mask
+        # entry leaves that chemical untouched by the action.
+        width = len(self._chemicals)
+        self._rewards = np.zeros(len(all_actions), dtype=np.float64)
+        self._bounded = np.zeros((len(all_actions), width), dtype=np.float64)
+        self._mask = np.zeros((len(all_actions), width), dtype=bool)
+        self._low = np.zeros(width, dtype=np.float64)
+        self._high = np.ones(width, dtype=np.float64)
+        self._span = np.ones(width, dtype=np.float64)
+        self._cortisol = self._column.get("cortisol")
+        for name, col in self._column.items():
+            if name in brain.chemicals:
+                chem_def = brain.chemicals[name]
+                self._low[col] = chem_def["min"]
+                self._high[col] = chem_def["max"]
+                self._span[col] = max(1e-6, chem_def["max"] - chem_def["min"])
+
+        for i, action in enumerate(all_actions):
+            feedback = decision_engine.execute_action(action, state).get("feedback", {}) if decision_engine else {}
+            self._rewards[i] = (
+                feedback.get("dopamine", 0.0) * w_dopamine +
+                feedback.get("serotonin", 0.0) * w_serotonin +
+                feedback.get("oxytocin", 0.0) * w_oxytocin +
+                feedback.get("cortisol", 0.0) * w_cortisol
+            )
+            for chem, delta in feedback.items():
+                if chem in self._column and chem in brain.chemicals:
+                    bounded = max(-3.0, min(3.0, delta * feedback_multiplier * decision_feedback_scale))
+                    if chem == "cortisol":
+                        bounded = max(-0.6, min(0.6, bounded))
+                    self._bounded[i, self._column[chem]] = bounded
+                    self._mask[i, self._column[chem]] = True
+
+        self._influence = []
+        if model:
+            self._influence = [
+                (self._column.get(chem_name), self._tree_column[action], weight)
+                for chem_name, action_map in model.chemical_influence.items()
+                for action, weight in action_map.items()
+                if action in self._tree_column
+            ]
+
+    def _vector(self, chemicals: dict) -> np.ndarray:
+        return np.array([float(chemicals[name]) for name in self._chemicals], dtype=np.float64)
+
+    def _transition(self, states: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        """``(states, actions, chemicals)`` layer reached by every action from every state."""
+        val = states[:, None, :]
+        bounded = self._bounded[actions][None, :, :]
+        headroom = np.where(bounded >= 0, (self._high - val) / self._span, (val - self._low) / self._span)
+        scale = np.maximum(0.15, np.minimum(1.0, headroom * 1.8))
+        new_val = np.maximum(self._low, np.minimum(val + bounded * scale, self._high))
+        if self._cortisol is not None:
+            new_val[:, :, self._cortisol] = np.minimum(100.0, new_val[:, :, self._cortisol])
+        return np.where(self._mask[actions][None, :, :], new_val, val)
+
+    def _probabilities(self, states: np.ndarray) -> np.ndarray:
+        """Next-action probabilities for each state, one row per state."""
+        rows = states.shape[0]
+        if not self._model:
+            return np.full((rows, len(self._tree_actions)), 1.0 / len(DEFAULT_ACTIONS))
+
+        model = self._model
+        effective = states * self._sensitivity
+        probs = np.empty((rows, len(self._tree_actions)), dtype=np.float64)
+        for j, action in enumerate(self._tree_actions):
+            probs[:, j] = model.base_probabilities[action]
+        for col, j, weight in self._influence:
+            probs[:, j] += (effective[:, col] if col is not None else 0) * weight
+        probs = np.maximum(model.min_prob, np.minimum(probs, model.max_prob))
+        if model.normalize:
+            probs = self._normalized(probs)
+
+        for j, delta in self._bias:
+            probs[:, j] += delta
+        min_prob = getattr(model, "min_prob", 0.0)
+        max_prob = getattr(model, "max_prob", 1.0)
+        probs = np.maximum(min_prob, np.minimum(max_prob, probs))
+        return self._normalized(probs)
+
+    @staticmethod
+    def _normalized(probs: np.ndarray) -> np.ndarray:
+        # Column-by-column accumulation keeps the left-to-right order of sum().
+        total = probs[:, 0].copy()
+        for j in range(1, probs.shape[1]):
+            total += probs[:, j]
+        total = total[:, None]
+        return np.divide(probs, total, out=probs.copy(), where=total > 0)
+
+    # -----------------------------------------
+    # LAYERED EXPANSION
+    # -----------------------------------------
+
+    def _values(self, states: np.ndarray, depth: int, actions: list[int] | np.ndarray) -> np.ndarray:
+        """``(states, actions)`` matrix of lookahead values at ``depth``."""
+        actions = np.asarray(actions, dtype=np.intp)
+        rows = states.shape[0]
+        is_tree = actions.shape == self._tree.shape and bool(np.all(actions == self._tree))
+
+        keys = None
+        values = np.empty((rows, len(actions)), dtype=np.float64)
+        pending = np.arange(rows)
+        if is_tree and self.table_size:
+            keys = [
+                (depth, row.tobytes())
+                for row in np.round(states / self.quantum).astype(np.int64)
+            ]
+            missing = []
+            first_seen: dict[tuple, int] = {}
+            duplicates = []
+            for i, key in enumerate(keys):
+                cached = self._table.get(key)
+                if cached is not None:
+                    self._table.move_to_end(key)
+                    values[i] = cached
+                    self.hits += 1
+                elif key in first_seen:
+                    duplicates.append((i, first_seen[key]))
+                    self.hits += 1
+                else:
+                    first_seen[key] = i
+                    missing.append(i)
+            pending = np.asarray(missing, dtype=np.intp)
+        else:
+            duplicates = []
+
+        if len(pending):
+            self.misses += len(pending)
+            values[pending] = self._expand(states[pending], depth, actions)
+            if keys is not None:
+                for i in pending:
+                    self._table[keys[i]] = values[i].copy()
+                while len(self._table) > self.table_size:
+                    self._table.popitem(last=False)
+        for i, source in duplicates:
+            values[i] = values[source]
+        return values
+
+    def _expand(self, states: np.ndarray, depth: int, actions: np.ndarray) -> np.ndarray:
+        rows, width = states.shape[0], len(actions)
+        self.nodes += rows * width
+        rewards = self._rewards[actions]
+
+        # Children laid out parent-major: row r * width + a is action a from state r.
+        children = self._transition(states, actions).reshape(rows * width, -1)
+
+        if depth == 1:
+            future = np.zeros(rows * width, dtype=np.float64)
+        else:
+            probs = self._probabilities(children)
+            child_values = self._values(children, depth - 1, self._tree)
+            future = np.zeros(rows * width, dtype=np.float64)
+            for j in range(len(self._tree)):
+                future += probs[:, j] * child_values[:, j]
+        return rewards[None, :] + 0.5 * future.reshape(rows, width)
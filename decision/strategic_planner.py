@@ -1,4 +1,4 @@
-import copy
+from .lookahead import LookaheadEngine
 
 
 class StrategicPlanner:
@@ -7,14 +7,25 @@ class StrategicPlanner:
         self,
         appraisal_engine,
         similarity_engine,
-        identity
+        identity,
+        depth=2,
+        time_budget_ms=0.0,
+        state_quantum=1e-4,
+        table_size=4096
     ):
         self.appraisal_engine = appraisal_engine
         self.similarity_engine = similarity_engine
         self.identity = identity
 
         # Planning depth (multi-step lookahead)
-        self.max_depth = 2
+        self.max_depth = int(depth)
+
+        # Optional per-decision time budget; deepens up to max_depth until spent
+        self.time_budget_ms = float(time_budget_ms)
+        self.last_depth = 0
+
+        # Layered lookahead with a transposition table across decisions
+        self.lookahead = LookaheadEngine(quantum=state_quantum, table_size=table_size)
 
         # Dynamic risk aversion (can evolve later)
         self.risk_aversion = 0.2
@@ -29,16 +40,19 @@ class StrategicPlanner:
         best_score = float("-inf")
 
         # Get a lightweight copy of the current state
-        current_state = brain.get_state()
+        current_state = brain.get_decision_view()
+
+        simulated_scores, self.last_depth = self.lookahead.evaluate(
+            brain,
+            current_state,
+            list(probabilities),
+            depth=self.max_depth,
+            time_budget_ms=self.time_budget_ms
+        )
 
         for action, base_prob in probabilities.items():
 
-            simulated_score = self._simulate_future(
-                brain,
-                current_state,
-                action,
-                depth=self.max_depth
-            )
+            simulated_score = simulated_scores[action]
 
             # Personality influence
             competence = self.identity.get("competence")
@@ -60,133 +74,3 @@ class StrategicPlanner:
                 best_action = action
 
         return best_action
-
-    # -------------------------------------------------
-    # FUTURE SIMULATION
-    # -------------------------------------------------
-
-    def _simulate_future(self, brain, current_state, action, depth):
-
-        if depth == 0:
-            return 0.0
-
-        # Execute hypothetical action
-        decision_output = brain.decision_engine.execute_action(
-            action,
-            current_state
-        ) if brain.decision_engine else {}
-
-        feedback = decision_output.get("feedback", {})
-        
-        # Retrieve active goal from goal system to scale utility weights
-        active_goal = None
-        if hasattr(brain, "goal_system") and brain.goal_system:
-            active_goal = brain.goal_system.get_active_goal()
-
-        w_dopamine = 1.0
-        w_serotonin = 1.0
-        w_oxytocin = 1.0
-        w_cortisol = -1.0
-
-        if active_goal == "safety":
-            w_cortisol = -2.5
-            w_oxytocin = 0.5
-            w_dopamine = 0.5
-        elif active_goal == "task_mastery":
-            w_dopamine = 2.0
-            w_cortisol = -0.5
-        elif active_goal == "social_bond":
-            w_oxytocin = 2.0
-            w_serotonin = 1.5
-            w_cortisol = -0.8
-
-        # Scale rewards if Love Emotion is active (love_score > 0.5)
-        love_score = float(current_state.get("love_score", 0.0))
-        if love_score > 0.5:
-            w_oxytocin = 3.0
-            w_cortisol = w_cortisol / 3.0
-
-        reward_score = (
-            feedback.get("dopamine", 0.0) * w_dopamine +
-            feedback.get("serotonin", 0.0) * w_serotonin +
-            feedback.get("oxytocin", 0.0) * w_oxytocin +
-            feedback.get("cortisol", 0.0) * w_cortisol
-        )
-
-        # Transition chemical state based on feedback
-        next_chemicals = current_state.get("neurochemicals", {}).copy()
-        feedback_multiplier = getattr(brain, "feedback_multiplier", 1.0)
-        decision_feedback_scale = getattr(brain, "decision_feedback_scale", 0.45)
-
-        for chem, delta in feedback.items():
-            if chem in next_chemicals and chem in brain.chemicals:
-                chem_def = brain.chemicals[chem]
-                val = next_chemicals[chem]
-                span = max(1e-6, chem_def["max"] - chem_def["min"])
-
-                bounded = max(-3.0, min(3.0, delta * feedback_multiplier * decision_feedback_scale))
-                if chem == "cortisol":
-                    bounded = max(-0.6, min(0.6, bounded))
-
-                # Saturation scaling
-                if bounded >= 0:
-                    headroom = (chem_def["max"] - val) / span
-                else:
-                    headroom = (val - chem_def["min"]) / span
-                scale = max(0.15, min(1.0, headroom * 1.8))
-
-                new_val = val + bounded * scale
-                # Clamp
-                new_val = max(chem_def["min"], min(new_val, chem_def["max"]))
-                if chem == "cortisol":
-                    new_val = min(100.0, new_val)
-
-                next_chemicals[chem] = new_val
-
-        # Create transitioned state dictionary for next lookahead steps
-        temp_state = current_state.copy()
-        temp_state["neurochemicals"] = next_chemicals
-        for chem, val in next_chemicals.items():
-            temp_state[chem] = val  # update flattened values
-
-        # Next state probabilities modulated by receptor sensitivities
-        if brain.decision_engine and brain.decision_engine.model:
-            effective_next = {}
-            for name, val in next_chemicals.items():
-                sens = 1.0
-                if name in brain.chemicals:
-                    sens = brain.chemicals[name].sensitivity
-                effective_next[name] = val * sens
-            next_probabilities = brain.decision_engine.model.compute(effective_next)
-            action_bias = temp_state.get("decision_action_bias", {})
-            if isinstance(action_bias, dict):
-                for act, delta in action_bias.items():
-                    if act in next_probabilities:
-                        next_probabilities[act] += float(delta)
-            # Clamp and normalize
-            min_prob = getattr(brain.decision_engine.model, "min_prob", 0.0)
-            max_prob = getattr(brain.decision_engine.model, "max_prob", 1.0)
-            for act in next_probabilities:
-                next_probabilities[act] = max(min_prob, min(max_prob, next_probabilities[act]))
-            total = sum(next_probabilities.values())
-            if total > 0:
-                for act in next_probabilities:
-                    next_probabilities[act] /= total
-        else:
-            actions = ["support", "challenge", "suggest", "refuse", "neutral"]
-            next_probabilities = {act: 1.0 / len(actions) for act in actions}
-
-        future_score = 0.0
-
-        for next_action, prob in next_probabilities.items():
-            future_score += (
-                prob *
-                self._simulate_future(
-                    brain,
-                    temp_state,
-                    next_action,
-                    depth - 1
-                )
-            )
-
-        return reward_score + 0.5 * future_score
@@ -128,6 +128,7 @@ def build_brain():
     decision_config = _load_yaml("config/decision.yaml").get("decision", {})
     chemical_configs = _load_yaml("config/chemicals.yaml")
     brain_config = _load_yaml("config/brain.yaml")
+    engine_config = _load_yaml("config/engine.yaml").get("engine", {})
 
     decision_engine = DecisionEngine(
         decision_config=decision_config,
@@ -140,6 +141,7 @@ def build_brain():
         decision_engine=decision_engine,
         deterministic=True,
         brain_config=brain_config,
+        engine_config=engine_config,
         memory_storage_path=memory_path,
     )
     return brain, tmp
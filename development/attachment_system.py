@@ -33,12 +33,15 @@ class AttachmentSystem:
     # HOMEOSTATIC DECAY
     # -----------------------------------------
 
-    def decay(self) -> None:
+    def decay(self, ticks: int = 1) -> None:
         """
         Decay social bonding levels slowly toward zero over time.
         
         Formula:
             Attachment <- Attachment * (1.0 - 0.0003) per simulation tick.
+
+        ``ticks`` applies that many ticks of decay in one step.
         """
+        factor = (1.0 - 0.0003) ** ticks
         for source in self.attachments:
-            self.attachments[source] *= (1.0 - 0.0003)
+            self.attachments[source] *= factor
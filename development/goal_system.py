@@ -33,12 +33,15 @@ class GoalSystem:
     # HOMEOSTATIC DECAY
     # -----------------------------------------
 
-    def decay(self) -> None:
+    def decay(self, ticks: int = 1) -> None:
         """
         Decay active goals slowly over time.
         
         Formula:
             Goal Value <- Goal Value * 0.999 per simulation cycle.
+
+        ``ticks`` applies that many cycles of decay in one step.
         """
+        factor = 0.999 ** ticks
         for goal in self.goals:
-            self.goals[goal] *= 0.999
+            self.goals[goal] *= factor
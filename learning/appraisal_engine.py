@@ -1,16 +1,43 @@
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import math
 
 
 class AppraisalEngine:
 
-    def __init__(self, similarity_engine=None):
+    def __init__(
+        self,
+        similarity_engine=None,
+        cache_quantum=0.0,
+        cache_size=0,
+        cache_audit_every=0
+    ):
 
         # event_type → learned emotional profile
         self.emotional_memory = defaultdict(self._empty_profile)
 
         self.similarity_engine = similarity_engine
 
+        # prediction cache: event_type → (profile versions, quantized
+        # state → prediction). A state is the values the similarity engine
+        # compares (chemicals and identity), rounded to multiples of
+        # cache_quantum (0 keeps them exact). A type's table is dropped
+        # once its learned profile or similarity profiles change. All tables
+        # together hold at most cache_size entries; the least recently used
+        # entry of the least recently used type goes first. Every
+        # cache_audit_every-th hit is recomputed to measure the error the
+        # quantization costs.
+        self.cache_quantum = max(0.0, float(cache_quantum))
+        self.cache_size = max(0, int(cache_size))
+        self.cache_audit_every = max(0, int(cache_audit_every))
+        self._cache = OrderedDict()
+        self._entries = 0
+        self._profile_versions = defaultdict(int)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_audits = 0
+        self._audit_error_total = 0.0
+        self._audit_error_max = 0.0
+
         # learning controls
         self.learning_rate = 0.06
         self.negative_amplifier = 1.3
@@ -43,6 +70,39 @@ class AppraisalEngine:
 
         profile = self.emotional_memory[event_type]
 
+        if not self.cache_size:
+            return self._predict(event_type, profile, current_state)
+
+        versions = self._versions(event_type)
+        table = self._cache.get(event_type)
+
+        if table is None or table[0] != versions:
+            if table is not None:
+                self._entries -= len(table[1])
+            table = self._cache[event_type] = (versions, OrderedDict())
+        self._cache.move_to_end(event_type)
+
+        entries = table[1]
+        key = self._cache_key(event_type, current_state)
+        cached = entries.get(key)
+
+        if cached is not None:
+            entries.move_to_end(key)
+            self.cache_hits += 1
+            if self.cache_audit_every and self.cache_hits % self.cache_audit_every == 0:
+                self._audit(cached, self._predict(event_type, profile, current_state))
+            return dict(cached)
+
+        self.cache_misses += 1
+        predicted = self._predict(event_type, profile, current_state)
+        entries[key] = dict(predicted)
+        self._entries += 1
+        while self._entries > self.cache_size:
+            self._evict()
+        return predicted
+
+    def _predict(self, event_type, profile, current_state):
+
         # Base learned prediction
         scale = min(1.0, profile["confidence"])
 
@@ -91,6 +151,75 @@ class AppraisalEngine:
 
         return predicted
 
+    # -------------------------------------------------
+    # Prediction Cache
+    # -------------------------------------------------
+
+    def _cache_key(self, event_type, current_state):
+
+        if not (self.similarity_engine and current_state):
+            return None
+
+        values = [
+            float(current_state.get(key, 0))
+            for key in self.similarity_engine.state_keys(event_type)
+        ]
+
+        if self.cache_quantum:
+            return tuple(round(v / self.cache_quantum) for v in values)
+
+        return tuple(values)
+
+    def _evict(self):
+
+        event_type, (_, entries) = next(iter(self._cache.items()))
+        entries.popitem(last=False)
+        self._entries -= 1
+
+        if not entries:
+            del self._cache[event_type]
+
+    def _versions(self, event_type):
+
+        similarity_version = (
+            self.similarity_engine.profile_version(event_type)
+            if self.similarity_engine
+            else 0
+        )
+
+        return (self._profile_versions[event_type], similarity_version)
+
+    def _audit(self, cached, fresh):
+
+        error = max(
+            (abs(cached.get(chem, 0.0) - fresh.get(chem, 0.0)) for chem in fresh),
+            default=0.0
+        )
+
+        self.cache_audits += 1
+        self._audit_error_total += error
+        self._audit_error_max = max(self._audit_error_max, error)
+
+    def clear_cache(self):
+        self._cache.clear()
+        self._entries = 0
+
+    def cache_stats(self):
+        """Hit rate of the prediction cache and, over the audited hits, the
+        mean and largest absolute error of a cached chemical prediction."""
+
+        lookups = self.cache_hits + self.cache_misses
+
+        return {
+            "entries": self._entries,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "audits": self.cache_audits,
+            "mean_abs_error": self._audit_error_total / self.cache_audits if self.cache_audits else 0.0,
+            "max_abs_error": self._audit_error_max,
+        }
+
     # -------------------------------------------------
     # Learning Update
     # -------------------------------------------------
@@ -103,6 +232,7 @@ class AppraisalEngine:
     ):
 
         profile = self.emotional_memory[event_type]
+        self._profile_versions[event_type] += 1
 
         modifier = (
             self.negative_amplifier
@@ -1,14 +1,112 @@
 import math
-from collections import defaultdict
 from typing import Dict, List
 
+import numpy as np
+
+
+class _ProfileRing:
+    """The last ``capacity`` profiles of one event type.
+
+    Chemical and identity values sit in one preallocated float matrix, a
+    column per key in first-seen order, written in place as a circular
+    buffer. The profile dicts are kept alongside to be returned as matches.
+    """
+
+    PARTS = ("chemicals", "identity")
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.start = 0
+        self.version = 0
+        self.profiles = [None] * self.capacity
+
+        # (part, key) → column; state key each column is compared with
+        self.columns: Dict[tuple, int] = {}
+        self.state_keys: List[str] = []
+        self.values = np.zeros((self.capacity, 0))
+        self.present = np.zeros((self.capacity, 0), dtype=bool)
+        # column → one-hot part, to sum squared differences per part
+        self.parts = np.zeros((0, len(self.PARTS)))
+        # Whether every stored row has every column, so no masking is needed
+        self.complete = True
+
+    def append(self, profile: Dict) -> None:
+        if self.count < self.capacity:
+            row = self.count
+            self.count += 1
+        else:
+            row = self.start
+            self.start = (self.start + 1) % self.capacity
+        self.version += 1
+        self.profiles[row] = profile
+
+        written = 0
+        self.values[row] = 0.0
+        self.present[row] = False
+        for index, part in enumerate(self.PARTS):
+            for key, value in profile[part].items():
+                column = self.columns.get((part, key))
+                if column is None:
+                    column = self._add_column(part, index, key)
+                self.values[row, column] = value
+                self.present[row, column] = True
+                written += 1
+        if written < len(self.state_keys):
+            self.complete = False
+
+    def _add_column(self, part: str, index: int, key: str) -> int:
+        column = self.columns[(part, key)] = len(self.state_keys)
+        self.state_keys.append(key if part == "chemicals" else f"identity_{key}")
+        self.values = np.hstack([self.values, np.zeros((self.capacity, 1))])
+        self.present = np.hstack([self.present, np.zeros((self.capacity, 1), dtype=bool)])
+        one_hot = np.zeros((1, len(self.PARTS)))
+        one_hot[0, index] = 1.0
+        self.parts = np.vstack([self.parts, one_hot])
+        if self.count > 1:
+            # rows already stored lack the new key
+            self.complete = False
+        return column
+
+    def chemical_columns(self) -> Dict[str, int]:
+        return {key: column for (part, key), column in self.columns.items() if part == "chemicals"}
+
+    def ordered(self) -> List[Dict]:
+        rows = range(self.start, self.start + self.count)
+        return [self.profiles[row % self.capacity] for row in rows]
+
+    def similarities(self, states: List[Dict[str, float]], weights: np.ndarray) -> np.ndarray:
+        """Similarity of every stored row to each state, one row per state.
+
+        Per part, the Euclidean distance over the keys the profile has (a
+        key missing from the state counts as 0) becomes ``1 / (1 + d)``;
+        the parts are then weighted.
+        """
+        query = np.array(
+            [[state.get(key, 0) for key in self.state_keys] for state in states],
+            dtype=float,
+        ).reshape(len(states), 1, len(self.state_keys))
+        diff = self.values[:self.count] - query
+        if not self.complete:
+            diff *= self.present[:self.count]
+        np.square(diff, out=diff)
+        distance = np.sqrt(diff @ self.parts)
+        distance += 1.0
+        return np.reciprocal(distance, out=distance) @ weights
+
+    def chronological(self, rows: np.ndarray) -> np.ndarray:
+        """``rows`` (ascending) reordered oldest profile first."""
+        if self.start:
+            rows = np.roll(rows, -int(np.searchsorted(rows, self.start)))
+        return rows
+
 
 class SimilarityEngine:
 
     def __init__(self):
 
-        # event_type → list of stored experience profiles
-        self.event_profiles = defaultdict(list)
+        # event_type → ring of stored experience profiles
+        self._rings: Dict[str, _ProfileRing] = {}
 
         # controls
         self.max_profiles_per_event = 300
@@ -32,14 +130,31 @@ class SimilarityEngine:
             "identity": identity_snapshot.copy()
         }
 
-        self.event_profiles[event_type].append(profile)
+        ring = self._rings.get(event_type)
+        if ring is None:
+            # bounded memory: the ring overwrites its oldest profile when full
+            ring = self._rings[event_type] = _ProfileRing(self.max_profiles_per_event)
+        ring.append(profile)
+
+    def profile_version(self, event_type: str) -> int:
+        """Number of profiles ever recorded for ``event_type``; changes
+        whenever its stored profiles do."""
+        ring = self._rings.get(event_type)
+        return ring.version if ring else 0
+
+    def state_keys(self, event_type: str) -> List[str]:
+        """The current-state keys ``event_type``'s profiles are compared on."""
+        ring = self._rings.get(event_type)
+        return list(ring.state_keys) if ring else []
 
-        # bounded memory
-        if len(self.event_profiles[event_type]) > self.max_profiles_per_event:
-            self.event_profiles[event_type].pop(0)
+    @property
+    def event_profiles(self) -> Dict[str, List[Dict]]:
+        """event_type → stored profiles, oldest first (a fresh dict)."""
+        return {event_type: ring.ordered() for event_type, ring in self._rings.items()}
 
     # -------------------------------------------------
     # SIMILARITY CALCULATION
+    # (scalar reference; queries use the rings' matrices)
     # -------------------------------------------------
 
     def _vector_distance(self, v1: Dict[str, float], v2: Dict[str, float]):
@@ -89,6 +204,30 @@ class SimilarityEngine:
     # FIND SIMILAR EXPERIENCES
     # -------------------------------------------------
 
+    def _nearest(self, ring, states, top_k):
+        """(rows, similarities) of each state's matches, best first."""
+        similarity = ring.similarities(
+            states,
+            np.array([self.chemical_weight, self.identity_weight])
+        )
+
+        matches = []
+
+        for scores in similarity:
+            candidates = ring.chronological(np.flatnonzero(scores >= self.similarity_threshold))
+
+            if 0 < top_k < len(candidates):
+                # only candidates scoring at least the k-th best can make
+                # the cut (ties included)
+                kth = np.partition(scores[candidates], len(candidates) - top_k)[len(candidates) - top_k]
+                candidates = candidates[scores[candidates] >= kth]
+
+            # sort by similarity descending; ties keep the oldest first
+            rows = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+            matches.append((rows, scores[rows]))
+
+        return matches
+
     def find_similar_profiles(
         self,
         event_type: str,
@@ -96,23 +235,26 @@ class SimilarityEngine:
         top_k: int = 5
     ) -> List[Dict]:
 
-        profiles = self.event_profiles.get(event_type, [])
+        return self.find_similar_profiles_many(event_type, [current_state], top_k)[0]
 
-        if not profiles:
-            return []
-
-        scored = []
-
-        for profile in profiles:
-            sim = self._compute_similarity(profile, current_state)
+    def find_similar_profiles_many(
+        self,
+        event_type: str,
+        states: List[Dict[str, float]],
+        top_k: int = 5
+    ) -> List[List[Dict]]:
+        """find_similar_profiles for several states with one distance
+        computation."""
 
-            if sim >= self.similarity_threshold:
-                scored.append((sim, profile))
+        ring = self._rings.get(event_type)
 
-        # sort by similarity descending
-        scored.sort(key=lambda x: x[0], reverse=True)
+        if ring is None or not ring.count or not states:
+            return [[] for _ in states]
 
-        return [p for _, p in scored[:top_k]]
+        return [
+            [ring.profiles[row] for row in rows]
+            for rows, _ in self._nearest(ring, states, top_k)
+        ]
 
     # -------------------------------------------------
     # BLEND EMOTIONAL EXPECTATION
@@ -124,33 +266,44 @@ class SimilarityEngine:
         current_state: Dict[str, float]
     ) -> Dict[str, float]:
 
-        similar = self.find_similar_profiles(
-            event_type,
-            current_state
-        )
+        return self.blended_emotional_prediction_many(event_type, [current_state])[0]
+
+    def blended_emotional_prediction_many(
+        self,
+        event_type: str,
+        states: List[Dict[str, float]]
+    ) -> List[Dict[str, float]]:
+        """blended_emotional_prediction for several states with one
+        distance computation."""
 
-        if not similar:
-            return {}
+        ring = self._rings.get(event_type)
 
-        blended = defaultdict(float)
-        total_weight = 0
+        if ring is None or not ring.count or not states:
+            return [{} for _ in states]
 
-        for profile in similar:
+        chemicals = ring.chemical_columns()
+        predictions = []
 
-            sim = self._compute_similarity(profile, current_state)
+        for rows, weights in self._nearest(ring, states, 5):
 
-            for chem, value in profile["chemicals"].items():
-                blended[chem] += value * sim
+            total_weight = float(weights.sum())
 
-            total_weight += sim
+            if not len(rows) or total_weight == 0:
+                predictions.append({})
+                continue
 
-        if total_weight == 0:
-            return {}
+            present = ring.present[rows].any(axis=0)
+            # similarity-weighted mean of each chemical; a chemical a match
+            # did not record is stored as 0 and adds nothing
+            blended = (ring.values[rows] * weights[:, None]).sum(axis=0) / total_weight
 
-        for chem in blended:
-            blended[chem] /= total_weight
+            predictions.append({
+                chem: float(blended[column])
+                for chem, column in chemicals.items()
+                if present[column]
+            })
 
-        return dict(blended)
+        return predictions
 
     # -------------------------------------------------
     # CONFIDENCE ESTIMATION
@@ -158,7 +311,8 @@ class SimilarityEngine:
 
     def get_event_confidence(self, event_type: str):
 
-        count = len(self.event_profiles.get(event_type, []))
+        ring = self._rings.get(event_type)
+        count = ring.count if ring else 0
 
         return min(1.0, count / 50.0)
 
@@ -169,6 +323,6 @@ class SimilarityEngine:
     def get_memory_snapshot(self):
 
         return {
-            event: len(profiles)
-            for event, profiles in self.event_profiles.items()
+            event: ring.count
+            for event, ring in self._rings.items()
         }
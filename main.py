@@ -6,6 +6,7 @@ import yaml
 
 from core.brain import VirtualBrain
 from decision.decision_engine import DecisionEngine
+from memory.checkpoint_writer import CheckpointWriter
 from memory.memory_manager import MemoryManager
 from simulation.simulator import Simulator
 from simulation.scenarios import build_structured_learning_scenario
@@ -70,6 +71,12 @@ def load_brain_config():
         return yaml.safe_load(f) or {}
 
 
+def load_engine_config():
+    with open("config/engine.yaml", "r") as f:
+        payload = yaml.safe_load(f) or {}
+    return payload.get("engine", payload)
+
+
 # =====================================================
 # MAIN
 # =====================================================
@@ -84,7 +91,8 @@ def main():
 
     logger = BrainLogger()
     logger.info("Starting Virtual Brain...")
-    memory_manager = MemoryManager(storage_path="memory_store.json")
+    engine_config = load_engine_config()
+    memory_manager = MemoryManager(storage_path="memory_store.json", persistence=engine_config.get("persistence"))
 
     loaded_state = None
     if os.path.exists("memory_store.json"):
@@ -109,6 +117,7 @@ def main():
         decision_engine=decision_engine,
         deterministic=args.deterministic,
         brain_config=brain_config,
+        engine_config=engine_config,
     )
     if loaded_state:
         brain.set_state(loaded_state)
@@ -137,9 +146,23 @@ def main():
     elif args.mode == "live":
 
         logger.info("Running in basic live debug mode")
-        run_live_debug(brain, memory_manager=memory_manager)
-        memory_manager.save(brain.get_state())
-
+        persistence = engine_config.get("persistence") or {}
+        writer = CheckpointWriter(
+            memory_manager.save,
+            min_interval=persistence.get("writer_min_interval", 0.5),
+            max_staleness=persistence.get("writer_max_staleness", 5.0),
+        )
+        try:
+            run_live_debug(brain, checkpoint_writer=writer)
+        finally:
+            # Flush the newest state on shutdown, including Ctrl-C.
+            writer.submit(brain.get_state())
+            writer.close()
+            brain.memory_manager.flush_pending()
+            logger.info(f"Checkpoints: {writer.written} written, {writer.skipped} skipped")
+
+    # Episodic memories are flushed in batches; write the last partial batch.
+    brain.memory_manager.flush_pending()
     logger.info("Shutting down Virtual Brain.")
 
 
@@ -147,7 +170,7 @@ def main():
 # BASIC LIVE DEBUG (OLD STYLE)
 # =====================================================
 
-def run_live_debug(brain, memory_manager=None):
+def run_live_debug(brain, checkpoint_writer=None):
 
     print("Virtual Brain Debug Mode. Type 'exit' to quit.\n")
 
@@ -165,8 +188,8 @@ def run_live_debug(brain, memory_manager=None):
         state = brain.get_state()
         print(f"Current State: {state}\n")
 
-        if memory_manager:
-            memory_manager.save(state)
+        if checkpoint_writer:
+            checkpoint_writer.submit(state)
 
 
 # =====================================================
@@ -0,0 +1,323 @@
+"""Versioned binary checkpoint format.
+
+A checkpoint is ``MAGIC`` + a little-endian ``u16`` format version + one
+encoded value. Each value is a one-byte tag followed by its payload:
+
+====  =====================================================================
+tag   payload
+====  =====================================================================
+N/T/F ``None`` / ``True`` / ``False`` (no payload)
+i     ``int64``
+b     integer outside the ``int64`` range, as a length-prefixed decimal string
+f     ``float64``
+s     length-prefixed (``u32``) UTF-8 string
+D     packed ``float64`` array: ``u32`` count + raw block (a list of floats)
+I     packed ``int64`` array: ``u32`` count + raw block (a list of ints)
+M     packed ``float64`` matrix: ``u32`` rows, ``u32`` cols + raw block
+S     string array: ``u32`` count, packed ``u32`` byte lengths, UTF-8 bytes
+l     list: ``u32`` count + encoded items
+R     record table (a list of dicts that all share one key order): ``u32``
+      rows, a key shape, then one encoded column list per key
+d     dict: a key shape + the values, encoded as one list
+====  =====================================================================
+
+A key shape is a ``u32`` index into the shapes seen so far in the
+checkpoint. The index equal to the number of known shapes introduces a new
+shape and is followed by its key string array. Dicts with a repeated key
+order (every event's chemical snapshot, every concept entry) therefore
+store their keys once per checkpoint.
+
+Dict values and table columns are encoded as lists, so homogeneous numeric
+data (chemical histories, identity snapshots, Hopfield weights) ends up in
+packed NumPy blocks and repeated record shapes (autobiography events) in
+columns. ``loads(dumps(x))`` equals ``json.loads(json.dumps(x))``: tuples
+come back as lists and non-string keys are converted the way ``json`` does.
+"""
+import json
+import struct
+from itertools import accumulate
+
+import numpy as np
+
+MAGIC = b"VBCK"
+FORMAT_VERSION = 1
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U32x2 = struct.Struct("<II")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+class BinaryCheckpointError(ValueError):
+    """Raised when a payload is not a readable binary checkpoint."""
+
+
+def is_binary(raw: bytes) -> bool:
+    return raw[:len(MAGIC)] == MAGIC
+
+
+def _key(key) -> str:
+    # Same key coercion as json.dumps.
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return json.dumps(key)
+    if isinstance(key, int):
+        return str(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+# -----------------------------------------
+# ENCODING
+# -----------------------------------------
+
+class _Encoder:
+    def __init__(self):
+        self.out = bytearray()
+        self.shapes: dict[tuple, int] = {}
+
+    def value(self, value):
+        out = self.out
+        kind = type(value)
+        if value is None:
+            out += b"N"
+        elif value is True:
+            out += b"T"
+        elif value is False:
+            out += b"F"
+        elif kind is float or isinstance(value, float):
+            out += b"f"
+            out += _F64.pack(value)
+        elif isinstance(value, int):
+            if _INT64_MIN <= value <= _INT64_MAX:
+                out += b"i"
+                out += _I64.pack(value)
+            else:
+                out += b"b"
+                self.text(str(value))
+        elif isinstance(value, str):
+            out += b"s"
+            self.text(value)
+        elif isinstance(value, dict):
+            out += b"d"
+            self.shape(tuple(_key(key) for key in value))
+            self.sequence(list(value.values()))
+        elif isinstance(value, (list, tuple)):
+            self.sequence(value)
+        else:
+            raise TypeError(f"Object of type {kind.__name__} is not checkpoint serializable")
+
+    def text(self, text: str):
+        data = text.encode("utf-8", "surrogatepass")
+        self.out += _U32.pack(len(data))
+        self.out += data
+
+    def shape(self, keys: tuple):
+        index = self.shapes.get(keys)
+        if index is not None:
+            self.out += _U32.pack(index)
+            return
+        index = self.shapes[keys] = len(self.shapes)
+        self.out += _U32.pack(index)
+        self.strings(list(keys))
+
+    def strings(self, items: list):
+        encoded = [item.encode("utf-8", "surrogatepass") for item in items]
+        self.out += _U32.pack(len(encoded))
+        self.out += np.fromiter((len(item) for item in encoded), dtype="<u4", count=len(encoded)).tobytes()
+        self.out += b"".join(encoded)
+
+    def sequence(self, items):
+        out = self.out
+        count = len(items)
+        if count:
+            kinds = {type(item) for item in items}
+            if len(kinds) == 1:
+                kind = kinds.pop()
+                if kind is float:
+                    out += b"D"
+                    out += _U32.pack(count)
+                    out += np.array(items, dtype="<f8").tobytes()
+                    return
+                if kind is int and _INT64_MIN <= min(items) and max(items) <= _INT64_MAX:
+                    out += b"I"
+                    out += _U32.pack(count)
+                    out += np.array(items, dtype="<i8").tobytes()
+                    return
+                if kind is str:
+                    out += b"S"
+                    self.strings(items)
+                    return
+                if issubclass(kind, list) and count > 1:
+                    width = len(items[0])
+                    if width and all(len(row) == width and all(type(x) is float for x in row) for row in items):
+                        out += b"M"
+                        out += _U32x2.pack(count, width)
+                        out += np.array(items, dtype="<f8").tobytes()
+                        return
+            if count > 1 and all(isinstance(item, dict) for item in items):
+                keys = tuple(items[0])
+                if all(isinstance(key, str) for key in keys) and all(tuple(item) == keys for item in items):
+                    out += b"R"
+                    out += _U32.pack(count)
+                    self.shape(keys)
+                    for key in keys:
+                        self.sequence([item[key] for item in items])
+                    return
+        out += b"l"
+        out += _U32.pack(count)
+        for item in items:
+            self.value(item)
+
+
+def dumps(value) -> bytes:
+    """Encode a JSON-compatible value as a binary checkpoint."""
+    encoder = _Encoder()
+    encoder.out += MAGIC
+    encoder.out += _U16.pack(FORMAT_VERSION)
+    encoder.value(value)
+    return bytes(encoder.out)
+
+
+# -----------------------------------------
+# DECODING
+# -----------------------------------------
+
+class _Decoder:
+    def __init__(self, buf: bytes, pos: int):
+        self.buf = buf
+        self.pos = pos
+        self.shapes: list[list[str]] = []
+        self.handlers = {
+            ord("N"): lambda: None,
+            ord("T"): lambda: True,
+            ord("F"): lambda: False,
+            ord("i"): self._int,
+            ord("b"): lambda: int(self.text()),
+            ord("f"): self._float,
+            ord("s"): self.text,
+            ord("d"): self._dict,
+            ord("D"): lambda: self._array("<f8"),
+            ord("I"): lambda: self._array("<i8"),
+            ord("M"): self._matrix,
+            ord("S"): self.strings,
+            ord("l"): self._list,
+            ord("R"): self._table,
+        }
+
+    def take(self, size: int) -> int:
+        """Claim the next ``size`` bytes and return where they start."""
+        start = self.pos
+        if start + size > len(self.buf):
+            raise BinaryCheckpointError(f"payload ends inside a {size}-byte field at offset {start}")
+        self.pos = start + size
+        return start
+
+    def value(self):
+        tag = self.buf[self.pos]
+        self.pos += 1
+        handler = self.handlers.get(tag)
+        if handler is None:
+            raise BinaryCheckpointError(f"unknown tag {tag!r} at offset {self.pos - 1}")
+        return handler()
+
+    def _u32(self) -> int:
+        (value,) = _U32.unpack_from(self.buf, self.pos)
+        self.pos += 4
+        return value
+
+    def _int(self) -> int:
+        (value,) = _I64.unpack_from(self.buf, self.pos)
+        self.pos += 8
+        return value
+
+    def _float(self) -> float:
+        (value,) = _F64.unpack_from(self.buf, self.pos)
+        self.pos += 8
+        return value
+
+    def text(self) -> str:
+        size = self._u32()
+        start = self.take(size)
+        return self.buf[start:self.pos].decode("utf-8", "surrogatepass")
+
+    def shape(self) -> list:
+        index = self._u32()
+        if index < len(self.shapes):
+            return self.shapes[index]
+        if index != len(self.shapes):
+            raise BinaryCheckpointError(f"key shape {index} referenced before it is defined")
+        keys = self.strings()
+        self.shapes.append(keys)
+        return keys
+
+    def strings(self) -> list:
+        count = self._u32()
+        ends = list(accumulate(struct.unpack_from(f"<{count}I", self.buf, self.take(4 * count))))
+        base = self.take(ends[-1] if ends else 0)
+        blob = self.buf[base:self.pos].decode("utf-8", "surrogatepass")
+        if blob.isascii():
+            starts = [0] + ends[:-1]
+            return [blob[a:b] for a, b in zip(starts, ends)]
+        # Non-ASCII text: byte offsets differ from character offsets.
+        raw = self.buf[base:self.pos]
+        starts = [0] + ends[:-1]
+        return [raw[a:b].decode("utf-8", "surrogatepass") for a, b in zip(starts, ends)]
+
+    def _array(self, dtype: str) -> list:
+        count = self._u32()
+        return np.frombuffer(self.buf, dtype=dtype, count=count, offset=self.take(8 * count)).tolist()
+
+    def _matrix(self) -> list:
+        rows, cols = _U32x2.unpack_from(self.buf, self.take(8))
+        values = np.frombuffer(self.buf, dtype="<f8", count=rows * cols, offset=self.take(8 * rows * cols))
+        return values.reshape(rows, cols).tolist()
+
+    def _list(self) -> list:
+        count = self._u32()
+        value = self.value
+        return [value() for _ in range(count)]
+
+    def _dict(self) -> dict:
+        keys = self.shape()
+        values = self.value()
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise BinaryCheckpointError(f"dict has {len(keys)} keys but a different number of values")
+        return dict(zip(keys, values))
+
+    def _table(self) -> list:
+        rows = self._u32()
+        keys = self.shape()
+        columns = [self.value() for _ in keys]
+        if any(not isinstance(column, list) or len(column) != rows for column in columns):
+            raise BinaryCheckpointError(f"record table columns do not all hold {rows} rows")
+        return [dict(zip(keys, row)) for row in zip(*columns)] if keys else [{} for _ in range(rows)]
+
+
+def loads(raw: bytes):
+    """Decode a binary checkpoint produced by :func:`dumps`."""
+    if not is_binary(raw):
+        raise BinaryCheckpointError("not a binary checkpoint (bad magic)")
+    if len(raw) < len(MAGIC) + _U16.size:
+        raise BinaryCheckpointError("truncated checkpoint header")
+    (version,) = _U16.unpack_from(raw, len(MAGIC))
+    if version > FORMAT_VERSION:
+        raise BinaryCheckpointError(f"checkpoint format version {version} is newer than supported ({FORMAT_VERSION})")
+    decoder = _Decoder(raw, len(MAGIC) + _U16.size)
+    try:
+        value = decoder.value()
+    except BinaryCheckpointError:
+        raise
+    except (struct.error, IndexError, ValueError, TypeError) as exc:
+        raise BinaryCheckpointError(f"truncated or corrupt checkpoint: {exc}") from exc
+    if decoder.pos != len(raw):
+        raise BinaryCheckpointError(f"{len(raw) - decoder.pos} trailing bytes after the checkpoint value")
+    return value
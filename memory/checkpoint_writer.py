@@ -0,0 +1,172 @@
+import threading
+import time
+
+
+class CheckpointWriter:
+    """Dedicated thread that persists brain-state checkpoints off the hot path.
+
+    ``submit(state)`` only records the state and returns. Requests coalesce:
+    if a newer state arrives before the pending one is written, the older one
+    is dropped and counted in ``skipped``, so at most one write is ever queued
+    behind the one in progress.
+
+    A pending state is written once no newer request has arrived for
+    ``min_interval`` seconds, or once it has been waiting ``max_staleness``
+    seconds, whichever comes first. A burst of ticks therefore costs one
+    write at its end, and a steady stream of ticks still reaches disk at
+    least every ``max_staleness`` seconds (plus the wait for the previous
+    write). Consecutive writes start at least ``min_interval`` apart.
+
+    ``flush()`` writes any pending state immediately and waits for it;
+    ``close()`` flushes (unless ``flush=False``) and stops the thread. Call
+    ``close()`` on shutdown so the newest state is not lost. A state
+    submitted after ``close()`` (e.g. by a request racing a hard reset) is
+    dropped and counted in ``dropped``.
+    """
+
+    def __init__(self, save, min_interval=0.5, max_staleness=5.0, clock=time.monotonic):
+        self._save = save
+        self.min_interval = max(0.0, float(min_interval))
+        self.max_staleness = max(self.min_interval, float(max_staleness))
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._first_request = 0.0
+        self._last_request = 0.0
+        self._last_write = None
+        self._writing = False
+        self._flushing = 0
+        self._closed = False
+
+        self.requested = 0
+        self.written = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error = None
+        self.last_write_seconds = 0.0
+        self.max_write_seconds = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, state) -> bool:
+        """Queue ``state`` for writing, replacing any state still pending.
+
+        Returns False, and writes nothing, once the writer is closed.
+        """
+        with self._cond:
+            if self._closed:
+                self.dropped += 1
+                return False
+            now = self._clock()
+            if self._has_pending:
+                self.skipped += 1
+            else:
+                self._first_request = now
+            self._pending = state
+            self._has_pending = True
+            self._last_request = now
+            self.requested += 1
+            self._cond.notify_all()
+            return True
+
+    def flush(self, timeout=None) -> bool:
+        """Write the pending state now and wait until the writer is idle.
+
+        Returns False if ``timeout`` expired first.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while self._has_pending or self._writing:
+                    remaining = None if deadline is None else deadline - self._clock()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                self._flushing -= 1
+
+    def close(self, flush=True, timeout=None) -> bool:
+        """Stop the writer thread, first writing the pending state if ``flush``."""
+        drained = self.flush(timeout) if flush else True
+        with self._cond:
+            self._closed = True
+            if not flush and self._has_pending:
+                self.skipped += 1
+                self._pending = None
+                self._has_pending = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return drained
+
+    # -----------------------------------------
+    # WRITER THREAD
+    # -----------------------------------------
+
+    def _due(self) -> float:
+        due = min(self._last_request + self.min_interval, self._first_request + self.max_staleness)
+        if self._last_write is not None:
+            due = max(due, self._last_write + self.min_interval)
+        return due
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._has_pending and not self._closed:
+                    self._cond.wait()
+                if not self._has_pending:
+                    return
+                while self._has_pending and not self._flushing and not self._closed:
+                    delay = self._due() - self._clock()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if not self._has_pending:
+                    continue
+                state = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._writing = True
+
+            start = self._clock()
+            try:
+                self._save(state)
+            except Exception as e:  # Keep the thread alive; the next request retries.
+                error = repr(e)
+            else:
+                error = None
+            seconds = self._clock() - start
+
+            with self._cond:
+                if error is None:
+                    self.written += 1
+                else:
+                    self.failed += 1
+                    self.last_error = error
+                self.last_write_seconds = seconds
+                self.max_write_seconds = max(self.max_write_seconds, seconds)
+                self._last_write = start
+                self._writing = False
+                self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "requested": self.requested,
+                "written": self.written,
+                "skipped": self.skipped,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "pending": self._has_pending,
+                "writing": self._writing,
+                "last_write_seconds": self.last_write_seconds,
+                "max_write_seconds": self.max_write_seconds,
+                "last_error": self.last_error,
+                "min_interval": self.min_interval,
+                "max_staleness": self.max_staleness,
+            }
@@ -0,0 +1,87 @@
+"""Convert a brain checkpoint between the JSON and binary formats.
+
+Usage:
+    python -m memory.convert_checkpoint memory_store.json --to binary
+    python -m memory.convert_checkpoint memory_store.json backup.json --to json
+
+The source format is detected from the file itself. If a write-ahead log
+(``<source>.wal``) sits next to the source, it is replayed first, and a
+section manifest (``mode: sections``) is assembled from its section files,
+so the output holds the latest saved state as one plain checkpoint.
+Without a destination the source is converted in place and its folded-in
+log or section directory is removed.
+"""
+import argparse
+import os
+import shutil
+import sys
+
+from memory.sections import SectionStorage, is_manifest
+from memory.storage import CHECKPOINT_FORMATS, MemoryStorage, decode_checkpoint, encode_checkpoint
+from memory.wal import WalStorage
+
+
+def convert(source: str, destination: str | None = None, to: str = "binary") -> dict:
+    """Rewrite ``source`` in format ``to`` and return a short summary."""
+    if not os.path.exists(source):
+        raise FileNotFoundError(source)
+    with open(source, "rb") as f:
+        raw = f.read()
+    data = decode_checkpoint(raw)  # Refuse to convert an unreadable checkpoint.
+
+    log_path = f"{source}.wal"
+    has_log = os.path.exists(log_path)
+    source_bytes = len(raw) + (os.path.getsize(log_path) if has_log else 0)
+    if is_manifest(data):
+        storage = SectionStorage(source)
+        if not storage.get_all():
+            raise ValueError("section files are missing or corrupt")
+        source_bytes += sum(entry.stat().st_size for entry in os.scandir(storage.section_dir))
+    elif has_log:
+        storage = WalStorage(source)
+    else:
+        storage = MemoryStorage(source)
+    payload = encode_checkpoint(storage.get_all(), to)
+
+    destination = destination or source
+    directory = os.path.dirname(destination)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{destination}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, destination)
+    if os.path.abspath(destination) == os.path.abspath(source):
+        if isinstance(storage, SectionStorage):
+            shutil.rmtree(storage.section_dir, ignore_errors=True)
+        elif has_log:
+            os.remove(log_path)
+
+    return {
+        "source_bytes": source_bytes,
+        "destination_bytes": len(payload),
+        "replayed": storage.replayed if isinstance(storage, WalStorage) else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source")
+    parser.add_argument("destination", nargs="?")
+    parser.add_argument("--to", choices=CHECKPOINT_FORMATS, default="binary")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = convert(args.source, args.destination, args.to)
+    except (OSError, ValueError) as exc:
+        print(f"cannot convert {args.source}: {exc}", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"{args.source} -> {args.destination or args.source} ({args.to}): "
+        f"{summary['source_bytes']} -> {summary['destination_bytes']} bytes"
+        + (f", {summary['replayed']} log records folded in" if summary["replayed"] else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
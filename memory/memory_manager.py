@@ -1,9 +1,11 @@
 import json
 import os
 import time
+from contextlib import contextmanager
 from memory.schemas import Memory
+from memory.sections import SectionStorage
 from memory.storage import MemoryStorage
-from memory.vector_store import VectorStore
+from memory.wal import WalStorage
 
 
 class MemoryManager:
@@ -11,16 +13,73 @@ class MemoryManager:
 
     Episodic memories (created by create_memory) live in a ChromaDB vector
     store for semantic retrieval. The full brain-state snapshot (used by
-    save/load for persistence across restarts) stays in a JSON checkpoint."""
+    save/load for persistence across restarts) stays in a JSON checkpoint.
 
-    def __init__(self, storage_path="memory_store.json", scoring_config=None):
-        self.storage = MemoryStorage(storage_path)
+    The ChromaDB store (and the chromadb import) is created on first use, so
+    constructing a manager, and therefore a brain, stays cheap.
 
-        db_dir = os.path.join(os.path.dirname(os.path.abspath(storage_path)) or ".", "brain_memory_db")
-        self.vector_store = VectorStore(path=db_dir, collection="brain_episodic_memory")
+    ``persistence`` is the ``engine.persistence`` config section. With
+    ``mode: wal`` checkpoints go through :class:`WalStorage` (snapshot plus
+    append-only change log) instead of a full rewrite per save, ``mode:
+    sections`` through :class:`SectionStorage` (one file per changed section
+    behind a manifest), and
+    ``format: binary`` writes snapshots in the compact binary format
+    (``memory/binary_checkpoint.py``). Either format is always readable.
 
+    ``flush_config`` is the ``engine.episodic_memory`` config section: the
+    flush thresholds below, ``vector_backend`` (``chroma`` or ``numpy``)
+    and the ``ivf_lists``/``ivf_probes`` index options of the vector store,
+    and the decay settings.
+
+    Importance decays lazily: a stored memory keeps the importance it had
+    when it was created, last accessed or last compacted (``decayed_at``),
+    and :meth:`effective_importance` applies ``decay_rate`` once per
+    ``decay_period`` seconds elapsed since then whenever a memory is scored.
+    :meth:`decay_memories` is the optional compaction: it persists the
+    decayed values in bulk and prunes memories below ``prune_below``."""
+
+    def __init__(self, storage_path="memory_store.json", scoring_config=None, persistence=None, flush_config=None):
+        persistence = persistence or {}
+        checkpoint_format = persistence.get("format", "json")
+        mode = persistence.get("mode", "snapshot")
+        if mode == "wal":
+            self.storage = WalStorage(
+                storage_path,
+                compact_records=persistence.get("wal_compact_records", 1000),
+                compact_ratio=persistence.get("wal_compact_ratio", 2.0),
+                fsync=persistence.get("wal_fsync", False),
+                format=checkpoint_format,
+            )
+        elif mode == "sections":
+            self.storage = SectionStorage(
+                storage_path,
+                segment_size=persistence.get("section_segment_size", 64),
+                format=checkpoint_format,
+            )
+        else:
+            self.storage = MemoryStorage(storage_path, format=checkpoint_format)
+
+        self._vector_store_path = os.path.join(os.path.dirname(os.path.abspath(storage_path)) or ".", "brain_memory_db")
+        self._vector_store = None
+
+        # Episodic memories are buffered and written to the vector store in
+        # bulk once the buffer holds max_pending_writes records or its oldest
+        # record is max_pending_age seconds old (engine.episodic_memory).
+        flush_config = flush_config or {}
         self.pending_memories = []
-        self.max_pending_writes = 25
+        self.max_pending_writes = max(1, int(flush_config.get("flush_size", 25)))
+        self.max_pending_age = float(flush_config.get("flush_max_age", 5.0))
+        self._pending_since = None
+        self._flush_deferred = 0
+        self.flushes = 0
+        self.memories_flushed = 0
+        self.decay_period = max(1e-9, float(flush_config.get("decay_period", 3600.0)))
+        self.prune_below = float(flush_config.get("prune_below", 0.0))
+        self._vector_options = {
+            "backend": flush_config.get("vector_backend", "chroma"),
+            "ivf_lists": int(flush_config.get("ivf_lists", 0)),
+            "ivf_probes": int(flush_config.get("ivf_probes", 16)),
+        }
 
         # Dynamic scoring weights
         self.scoring_config = scoring_config or {
@@ -29,50 +88,149 @@ class MemoryManager:
             "similarity_weight": 0.3
         }
 
+    @property
+    def vector_store(self):
+        if self._vector_store is None:
+            from memory.vector_store import VectorStore
+
+            self._vector_store = VectorStore(
+                path=self._vector_store_path, collection="brain_episodic_memory", **self._vector_options
+            )
+        return self._vector_store
+
+    def open_vector_store(self):
+        """Create the vector store now rather than at the first flush."""
+        return self.vector_store
+
     def create_memory(self, memory_type: str, content: dict, metadata: dict = None):
-        memory = Memory(memory_type, content, metadata)
-        self.pending_memories.append(memory.to_dict())
-        if len(self.pending_memories) >= self.max_pending_writes:
+        self.create_memories(memory_type, [content], metadata)
+
+    def create_memories(self, memory_type: str, contents: list, metadata: dict = None):
+        """Create one memory of ``memory_type`` per content dict in one
+        buffer append (and at most one threshold check)."""
+        if not contents:
+            return
+        # Serialize now rather than at flush time, so a memory holds the
+        # values it was created with even if the flush is deferred.
+        records = [self._vector_record(Memory(memory_type, content, metadata).to_dict()) for content in contents]
+        if not self.pending_memories:
+            self._pending_since = time.monotonic()
+        self.pending_memories.extend(records)
+        if not self._flush_deferred:
+            self.flush_due()
+
+    @staticmethod
+    def _vector_record(mem: dict) -> dict:
+        return {
+            "id": mem["id"],
+            "memory_type": mem["type"],
+            "content": json.dumps(mem["content"]),
+            "importance": float(mem.get("importance", 1.0)),
+            "reinforcement_count": int(mem.get("reinforcement_count", 0)),
+            "created_at": mem["created_at"],
+            "last_accessed": mem["last_accessed"],
+            "decay_rate": float(mem.get("decay_rate", 0.001)),
+            "metadata": json.dumps(mem.get("metadata", {})),
+        }
+
+    @property
+    def flush_deferred(self) -> bool:
+        return self._flush_deferred > 0
+
+    @contextmanager
+    def deferred_flush(self):
+        """Hold created memories in the pending buffer until the block exits.
+
+        The threshold-triggered flush in create_memory is suspended and callers that
+        flush on a schedule (the tick's memory_flush stage) check
+        ``flush_deferred``. Everything pending is written once on exit. Explicit
+        flush_pending(), retrieve(), save() and load() calls still flush.
+        """
+        self._flush_deferred += 1
+        try:
+            yield self
+        finally:
+            self._flush_deferred -= 1
+            if not self._flush_deferred:
+                self.flush_pending()
+
+    def flush_due(self) -> bool:
+        """Flush if the pending buffer reached its size or age threshold."""
+        if not self.pending_memories:
+            return False
+        if (
+            len(self.pending_memories) >= self.max_pending_writes
+            or time.monotonic() - self._pending_since >= self.max_pending_age
+        ):
             self.flush_pending()
+            return True
+        return False
 
     def flush_pending(self):
         if not self.pending_memories:
             return
 
-        for mem in self.pending_memories:
-            self.vector_store.store({
-                "id": mem["id"],
-                "memory_type": mem["type"],
-                "content": json.dumps(mem["content"]),
-                "importance": float(mem.get("importance", 1.0)),
-                "reinforcement_count": int(mem.get("reinforcement_count", 0)),
-                "created_at": mem["created_at"],
-                "last_accessed": mem["last_accessed"],
-                "decay_rate": float(mem.get("decay_rate", 0.001)),
-                "metadata": json.dumps(mem.get("metadata", {})),
-            })
-        self.pending_memories = []
+        batch, self.pending_memories = self.pending_memories, []
+        pending_since, self._pending_since = self._pending_since, None
+        try:
+            self.vector_store.store_many(batch)
+        except Exception:
+            # Keep the records for the next flush instead of dropping them.
+            self.pending_memories = batch + self.pending_memories
+            self._pending_since = pending_since
+            raise
+        self.flushes += 1
+        self.memories_flushed += len(batch)
+
+    def effective_importance(self, mem: dict, now: float = None) -> float:
+        """Importance of ``mem`` at ``now``, decayed from its stored value."""
+        importance = float(mem.get("importance", 1.0))
+        decay_rate = min(1.0, max(0.0, float(mem.get("decay_rate", 0.001))))
+        anchor = max(float(mem.get(key) or 0.0) for key in ("created_at", "last_accessed", "decayed_at"))
+        elapsed = max(0.0, (time.time() if now is None else now) - anchor)
+        if not decay_rate or not elapsed:
+            return importance
+        return max(0.0, importance * (1.0 - decay_rate) ** (elapsed / self.decay_period))
 
-    def decay_memories(self):
+    def decay_memories(self, now: float = None) -> int:
+        """Compact the lazy decay: store every memory's effective importance
+        (re-anchored at ``now``) with one bulk metadata update, and delete the
+        memories whose importance fell below ``prune_below`` in one call.
+
+        Scoring never needs this; it only bounds the stored drift and the
+        store size. Returns the number of memories pruned."""
         self.flush_pending()
+        now = time.time() if now is None else now
+        updates, expired = [], []
         for mem in self.vector_store.items:
-            decay_rate = float(mem.get("decay_rate", 0.001))
-            importance = float(mem.get("importance", 1.0)) - float(mem.get("importance", 1.0)) * decay_rate
-            if importance < 0:
-                importance = 0
-            mem["importance"] = importance
-            self.vector_store.update(mem)
-
-    def retrieve(self, context: dict, limit=5):
+            importance = self.effective_importance(mem, now)
+            if importance < self.prune_below:
+                expired.append(mem["id"])
+            elif importance != float(mem.get("importance", 1.0)):
+                updates.append({"id": mem["id"], "importance": importance, "decayed_at": now})
+        if updates:
+            self.vector_store.update_metadata(updates)
+        if expired:
+            self.vector_store.delete_many(expired)
+        return len(expired)
+
+    def retrieve(self, context: dict, limit=5, where=None, overfetch=3):
+        """Top ``limit`` memories for ``context`` under the scoring weights.
+
+        Only the ``max(limit * overfetch, 10)`` most similar memories that
+        match the Chroma metadata filter ``where`` are fetched and re-scored,
+        so recall cost does not grow with the size of the store.
+        """
         self.flush_pending()
         query = " ".join(f"{k} {v}" for k, v in (context or {}).items())
-        candidates = self.vector_store.search(query, limit=max(limit * 3, 10)) if query else self.vector_store.items[:limit]
+        candidates = self.vector_store.search(query, limit=max(limit * overfetch, 10), where=where) if query else []
         if not candidates:
-            candidates = self.vector_store.items[:limit]
+            candidates = self.vector_store.head(limit, where=where)
 
+        now = time.time()
         scored_memories = []
         for mem in candidates:
-            importance_score = float(mem.get("importance", 0.0))
+            importance_score = self.effective_importance(mem, now)
             recency_score = self._calculate_recency(float(mem.get("created_at", 0.0)))
             similarity_score = float(mem.get("_sim", 0.0))
 
@@ -90,14 +248,14 @@ class MemoryManager:
         return scored_memories[:limit]
 
     def save(self, state_dict: dict):
-        """Persist the full brain-state checkpoint to JSON storage."""
+        """Persist the brain-state checkpoint (full rewrite, or a log record in WAL mode)."""
         self.flush_pending()
         if state_dict is None:
             state_dict = {}
         self.storage.update_all(state_dict)
 
     def load(self):
-        """Load the persisted brain-state checkpoint from JSON storage."""
+        """Load the persisted brain-state checkpoint (snapshot plus replayed log in WAL mode)."""
         self.flush_pending()
         return self.storage.get_all()
 
@@ -0,0 +1,322 @@
+import json
+import os
+import re
+import shutil
+import zlib
+
+from core.snapshot import FrozenDict, FrozenList
+from memory.storage import MemoryStorage, decode_checkpoint, encode_checkpoint
+from memory.wal import _window_shift
+
+LAYOUT = "sections"
+LAYOUT_VERSION = 1
+
+
+def is_manifest(value) -> bool:
+    """True if a decoded checkpoint is a :class:`SectionStorage` manifest."""
+    return isinstance(value, dict) and value.get("layout") == LAYOUT and "order" in value
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class SectionStorage(MemoryStorage):
+    """Checkpoint storage that rewrites only the sections that changed.
+
+    ``file_path`` holds a small JSON manifest; the sections live in
+    ``file_path + ".sections/"``. A top-level key of the state is stored:
+
+    * as its own section file if its value is a frozen snapshot section
+      (``FrozenDict``/``FrozenList`` from ``StateSnapshots``: Q-table,
+      Hopfield weights, concept memory, language cortex, user memory). Such a
+      section comes back as the same object until its owner bumps its
+      version, so an unchanged one is skipped by identity without encoding;
+    * as a window of segment files if its value is a list of records
+      (autobiography, recent perceptions). Items trimmed from the front only
+      move the manifest's ``skip`` offset or drop whole segments, and
+      appended items rewrite the last, partly filled segment and add new
+      ones, ``segment_size`` records each;
+    * otherwise in the shared ``core`` section (chemistry, counters, mood,
+      worldview, narrative ...), which is rewritten when its encoding changes.
+
+    A section whose encoding matches its stored checksum is not rewritten
+    either. Section files are never overwritten in place: each save writes
+    new file names, then swaps in the new manifest with ``os.replace``, then
+    deletes the files the old manifest referenced. A crash at any point
+    leaves a manifest whose files are all complete; leftovers are removed
+    on the next load. ``save()`` rewrites every section.
+
+    A plain checkpoint at ``file_path`` (from ``snapshot`` or ``wal`` mode)
+    is loaded as-is and split into sections on the first save. Reopening a
+    store with a different ``format`` reads the old files and rewrites them
+    all in the new format on the next save. To go back,
+    convert with ``python -m memory.convert_checkpoint``.
+    """
+
+    def __init__(self, file_path="memory_store.json", segment_size=64, format="json"):
+        self.section_dir = f"{file_path}.sections"
+        self.segment_size = max(1, int(segment_size))
+        self._manifest = None
+        self._saved: dict = {}
+        self._items: dict = {}
+        self._generation = 0
+        self._files_this_save = 0
+        self.saves = 0
+        self.sections_written = 0
+        self.sections_skipped = 0
+        self.bytes_written = 0
+        super().__init__(file_path, format=format)
+
+    # -----------------------------------------
+    # LOAD
+    # -----------------------------------------
+
+    def _load(self):
+        self.memories = []
+        self._manifest = None
+        if not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, "rb") as f:
+                data = decode_checkpoint(f.read())
+        except (ValueError, OSError):
+            return
+        if not is_manifest(data):
+            # A plain checkpoint from another mode; the first save splits it.
+            self.memories = data
+            return
+        try:
+            self.memories = self._read(data)
+        except (ValueError, OSError, KeyError, TypeError):
+            self.memories = []
+            return
+        self._manifest = data
+        self._generation = int(data.get("generation", 0))
+        if isinstance(self.memories, dict):
+            self._saved = dict(self.memories)
+        self._sweep(self._referenced(data))
+
+    def _read_file(self, entry: dict):
+        with open(os.path.join(self.section_dir, entry["file"]), "rb") as f:
+            raw = f.read()
+        if zlib.crc32(raw) != entry["crc"]:
+            raise ValueError(f"section file {entry['file']} does not match its checksum")
+        return decode_checkpoint(raw)
+
+    def _read(self, manifest: dict):
+        core = self._read_file(manifest["core"])
+        if manifest["order"] is None:
+            return core
+        state = {}
+        for key in manifest["order"]:
+            if key in manifest["sections"]:
+                state[key] = self._read_file(manifest["sections"][key])
+            elif key in manifest["windows"]:
+                window = manifest["windows"][key]
+                items = []
+                for segment in window["segments"]:
+                    items.extend(self._read_file(segment))
+                state[key] = items[window["skip"]:]
+            else:
+                state[key] = core[key]
+        return state
+
+    # -----------------------------------------
+    # WRITES
+    # -----------------------------------------
+
+    def save(self):
+        """Rewrite every section and the manifest."""
+        with self._save_lock:
+            self._checkpoint(self.memories, full=True)
+
+    def add(self, memory_dict: dict):
+        with self._save_lock:
+            self.memories.append(memory_dict)
+            self._checkpoint(self.memories, full=True)
+
+    def update_all(self, updated_memories):
+        with self._save_lock:
+            self.memories = updated_memories
+            self._checkpoint(updated_memories, full=False)
+
+    def _checkpoint(self, state, full: bool):
+        # Caller holds self._save_lock.
+        previous = None if full else self._manifest
+        if previous is not None and previous.get("format") != self.format:
+            # The format changed since the last save: rewrite every file in the new one.
+            previous = None
+        self._generation += 1
+        self._files_this_save = 0
+        if not isinstance(state, dict):
+            manifest = self._new_manifest(None)
+            manifest["core"] = self._blob("core", state, None if previous is None else previous.get("core"))
+            self._saved, self._items = {}, {}
+            self._commit(manifest)
+            return
+
+        manifest = self._new_manifest(list(state))
+        core = {}
+        saved, items = {}, {}
+        for key, value in state.items():
+            if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+                old_entry = None if previous is None else previous["windows"].get(key)
+                manifest["windows"][key] = self._window(key, value, old_entry, items)
+                saved[key] = value
+            elif isinstance(value, (FrozenDict, FrozenList)):
+                old_entry = None if previous is None else previous["sections"].get(key)
+                if old_entry is not None and self._saved.get(key) is value:
+                    manifest["sections"][key] = old_entry
+                    self.sections_skipped += 1
+                else:
+                    manifest["sections"][key] = self._blob(key, value, old_entry)
+                saved[key] = value
+            else:
+                core[key] = value
+        manifest["core"] = self._blob("core", core, None if previous is None else previous.get("core"))
+        self._saved, self._items = saved, items
+        self._commit(manifest)
+
+    def _new_manifest(self, order) -> dict:
+        return {
+            "layout": LAYOUT,
+            "version": LAYOUT_VERSION,
+            "generation": self._generation,
+            "format": self.format,
+            "order": order,
+            "core": None,
+            "sections": {},
+            "windows": {},
+        }
+
+    def _blob(self, name: str, value, old_entry: dict | None) -> dict:
+        raw = encode_checkpoint(value, self.format, indent=None)
+        if old_entry is not None and old_entry["crc"] == zlib.crc32(raw) and old_entry["bytes"] == len(raw):
+            self.sections_skipped += 1
+            return old_entry
+        return self._write(name, raw)
+
+    def _window(self, key: str, value: list, old_entry: dict | None, items: dict) -> dict:
+        shift = None
+        old = self._saved.get(key)
+        if old_entry is not None and isinstance(old, list):
+            if isinstance(old, FrozenList) and isinstance(value, FrozenList):
+                shift = _window_shift(old, value, lambda a, b: a is b)
+            else:
+                # Match plain items by their JSON, cached from the last save.
+                old_items = self._items.get(key)
+                if old_items is None:
+                    old_items = [_dumps(item) for item in old]
+                new_items = [_dumps(item) for item in value]
+                items[key] = new_items
+                shift = _window_shift(old_items, new_items, str.__eq__)
+        elif not isinstance(value, FrozenList):
+            items[key] = [_dumps(item) for item in value]
+
+        size = self.segment_size
+        count = len(value)
+        if shift is None:
+            segments = [self._segment(key, value[start:start + size]) for start in range(0, count, size)]
+            return {"skip": 0, "segments": segments}
+
+        skip = old_entry["skip"] + shift
+        segments = list(old_entry["segments"])
+        while segments and segments[0]["count"] <= skip:
+            skip -= segments.pop(0)["count"]
+        start = sum(segment["count"] for segment in segments) - skip
+        if start < count and segments and segments[-1]["count"] < size:
+            # Refill the partly filled last segment (dropping any trimmed
+            # items if it is also the first one).
+            last = segments.pop()
+            live = last["count"] - (0 if segments else skip)
+            if not segments:
+                skip = 0
+            end = min(count, start + size - live)
+            segments.append(self._segment(key, value[start - live:end]))
+            start = end
+        while start < count:
+            segments.append(self._segment(key, value[start:start + size]))
+            start += size
+        if not shift and len(segments) == len(old_entry["segments"]) and all(
+            a is b for a, b in zip(segments, old_entry["segments"])
+        ):
+            self.sections_skipped += 1
+            return old_entry
+        return {"skip": skip, "segments": segments}
+
+    def _segment(self, key: str, items: list) -> dict:
+        entry = self._write(key, encode_checkpoint(list(items), self.format, indent=None))
+        entry["count"] = len(items)
+        return entry
+
+    def _write(self, name: str, raw: bytes) -> dict:
+        os.makedirs(self.section_dir, exist_ok=True)
+        extension = "ckpt" if self.format == "binary" else "json"
+        self._files_this_save += 1
+        file_name = f"{re.sub(r'[^A-Za-z0-9_-]', '_', name)}.{self._generation}.{self._files_this_save}.{extension}"
+        with open(os.path.join(self.section_dir, file_name), "wb") as f:
+            f.write(raw)
+        self.sections_written += 1
+        self.bytes_written += len(raw)
+        return {"file": file_name, "crc": zlib.crc32(raw), "bytes": len(raw)}
+
+    def _commit(self, manifest: dict):
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        raw = _dumps(manifest).encode()
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, self.file_path)
+        self.bytes_written += len(raw)
+        self.saves += 1
+
+        referenced = self._referenced(manifest)
+        if self._manifest is None:
+            self._sweep(referenced)
+        else:
+            for file_name in self._referenced(self._manifest) - referenced:
+                try:
+                    os.remove(os.path.join(self.section_dir, file_name))
+                except FileNotFoundError:
+                    pass
+        self._manifest = manifest
+
+    @staticmethod
+    def _referenced(manifest: dict) -> set:
+        files = {manifest["core"]["file"]}
+        files.update(entry["file"] for entry in manifest["sections"].values())
+        for window in manifest["windows"].values():
+            files.update(segment["file"] for segment in window["segments"])
+        return files
+
+    def _sweep(self, referenced: set):
+        # Remove section files no manifest points to (left by a crashed save).
+        if not os.path.isdir(self.section_dir):
+            return
+        for file_name in os.listdir(self.section_dir):
+            if file_name not in referenced:
+                try:
+                    os.remove(os.path.join(self.section_dir, file_name))
+                except OSError:
+                    pass
+
+    def _remove_files(self):
+        super()._remove_files()
+        shutil.rmtree(self.section_dir, ignore_errors=True)
+        self._manifest = None
+        self._saved, self._items = {}, {}
+        self._generation = 0
+
+    def stats(self) -> dict:
+        manifest = self._manifest
+        return {
+            "saves": self.saves,
+            "sections_written": self.sections_written,
+            "sections_skipped": self.sections_skipped,
+            "bytes_written": self.bytes_written,
+            "files": len(self._referenced(manifest)) if manifest else 0,
+            "generation": self._generation,
+        }
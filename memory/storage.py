@@ -2,22 +2,48 @@ import json
 import os
 import threading
 
+from memory import binary_checkpoint
+
+CHECKPOINT_FORMATS = ("json", "binary")
+
+
+def encode_checkpoint(value, format="json", indent=4) -> bytes:
+    """Serialize a checkpoint payload. ``indent=None`` writes compact JSON."""
+    if format == "binary":
+        return binary_checkpoint.dumps(value)
+    if format != "json":
+        raise ValueError(f"unknown checkpoint format {format!r} (expected one of {CHECKPOINT_FORMATS})")
+    if indent is None:
+        return json.dumps(value, separators=(",", ":")).encode()
+    return json.dumps(value, indent=indent).encode()
+
+
+def decode_checkpoint(raw: bytes):
+    """Parse a checkpoint in either format; the binary magic decides which."""
+    if binary_checkpoint.is_binary(raw):
+        return binary_checkpoint.loads(raw)
+    return json.loads(raw)
+
 
 class MemoryStorage:
-    def __init__(self, file_path="memory_store.json"):
+    def __init__(self, file_path="memory_store.json", format="json"):
+        if format not in CHECKPOINT_FORMATS:
+            raise ValueError(f"unknown checkpoint format {format!r} (expected one of {CHECKPOINT_FORMATS})")
         self.file_path = file_path
+        self.format = format
         self.memories = []
         self._save_lock = threading.Lock()
 
         self._load()
 
     def _load(self):
+        # Either format is readable regardless of self.format, so switching
+        # formats never strands an existing checkpoint.
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, "r") as f:
-                    data = json.load(f)
-                    self.memories = data
-            except (json.JSONDecodeError, OSError):
+                with open(self.file_path, "rb") as f:
+                    self.memories = decode_checkpoint(f.read())
+            except (ValueError, OSError):
                 self.memories = []
         else:
             self.memories = []
@@ -30,9 +56,9 @@ class MemoryStorage:
             if directory:
                 os.makedirs(directory, exist_ok=True)
             tmp_path = f"{self.file_path}.tmp"
-            with open(tmp_path, "w") as f:
-                json.dump(self.memories, f, indent=4)
-            os.replace(tmp_path, self.file_path)
+            with open(tmp_path, "wb") as f:
+                f.write(encode_checkpoint(self.memories, self.format))
+            os.replace(tmp_path, self.file_path)
 
     def add(self, memory_dict: dict):
         self.memories.append(memory_dict)
@@ -44,3 +70,17 @@ class MemoryStorage:
     def update_all(self, updated_memories):
         self.memories = updated_memories
         self.save()
+
+    def reset(self):
+        """Delete every file this storage owns and start empty."""
+        with self._save_lock:
+            self.memories = []
+            self._remove_files()
+
+    def _remove_files(self):
+        # Caller holds self._save_lock; subclasses add their own files.
+        for path in (self.file_path, f"{self.file_path}.tmp"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -1,14 +1,29 @@
 import os
 import datetime
 import uuid
+from collections import Counter
+from functools import lru_cache
 
-from memory.vector_store import VectorStore
+# Facts whose decayed importance falls below this are forgotten.
+RETENTION_FLOOR = 0.15
 
 
 def _now_iso():
     return datetime.datetime.now().isoformat(timespec="seconds")
 
 
+def _fact_type(fact):
+    return fact.get("fact_type", "general")
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value):
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
 class UserMemory:
     """Vector-backed long-term memory about the user.
 
@@ -16,26 +31,132 @@ class UserMemory:
     as embeddings for semantic recall, and can build a compact profile summary
     used to personalise conversation.
 
-    The ChromaDB store is initialized lazily so constructing the object has no
-    side effects (and does not disturb a seeded RNG stream)."""
+    The ChromaDB store (and the chromadb import) is initialized lazily so
+    constructing the object has no side effects (and does not disturb a
+    seeded RNG stream).
 
-    def __init__(self, path=None, user_name=None):
+    Every stored fact is mirrored in memory, in store order. The mirror is read from the store once; after that
+    every write goes to the store and then to the mirror, so ``facts()``,
+    ``profile()``, ``to_state()`` and the rest never read the whole store
+    again. The profile counts are kept alongside the mirror by the same
+    writes, so ``profile()`` does not walk the facts either. Only semantic ``recall`` queries the store. If the store is
+    written some other way (``version`` of the ``VectorStore`` moved), the
+    mirror is reloaded on the next read; call :meth:`invalidate` after
+    another process writes to the same path.
+
+    Forgetting is evaluated at read time: :meth:`effective_importance`
+    halves a fact's stored importance every ``half_life_days * importance``
+    days since it was stored (or last compacted), and facts below
+    ``RETENTION_FLOOR`` are left out of recall. :meth:`decay` compacts:
+    it persists the decayed importances and deletes the forgotten facts in
+    bulk. ``profile()`` and ``to_state()`` describe the stored facts, so
+    they only change when :meth:`decay` (or another write) does."""
+
+    def __init__(self, path=None, user_name=None, vector_backend="chroma", half_life_days=90):
         if path is None:
             base = os.getenv("AASHU_MEMORY_DIR", ".")
             path = os.path.join(base, "user_db")
         self.path = path
         self.user_name = user_name
+        self.vector_backend = vector_backend
+        self.half_life_days = half_life_days
         self._store = None
+        self._facts = None
+        self._store_version = None
+        self._fact_types = Counter()
+        self.mirror_loads = 0
+        # Bumped whenever the stored facts or the user name change, so state
+        # snapshots only re-read the vector store after a write.
+        self.version = 0
 
     @property
     def store(self):
         if self._store is None:
-            self._store = VectorStore(path=self.path, collection="user_profile")
+            from memory.vector_store import VectorStore
+
+            self._store = VectorStore(path=self.path, collection="user_profile", backend=self.vector_backend)
         return self._store
 
+    # -----------------------------------------
+    # MIRROR
+    # -----------------------------------------
+
+    def _mirror(self):
+        """id -> fact for every stored fact, in store order."""
+        store = self.store
+        if self._facts is None or store.version != self._store_version:
+            if self._facts is not None:
+                # Written behind our back: snapshots must not reuse old copies.
+                self.version += 1
+            self._facts = {f["id"]: f for f in store.items}
+            self._fact_types = Counter(_fact_type(f) for f in self._facts.values())
+            self._store_version = store.version
+            self.mirror_loads += 1
+        return self._facts
+
+    def invalidate(self):
+        """Drop the mirror so the next read reloads it from the store."""
+        self._facts = None
+
+    def _add_facts(self, items):
+        facts = self._mirror()
+        items = [item for item in items if item.get("id") not in facts]
+        if not items:
+            return []
+        self.store.store_many(items)
+        for item in items:
+            fact = self.store.stored(item)
+            facts[fact["id"]] = fact
+            self._fact_types[_fact_type(fact)] += 1
+        self._store_version = self.store.version
+        self.version += 1
+        return items
+
+    def _delete_facts(self, ids):
+        facts = self._mirror()
+        ids = [fact_id for fact_id in ids if fact_id in facts]
+        if not ids:
+            return []
+        try:
+            self.store.delete_many(ids)
+        except Exception:
+            self.invalidate()
+            return []
+        removed = []
+        for fact_id in ids:
+            fact = facts.pop(fact_id)
+            self._count_out(fact)
+            removed.append(fact)
+        self._store_version = self.store.version
+        self.version += 1
+        return removed
+
+    def _update_facts(self, updates):
+        facts = self._mirror()
+        self.store.update_metadata(updates)
+        for update in updates:
+            fact = facts.get(update["id"])
+            if fact is not None:
+                self._count_out(fact)
+                fact.update((key, value) for key, value in update.items() if key != "id")
+                self._fact_types[_fact_type(fact)] += 1
+        self._store_version = self.store.version
+        self.version += 1
+
+    def _count_out(self, fact):
+        fact_type = _fact_type(fact)
+        self._fact_types[fact_type] -= 1
+        if not self._fact_types[fact_type]:
+            del self._fact_types[fact_type]
+
+    # -----------------------------------------
+    # FACTS
+    # -----------------------------------------
+
     def set_user_name(self, name):
         if name and name.strip():
             self.user_name = name.strip().lower().capitalize()
+            self.version += 1
 
     def remember(self, fact, fact_type="general", importance=0.6):
         """Store a durable fact about the user."""
@@ -49,19 +170,18 @@ class UserMemory:
             "importance": float(importance),
             "timestamp": _now_iso(),
         }
-        self.store.store(item)
+        self._add_facts([item])
         return item
 
     def forget(self, fact_type=None, fact=None):
-        removed = []
-        for item in self.store.items:
+        matches = []
+        for item in self._mirror().values():
             if fact_type and item.get("fact_type") != fact_type:
                 continue
             if fact and fact.lower() not in item.get("content", "").lower():
                 continue
-            if self.store.delete(item["id"]):
-                removed.append(item)
-        return removed
+            matches.append(item["id"])
+        return self._delete_facts(matches)
 
     def recall(self, context, limit=5):
         """Semantically recall facts relevant to the given context.
@@ -69,30 +189,32 @@ class UserMemory:
         Falls back to the most recently stored facts when the hashed
         embedding finds no shared vocabulary with the context."""
         if not context or not context.strip():
-            return self.store.items[:limit]
-        results = self.store.search(context, limit=limit)
+            return self.all_facts(limit)
+        results = self._retained(self.store.search(context, limit=limit))
         hits = [r for r in results if r.get("content")]
         if hits:
             return hits
-        return self.store.items[:limit]
+        return self.all_facts(limit)
 
     def facts(self):
-        return self.store.items
+        return [dict(f) for f in self._retained(self._mirror().values())]
 
     def all_facts(self, limit=20):
-        return self.store.items[:limit]
+        return [dict(f) for f in self._retained(self._mirror().values())[:limit]]
 
     def profile(self):
-        facts = self.store.items
-        types = {}
-        for f in facts:
-            t = f.get("fact_type", "general")
-            types[t] = types.get(t, 0) + 1
+        """Summary of the stored facts, read from counts the writes keep.
+
+        Like ``to_state()`` it includes facts that have faded below the
+        retention floor until :meth:`decay` deletes them, so it does not
+        depend on the clock and snapshots can cache it by ``version``."""
+        facts = self._mirror()
+        first = next(iter(facts.values()), None)
         return {
             "user_name": self.user_name,
             "total_facts": len(facts),
-            "fact_types": types,
-            "last_updated": facts[0]["timestamp"] if facts else None,
+            "fact_types": dict(self._fact_types),
+            "last_updated": first.get("timestamp") if first else None,
         }
 
     def context_for_conversation(self, context=None, limit=6):
@@ -101,7 +223,7 @@ class UserMemory:
             header = f"Known about {self.user_name}:"
         else:
             header = "Known about the user:"
-        facts = self.recall(context, limit=limit) if context else self.store.items[:limit]
+        facts = self.recall(context, limit=limit) if context else self.all_facts(limit)
         if not facts:
             return ""
         lines = [header]
@@ -119,7 +241,8 @@ class UserMemory:
         Groups stored facts by type and content pattern; when several facts
         agree, a single consolidated 'trait' fact is stored and the individual
         low-importance sources are removed."""
-        facts = self.store.items
+        now = datetime.datetime.now()
+        facts = self._retained(self._mirror().values(), now)
         if len(facts) < 3:
             return 0
         traits = {}
@@ -138,9 +261,8 @@ class UserMemory:
             contents = {f["content"].strip().lower() for f in group}
             if len(contents) < 2:
                 continue
-            for f in group:
-                if f.get("importance", 0.6) < 0.5:
-                    self.store.delete(f["id"])
+            self.version += 1
+            self._delete_facts([f["id"] for f in group if self.effective_importance(f, now) < 0.5])
             trait_content = "; ".join(f["content"].strip() for f in group)
             trait = {
                 "id": uuid.uuid4().hex[:12],
@@ -150,35 +272,47 @@ class UserMemory:
                 "timestamp": _now_iso(),
                 "derived": True,
             }
-            self.store.store(trait)
+            self._add_facts([trait])
             created += 1
         return created
 
-    def decay(self, half_life_days=90):
-        """Importance-weighted forgetting.
+    def effective_importance(self, fact, now=None):
+        """Importance of ``fact`` at ``now``: older, low-importance facts fade
+        faster. Facts at importance 1.0 or above never decay. Deterministic,
+        no randomness involved."""
+        importance = float(fact.get("importance", 0.6))
+        if importance >= 1.0:
+            return importance
+        now = now or datetime.datetime.now()
+        stored = _parse_iso(fact.get("decayed_at") or fact.get("timestamp")) or now
+        age_days = max(0.0, (now - stored).total_seconds() / 86400.0)
+        return importance * 0.5 ** (age_days / max(1.0, self.half_life_days * importance))
+
+    def _retained(self, facts, now=None):
+        now = now or datetime.datetime.now()
+        return [f for f in facts if self.effective_importance(f, now) >= RETENTION_FLOOR]
+
+    def decay(self, half_life_days=None):
+        """Compact the read-time forgetting curve.
 
-        Older, low-importance facts decay until they fall below the retention
-        floor and are removed. Deterministic — no randomness involved."""
+        Deletes the facts below the retention floor in one call and stores
+        the decayed importance of the rest, re-anchored at now, in one bulk
+        metadata update. Returns the number of facts removed."""
+        if half_life_days is not None:
+            self.half_life_days = half_life_days
         now = datetime.datetime.now()
-        removed = 0
-        for f in self.store.items:
+        stamp = now.isoformat(timespec="seconds")
+        updates, expired = [], []
+        for f in self._mirror().values():
             importance = float(f.get("importance", 0.6))
-            try:
-                ts = datetime.datetime.fromisoformat(f.get("timestamp", _now_iso()))
-            except ValueError:
-                ts = now
-            age_days = max(0.0, (now - ts).total_seconds() / 86400.0)
-            if importance >= 1.0:
-                continue
-            decayed = importance * 0.5 ** (age_days / max(1.0, half_life_days * importance))
-            if decayed < 0.15:
-                if self.store.delete(f["id"]):
-                    removed += 1
-            elif abs(decayed - importance) > 1e-9:
-                f["importance"] = round(decayed, 3)
-                f["content"] = f.get("content", "")
-                self.store.update(f)
-        return removed
+            decayed = self.effective_importance(f, now)
+            if decayed < RETENTION_FLOOR:
+                expired.append(f["id"])
+            elif round(decayed, 3) != importance:
+                updates.append({"id": f["id"], "importance": round(decayed, 3), "decayed_at": stamp})
+        if updates:
+            self._update_facts(updates)
+        return len(self._delete_facts(expired))
 
     def to_state(self):
         return {
@@ -191,7 +325,7 @@ class UserMemory:
                     "importance": f.get("importance"),
                     "timestamp": f.get("timestamp"),
                 }
-                for f in self.store.items
+                for f in self._mirror().values()
             ],
         }
 
@@ -201,17 +335,15 @@ class UserMemory:
         self.set_user_name(state.get("user_name"))
         # Idempotent restore: the store already persists on disk, so skip
         # facts that exist instead of re-adding them with duplicate IDs.
-        known_ids = {f.get("id") for f in self.store.items}
+        items = []
         for fact in state.get("facts", []) or []:
             if not isinstance(fact, dict) or not fact.get("content"):
                 continue
-            fact_id = fact.get("id") or uuid.uuid4().hex[:12]
-            if fact_id in known_ids:
-                continue
-            self.store.store({
-                "id": fact_id,
+            items.append({
+                "id": fact.get("id") or uuid.uuid4().hex[:12],
                 "content": fact["content"],
                 "fact_type": fact.get("fact_type", "general"),
                 "importance": fact.get("importance", 0.6),
                 "timestamp": fact.get("timestamp") or _now_iso(),
             })
+        self._add_facts(items)
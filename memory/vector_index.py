@@ -0,0 +1,543 @@
+import json
+import operator
+import os
+import threading
+
+import numpy as np
+
+INDEX_VERSION = 1
+CHECKPOINT_MIN_LINES = 1024
+IVF_MIN_PER_LIST = 16
+IVF_TRAIN_PER_LIST = 64
+IVF_ITERATIONS = 8
+
+
+def _kind(value):
+    if isinstance(value, bool):
+        return bool
+    if isinstance(value, (int, float)):
+        return float
+    return type(value)
+
+
+def _same(value, target) -> bool:
+    """Chroma equality: a bool, a number and a string never match each other."""
+    return value is not None and _kind(value) is _kind(target) and value == target
+
+
+def _ordered(compare):
+    def test(value, target):
+        return value is not None and _kind(value) is float and compare(value, target)
+    return test
+
+
+_COMPARE = {
+    "$eq": _same,
+    "$ne": lambda value, target: not _same(value, target),
+    "$gt": _ordered(operator.gt),
+    "$gte": _ordered(operator.ge),
+    "$lt": _ordered(operator.lt),
+    "$lte": _ordered(operator.le),
+    "$in": lambda value, target: any(_same(value, item) for item in target),
+    "$nin": lambda value, target: not any(_same(value, item) for item in target),
+}
+_ORDERED = {"$gt", "$gte", "$lt", "$lte"}
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+class NumpyCollection:
+    """In-process vector collection: a float32 matrix plus metadata columns.
+
+    Implements the part of the Chroma collection API that :class:`VectorStore`
+    uses (``add``, ``get``, ``query``, ``update``, ``delete``, ``count``), so
+    the store runs unchanged on either backend. Vectors are stored unit length
+    and ``query`` ranks by cosine distance (``1 - dot``) with one
+    matrix-vector product, like a Chroma collection with ``hnsw:space:
+    cosine`` but exact. ``where`` takes Chroma metadata filters: ``{key:
+    value}``, ``{key: {"$eq"|"$ne"|"$gt"|"$gte"|"$lt"|"$lte"|"$in"|"$nin":
+    value}}`` and ``$and``/``$or`` lists, with Chroma's semantics: bools,
+    numbers and strings are distinct types, ``$ne``/``$nin`` also match
+    records without the key, and the ordering operators take numbers only.
+
+    Everything lives under ``<path>/<name>.npvec/``:
+
+    * ``vectors.<generation>.f32``: the raw row-major matrix, opened with
+      ``np.memmap``. Its capacity doubles as rows are appended, so an add
+      only writes the new rows;
+    * ``rows.<generation>.json``: ids, documents and one list per metadata
+      key, as of the last checkpoint;
+    * ``records.<generation>.jsonl``: one line per add, update or delete
+      since then. Rows are numbered in add order. A torn last line is
+      dropped on load;
+    * ``index.json``: the dimension and the current generations.
+
+    Once the log holds more lines than half the rows (and at least
+    ``CHECKPOINT_MIN_LINES``), the rows are written to a new snapshot with an
+    empty log, so a load reads one JSON document and a short tail. If more
+    than half of the rows are deleted, the matrix is rewritten without them
+    too. The new files get the next generation and ``index.json`` is swapped in
+    with ``os.replace``, so a crash leaves the previous generation intact.
+    Files of other generations are removed on load.
+
+    With ``ivf_lists > 0`` queries go through a coarse-quantized (IVF) index
+    once the collection holds ``IVF_MIN_PER_LIST`` rows per list: spherical
+    k-means centroids, trained on a sample, partition the rows, and a query
+    scores only the rows of its ``ivf_probes`` nearest lists, whose vectors
+    are kept contiguous in memory. New rows join their nearest list and the
+    centroids are retrained once the collection doubles. The index is built
+    on the first query after a load. Queries whose probed lists hold fewer
+    matches than requested (narrow ``where`` filters) fall back to the exact
+    scan.
+    """
+
+    def __init__(self, path, name, embedding_function, dim=None, ivf_lists=0, ivf_probes=16):
+        self.directory = os.path.join(path, f"{name}.npvec")
+        self.name = name
+        self.embedding_function = embedding_function
+        self.ivf_lists = max(0, int(ivf_lists))
+        self.ivf_probes = max(1, int(ivf_probes))
+        self._lock = threading.RLock()
+        self._dim = dim or getattr(embedding_function, "dim", None)
+        self._generation = 0
+        self._vector_generation = 0
+        self._reset_rows()
+        self._load()
+
+    def _reset_rows(self):
+        self._ids: list = []
+        self._rows: dict = {}
+        self._documents: list = []
+        self._columns: dict = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._vectors = None
+        self._log_lines = 0
+        self._reset_ivf()
+
+    def _reset_ivf(self):
+        self._centroids = None
+        self._assignments = None
+        self._lists = None
+        self._trained_rows = 0
+
+    # -----------------------------------------
+    # FILES
+    # -----------------------------------------
+
+    def _file(self, kind: str) -> str:
+        if kind == "vectors":
+            return os.path.join(self.directory, f"vectors.{self._vector_generation}.f32")
+        extension = "json" if kind == "rows" else "jsonl"
+        return os.path.join(self.directory, f"{kind}.{self._generation}.{extension}")
+
+    def _load(self):
+        index_path = os.path.join(self.directory, "index.json")
+        if not os.path.exists(index_path):
+            return
+        with open(index_path) as f:
+            index = json.load(f)
+        self._dim = int(index["dim"])
+        self._generation = int(index["generation"])
+        self._vector_generation = int(index["vector_generation"])
+        self._sweep()
+
+        if os.path.exists(self._file("rows")):
+            with open(self._file("rows")) as f:
+                snapshot = json.load(f)
+            self._ids = snapshot["ids"]
+            self._documents = snapshot["documents"]
+            self._columns = snapshot["columns"]
+            self._rows = {item_id: row for row, item_id in enumerate(self._ids) if item_id is not None}
+            self._live = np.array([item_id is not None for item_id in self._ids], dtype=bool)
+
+        log_path = self._file("records")
+        valid_bytes = 0
+        if os.path.exists(log_path):
+            with open(log_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        break
+                    self._replay(op)
+                    valid_bytes += len(line)
+            if valid_bytes != os.path.getsize(log_path):
+                with open(log_path, "r+b") as f:
+                    f.truncate(valid_bytes)
+        self._open_vectors(max(len(self._ids), 1))
+        if self._needs_checkpoint():
+            self._checkpoint()
+
+    def _replay(self, op):
+        kind = op[0]
+        if kind == "add":
+            self._append_row(op[1], op[2], op[3])
+        elif kind == "set":
+            self._set_row(self._rows[op[1]], op[2], op[3])
+        elif kind == "del":
+            self._drop_row(self._rows.pop(op[1]))
+        self._log_lines += 1
+
+    def _sweep(self):
+        keep = {"index.json"} | {os.path.basename(self._file(kind)) for kind in ("vectors", "rows", "records")}
+        for file_name in os.listdir(self.directory):
+            if file_name not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, file_name))
+                except OSError:
+                    pass
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        index_path = os.path.join(self.directory, "index.json")
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "dim": self._dim,
+                "generation": self._generation,
+                "vector_generation": self._vector_generation,
+            }, f)
+        os.replace(tmp_path, index_path)
+
+    def _open_vectors(self, rows: int):
+        path = self._file("vectors")
+        row_bytes = self._dim * 4
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        capacity = size // row_bytes
+        if capacity < rows:
+            capacity = max(rows, 2 * capacity, 64)
+            self._vectors = None
+            with open(path, "ab") as f:
+                f.truncate(capacity * row_bytes)
+        elif self._vectors is not None:
+            return
+        self._vectors = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, self._dim))
+
+    def _log(self, ops: list):
+        with open(self._file("records"), "a") as f:
+            f.write("".join(_dumps(op) + "\n" for op in ops))
+        self._log_lines += len(ops)
+        if self._needs_checkpoint():
+            self._checkpoint()
+
+    def _needs_checkpoint(self) -> bool:
+        threshold = max(CHECKPOINT_MIN_LINES, len(self._ids) // 2)
+        return self._log_lines > threshold or len(self._ids) - self.count() > max(threshold, self.count())
+
+    def _checkpoint(self):
+        self._generation += 1
+        live = self.count()
+        if len(self._ids) - live > live:
+            rows = np.flatnonzero(self._live[:len(self._ids)])
+            vectors = np.array(self._vectors[rows], dtype=np.float32)
+            self._ids = [self._ids[row] for row in rows]
+            self._documents = [self._documents[row] for row in rows]
+            self._columns = {key: [column[row] for row in rows] for key, column in self._columns.items()}
+            self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+            self._live = np.ones(len(rows), dtype=bool)
+            self._reset_ivf()
+            self._vector_generation = self._generation
+            self._vectors = None
+            self._open_vectors(max(len(rows), 1))
+            self._vectors[:len(rows)] = vectors
+        self._vectors.flush()
+        with open(self._file("rows"), "w") as f:
+            f.write(_dumps({"ids": self._ids, "documents": self._documents, "columns": self._columns}))
+        open(self._file("records"), "w").close()
+        self._log_lines = 0
+        self._write_index()
+        self._sweep()
+
+    # -----------------------------------------
+    # ROWS
+    # -----------------------------------------
+
+    def _append_row(self, item_id, document, metadata):
+        row = len(self._ids)
+        self._ids.append(item_id)
+        self._rows[item_id] = row
+        self._documents.append(document)
+        for column in self._columns.values():
+            column.append(None)
+        self._set_row(row, None, metadata)
+        if len(self._live) <= row:
+            self._live = np.concatenate([self._live, np.zeros(max(64, len(self._live)), dtype=bool)])
+        self._live[row] = True
+        return row
+
+    def _set_row(self, row: int, document, metadata):
+        if document is not None:
+            self._documents[row] = document
+        for key, value in (metadata or {}).items():
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[key] = [None] * len(self._ids)
+            column[row] = value
+
+    def _drop_row(self, row: int):
+        self._live[row] = False
+        self._ids[row] = None
+        self._documents[row] = None
+        for column in self._columns.values():
+            column[row] = None
+
+    def _metadata(self, row: int) -> dict:
+        return {key: column[row] for key, column in self._columns.items() if column[row] is not None}
+
+    def _embed(self, documents) -> np.ndarray:
+        if hasattr(self.embedding_function, "embed_many"):
+            return self.embedding_function.embed_many(documents)
+        return np.asarray(self.embedding_function(list(documents)), dtype=np.float32)
+
+    # -----------------------------------------
+    # COLLECTION API
+    # -----------------------------------------
+
+    def count(self) -> int:
+        return len(self._rows)
+
+    def add(self, ids, documents=None, metadatas=None, embeddings=None):
+        """Append records; ids that already exist are ignored, as in Chroma."""
+        with self._lock:
+            documents = documents if documents is not None else [None] * len(ids)
+            metadatas = metadatas if metadatas is not None else [None] * len(ids)
+            if embeddings is None:
+                embeddings = self._embed(documents)
+            seen = set(self._rows)
+            fresh = []
+            for i, item_id in enumerate(ids):
+                if item_id not in seen:
+                    seen.add(item_id)
+                    fresh.append(i)
+            if not fresh:
+                return
+            vectors = _unit_rows(np.asarray(embeddings, dtype=np.float32)[fresh])
+            if self._dim is None:
+                self._dim = vectors.shape[1]
+            if self._vectors is None:
+                self._write_index()
+            start = len(self._ids)
+            self._open_vectors(start + len(fresh))
+            self._vectors[start:start + len(fresh)] = vectors
+            ops = []
+            for i in fresh:
+                op = ["add", ids[i], documents[i], dict(metadatas[i] or {})]
+                self._append_row(op[1], op[2], op[3])
+                ops.append(op)
+            if self._lists is not None:
+                self._assign(np.arange(start, start + len(fresh)))
+            self._log(ops)
+
+    def update(self, ids, documents=None, metadatas=None, embeddings=None):
+        """Replace documents (re-embedding them) and merge metadata; unknown
+        ids are ignored, as in Chroma."""
+        with self._lock:
+            known = [i for i, item_id in enumerate(ids) if item_id in self._rows]
+            if not known:
+                return
+            if documents is not None and embeddings is None:
+                vectors = self._embed([documents[i] for i in known])
+            elif embeddings is not None:
+                vectors = np.asarray(embeddings, dtype=np.float32)[known]
+            else:
+                vectors = None
+            if vectors is not None:
+                rows = np.array([self._rows[ids[i]] for i in known])
+                self._vectors[rows] = _unit_rows(vectors)
+                if self._lists is not None:
+                    self._assign(rows, moved=True)
+            ops = []
+            for i in known:
+                document = None if documents is None else documents[i]
+                metadata = None if metadatas is None else dict(metadatas[i] or {})
+                self._set_row(self._rows[ids[i]], document, metadata)
+                ops.append(["set", ids[i], document, metadata])
+            self._log(ops)
+
+    def delete(self, ids=None, where=None):
+        with self._lock:
+            if ids is None:
+                ids = [self._ids[row] for row in self._select(where)]
+            ops = []
+            for item_id in ids:
+                row = self._rows.pop(item_id, None)
+                if row is not None:
+                    self._drop_row(row)
+                    ops.append(["del", item_id])
+            if ops:
+                self._log(ops)
+
+    def get(self, ids=None, where=None, limit=None, offset=None, include=("metadatas", "documents")):
+        with self._lock:
+            if ids is not None:
+                rows = np.array([self._rows[item_id] for item_id in ids if item_id in self._rows], dtype=np.int64)
+                if where:
+                    rows = rows[self._where_mask(where, rows)]
+            else:
+                rows = self._select(where)
+            rows = rows[offset or 0:]
+            if limit is not None:
+                rows = rows[:limit]
+            return self._result(rows.tolist(), include)
+
+    def query(self, query_texts=None, query_embeddings=None, n_results=10, where=None,
+              include=("metadatas", "documents", "distances")):
+        with self._lock:
+            if query_embeddings is None:
+                query_embeddings = self._embed(query_texts)
+            queries = _unit_rows(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+            result = {"ids": [], "metadatas": [], "documents": [], "distances": []}
+            for query in queries:
+                rows, scores = self._top(query, max(1, int(n_results)), where)
+                single = self._result(rows, include)
+                for key in ("ids", "metadatas", "documents"):
+                    result[key].append(single[key])
+                result["distances"].append([1.0 - score for score in scores])
+            for key in ("metadatas", "documents", "distances"):
+                if key not in include:
+                    result[key] = None
+            result["included"] = list(include)
+            return result
+
+    def _result(self, rows: list, include) -> dict:
+        return {
+            "ids": [self._ids[row] for row in rows],
+            "metadatas": [self._metadata(row) for row in rows] if "metadatas" in include else None,
+            "documents": [self._documents[row] for row in rows] if "documents" in include else None,
+            "included": list(include),
+        }
+
+    def reset(self):
+        """Drop every record and the files of the current generation."""
+        with self._lock:
+            self._generation += 1
+            self._vector_generation = self._generation
+            self._reset_rows()
+            if os.path.isdir(self.directory):
+                self._write_index()
+                self._sweep()
+
+    # -----------------------------------------
+    # SEARCH
+    # -----------------------------------------
+
+    def _select(self, where) -> np.ndarray:
+        rows = np.flatnonzero(self._live[:len(self._ids)])
+        if where:
+            rows = rows[self._where_mask(where, rows)]
+        return rows
+
+    def _where_mask(self, where: dict, rows: np.ndarray) -> np.ndarray:
+        mask = np.ones(len(rows), dtype=bool)
+        for key, condition in where.items():
+            if key in ("$and", "$or"):
+                masks = [self._where_mask(clause, rows) for clause in condition]
+                mask &= np.logical_and.reduce(masks) if key == "$and" else np.logical_or.reduce(masks)
+                continue
+            if isinstance(condition, dict):
+                (name, target), = condition.items()
+            else:
+                name, target = "$eq", condition
+            compare = _COMPARE.get(name)
+            if compare is None:
+                raise ValueError(f"unsupported where operator {name!r}")
+            if name in _ORDERED and _kind(target) is not float:
+                raise ValueError(f"where operator {name!r} needs a number, got {target!r}")
+            column = self._columns.get(key)
+            if column is None:
+                mask &= compare(None, target)
+                continue
+            mask &= np.fromiter((compare(column[row], target) for row in rows), dtype=bool, count=len(rows))
+        return mask
+
+    def _top(self, query: np.ndarray, limit: int, where):
+        if self._vectors is None or not self.count():
+            # Nothing stored (yet, or any more): empty results, as in Chroma.
+            return [], []
+        rows = None
+        if self.ivf_lists and self.count() >= self.ivf_lists * IVF_MIN_PER_LIST:
+            rows, scores = self._probe(query)
+            keep = self._live[rows]
+            if where:
+                keep[keep] = self._where_mask(where, rows[keep])
+            rows, scores = rows[keep], scores[keep]
+            if len(rows) < limit:
+                rows = None
+        if rows is None:
+            count = len(self._ids)
+            if where or self.count() < count:
+                rows = self._select(where)
+                scores = self._vectors[rows] @ query
+            else:
+                rows = np.arange(count)
+                scores = self._vectors[:count] @ query
+        if len(rows) > limit:
+            keep = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[keep], scores[keep]
+        order = np.lexsort((rows, -scores))
+        return rows[order].tolist(), scores[order].tolist()
+
+    # -----------------------------------------
+    # IVF INDEX
+    # -----------------------------------------
+
+    def _probe(self, query: np.ndarray):
+        if self._centroids is None or self.count() >= 2 * self._trained_rows:
+            self._train()
+        nearest = np.argsort(-(self._centroids @ query), kind="stable")[:self.ivf_probes]
+        rows, scores = [], []
+        for index in nearest:
+            entry = self._lists[index]
+            if entry is None:
+                members = np.flatnonzero(self._assignments[:len(self._ids)] == index)
+                entry = self._lists[index] = (members, np.array(self._vectors[members], dtype=np.float32))
+            rows.append(entry[0])
+            scores.append(entry[1] @ query)
+        return np.concatenate(rows), np.concatenate(scores)
+
+    def _train(self):
+        rows = np.flatnonzero(self._live[:len(self._ids)])
+        rng = np.random.default_rng(0)
+        if len(rows) > self.ivf_lists * IVF_TRAIN_PER_LIST:
+            rows = np.sort(rng.choice(rows, self.ivf_lists * IVF_TRAIN_PER_LIST, replace=False))
+        points = np.array(self._vectors[rows], dtype=np.float32)
+        centroids = points[rng.choice(len(points), self.ivf_lists, replace=False)]
+        for _ in range(IVF_ITERATIONS):
+            labels = np.argmax(points @ centroids.T, axis=1)
+            members = np.zeros((self.ivf_lists, len(points)), dtype=np.float32)
+            members[labels, np.arange(len(points))] = 1.0
+            sums = members @ points
+            empty = np.bincount(labels, minlength=self.ivf_lists) == 0
+            sums[empty] = centroids[empty]
+            centroids = _unit_rows(sums)
+        self._centroids = centroids
+        self._assignments = np.zeros(len(self._ids), dtype=np.int32)
+        self._lists = [None] * self.ivf_lists
+        self._assign(np.arange(len(self._ids)))
+        self._trained_rows = self.count()
+
+    def _assign(self, rows: np.ndarray, moved=False):
+        if len(self._assignments) < len(self._ids):
+            grown = np.zeros(max(len(self._ids), 2 * len(self._assignments)), dtype=np.int32)
+            grown[:len(self._assignments)] = self._assignments
+            self._assignments = grown
+        if moved:
+            for index in set(self._assignments[rows].tolist()):
+                self._lists[index] = None
+        for start in range(0, len(rows), 8192):
+            chunk = rows[start:start + 8192]
+            labels = np.argmax(self._vectors[chunk] @ self._centroids.T, axis=1)
+            self._assignments[chunk] = labels
+            for index in set(labels.tolist()):
+                self._lists[index] = None
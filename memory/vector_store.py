@@ -1,19 +1,31 @@
 import os
 import re
+import math
 import json
 import uuid
 import hashlib
 import datetime
-from collections import Counter
+import random
+from collections import Counter, OrderedDict
+from functools import lru_cache
 
 import numpy as np
+
+# Importing chromadb draws from the global random stream. The brain imports
+# this module lazily, on its first memory flush, so restore the stream to
+# keep seeded runs independent of when that happens.
+_random_state = random.getstate()
 import chromadb
 from chromadb.api.types import EmbeddingFunction
+random.setstate(_random_state)
+del _random_state
 
 KNOWLEDGE_STORE_PATH = "knowledge_db"
 KNOWLEDGE_COLLECTION = "aashu_knowledge"
 EMBEDDING_DIM = 384
 COSINE_THRESHOLD = 0.15
+SEARCH_OVERFETCH = 3
+VECTOR_BACKENDS = ("chroma", "numpy")
 
 STOPWORDS = {
     "the", "a", "an", "and", "or", "but", "is", "are", "was", "were", "be", "been",
@@ -87,44 +99,117 @@ def extract_topics(text, limit=5):
     return [w for w, _ in counts.most_common(limit)]
 
 
+TOKEN_RE = re.compile(r"[a-zA-Z0-9+#.]+")
+# Keyword matching in one scan. An alphanumeric keyword's _lang_pattern
+# (word boundaries on both sides) matches exactly when the text contains a
+# maximal run of word characters equal to it; the others (c++, c#,
+# scikit-learn) are matched without boundaries, i.e. as substrings.
+WORD_RUN_RE = re.compile(r"\w+")
+WORD_KEYWORDS = frozenset(kw for kw in ALL_KEYWORDS if re.fullmatch(r"[a-zA-Z0-9]+", kw))
+SYMBOL_KEYWORDS = tuple(sorted(ALL_KEYWORDS - WORD_KEYWORDS))
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_bucket(token, dim):
+    return int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16) % dim
+
+
 class HashedEmbeddingFunction(EmbeddingFunction):
     """Deterministic, offline, local embedding: hashed bag-of-words with
-    keyword boosts, normalized to unit length. No external model needed."""
+    keyword boosts, normalized to unit length. No external model needed.
+
+    Token buckets are memoized, counts are accumulated with NumPy and all
+    keywords are found in one scan of the text. Whole-text embeddings are kept
+    in an LRU cache of ``cache_size`` entries keyed by a hash of the text.
+    The vectors are bit-identical to the per-token, per-keyword original."""
 
-    def __init__(self, dim=EMBEDDING_DIM):
+    def __init__(self, dim=EMBEDDING_DIM, cache_size=2048):
         self.dim = dim
+        self.cache_size = max(0, int(cache_size))
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def __call__(self, input):
-        return [self._embed(text) for text in input]
+        return self.embed_many(input).tolist()
+
+    def embed_many(self, texts):
+        """Embed a batch of texts into one ``(n, dim)`` float32 matrix."""
+        texts = list(texts)
+        matrix = np.empty((len(texts), self.dim), dtype=np.float32)
+        cache = self._cache
+        for row, text in enumerate(texts):
+            text = text or ""
+            key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                self.cache_hits += 1
+                matrix[row] = cached
+                continue
+            self.cache_misses += 1
+            vec = self._vector(text)
+            matrix[row] = vec
+            if self.cache_size:
+                cache[key] = vec
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return matrix
 
     def _embed(self, text):
-        vec = np.zeros(self.dim, dtype=np.float32)
-        lowered = (text or "").lower()
-        for word in re.findall(r"[a-zA-Z0-9+#.]+", lowered):
-            if word in STOPWORDS:
-                continue
-            vec[self._bucket(word)] += 1.0
-        for kw in ALL_KEYWORDS:
-            if re.search(_lang_pattern(kw), lowered):
-                vec[self._bucket(kw)] += 2.0
+        return self.embed_many([text])[0].tolist()
+
+    def _vector(self, text):
+        lowered = text.lower()
+        dim = self.dim
+        buckets = [_token_bucket(word, dim) for word in TOKEN_RE.findall(lowered) if word not in STOPWORDS]
+        vec = np.bincount(buckets, minlength=dim).astype(np.float32) if buckets else np.zeros(dim, dtype=np.float32)
+        keywords = set(WORD_RUN_RE.findall(lowered)) & WORD_KEYWORDS
+        keywords.update(kw for kw in SYMBOL_KEYWORDS if kw in lowered)
+        for kw in keywords:
+            vec[_token_bucket(kw, dim)] += 2.0
         norm = float(np.linalg.norm(vec))
         if norm > 0:
             vec = vec / norm
-        return vec.tolist()
+        return vec
 
     def _bucket(self, token):
-        return int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16) % self.dim
+        return _token_bucket(token, self.dim)
 
 
 class VectorStore:
-    """Persistent ChromaDB vector store for embedded text records.
+    """Persistent vector store for embedded text records.
 
-    Every record is embedded and stored for semantic (cosine) recall."""
+    Every record is embedded and stored for semantic (cosine) recall.
 
-    def __init__(self, path=None, embedding_function=None, collection=KNOWLEDGE_COLLECTION):
+    ``backend`` picks the collection behind the store: ``"chroma"`` (a
+    ChromaDB ``PersistentClient`` collection) or ``"numpy"`` (an in-process
+    :class:`~memory.vector_index.NumpyCollection` with memory-mapped files
+    under ``path``; ``ivf_lists``/``ivf_probes`` enable its coarse-quantized
+    index). Both expose the same collection calls, and the two backends keep
+    separate files, so switching starts from an empty store.
+
+    ``version`` counts the writes made through this object, so a caller
+    that mirrors the records can tell when someone else has written.
+    ``stored(item)`` is the record as ``items`` returns it after a write."""
+
+    def __init__(self, path=None, embedding_function=None, collection=KNOWLEDGE_COLLECTION,
+                 backend="chroma", ivf_lists=0, ivf_probes=16):
+        if backend not in VECTOR_BACKENDS:
+            raise ValueError(f"unknown vector store backend {backend!r}; expected one of {VECTOR_BACKENDS}")
         self.path = path or KNOWLEDGE_STORE_PATH
         self._collection_name = collection
+        self.backend = backend
+        self.version = 0
         self.embedding_function = embedding_function or HashedEmbeddingFunction()
+        if backend == "numpy":
+            from memory.vector_index import NumpyCollection
+
+            self._client = None
+            self._collection = NumpyCollection(
+                self.path, collection, self.embedding_function, ivf_lists=ivf_lists, ivf_probes=ivf_probes
+            )
+            return
         self._client = chromadb.PersistentClient(path=self.path)
         self._collection = self._client.get_or_create_collection(
             collection,
@@ -139,6 +224,10 @@ class VectorStore:
         store, which covers transient read errors and index corruption.
         The directory-level wipe is a last resort for an unusable underlying
         database, never a first response to a failed read."""
+        self.version += 1
+        if self._client is None:
+            self._collection.reset()
+            return
         import shutil
         name = self._collection_name
         try:
@@ -191,6 +280,7 @@ class VectorStore:
         return " ".join(p for p in parts if p)
 
     def _add(self, item):
+        self.version += 1
         self._collection.add(
             ids=[item["id"]],
             documents=[self._search_doc(item)],
@@ -205,7 +295,44 @@ class VectorStore:
         self._add(item)
         return item
 
+    def store_many(self, items):
+        """Bulk counterpart of ``store``: embed all items in one pass and add
+        them with one collection call per Chroma batch limit."""
+        items = list(items)
+        if not items:
+            return items
+        timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+        for item in items:
+            item.setdefault("id", uuid.uuid4().hex[:12])
+            item.setdefault("timestamp", timestamp)
+            item.setdefault("times_recalled", 0)
+        documents = [self._search_doc(item) for item in items]
+        self.version += 1
+        if hasattr(self.embedding_function, "embed_many"):
+            embeddings = self.embedding_function.embed_many(documents)
+        else:
+            embeddings = np.asarray(self.embedding_function(documents), dtype=np.float32)
+        batch = self._max_batch_size()
+        for start in range(0, len(items), batch):
+            chunk = items[start:start + batch]
+            self._collection.add(
+                ids=[item["id"] for item in chunk],
+                documents=documents[start:start + batch],
+                metadatas=[self._clean_meta(item) for item in chunk],
+                embeddings=embeddings[start:start + batch],
+            )
+        return items
+
+    def _max_batch_size(self):
+        if self._client is None:
+            return 5000
+        try:
+            return max(1, int(self._client.get_max_batch_size()))
+        except Exception:
+            return 5000
+
     def update(self, item):
+        self.version += 1
         try:
             self._collection.update(
                 ids=[item["id"]],
@@ -216,6 +343,25 @@ class VectorStore:
         except Exception:
             return False
 
+    def update_metadata(self, items):
+        """Bulk metadata update: merge each item's metadata into its stored
+        record, one collection call per batch limit. Documents and embeddings
+        are left as they are, so nothing is re-embedded."""
+        items = [item for item in items if item.get("id")]
+        self.version += 1
+        batch = self._max_batch_size()
+        for start in range(0, len(items), batch):
+            chunk = items[start:start + batch]
+            self._collection.update(
+                ids=[item["id"] for item in chunk],
+                metadatas=[self._clean_meta(item) for item in chunk],
+            )
+        return len(items)
+
+    def stored(self, item):
+        """``item`` as it reads back from the store once written."""
+        return self._item_from_result(item["id"], self._clean_meta(item), self._search_doc(item))
+
     def _item_from_result(self, item_id, meta, doc):
         base = dict(meta) if meta else {}
         base["id"] = item_id
@@ -229,6 +375,14 @@ class VectorStore:
             items.append(self._item_from_result(item_id, metadatas[i], documents[i]))
         return items
 
+    def head(self, limit=5, where=None):
+        """Up to ``limit`` items in storage order, without reading the rest."""
+        try:
+            result = self._collection.get(limit=limit, where=where or None)
+            return self._result_items(result["ids"], result["metadatas"], result["documents"])
+        except Exception:
+            return []
+
     @property
     def items(self):
         try:
@@ -238,13 +392,22 @@ class VectorStore:
             self._reset()
             return []
 
-    def search(self, query, limit=5):
-        if not query:
+    def search(self, query, limit=5, where=None, overfetch=SEARCH_OVERFETCH):
+        """Top-``limit`` items by cosine similarity to ``query``.
+
+        Only ``limit * overfetch`` nearest candidates are fetched from the
+        index (filtered by the Chroma metadata filter ``where``, if given).
+        They are thresholded and ordered by similarity, then recall count,
+        so the cost depends on ``limit`` and not on the collection size.
+        """
+        if not query or limit <= 0:
             return []
+        candidates = max(limit, int(math.ceil(limit * max(1.0, overfetch))))
         try:
             result = self._collection.query(
                 query_texts=[query],
-                n_results=max(self._collection.count(), 1),
+                n_results=candidates,
+                where=where or None,
                 include=["metadatas", "documents", "distances"],
             )
         except Exception:
@@ -262,8 +425,8 @@ class VectorStore:
         hits.sort(key=lambda it: (-it.get("_sim", 0.0), -int(it.get("times_recalled", 0))))
         return hits[:limit]
 
-    def recall(self, query, limit=5):
-        results = self.search(query, limit=limit)
+    def recall(self, query, limit=5, where=None):
+        results = self.search(query, limit=limit, where=where)
         for item in results:
             new_count = self._bump_recall(item["id"])
             if new_count is not None:
@@ -271,6 +434,7 @@ class VectorStore:
         return results
 
     def _bump_recall(self, item_id):
+        self.version += 1
         try:
             got = self._collection.get(ids=[item_id], include=["metadatas"])
             if not got["ids"]:
@@ -300,17 +464,28 @@ class VectorStore:
         return langs
 
     def clear(self):
+        self.version += 1
         ids = self._ids()
         if ids:
             self._collection.delete(ids=list(ids))
 
     def delete(self, item_id):
+        self.version += 1
         try:
             self._collection.delete(ids=[str(item_id)])
             return True
         except Exception:
             return False
 
+    def delete_many(self, item_ids):
+        """Delete records by id, one collection call per batch limit."""
+        item_ids = [str(item_id) for item_id in item_ids]
+        self.version += 1
+        batch = self._max_batch_size()
+        for start in range(0, len(item_ids), batch):
+            self._collection.delete(ids=item_ids[start:start + batch])
+        return len(item_ids)
+
     def __len__(self):
         try:
             return self._collection.count()
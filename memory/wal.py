@@ -0,0 +1,351 @@
+import json
+import os
+import zlib
+
+from memory.storage import MemoryStorage, decode_checkpoint, encode_checkpoint
+from core.snapshot import FrozenDict, FrozenList
+
+_MISSING = object()
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _window_shift(old: list, new: list, same) -> int | None:
+    """Items dropped from the front of ``old`` to get a prefix of ``new``.
+
+    Returns ``k`` such that ``old[k:]`` equals the start of ``new`` (so
+    ``new`` is ``old`` with ``k`` items trimmed and some appended), or
+    ``None`` if ``new`` is not such a sliding window of ``old``.
+    """
+    if not old:
+        return 0
+    if not new:
+        return None
+    first = new[0]
+    for k, item in enumerate(old):
+        if same(item, first):
+            overlap = len(old) - k
+            if overlap <= len(new) and all(same(a, b) for a, b in zip(old[k:], new)):
+                return k
+    return None
+
+
+class WalStorage(MemoryStorage):
+    """Checkpoint storage backed by a snapshot plus an append-only log.
+
+    The snapshot at ``file_path`` is the same document that
+    :class:`MemoryStorage` writes, in compact JSON or in the binary format
+    (``format``). Each ``update_all()`` appends one compact
+    record to ``file_path + ".wal"``. The record holds only what changed
+    since the previous call:
+
+    * sections handed out by ``StateSnapshots`` are frozen, so an unchanged
+      one comes back as the same object and is skipped by identity;
+    * lists that behave as bounded windows (autobiography, recent
+      perceptions) are logged as the number of items trimmed from the front
+      plus the items appended. Frozen items are matched by identity, other
+      items by their JSON;
+    * a frozen mapping (concept memory) is logged as its changed and dropped
+      entries;
+    * every other section is re-encoded and logged only if its JSON differs
+      from the last one written.
+
+    Once the log holds ``compact_records`` records or grows past
+    ``compact_ratio`` times the snapshot size, it is folded into a fresh
+    snapshot (compaction). ``save()`` compacts explicitly.
+
+    Recovery: the log's first line names the CRC-32 of the snapshot it
+    applies to, and each record line is ``<crc32 hex> <json ops>``. On load
+    the snapshot is read and the log replayed in order. The first torn or
+    corrupt record ends the replay, and the log is truncated there. A
+    compaction writes the new snapshot and a new log (header only), each to
+    a temp file, then swaps in the snapshot and then the log. If the process
+    dies between the two swaps, the old log's header no longer matches the
+    snapshot, so that log is discarded instead of being applied twice.
+
+    With ``fsync`` set, every appended record is synced to disk, and a
+    compaction syncs both temp files and their directory before the swaps
+    and the directory again after them, so a power cut cannot leave a
+    swapped-in snapshot or log whose contents never reached the disk.
+    """
+
+    def __init__(self, file_path="memory_store.json", compact_records=1000, compact_ratio=2.0, fsync=False, format="json"):
+        self.log_path = f"{file_path}.wal"
+        self.compact_records = max(1, int(compact_records))
+        self.compact_ratio = float(compact_ratio)
+        self.fsync = bool(fsync)
+        self._encoded: dict = {}
+        self._snapshot_crc = 0
+        self._snapshot_bytes = 0
+        self._log_records = 0
+        self._log_bytes = 0
+        self.records_written = 0
+        self.bytes_written = 0
+        self.compactions = 0
+        self.replayed = 0
+        self.discarded_bytes = 0
+        super().__init__(file_path, format=format)
+
+    # -----------------------------------------
+    # LOAD / REPLAY
+    # -----------------------------------------
+
+    def _load(self):
+        self.memories = []
+        if os.path.exists(self.file_path):
+            try:
+                with open(self.file_path, "rb") as f:
+                    raw = f.read()
+                self.memories = decode_checkpoint(raw)
+                self._snapshot_crc = zlib.crc32(raw)
+                self._snapshot_bytes = len(raw)
+            except (ValueError, OSError):
+                self.memories = []
+        if not os.path.exists(self.log_path):
+            return
+
+        good_offset = 0
+        with open(self.log_path, "rb") as f:
+            header = f.readline()
+            parsed = self._parse(header)
+            if isinstance(parsed, dict) and parsed.get("snapshot_crc") == self._snapshot_crc:
+                good_offset = len(header)
+                for raw in f:
+                    record = self._parse(raw)
+                    if not isinstance(record, list):
+                        break
+                    for op in record:
+                        self._apply(op)
+                    good_offset += len(raw)
+                    self._log_records += 1
+                    self.replayed += 1
+
+        size = os.path.getsize(self.log_path)
+        if good_offset < size:
+            # Torn or corrupt tail from an interrupted append, or a log left
+            # over from an interrupted compaction: drop it so new records are
+            # never written after garbage.
+            self.discarded_bytes = size - good_offset
+            with open(self.log_path, "r+b") as f:
+                f.truncate(good_offset)
+        self._log_bytes = good_offset
+
+    @staticmethod
+    def _line(payload: str) -> bytes:
+        data = payload.encode()
+        return b"%08x %s\n" % (zlib.crc32(data), data)
+
+    @staticmethod
+    def _parse(raw: bytes):
+        if not raw.endswith(b"\n"):
+            return None
+        checksum, _, payload = raw.rstrip(b"\n").partition(b" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except (ValueError, json.JSONDecodeError):
+            return None
+
+    def _apply(self, op):
+        kind, key = op[0], op[1]
+        if kind == "set":
+            if key is None:
+                self.memories = op[2]
+            else:
+                self._root()[key] = op[2]
+        elif kind == "del":
+            self._root().pop(key, None)
+        elif kind == "window":
+            target = self.memories if key is None else self._root().setdefault(key, [])
+            del target[:op[2]]
+            target.extend(op[3])
+        elif kind == "patch":
+            target = self._root().setdefault(key, {})
+            target.update(op[2])
+            for dropped in op[3]:
+                target.pop(dropped, None)
+
+    def _root(self) -> dict:
+        if not isinstance(self.memories, dict):
+            self.memories = {}
+        return self.memories
+
+    # -----------------------------------------
+    # WRITES
+    # -----------------------------------------
+
+    def save(self):
+        """Write a full snapshot and start a new log (compaction)."""
+        with self._save_lock:
+            self._compact()
+
+    def add(self, memory_dict: dict):
+        with self._save_lock:
+            self.memories.append(memory_dict)
+            self._append([f'["window",null,0,[{_dumps(memory_dict)}]]'])
+
+    def update_all(self, updated_memories):
+        # Diff and append under one lock so overlapping background saves
+        # log their records in the order their states were diffed.
+        with self._save_lock:
+            previous = self.memories
+            self.memories = updated_memories
+            ops = self._diff(previous, updated_memories)
+            if ops:
+                self._append(ops)
+
+    def _diff(self, previous, current) -> list[str]:
+        if not isinstance(current, dict) or not isinstance(previous, dict):
+            self._encoded = {}
+            return [f'["set",null,{_dumps(current)}]']
+
+        ops = []
+        for key, value in current.items():
+            old = previous.get(key, _MISSING)
+            if isinstance(value, (FrozenDict, FrozenList)) and value is old:
+                continue
+            encoded_key = _dumps(key)
+
+            if isinstance(value, FrozenList) and isinstance(old, FrozenList):
+                shift = _window_shift(old, value, lambda a, b: a is b)
+                if shift is not None:
+                    appended = value[len(old) - shift:]
+                    if shift or appended:
+                        ops.append(f'["window",{encoded_key},{shift},{_dumps(appended)}]')
+                    self._encoded.pop(key, None)
+                    continue
+
+            if isinstance(value, FrozenDict) and isinstance(old, FrozenDict):
+                changed = {k: v for k, v in value.items() if old.get(k, _MISSING) is not v}
+                dropped = [k for k in old if k not in value]
+                if changed or dropped:
+                    ops.append(f'["patch",{encoded_key},{_dumps(changed)},{_dumps(dropped)}]')
+                self._encoded.pop(key, None)
+                continue
+
+            if isinstance(value, list) and not isinstance(value, FrozenList):
+                items = [_dumps(item) for item in value]
+                old_items = self._encoded.get(key)
+                if isinstance(old_items, list):
+                    shift = _window_shift(old_items, items, str.__eq__)
+                    if shift is not None:
+                        appended = items[len(old_items) - shift:]
+                        if shift or appended:
+                            ops.append(f'["window",{encoded_key},{shift},[{",".join(appended)}]]')
+                        self._encoded[key] = items
+                        continue
+                self._encoded[key] = items
+                ops.append(f'["set",{encoded_key},[{",".join(items)}]]')
+                continue
+
+            encoded = _dumps(value)
+            if self._encoded.get(key) != encoded:
+                self._encoded[key] = encoded
+                ops.append(f'["set",{encoded_key},{encoded}]')
+        for key in previous:
+            if key not in current:
+                self._encoded.pop(key, None)
+                ops.append(f'["del",{_dumps(key)}]')
+        return ops
+
+    def _append(self, ops: list[str]):
+        # Caller holds self._save_lock.
+        if not self._log_bytes:
+            # Every log starts with a header naming its snapshot.
+            self._start_log()
+        line = self._line(f"[{','.join(ops)}]")
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._log_records += 1
+        self._log_bytes += len(line)
+        self.records_written += 1
+        self.bytes_written += len(line)
+        if (
+            self._log_records >= self.compact_records
+            or self._log_bytes > self.compact_ratio * max(self._snapshot_bytes, 4096)
+        ):
+            self._compact()
+
+    def _header(self) -> bytes:
+        return self._line(_dumps({"snapshot_crc": self._snapshot_crc}))
+
+    def _start_log(self):
+        directory = os.path.dirname(self.log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        header = self._header()
+        self._write(self.log_path, header)
+        self._log_bytes = len(header)
+
+    def _write(self, path: str, data: bytes):
+        with open(path, "wb") as f:
+            f.write(data)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _sync_directory(self, directory: str):
+        """Persist renames in ``directory`` (no-op without ``fsync``)."""
+        if not self.fsync:
+            return
+        try:
+            fd = os.open(directory or ".", os.O_RDONLY)
+        except OSError:
+            # Directories cannot be opened for syncing on some platforms.
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _compact(self):
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        raw = encode_checkpoint(self.memories, self.format, indent=None)
+        tmp_path = f"{self.file_path}.tmp"
+        self._write(tmp_path, raw)
+        self._snapshot_crc = zlib.crc32(raw)
+        self._snapshot_bytes = len(raw)
+        header = self._header()
+        tmp_log = f"{self.log_path}.tmp"
+        self._write(tmp_log, header)
+        self._sync_directory(directory)
+        os.replace(tmp_path, self.file_path)
+        os.replace(tmp_log, self.log_path)
+        self._sync_directory(directory)
+        self._log_records = 0
+        self._log_bytes = len(header)
+        self.bytes_written += len(raw)
+        self.compactions += 1
+
+    def _remove_files(self):
+        super()._remove_files()
+        for path in (self.log_path, f"{self.log_path}.tmp"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._encoded = {}
+        self._snapshot_crc = 0
+        self._snapshot_bytes = 0
+        self._log_records = 0
+        self._log_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "log_records": self._log_records,
+            "log_bytes": self._log_bytes,
+            "snapshot_bytes": self._snapshot_bytes,
+            "records_written": self.records_written,
+            "bytes_written": self.bytes_written,
+            "compactions": self.compactions,
+            "replayed": self.replayed,
+            "discarded_bytes": self.discarded_bytes,
+        }
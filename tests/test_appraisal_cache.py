@@ -0,0 +1,181 @@
+import random
+
+import pytest
+
+from learning.appraisal_engine import AppraisalEngine
+from learning.similarity_engine import SimilarityEngine
+
+CHEMICALS = ["dopamine", "cortisol", "oxytocin", "serotonin"]
+TRAITS = ["competence", "social_value", "resilience"]
+
+
+class FlatSimilarityEngine(SimilarityEngine):
+    """Hands matches back as flat chemical dicts, which predict_emotion blends."""
+
+    def find_similar_profiles(self, event_type, current_state, top_k=5):
+        return [profile["chemicals"] for profile in super().find_similar_profiles(event_type, current_state, top_k)]
+
+
+def _delta(rng):
+    return {chem: rng.uniform(-3.0, 3.0) for chem in CHEMICALS if rng.random() < 0.9}
+
+
+def _identity(rng):
+    return {trait: rng.uniform(0.0, 1.0) for trait in TRAITS}
+
+
+def _state(rng):
+    state = {chem: rng.uniform(-3.0, 3.0) for chem in CHEMICALS if rng.random() < 0.85}
+    state.update({f"identity_{trait}": value for trait, value in _identity(rng).items()})
+    return state
+
+
+def _engines(**cache):
+    similarity = FlatSimilarityEngine()
+    similarity.similarity_threshold = 0.2
+    return AppraisalEngine(similarity), AppraisalEngine(similarity, **cache), similarity
+
+
+def _teach(rng, similarity, appraisals, event_type, profiles=40):
+    for _ in range(profiles):
+        similarity.record_event_profile(event_type, _delta(rng), _identity(rng))
+    for appraisal in appraisals:
+        appraisal.update_emotional_learning(event_type, {chem: 1.0 for chem in CHEMICALS}, 0.8)
+
+
+def test_exact_grid_returns_the_uncached_prediction():
+    rng = random.Random(3)
+    plain, cached, similarity = _engines(cache_quantum=0, cache_size=64)
+    for event_type in ("praise", "criticism"):
+        _teach(rng, similarity, (plain, cached), event_type)
+    states = [_state(rng) for _ in range(30)]
+    for step in range(300):
+        event_type = rng.choice(["praise", "criticism", "unseen"])
+        state = rng.choice(states)
+        if step % 7 == 0:
+            # Same values, but a key missing instead of 0, and reordered.
+            state = {key: state[key] for key in reversed(state) if state[key] != 0}
+        assert cached.predict_emotion(event_type, state) == plain.predict_emotion(event_type, state), step
+        if step % 50 == 49:
+            _teach(rng, similarity, (plain, cached), rng.choice(["praise", "criticism"]), profiles=3)
+    assert cached.cache_hits > 100
+    assert plain.predict_emotion("praise", None) == cached.predict_emotion("praise", None)
+    assert plain.predict_emotion("praise", {}) == cached.predict_emotion("praise", {})
+
+
+def test_similarity_blending_reaches_the_prediction():
+    rng = random.Random(4)
+    plain, _, similarity = _engines()
+    _teach(rng, similarity, (plain,), "praise")
+    assert plain.predict_emotion("praise", _state(rng)) != plain.predict_emotion("praise", None)
+
+
+def test_learning_drops_the_event_types_table():
+    rng = random.Random(5)
+    plain, cached, similarity = _engines(cache_quantum=0.5, cache_size=64)
+    for event_type in ("praise", "criticism"):
+        _teach(rng, similarity, (plain, cached), event_type)
+    state = _state(rng)
+    for event_type in ("praise", "criticism"):
+        cached.predict_emotion(event_type, state)
+    before = cached.predict_emotion("praise", state)
+    misses = cached.cache_misses
+
+    for appraisal in (plain, cached):
+        appraisal.update_emotional_learning("praise", {"dopamine": 4.0}, 1.0)
+    after = cached.predict_emotion("praise", state)
+    assert cached.cache_misses == misses + 1
+    assert after != before and after == plain.predict_emotion("praise", state)
+    # Other types keep their tables.
+    cached.predict_emotion("criticism", state)
+    assert cached.cache_misses == misses + 1
+    assert cached.cache_stats()["entries"] == 2
+
+
+def test_new_similarity_profiles_drop_the_event_types_table():
+    rng = random.Random(6)
+    plain, cached, similarity = _engines(cache_quantum=0.5, cache_size=64)
+    _teach(rng, similarity, (plain, cached), "praise")
+    state = _state(rng)
+    cached.predict_emotion("praise", state)
+    version = similarity.profile_version("praise")
+
+    # A profile right on top of the state changes the blended matches.
+    similarity.record_event_profile(
+        "praise",
+        {chem: 8.0 for chem in CHEMICALS},
+        {trait: state[f"identity_{trait}"] for trait in TRAITS},
+    )
+    assert similarity.profile_version("praise") == version + 1
+    hits, misses = cached.cache_hits, cached.cache_misses
+    assert cached.predict_emotion("praise", state) == plain.predict_emotion("praise", state)
+    assert (cached.cache_hits, cached.cache_misses) == (hits, misses + 1)
+
+    # The ring overwriting its oldest profile is a change too.
+    similarity.max_profiles_per_event = 1
+    for _ in range(350):
+        similarity.record_event_profile("praise", _delta(rng), _identity(rng))
+        assert cached.predict_emotion("praise", state) == plain.predict_emotion("praise", state)
+    assert cached.cache_hits == hits
+
+
+@pytest.mark.parametrize("cache_size", [1, 5, 32])
+def test_lru_eviction_stays_within_cache_size(cache_size):
+    rng = random.Random(cache_size)
+    plain, cached, similarity = _engines(cache_quantum=0, cache_size=cache_size)
+    types = ["praise", "criticism", "success", "threat"]
+    for event_type in types:
+        _teach(rng, similarity, (plain, cached), event_type, profiles=10)
+    states = [_state(rng) for _ in range(3 * cache_size)]
+    for step in range(600):
+        event_type, state = rng.choice(types), rng.choice(states)
+        assert cached.predict_emotion(event_type, state) == plain.predict_emotion(event_type, state)
+        stats = cached.cache_stats()
+        assert stats["entries"] == sum(len(entries) for _, entries in cached._cache.values())
+        assert stats["entries"] <= cache_size, step
+    assert cached.cache_stats()["entries"] == cache_size
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    rng = random.Random(8)
+    _, cached, similarity = _engines(cache_quantum=0, cache_size=3)
+    _teach(rng, similarity, (cached,), "praise", profiles=5)
+    _teach(rng, similarity, (cached,), "criticism", profiles=5)
+    a, b, c, d = (_state(rng) for _ in range(4))
+    cached.predict_emotion("praise", a)
+    cached.predict_emotion("praise", b)
+    cached.predict_emotion("criticism", c)
+    cached.predict_emotion("praise", a)        # praise's a is now its most recent
+    cached.predict_emotion("criticism", d)     # evicts praise's b, the oldest in the oldest type
+    misses = cached.cache_misses
+    for event_type, state in (("praise", a), ("criticism", c), ("criticism", d)):
+        cached.predict_emotion(event_type, state)
+    assert cached.cache_misses == misses
+    cached.predict_emotion("praise", b)
+    assert cached.cache_misses == misses + 1
+
+
+def test_cached_predictions_are_private_copies():
+    rng = random.Random(9)
+    _, cached, similarity = _engines(cache_quantum=0, cache_size=8)
+    _teach(rng, similarity, (cached,), "praise")
+    state = _state(rng)
+    first = cached.predict_emotion("praise", state)
+    expected = dict(first)
+    first["dopamine"] = 99.0
+    second = cached.predict_emotion("praise", state)
+    assert second == expected
+    second["dopamine"] = 99.0
+    assert cached.predict_emotion("praise", state) == expected
+
+
+def test_clear_cache_and_disabled_cache():
+    rng = random.Random(10)
+    plain, cached, similarity = _engines(cache_quantum=0, cache_size=8)
+    _teach(rng, similarity, (plain, cached), "praise")
+    cached.predict_emotion("praise", _state(rng))
+    cached.clear_cache()
+    assert cached.cache_stats()["entries"] == 0
+    state = _state(rng)
+    assert plain.predict_emotion("praise", state) == cached.predict_emotion("praise", state)
+    assert (plain.cache_hits, plain.cache_misses) == (0, 0)
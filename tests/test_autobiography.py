@@ -0,0 +1,179 @@
+import random
+from collections import deque
+
+import numpy as np
+
+from cognition.autobiographical_memory import RECALL_WINDOW, AutobiographicalMemory
+from core.internal_thoughts import STATE_CHEMICALS, STATE_TRAITS, _get_state_vector
+
+DESCRIPTIONS = [
+    "cycle_step", "cycle_step", "cycle_step", "tick_marker", "internal_process_cleanup", "belief_update",
+    "perceived_hello", "perceived_praise", "perceived_criticism", "perceived_threat_detected",
+    "perceived_ignored", "worldview_success", "worldview_failure", "perceived_good job",
+]
+CATEGORIES = [None, "praise", "criticism", "failure", "threat_detected", "ignored", "loneliness", "success", "Greeted"]
+KINDS = ("threat", "failure", "social_pain", "positive", "neutral")
+
+
+def legacy_select(memory, events, last):
+    """The old selection: filter and sort the 120 most recent non-system events."""
+    if not events:
+        return None, last
+    candidates = [ev for ev in reversed(events) if not memory._is_system_event(ev.get("description", ""))]
+    if not candidates:
+        return events[-1], last
+    scored = sorted(candidates[:120], key=memory._event_salience, reverse=True)
+    selected = scored[0]
+    for ev in scored:
+        if ev.get("description", "") != last:
+            selected = ev
+            break
+    return selected, str(selected.get("description", ""))
+
+
+def legacy_replay(events):
+    return [
+        ev for ev in events
+        if ev.get("description") != "cycle_step" and "cycle_step" not in str(ev.get("description", ""))
+    ][-60:]
+
+
+def legacy_patterns(events):
+    return np.array([
+        _get_state_vector(ev.get("chemicals", {}), ev.get("identity", {})) for ev in legacy_replay(events)
+    ]) >= 0.5
+
+
+def indexed_patterns(memory):
+    recent = memory.replayable_seqs(60)
+    return np.hstack([
+        memory.events.snapshot_matrix(recent, "chemicals", STATE_CHEMICALS, 50.0) / 100.0,
+        memory.events.snapshot_matrix(recent, "identity", STATE_TRAITS, 0.5),
+    ]) >= 0.5
+
+
+def event_args(rng):
+    metadata = {}
+    if rng.random() < 0.8:
+        metadata = {
+            # Few distinct values, so saliences tie often.
+            "valence": rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0, round(rng.uniform(-1, 1), 2)]),
+            "intensity": rng.choice([0.0, 0.5, 1.0, round(rng.random(), 2)]),
+            "category": rng.choice(CATEGORIES),
+        }
+    chemicals = {name: rng.random() * 100 for name in rng.sample(STATE_CHEMICALS, rng.randint(3, 5))}
+    identity = {name: rng.random() for name in rng.sample(STATE_TRAITS, rng.randint(2, 4))}
+    return rng.choice(DESCRIPTIONS), chemicals, identity, metadata
+
+
+def assert_indexes_match(memory):
+    events = list(memory.events)
+    for category in CATEGORIES:
+        wanted = [ev for ev in events
+                  if str((ev["metadata"] or {}).get("category", "") or "").lower() == str(category or "").lower()]
+        assert memory.events_by_category(category, 50) == wanted[-50:]
+    for kind in KINDS:
+        wanted = [ev for ev in events if memory._classify_recall_event(ev) == kind]
+        assert memory.events_by_kind(kind, 50) == wanted[-50:]
+
+
+def test_indexed_recall_matches_legacy_scan():
+    rng = random.Random(3)
+    memory = AutobiographicalMemory(max_events=300)
+    last = ""
+    restores = 0
+    for step in range(1500):
+        memory.record_event(*event_args(rng))
+        events = list(memory.events)
+        expected, last = legacy_select(memory, events, last)
+        assert memory._select_recall_event() == expected, step
+        assert memory.replayable_events(60) == legacy_replay(events), step
+        if legacy_replay(events):
+            assert np.array_equal(indexed_patterns(memory), legacy_patterns(events)), step
+        if rng.random() < 0.02:
+            # A state restore reassigns the events and rebuilds the indexes.
+            memory.events = deque(events[rng.randrange(len(events)):], maxlen=memory.events.maxlen)
+            assert list(memory.events) == events[len(events) - len(memory.events):]
+            assert_indexes_match(memory)
+            restores += 1
+    assert restores > 0
+    assert_indexes_match(memory)
+
+
+def _record(memory, description, valence=0.0, intensity=0.0, category=None):
+    metadata = {"valence": valence, "intensity": intensity}
+    if category:
+        metadata["category"] = category
+    return memory.record_event(description, {"dopamine": 50.0}, {"competence": 0.5}, metadata)
+
+
+def test_ties_go_to_the_newest_event():
+    memory = AutobiographicalMemory()
+    _record(memory, "perceived_praise_a", valence=0.5, intensity=0.5)
+    _record(memory, "perceived_praise_b", valence=0.5, intensity=0.5)
+    _record(memory, "perceived_praise_c", valence=0.5, intensity=0.5)
+    assert memory._select_recall_event()["description"] == "perceived_praise_c"
+    # The last recalled description is skipped; the next newest tie wins.
+    assert memory._select_recall_event()["description"] == "perceived_praise_b"
+    assert memory._select_recall_event()["description"] == "perceived_praise_c"
+
+
+def test_salient_event_leaves_the_recall_window():
+    memory = AutobiographicalMemory(max_events=1000)
+    _record(memory, "perceived_threat", valence=-1.0, intensity=1.0, category="threat_detected")
+    for i in range(RECALL_WINDOW - 1):
+        _record(memory, f"perceived_hello_{i}", valence=0.1, intensity=0.3)
+        # System events do not count towards the window.
+        _record(memory, "cycle_step", valence=1.0, intensity=1.0)
+    assert memory._select_recall_event()["description"] == "perceived_threat"
+
+    _record(memory, "perceived_hello_last", valence=0.1, intensity=0.3)
+    assert memory._select_recall_event()["description"] == "perceived_hello_last"
+
+
+def test_repeated_description_is_skipped_when_another_exists():
+    memory = AutobiographicalMemory()
+    _record(memory, "perceived_criticism", valence=-0.9, intensity=1.0, category="criticism")
+    _record(memory, "perceived_criticism", valence=-0.8, intensity=1.0, category="criticism")
+    _record(memory, "perceived_hello", valence=0.1, intensity=0.3)
+
+    first = memory._select_recall_event()
+    assert first["description"] == "perceived_criticism"
+    assert first["metadata"]["valence"] == -0.9
+    # Both criticism events share the description, so the hello wins.
+    assert memory._select_recall_event()["description"] == "perceived_hello"
+
+    only = AutobiographicalMemory()
+    _record(only, "perceived_praise", valence=0.5, intensity=0.5)
+    assert only._select_recall_event()["description"] == "perceived_praise"
+    # Nothing else to recall: the repeat is allowed.
+    assert only._select_recall_event()["description"] == "perceived_praise"
+
+
+def test_only_system_events_fall_back_to_latest():
+    memory = AutobiographicalMemory()
+    assert memory._select_recall_event() is None
+    _record(memory, "cycle_step")
+    latest = _record(memory, "tick_update")
+    assert memory._select_recall_event() == latest
+
+
+def test_restore_through_events_setter_continues_sequence_numbers():
+    rng = random.Random(8)
+    memory = AutobiographicalMemory(max_events=50)
+    for _ in range(80):
+        memory.record_event(*event_args(rng))
+    state = [dict(event) for event in memory.events]
+    next_seq = memory.events.next_seq
+
+    restored = AutobiographicalMemory(max_events=50)
+    restored.events = state
+    assert list(restored.events) == state
+    assert_indexes_match(restored)
+
+    memory.events = state
+    assert memory.events.seqs()[0] == next_seq
+    assert memory._select_recall_event() == legacy_select(memory, state, "")[0]
+    memory.record_event("perceived_hello", {}, {}, {"valence": 0.2})
+    assert len(memory.events) == 50
+    assert memory.events[-1]["description"] == "perceived_hello"
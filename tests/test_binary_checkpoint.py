@@ -0,0 +1,193 @@
+import json
+import math
+
+import pytest
+
+from conftest import build_brain, run_stream
+from memory import binary_checkpoint
+from memory.binary_checkpoint import MAGIC, BinaryCheckpointError, dumps, loads
+from memory.convert_checkpoint import convert
+from memory.storage import MemoryStorage
+
+HEADER = len(MAGIC) + 2
+
+
+def _plain(value):
+    return json.loads(json.dumps(value))
+
+
+def _tag(value):
+    return chr(dumps(value)[HEADER])
+
+
+def _typed(value):
+    """``value`` with every scalar paired with its type, so 1, 1.0 and True differ."""
+    if isinstance(value, dict):
+        return {key: _typed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_typed(item) for item in value]
+    return type(value).__name__, value
+
+
+def _key_orders(value):
+    if isinstance(value, dict):
+        return [list(value), [_key_orders(item) for item in value.values()]]
+    if isinstance(value, list):
+        return [_key_orders(item) for item in value]
+    return None
+
+
+def _assert_round_trip(value):
+    decoded, expected = loads(dumps(value)), _plain(value)
+    assert _typed(decoded) == _typed(expected)
+    assert _key_orders(decoded) == _key_orders(expected)
+
+
+@pytest.mark.parametrize("value, tag", [
+    ([0.5, -1.25, 1e300, -0.0], "D"),
+    ([3, -7, 2 ** 63 - 1, -(2 ** 63)], "I"),
+    ([[1.0, 2.5], [3.0, -4.0], [0.0, 1e-9]], "M"),
+    (["a", "", "é", "naïve \U0001f600"], "S"),
+    ([{"k": 1, "v": "a"}, {"k": 2, "v": "b"}, {"k": 3, "v": "c"}], "R"),
+    ([1, 1.0, True, None, "1", [1], {"1": 1}], "l"),
+    ({"a": 1, "b": [1.0, 2.0]}, "d"),
+])
+def test_every_tag_round_trips(value, tag):
+    assert _tag(value) == tag
+    _assert_round_trip(value)
+
+
+@pytest.mark.parametrize("value", [
+    None, True, False, 0, -1, 2 ** 63 - 1, 2 ** 80, -(2 ** 80), 0.0, 1.5, -2.5e-300, "", "text é",
+    [], {}, [[]], [{}], [{}, {}], [[], []], [None, None],
+])
+def test_scalars_and_empty_containers_round_trip(value):
+    _assert_round_trip(value)
+
+
+def test_bool_int_and_float_stay_distinct():
+    values = [True, 1, 1.0, False, 0, 0.0]
+    assert _tag(values) == "l"
+    _assert_round_trip(values)
+    # Columns and packed blocks keep the distinction too.
+    rows = [{"flag": True, "count": 1, "level": 1.0}, {"flag": False, "count": 0, "level": 0.0}]
+    _assert_round_trip(rows)
+    _assert_round_trip([[1.0, 2.0], [1, 2]])
+    _assert_round_trip([[True, False], [False, True]])
+    _assert_round_trip({"ints": [1, 2], "floats": [1.0, 2.0], "bools": [True, False]})
+
+
+def test_non_finite_floats_round_trip():
+    decoded = loads(dumps([math.inf, -math.inf, math.nan]))
+    assert decoded[:2] == [math.inf, -math.inf] and math.isnan(decoded[2])
+
+
+def test_non_string_keys_are_coerced_like_json():
+    value = {1: "int", 2.5: "float", None: "none", "s": {0: [1, 2], "t": {True: 1.0, False: 0.0}}}
+    _assert_round_trip(value)
+    decoded = loads(dumps(value))
+    assert list(decoded) == ["1", "2.5", "null", "s"]
+    assert list(decoded["s"]["t"]) == ["true", "false"]
+    # Keys that collide after coercion keep the last value, as json.loads does.
+    _assert_round_trip({1: "a", "1": "b"})
+    with pytest.raises(TypeError):
+        dumps({(1, 2): "tuple key"})
+
+
+def test_nested_and_ragged_structures_round_trip():
+    value = {
+        "tuple": (1, 2.0, "x"),
+        "ragged": [[1.0, 2.0], [3.0]],
+        "mixed_rows": [{"a": 1}, {"b": 2}, {"a": 1, "b": 2}],
+        "reordered": [{"a": 1, "b": 2}, {"b": 2, "a": 1}],
+        "table_of_tables": [{"inner": [{"x": 1.0}, {"x": 2.0}], "n": i} for i in range(3)],
+        "deep": {"a": {"b": {"c": [{"d": [[0.5, 1.5], [2.5, 3.5]]}]}}},
+        "int_keyed_rows": [{1: "a"}, {1: "b"}],
+    }
+    _assert_round_trip(value)
+    decoded = loads(dumps(value))
+    assert [list(row) for row in decoded["reordered"]] == [["a", "b"], ["b", "a"]]
+
+
+def test_repeated_key_shapes_are_stored_once():
+    rows = [{"dopamine": float(i), "serotonin": float(i) / 2} for i in range(50)]
+    value = {"snapshots": [dict(row) for row in rows], "also": {"dopamine": 1.0, "serotonin": 2.0}}
+    raw = dumps(value)
+    assert raw.count(b"serotonin") == 1
+    _assert_round_trip(value)
+
+
+@pytest.fixture(scope="module")
+def brain_state(tmp_path_factory):
+    brain = build_brain(tmp_path_factory.mktemp("brain"), seed=7)
+    run_stream(brain, 40)
+    return brain.get_state()
+
+
+def test_brain_state_and_columnar_autobiography_round_trip(brain_state):
+    events = brain_state["autobiographical_memory"]
+    assert len(events) > 10
+    assert _tag(list(events)) == "R"
+    _assert_round_trip(list(events))
+    _assert_round_trip(brain_state)
+
+
+def test_convert_json_to_binary_and_back_is_byte_identical(tmp_path, brain_state):
+    source = tmp_path / "store.json"
+    storage = MemoryStorage(str(source))
+    storage.update_all(brain_state)
+    original = source.read_bytes()
+
+    binary_path = tmp_path / "store.ckpt"
+    summary = convert(str(source), str(binary_path), to="binary")
+    assert binary_checkpoint.is_binary(binary_path.read_bytes())
+    assert summary["destination_bytes"] < summary["source_bytes"]
+
+    back = tmp_path / "back.json"
+    convert(str(binary_path), str(back), to="json")
+    assert back.read_bytes() == original
+
+    # In place, both ways.
+    convert(str(source), to="binary")
+    convert(str(source), to="json")
+    assert source.read_bytes() == original
+
+
+@pytest.fixture(scope="module")
+def payload():
+    return dumps({
+        "floats": [0.25, 0.5], "ints": [1, 2], "matrix": [[1.0, 2.0], [3.0, 4.0]],
+        "names": ["alpha", "béta"], "rows": [{"k": 1, "t": "a"}, {"k": 2, "t": "b"}],
+        "mixed": [1, "a", None, True, 2 ** 70], "text": "hello",
+    })
+
+
+def test_every_truncation_is_rejected(payload):
+    for size in range(len(payload)):
+        with pytest.raises(BinaryCheckpointError):
+            loads(payload[:size])
+
+
+def test_trailing_bytes_are_rejected(payload):
+    with pytest.raises(BinaryCheckpointError):
+        loads(payload + b"N")
+
+
+def test_corrupt_headers_and_tags_are_rejected(payload):
+    with pytest.raises(BinaryCheckpointError, match="magic"):
+        loads(b"JSON" + payload[4:])
+    with pytest.raises(BinaryCheckpointError, match="newer"):
+        loads(MAGIC + (binary_checkpoint.FORMAT_VERSION + 1).to_bytes(2, "little") + payload[HEADER:])
+    with pytest.raises(BinaryCheckpointError, match="unknown tag"):
+        loads(payload[:HEADER] + b"?" + payload[HEADER + 1:])
+
+
+def test_corrupt_bytes_never_escape_as_other_errors(payload):
+    # Flipping any single byte either still decodes or raises BinaryCheckpointError.
+    for pos in range(HEADER, len(payload)):
+        for byte in (0x00, 0xFF, payload[pos] ^ 0x01):
+            corrupt = payload[:pos] + bytes([byte]) + payload[pos + 1:]
+            try:
+                loads(corrupt)
+            except BinaryCheckpointError:
+                pass
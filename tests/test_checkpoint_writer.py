@@ -0,0 +1,182 @@
+import threading
+import time
+
+import pytest
+
+from memory.checkpoint_writer import CheckpointWriter
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand; moving it wakes the writer."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.writer = None
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+        with self.writer._cond:
+            self.writer._cond.notify_all()
+
+
+def _eventually(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def _settle():
+    # Long enough for the writer thread to act on a wake-up if it were due.
+    time.sleep(0.05)
+
+
+@pytest.fixture
+def writer():
+    saved = []
+    clock = FakeClock()
+    writer = CheckpointWriter(saved.append, min_interval=1.0, max_staleness=5.0, clock=clock)
+    clock.writer = writer
+    writer.saved, writer.clock = saved, clock
+    yield writer
+    writer.close(flush=False)
+
+
+def test_burst_coalesces_to_the_newest_state(writer):
+    for step in range(3):
+        assert writer.submit({"step": step})
+    _settle()
+    assert writer.saved == []
+
+    writer.clock.advance(1.0)
+    assert _eventually(lambda: writer.written == 1)
+    assert writer.saved == [{"step": 2}]
+    assert (writer.requested, writer.skipped) == (3, 2)
+
+
+def test_write_waits_for_a_quiet_interval(writer):
+    writer.submit({"step": 0})
+    writer.clock.advance(0.5)
+    writer.submit({"step": 1})
+    writer.clock.advance(0.7)
+    _settle()
+    # 1.2s after the first request, but only 0.7s after the last one.
+    assert writer.written == 0
+
+    writer.clock.advance(0.3)
+    assert _eventually(lambda: writer.written == 1)
+    assert writer.saved == [{"step": 1}]
+
+
+def test_steady_requests_are_written_by_the_staleness_deadline(writer):
+    for step in range(7):
+        writer.submit({"step": step})
+        _settle()
+        assert writer.written == 0, step
+        writer.clock.advance(0.8)
+    # The first request has now waited 5.6s > max_staleness.
+    assert _eventually(lambda: writer.written == 1)
+    assert writer.saved == [{"step": 6}]
+
+
+def test_consecutive_writes_start_min_interval_apart():
+    saved = []
+    clock = FakeClock()
+    writer = CheckpointWriter(saved.append, min_interval=1.0, max_staleness=1.0, clock=clock)
+    clock.writer = writer
+    try:
+        writer.submit({"step": 0})
+        clock.advance(1.0)
+        assert _eventually(lambda: writer.written == 1)
+        # The next request waits out its own interval after the last write.
+        clock.advance(0.5)
+        writer.submit({"step": 1})
+        clock.advance(0.9)
+        _settle()
+        assert writer.written == 1
+        clock.advance(0.1)
+        assert _eventually(lambda: writer.written == 2)
+        assert saved == [{"step": 0}, {"step": 1}]
+    finally:
+        writer.close(flush=False)
+
+
+def test_flush_writes_immediately(writer):
+    writer.submit({"step": 0})
+    assert writer.flush()
+    assert writer.saved == [{"step": 0}]
+    assert writer.flush()
+    assert writer.written == 1
+    assert writer.stats()["pending"] is False
+
+
+def test_close_flushes_and_later_submits_are_dropped(writer):
+    writer.submit({"step": 0})
+    assert writer.close()
+    assert writer.saved == [{"step": 0}]
+    assert not writer._thread.is_alive()
+
+    assert writer.submit({"step": 1}) is False
+    assert writer.saved == [{"step": 0}]
+    assert writer.stats()["dropped"] == 1
+    assert writer.requested == 1
+
+
+def test_close_without_flush_discards_the_pending_state(writer):
+    writer.submit({"step": 0})
+    writer.close(flush=False)
+    assert writer.saved == []
+    assert writer.skipped == 1
+    assert writer.submit({"step": 1}) is False
+
+
+def test_submits_racing_close_never_raise(writer):
+    errors = []
+    stop = threading.Event()
+
+    def tick():
+        try:
+            while not stop.is_set():
+                writer.submit({"step": "racing"})
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=tick)
+    thread.start()
+    _settle()
+    writer.close(flush=False)
+    _settle()
+    stop.set()
+    thread.join()
+    assert errors == []
+    assert writer.dropped > 0
+
+
+def test_failed_write_is_counted_and_retried():
+    attempts = []
+    clock = FakeClock()
+
+    def save(state):
+        attempts.append(state)
+        if len(attempts) == 1:
+            raise OSError("disk full")
+
+    writer = CheckpointWriter(save, min_interval=1.0, max_staleness=5.0, clock=clock)
+    clock.writer = writer
+    try:
+        writer.submit({"step": 0})
+        assert writer.flush()
+        assert (writer.written, writer.failed) == (0, 1)
+        assert "disk full" in writer.last_error
+
+        writer.submit({"step": 1})
+        assert writer.flush()
+        assert (writer.written, writer.failed) == (1, 1)
+        assert attempts == [{"step": 0}, {"step": 1}]
+    finally:
+        writer.close(flush=False)
@@ -0,0 +1,109 @@
+import hashlib
+import random
+import re
+
+import numpy as np
+import pytest
+
+from chatbot import local_vector_store
+from memory import vector_store
+
+MODULES = [vector_store, local_vector_store]
+
+TEXTS = [
+    "",
+    "I write C++ and C# at work",
+    "c++/c#(scikit-learn) with numpy, pandas.",
+    "scikit-learning is not scikit-learn? Maybe: scikit-learn!",
+    "Go, R and golang; GO-lang; r&d; node.js vs nodejs vs NodeJS",
+    "reactjs react_native react-native pre-react",
+    "Build an app for me in Python3 and python",
+    "c+++ c## cc++ x#c# notc++",
+    "élève café pythoné naïve rust",
+    "the a of and with",
+    "Dart\tLua\nSQL sql-server mysql NoSQL",
+]
+
+
+def _legacy_pattern(keyword):
+    if re.fullmatch(r"[a-zA-Z0-9]+", keyword):
+        return r"(?<!\w)" + re.escape(keyword) + r"(?!\w)"
+    return re.escape(keyword)
+
+
+def _legacy_embed(module, text, dim):
+    """The original embedding: md5 per token, one regex search per keyword."""
+    vec = np.zeros(dim, dtype=np.float32)
+    lowered = (text or "").lower()
+    for word in re.findall(r"[a-zA-Z0-9+#.]+", lowered):
+        if word in module.STOPWORDS:
+            continue
+        vec[int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16) % dim] += 1.0
+    for kw in module.ALL_KEYWORDS:
+        if re.search(_legacy_pattern(kw), lowered):
+            vec[int(hashlib.md5(kw.encode("utf-8")).hexdigest(), 16) % dim] += 2.0
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec = vec / norm
+    return vec
+
+
+def _corpus(module, count=300, seed=5):
+    rng = random.Random(seed)
+    words = sorted(module.ALL_KEYWORDS) + ["C++", "C#", "Node.js", "ReactJS", "scikit-learn", "hello", "garden", "the"]
+    punctuation = [" ", ", ", ". ", "-", "/", "(", ") ", "\n", "_", "+", "#"]
+    return ["".join(rng.choice(words) + rng.choice(punctuation) for _ in range(rng.randint(1, 20))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("module", MODULES, ids=lambda module: module.__name__)
+def test_vectors_match_legacy_embedding_bit_for_bit(module):
+    texts = TEXTS + _corpus(module)
+    function = module.HashedEmbeddingFunction(cache_size=0)
+    expected = np.array([_legacy_embed(module, text, function.dim) for text in texts])
+    assert np.array_equal(function.embed_many(texts), expected)
+    assert np.array_equal(np.array(function(texts), dtype=np.float32), expected)
+
+
+@pytest.mark.parametrize("module", MODULES, ids=lambda module: module.__name__)
+@pytest.mark.parametrize("keyword", ["c++", "c#", "scikit-learn"])
+def test_symbol_keywords_get_their_boost(module, keyword):
+    function = module.HashedEmbeddingFunction(cache_size=0)
+    for text in (f"I use {keyword}", f"x{keyword}y", f"({keyword.upper()})"):
+        assert np.array_equal(function.embed_many([text])[0], _legacy_embed(module, text, function.dim))
+    bucket = module._token_bucket(keyword, function.dim)
+    with_keyword = function.embed_many([f"I use {keyword} daily"])[0]
+    assert with_keyword[bucket] > 0
+
+
+@pytest.mark.parametrize("module", MODULES, ids=lambda module: module.__name__)
+def test_cache_hits_return_identical_vectors(module):
+    function = module.HashedEmbeddingFunction(cache_size=4)
+    first = function.embed_many(TEXTS[:3])
+    assert (function.cache_hits, function.cache_misses) == (0, 3)
+
+    again = function.embed_many(TEXTS[:3] + TEXTS[:1])
+    assert (function.cache_hits, function.cache_misses) == (4, 3)
+    assert np.array_equal(again[:3], first)
+    assert np.array_equal(again[3], first[0])
+
+    # Cached rows are copies: editing a result leaves the cache intact.
+    again[0] += 1.0
+    assert np.array_equal(function.embed_many(TEXTS[:1])[0], first[0])
+
+
+@pytest.mark.parametrize("module", MODULES, ids=lambda module: module.__name__)
+def test_cache_evicts_least_recently_used(module):
+    function = module.HashedEmbeddingFunction(cache_size=2)
+    function.embed_many(["alpha", "beta"])
+    function.embed_many(["alpha"])            # beta is now the oldest
+    function.embed_many(["gamma"])            # evicts beta
+    hits = function.cache_hits
+    function.embed_many(["alpha"])
+    assert function.cache_hits == hits + 1
+    misses = function.cache_misses
+    function.embed_many(["beta"])
+    assert function.cache_misses == misses + 1
+
+    uncached = module.HashedEmbeddingFunction(cache_size=0)
+    uncached.embed_many(["alpha", "alpha"])
+    assert uncached.cache_hits == 0 and not uncached._cache
@@ -0,0 +1,183 @@
+import copy
+import json
+import random
+
+import numpy as np
+import pytest
+
+from conftest import build_brain, run_stream
+from core.hopfield import HopfieldNetwork
+from core.internal_thoughts import _closest_replay, _get_state_vector
+
+
+# The list-of-lists network the brain used before HopfieldNetwork, kept
+# here as the reference for storage and recall.
+
+def legacy_learn(w, p, update_multiplier):
+    for i in range(len(w)):
+        for j in range(len(w)):
+            if i != j:
+                w[i][j] += float(p[i] * p[j]) * update_multiplier
+
+
+def legacy_recall(w, x, iterations=5):
+    for _ in range(iterations):
+        new_x = []
+        for i in range(len(w)):
+            val = sum(w[i][j] * x[j] for j in range(len(w)))
+            new_x.append(1 if val >= 0.0 else -1)
+        x = new_x
+    return x
+
+
+def legacy_replay(w, events, x):
+    """Best matching recent event and its match count, as generate_spontaneous scanned them."""
+    candidates = [
+        ev for ev in events
+        if ev.get("description") != "cycle_step" and "cycle_step" not in str(ev.get("description", ""))
+    ]
+    x = legacy_recall(w, x)
+    best_matches = []
+    best_match_count = -1
+    for ev in candidates[-60:]:
+        ev_vec = _get_state_vector(ev.get("chemicals", {}), ev.get("identity", {}))
+        ev_pattern = [1 if v >= 0.5 else -1 for v in ev_vec]
+        matches = sum(1 for a, b in zip(x, ev_pattern) if a == b)
+        if matches > best_match_count:
+            best_match_count = matches
+            best_matches = [ev]
+        elif matches == best_match_count:
+            best_matches.append(ev)
+    return best_matches[-1], best_match_count
+
+
+def _patterns(rng, count, size=9):
+    return [[rng.choice((1, -1)) for _ in range(size)] for _ in range(count)]
+
+
+def _trained(rng, size=9, count=6):
+    network = HopfieldNetwork(size)
+    w = [[0.0] * size for _ in range(size)]
+    for p in _patterns(rng, count, size):
+        rate = rng.choice((0.3, 0.9, 1.5, rng.uniform(0.3, 1.5)))
+        network.learn(p, rate)
+        legacy_learn(w, p, rate)
+    return network, w
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_learning_matches_the_list_weights(seed):
+    rng = random.Random(seed)
+    network, w = _trained(rng, count=40)
+    assert network.to_list() == w
+    assert network.version == 40
+    assert np.all(np.diag(network.weights) == 0.0)
+
+    patterns = _patterns(rng, 12)
+    rates = [rng.uniform(0.3, 1.5) for _ in patterns]
+    network.learn_many(patterns, rates)
+    for p, rate in zip(patterns, rates):
+        legacy_learn(w, p, rate)
+    assert network.weights == pytest.approx(np.array(w), abs=1e-9)
+    assert network.version == 41
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_recall_matches_the_list_weights(seed):
+    rng = random.Random(seed)
+    network, w = _trained(rng, count=seed + 1)
+    probes = _patterns(rng, 64)
+    batch = network.recall(probes)
+    assert batch.shape == (64, 9) and batch.dtype == np.int64
+    for probe, recalled in zip(probes, batch):
+        expected = legacy_recall(w, probe)
+        assert network.recall(probe).tolist() == expected
+        assert recalled.tolist() == expected
+    for iterations in (0, 1, 2):
+        assert network.recall(probes[0], iterations).tolist() == legacy_recall(w, probes[0], iterations)
+
+
+def test_zero_input_recalls_plus_one():
+    network = HopfieldNetwork(9)
+    assert network.recall([-1] * 9).tolist() == legacy_recall(network.to_list(), [-1] * 9) == [1] * 9
+
+    # Unlearning a pattern at the same rate cancels it exactly.
+    p = [1, -1, 1, -1, 1, -1, 1, -1, 1]
+    network.learn(p, 0.7)
+    network.learn(p, -0.7)
+    assert network.recall(p, 1).tolist() == [1] * 9
+
+
+def test_brain_learning_matches_the_list_weights(tmp_path):
+    brain = build_brain(tmp_path, seed=42)
+    size = brain.hopfield.size
+    w = [[0.0] * size for _ in range(size)]
+    learn = brain._project_hebbian_learning
+
+    def tracked(chemicals, identity):
+        p = brain._binarize_state(chemicals, identity)
+        ach = chemicals.get("acetylcholine")
+        ach_val = (ach.get("value", 50.0) if isinstance(ach, dict) else float(ach)) if ach else 50.0
+        cfg = brain.brain_config["hopfield"]
+        legacy_learn(w, p, float(cfg["ach_scale_min"]) + float(cfg["ach_scale_max"]) * ach_val / 100.0)
+        learn(chemicals, identity)
+
+    brain._project_hebbian_learning = tracked
+    run_stream(brain, 45)
+    assert brain.hopfield.version > 0
+    assert brain.hopfield_weights == w
+
+
+def test_replay_search_matches_the_event_scan(tmp_path):
+    brain = run_stream(build_brain(tmp_path, seed=42), 90)
+    events = brain.autobiography.events
+    recent = brain.autobiography.replayable_seqs(60)
+    w = brain.hopfield_weights
+    rng = random.Random(3)
+    chemicals = {k: v["value"] for k, v in brain.chemicals.items()}
+    current = [1 if v >= 0.5 else -1 for v in _get_state_vector(chemicals, brain.identity.get_snapshot())]
+    for query in [current] + _patterns(rng, 30):
+        seq, count = _closest_replay(brain.hopfield, events, recent, query)
+        event, expected = legacy_replay(w, list(events), query)
+        assert count == expected
+        assert events.get(seq) == event
+
+
+def test_hopfield_weights_round_trip_through_set_state(tmp_path):
+    source = run_stream(build_brain(tmp_path / "a", seed=42), 30)
+    state = json.loads(json.dumps(source.get_state()))
+    saved = copy.deepcopy(state["hopfield_weights"])
+    assert saved == source.hopfield.to_list()
+
+    target = build_brain(tmp_path / "b", seed=42)
+    version = target._snapshots.version("hopfield_weights")
+    target.set_state(state)
+    assert target._snapshots.version("hopfield_weights") != version
+    assert target.hopfield_weights == saved
+    assert target.get_state()["hopfield_weights"] == saved
+    probes = _patterns(random.Random(5), 32)
+    assert target.hopfield.recall(probes).tolist() == source.hopfield.recall(probes).tolist()
+    assert [legacy_recall(saved, p) for p in probes] == target.hopfield.recall(probes).tolist()
+
+    # The restored network owns its weights.
+    state["hopfield_weights"][0][1] += 5.0
+    assert target.hopfield_weights == saved
+
+    # Learning keeps going from the restored weights.
+    chemicals = {k: v["value"] for k, v in target.chemicals.items()}
+    identity = target.identity.get_snapshot()
+    for brain in (source, target):
+        brain._project_hebbian_learning(chemicals, identity)
+    assert target.hopfield_weights == source.hopfield_weights
+
+    # Without saved weights the current network is kept.
+    kept = target.hopfield
+    del state["hopfield_weights"]
+    target.set_state(state)
+    assert target.hopfield is kept
+
+
+@pytest.mark.parametrize("weights", [[[0.0, 1.0]], [0.0, 1.0], [[[0.0]]]])
+def test_from_list_rejects_non_square_weights(weights):
+    with pytest.raises(ValueError):
+        HopfieldNetwork.from_list(weights)
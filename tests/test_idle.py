@@ -0,0 +1,149 @@
+import random
+
+import numpy as np
+import pytest
+
+from conftest import build_brain, run_stream
+from core.idle import IdleChemistry
+from core.interactions import Interactions
+from core.vector_engine import VectorBrainEngine
+
+# advance_idle() agrees with stepping the chemistry to this absolute
+# tolerance (chemical values range over 0-100).
+TOLERANCE = 1e-6
+
+
+def _warm(tmp_path, name, seed=42, ticks=20):
+    brain = build_brain(tmp_path / name, seed=seed)
+    run_stream(brain, ticks)
+    return brain
+
+
+def _engine(brain, deterministic=True):
+    return VectorBrainEngine(
+        state=brain.chemicals,
+        interactions=Interactions(brain.interaction_matrix),
+        deterministic=deterministic,
+        brain=brain,
+    )
+
+
+def _values(brain):
+    return np.array([brain.chemicals[name]["value"] for name in _engine(brain).names])
+
+
+def _stepped(chemistry, values, ticks):
+    for _ in range(ticks):
+        values = chemistry.step(values)
+    return values
+
+
+@pytest.mark.parametrize("ticks", [1, 16, 17, 40, 300, 5000])
+def test_advance_idle_matches_stepped_chemistry_ticks(tmp_path, ticks):
+    jumped = _warm(tmp_path, "jumped")
+    stepped = _warm(tmp_path, "stepped")
+    assert np.array_equal(_values(jumped), _values(stepped))
+
+    summary = jumped.advance_idle(ticks)
+    engine = _engine(stepped)
+    for _ in range(ticks):
+        engine.tick()
+
+    assert np.max(np.abs(_values(jumped) - _values(stepped))) <= TOLERANCE
+    assert summary["ticks"] == ticks
+    assert summary["chemistry_exact_steps"] <= ticks
+    assert jumped.step_counter == stepped.step_counter + ticks
+
+
+def test_long_stretches_jump_and_short_ones_step_exactly(tmp_path):
+    brain = _warm(tmp_path, "brain")
+    engine = _engine(brain)
+    start = engine.values()
+
+    short = IdleChemistry(engine, deterministic=True)
+    assert np.array_equal(short.advance(start, IdleChemistry.EXACT_STEPS), _stepped(short, start, IdleChemistry.EXACT_STEPS))
+    assert (short.jumps, short.exact_steps) == (0, IdleChemistry.EXACT_STEPS)
+
+    long = IdleChemistry(engine, deterministic=True)
+    long.advance(start, 10000)
+    assert long.jumps > 0
+    assert long.exact_steps < 200
+
+
+def test_far_from_baseline_crosses_clamped_regimes(tmp_path):
+    brain = _warm(tmp_path, "brain")
+    engine = _engine(brain)
+    start = engine.values()
+    for name, value in (("cortisol", 90.0), ("dopamine", 10.0), ("oxytocin", 20.0), ("serotonin", 100.0)):
+        start[engine.index[name]] = value
+    chemistry = IdleChemistry(engine, deterministic=True)
+    for ticks in (50, 700, 4000):
+        assert np.max(np.abs(chemistry.advance(start, ticks) - _stepped(chemistry, start, ticks))) <= TOLERANCE
+
+
+def test_a_jump_that_leaves_its_affine_piece_falls_back_to_exact_steps(tmp_path, monkeypatch):
+    brain = _warm(tmp_path, "brain")
+    engine = _engine(brain)
+    start = engine.values()
+    monkeypatch.setattr(IdleChemistry, "_holds", lambda self, values, matrix, offset: False)
+    chemistry = IdleChemistry(engine, deterministic=True)
+    # With no jump accepted, every tick is an exact step, bit for bit.
+    assert np.array_equal(chemistry.advance(start, 100), _stepped(chemistry, start, 100))
+    assert (chemistry.jumps, chemistry.exact_steps) == (0, 100)
+
+
+def test_noisy_jumps_match_stepped_noise_in_distribution(tmp_path):
+    brain = _warm(tmp_path, "brain")
+    engine = _engine(brain)
+    start = engine.values()
+    random.seed(1)
+    samples = 200
+
+    jumping = IdleChemistry(engine)
+    jumped = np.array([jumping.advance(start, 200) for _ in range(samples)])
+    stepping = IdleChemistry(engine)
+    stepping.EXACT_STEPS = 10 ** 9
+    stepped = np.array([stepping.advance(start, 200) for _ in range(samples)])
+    assert jumping.jumps > 0 and stepping.jumps == 0
+
+    spread = stepped.std(axis=0)
+    assert np.all(np.abs(jumped.mean(axis=0) - stepped.mean(axis=0)) <= 4 * spread * np.sqrt(2 / samples))
+    assert np.all((0.75 * spread <= jumped.std(axis=0)) & (jumped.std(axis=0) <= 1.33 * spread))
+    assert np.all((engine.min <= jumped) & (jumped <= engine.max))
+
+
+def test_attachment_and_goal_decay_match_per_tick_decay(tmp_path):
+    jumped = _warm(tmp_path, "jumped")
+    stepped = _warm(tmp_path, "stepped")
+    for brain in (jumped, stepped):
+        brain.attachment_system.attachments.update({"user": 0.8, "stranger": -0.4})
+        brain.goal_system.goals.update({"safety": 2.0, "social_bond": 0.5})
+
+    jumped.advance_idle(2500)
+    for _ in range(2500):
+        stepped.attachment_system.decay()
+        stepped.goal_system.decay()
+
+    for name, value in stepped.attachment_system.attachments.items():
+        assert jumped.attachment_system.attachments[name] == pytest.approx(value, rel=1e-9)
+    for name, value in stepped.goal_system.goals.items():
+        assert jumped.goal_system.goals[name] == pytest.approx(value, rel=1e-9)
+    assert jumped.attachment_system.attachments["user"] == pytest.approx(0.8 * 0.9997 ** 2500)
+    assert jumped.goal_system.goals["safety"] == pytest.approx(2.0 * 0.999 ** 2500)
+
+
+def test_zero_ticks_change_nothing_and_negative_ticks_are_rejected(tmp_path):
+    brain = _warm(tmp_path, "brain")
+    brain.attachment_system.attachments["user"] = 0.5
+    values, step = _values(brain), brain.step_counter
+
+    summary = brain.advance_idle(0)
+    assert summary == {"ticks": 0, "chemistry_jumps": 0, "chemistry_exact_steps": 0, "slow_wave_ticks": 0}
+    assert np.array_equal(_values(brain), values)
+    assert brain.step_counter == step
+    assert brain.attachment_system.attachments["user"] == 0.5
+
+    with pytest.raises(ValueError):
+        brain.advance_idle(-1)
+    assert np.array_equal(_values(brain), values)
+    assert brain.step_counter == step
@@ -0,0 +1,221 @@
+import random
+
+import pytest
+
+from conftest import EVENT_STREAM, build_brain, run_stream
+from decision.lookahead import LookaheadEngine
+
+GOALS = [None, "safety", "task_mastery", "social_bond"]
+
+
+def legacy_simulate(brain, current_state, action, depth):
+    """``StrategicPlanner._simulate_future`` before the layered engine."""
+    if depth == 0:
+        return 0.0
+
+    feedback = (brain.decision_engine.execute_action(action, current_state) if brain.decision_engine else {}).get("feedback", {})
+
+    active_goal = brain.goal_system.get_active_goal() if brain.goal_system else None
+    w_dopamine, w_serotonin, w_oxytocin, w_cortisol = 1.0, 1.0, 1.0, -1.0
+    if active_goal == "safety":
+        w_cortisol, w_oxytocin, w_dopamine = -2.5, 0.5, 0.5
+    elif active_goal == "task_mastery":
+        w_dopamine, w_cortisol = 2.0, -0.5
+    elif active_goal == "social_bond":
+        w_oxytocin, w_serotonin, w_cortisol = 2.0, 1.5, -0.8
+    if float(current_state.get("love_score", 0.0)) > 0.5:
+        w_oxytocin = 3.0
+        w_cortisol = w_cortisol / 3.0
+
+    reward_score = (
+        feedback.get("dopamine", 0.0) * w_dopamine +
+        feedback.get("serotonin", 0.0) * w_serotonin +
+        feedback.get("oxytocin", 0.0) * w_oxytocin +
+        feedback.get("cortisol", 0.0) * w_cortisol
+    )
+
+    next_chemicals = current_state.get("neurochemicals", {}).copy()
+    feedback_multiplier = getattr(brain, "feedback_multiplier", 1.0)
+    decision_feedback_scale = getattr(brain, "decision_feedback_scale", 0.45)
+    for chem, delta in feedback.items():
+        if chem in next_chemicals and chem in brain.chemicals:
+            chem_def = brain.chemicals[chem]
+            val = next_chemicals[chem]
+            span = max(1e-6, chem_def["max"] - chem_def["min"])
+            bounded = max(-3.0, min(3.0, delta * feedback_multiplier * decision_feedback_scale))
+            if chem == "cortisol":
+                bounded = max(-0.6, min(0.6, bounded))
+            headroom = (chem_def["max"] - val) / span if bounded >= 0 else (val - chem_def["min"]) / span
+            scale = max(0.15, min(1.0, headroom * 1.8))
+            new_val = max(chem_def["min"], min(val + bounded * scale, chem_def["max"]))
+            if chem == "cortisol":
+                new_val = min(100.0, new_val)
+            next_chemicals[chem] = new_val
+
+    temp_state = current_state.copy()
+    temp_state["neurochemicals"] = next_chemicals
+    temp_state.update(next_chemicals)
+
+    if brain.decision_engine and brain.decision_engine.model:
+        model = brain.decision_engine.model
+        effective_next = {
+            name: val * (brain.chemicals[name].sensitivity if name in brain.chemicals else 1.0)
+            for name, val in next_chemicals.items()
+        }
+        next_probabilities = model.compute(effective_next)
+        action_bias = temp_state.get("decision_action_bias", {})
+        if isinstance(action_bias, dict):
+            for act, delta in action_bias.items():
+                if act in next_probabilities:
+                    next_probabilities[act] += float(delta)
+        min_prob = getattr(model, "min_prob", 0.0)
+        max_prob = getattr(model, "max_prob", 1.0)
+        for act in next_probabilities:
+            next_probabilities[act] = max(min_prob, min(max_prob, next_probabilities[act]))
+        total = sum(next_probabilities.values())
+        if total > 0:
+            for act in next_probabilities:
+                next_probabilities[act] /= total
+    else:
+        actions = ["support", "challenge", "suggest", "refuse", "neutral"]
+        next_probabilities = {act: 1.0 / len(actions) for act in actions}
+
+    future_score = 0.0
+    for next_action, prob in next_probabilities.items():
+        future_score += prob * legacy_simulate(brain, temp_state, next_action, depth - 1)
+    return reward_score + 0.5 * future_score
+
+
+def legacy_choose(planner, brain, probabilities):
+    """``StrategicPlanner.choose_action`` before the layered engine."""
+    current_state = brain.get_state()
+    best_action, best_score = None, float("-inf")
+    for action, base_prob in probabilities.items():
+        simulated_score = legacy_simulate(brain, current_state, action, planner.max_depth)
+        personality_modifier = planner.identity.get("competence") * 0.3 + planner.identity.get("resilience") * 0.2
+        final_score = simulated_score + personality_modifier - planner.risk_aversion * (1 - base_prob)
+        if final_score > best_score:
+            best_score, best_action = final_score, action
+    return best_action
+
+
+def _variants(brain, count, seed):
+    """Decision views around the brain's state, with odd love scores and action biases."""
+    rng = random.Random(seed)
+    base = brain.get_decision_view()
+    actions = list(brain.decision_engine.model.actions)
+    states = []
+    for i in range(count):
+        state = dict(base)
+        chemicals = {name: min(100.0, max(0.0, value + rng.uniform(-30.0, 30.0))) for name, value in base["neurochemicals"].items()}
+        if i % 5 == 0:
+            chemicals["cortisol"] = 100.0
+        state["neurochemicals"] = chemicals
+        state.update(chemicals)
+        state["love_score"] = rng.choice([0.0, 0.4, 0.9])
+        if i % 3 == 0:
+            state["decision_action_bias"] = {rng.choice(actions): rng.uniform(-0.2, 0.2), "unknown": 0.3}
+        states.append(state)
+    return states
+
+
+@pytest.mark.parametrize("seed", [3, 42, 99])
+def test_layered_scores_equal_the_recursive_planner(tmp_path, seed):
+    brain = build_brain(tmp_path, seed=seed)
+    run_stream(brain, 12 + seed % 7)
+    actions = list(brain.decision_engine.model.actions)
+    engines = {"untabled": LookaheadEngine(table_size=0), "tabled": LookaheadEngine()}
+    for i, state in enumerate(_variants(brain, 12, seed)):
+        brain.goal_system.goals = {GOALS[i % len(GOALS)]: 1.0} if GOALS[i % len(GOALS)] else {}
+        for depth in (1, 2, 3):
+            expected = {action: legacy_simulate(brain, state, action, depth) for action in actions}
+            for name, engine in engines.items():
+                scores, reached = engine.evaluate(brain, state, actions, depth)
+                assert reached == depth
+                assert scores == expected, (name, i, depth)
+
+
+def test_planner_chooses_the_recursive_planners_action(tmp_path):
+    brain = build_brain(tmp_path, seed=42)
+    planner = brain.strategic_planner
+    assert planner.max_depth == 2
+    choose = planner.choose_action
+    decisions = []
+
+    def checked(brain_, probabilities):
+        action = choose(brain_, probabilities)
+        assert action == legacy_choose(planner, brain_, probabilities)
+        decisions.append(action)
+        return action
+
+    planner.choose_action = checked
+    run_stream(brain, 3 * len(EVENT_STREAM))
+    assert len(decisions) > 10
+
+
+def test_transposition_hits_do_not_change_scores(tmp_path):
+    brain = build_brain(tmp_path, seed=5)
+    run_stream(brain, 10)
+    actions = list(brain.decision_engine.model.actions)
+    states = _variants(brain, 8, 11)
+    for state in states:
+        state.pop("decision_action_bias", None)
+        state["love_score"] = 0.0
+
+    def scores(engine, depth):
+        return [engine.evaluate(brain, state, actions, depth)[0] for state in states]
+
+    for depth in (3, 4):
+        expected = scores(LookaheadEngine(table_size=0), depth)
+        tabled = LookaheadEngine()
+        assert scores(tabled, depth) == expected
+        # Actions that touch different chemicals commute, so a-then-b and
+        # b-then-a reach the same state and one search already hits.
+        assert tabled.hits > 0
+        # A repeated decision is answered from the root entry.
+        hits, misses = tabled.hits, tabled.misses
+        assert scores(tabled, depth) == expected
+        assert (tabled.hits, tabled.misses) == (hits + len(states), misses)
+        # Entries left by the deeper search do not leak into a shallower one.
+        assert scores(tabled, depth - 1) == scores(LookaheadEngine(table_size=0), depth - 1)
+
+        # A table too small for one search evicts while searching.
+        tiny = LookaheadEngine(table_size=4)
+        assert scores(tiny, depth) == expected
+        assert scores(tiny, depth) == expected
+        assert len(tiny._table) <= 4
+
+
+def test_context_changes_clear_the_table(tmp_path):
+    brain = build_brain(tmp_path, seed=5)
+    run_stream(brain, 10)
+    actions = list(brain.decision_engine.model.actions)
+    state = brain.get_decision_view()
+    tabled = LookaheadEngine()
+    tabled.evaluate(brain, state, actions, 3)
+
+    changes = [
+        lambda: setattr(brain.chemicals["dopamine"], "sensitivity", 1.7),
+        lambda: brain.goal_system.goals.update({"safety": 99.0}),
+        lambda: state.update(love_score=0.9),
+        lambda: state.update(decision_action_bias={actions[0]: 0.2}),
+        lambda: setattr(brain, "feedback_multiplier", 1.3),
+    ]
+    for change in changes:
+        change()
+        expected = {action: legacy_simulate(brain, state, action, 3) for action in actions}
+        assert tabled.evaluate(brain, state, actions, 3)[0] == expected
+
+
+def test_time_budget_deepens_until_spent(tmp_path):
+    brain = build_brain(tmp_path, seed=5)
+    run_stream(brain, 10)
+    actions = list(brain.decision_engine.model.actions)
+    state = brain.get_decision_view()
+    engine = LookaheadEngine(table_size=0)
+    scores, reached = engine.evaluate(brain, state, actions, 3, time_budget_ms=1e-6)
+    assert reached == 1
+    assert scores == {action: legacy_simulate(brain, state, action, 1) for action in actions}
+    scores, reached = engine.evaluate(brain, state, actions, 3, time_budget_ms=60_000)
+    assert reached == 3
+    assert engine.evaluate(brain, state, actions, 0) == ({action: 0.0 for action in actions}, 0)
@@ -0,0 +1,64 @@
+from conftest import EVENT_STREAM, build_brain, run_stream, strip_time_fields
+from memory.memory_manager import MemoryManager
+
+
+def _state(brain):
+    return strip_time_fields({
+        "chemicals": {name: chem["value"] for name, chem in brain.chemicals.items()},
+        "q_table": brain.decision_engine.q_table,
+        "identity": brain.identity.get_snapshot(),
+        "focus": brain.current_focus.content if brain.current_focus else None,
+    })
+
+
+def test_pending_memories_flush_in_bulk_at_size_threshold(tmp_path):
+    manager = MemoryManager(
+        storage_path=str(tmp_path / "store.json"),
+        flush_config={"flush_size": 5, "flush_max_age": 3600.0, "vector_backend": "numpy"},
+    )
+    for i in range(4):
+        manager.create_memory("episode", {"step": i})
+    assert len(manager.pending_memories) == 4
+    assert not manager.flush_due()
+
+    manager.create_memory("episode", {"step": 4})
+    assert manager.pending_memories == []
+    assert manager.flushes == 1
+    assert len(manager.vector_store) == 5
+
+
+def test_deferred_flush_holds_records_until_exit(tmp_path):
+    manager = MemoryManager(
+        storage_path=str(tmp_path / "store.json"),
+        flush_config={"flush_size": 2, "vector_backend": "numpy"},
+    )
+    with manager.deferred_flush():
+        for i in range(7):
+            manager.create_memory("episode", {"step": i})
+        assert len(manager.pending_memories) == 7
+    assert manager.pending_memories == []
+    assert len(manager.vector_store) == 7
+
+
+def test_deterministic_brain_opens_vector_store_up_front(tmp_path):
+    brain = build_brain(tmp_path, seed=42)
+    assert brain.memory_manager._vector_store is not None
+
+    (tmp_path / "lazy").mkdir()
+    lazy = build_brain(tmp_path / "lazy", deterministic=False, seed=42)
+    assert lazy.memory_manager._vector_store is None
+
+
+def test_seeded_brains_match_across_first_flush(tmp_path):
+    # 40 perceptions cross the first bulk flush of the episodic buffer.
+    states = []
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        brain = build_brain(tmp_path / name, seed=42)
+        trace = []
+        for i in range(40):
+            run_stream(brain, 1, stream=[EVENT_STREAM[i % len(EVENT_STREAM)]])
+            trace.append(_state(brain))
+        assert brain.memory_manager.flushes > 0
+        states.append(trace)
+    assert states[0] == states[1]
@@ -0,0 +1,172 @@
+import copy
+import random
+
+import pytest
+
+from cognition.enhanced_belief_engine import EnhancedBeliefEngine
+from cognition.pattern_detectors import (
+    CRITICISM_CATEGORIES,
+    TASK_CATEGORIES,
+    PatternWindow,
+    build_default_detectors,
+)
+
+RUNS = [
+    ["criticism", "Criticism ", "correction", "reprimand", "negative_feedback"],
+    ["success", "task_completed", "failure", "mistake", "achievement", "setback"],
+    ["ignored", "loneliness", "rejection", "praise", "greeted", "welcome"],
+    ["threat_detected", "loud_noise", "danger", "alarm"],
+    ["novelty", "face_unknown", "success", "unknown_sound", "accomplishment"],
+    [None, "", "environment_scan", "hello", None],
+]
+
+
+def _stream(rng, count):
+    """Runs of related categories, with odd casing and metadata-less events."""
+    events = []
+    while len(events) < count:
+        run = rng.choice(RUNS)
+        for _ in range(rng.randint(1, 6)):
+            category = rng.choice(run)
+            roll = rng.random()
+            if roll < 0.05:
+                event = {"description": f"perceived_{category}", "metadata": None}
+            elif roll < 0.1:
+                event = {"description": f"perceived_{category}", "category": category}
+            else:
+                event = {"description": f"perceived_{category}", "metadata": {"category": category}}
+            event["timestamp"] = float(len(events))
+            events.append(event)
+    return events[:count]
+
+
+def _event(timestamp, category, description=None):
+    return {"timestamp": float(timestamp), "description": description or f"perceived_{category}",
+            "metadata": {"category": category}}
+
+
+def _batch(detectors, events):
+    return {name: detector.detect_pattern(events) for name, detector in detectors.items()}
+
+
+def _assert_tallies(window):
+    """The streaming bookkeeping only refers to events still in the window."""
+    for name in ("criticism_pattern", "threat_pattern"):
+        tally = window.detectors[name]._tally
+        for pairs in tally.preceded.values():
+            assert pairs
+            for match, prior in pairs:
+                assert window.start <= prior < match < window.end
+                assert match - prior <= 3
+    criticism = window.detectors["criticism_pattern"]._tally
+    matches = [pos for pos in range(window.start, window.end) if window.category(pos) in CRITICISM_CATEGORIES]
+    assert sorted(criticism.tasks_before) == matches
+    for pos in matches:
+        priors = range(max(window.start, pos - 3), pos)
+        assert criticism.tasks_before[pos] == sum(window.category(p) in TASK_CATEGORIES for p in priors)
+
+    outcomes = window.detectors["success_failure_pattern"]
+    head = max(1, len(outcomes._outcomes) // 2) if outcomes._outcomes else 0
+    assert outcomes._head == head
+    assert outcomes._head_successes == sum(list(outcomes._outcomes)[:head])
+
+
+@pytest.mark.parametrize("size", [1, 4, 12, 30])
+def test_streaming_results_match_batch_after_every_push(size):
+    rng = random.Random(size)
+    events = _stream(rng, 600)
+    window = PatternWindow(size, build_default_detectors())
+    for step, event in enumerate(events):
+        window.push(event)
+        expected = events[max(0, step + 1 - size): step + 1]
+        assert window.events() == expected
+        assert window.results() == _batch(window.detectors, expected), step
+        _assert_tallies(window)
+    assert window.start == len(events) - size
+
+
+def test_reset_keeps_only_the_newest_events():
+    rng = random.Random(4)
+    events = _stream(rng, 50)
+    window = PatternWindow(20, build_default_detectors())
+    window.reset(events)
+    assert window.events() == events[-20:]
+    assert window.results() == _batch(window.detectors, events[-20:])
+    _assert_tallies(window)
+
+
+def test_evicting_a_prior_task_drops_its_context():
+    window = PatternWindow(5, build_default_detectors())
+    for i, category in enumerate(["failure", "success", "criticism", "hello", "criticism"]):
+        window.push(_event(i, category))
+    tally = window.detectors["criticism_pattern"]._tally
+    # Criticism is a task category too, so the first one counts for the second.
+    assert tally.tasks_before == {2: 2, 4: 2}
+    assert tally.task_preceded == 2
+    assert list(tally.preceded["failure"]) == [(2, 0)]
+    assert list(tally.preceded["success"]) == [(2, 1), (4, 1)]
+
+    window.push(_event(5, "hello"))      # evicts the failure
+    assert "failure" not in tally.preceded
+    assert tally.tasks_before == {2: 1, 4: 2}
+    assert tally.task_preceded == 2
+
+    window.push(_event(6, "hello"))      # evicts the success
+    assert sorted(tally.preceded) == ["criticism", "hello"]
+    assert tally.tasks_before == {2: 0, 4: 1}
+    assert tally.task_preceded == 1
+    assert window.results() == _batch(window.detectors, window.events())
+
+
+def test_success_failure_midpoint_follows_pushes_and_evictions():
+    window = PatternWindow(7, build_default_detectors())
+    detector = window.detectors["success_failure_pattern"]
+    categories = ["success", "failure", "hello", "success", "success", "failure", "success",
+                  "success", "hello", "failure", "success", "success", "success"]
+    for i, category in enumerate(categories):
+        window.push(_event(i, category))
+        _assert_tallies(window)
+        assert window.results()["success_failure_pattern"] == detector.detect_pattern(window.events())
+
+
+def test_matches_compares_every_event():
+    rng = random.Random(9)
+    events = _stream(rng, 30)
+    window = PatternWindow(30, build_default_detectors())
+    window.reset(events)
+    assert window.matches(events)
+    # Restored copies of the same events still match.
+    assert window.matches(copy.deepcopy(events))
+    assert not window.matches(events[1:])
+
+    changed = copy.deepcopy(events)
+    changed[15]["description"] = "perceived_something_else"
+    assert not window.matches(changed)
+
+    recategorized = copy.deepcopy(events)
+    recategorized[15] = dict(recategorized[15], metadata={"category": "threat_detected"})
+    assert not window.matches(recategorized)
+
+    empty = PatternWindow(5, build_default_detectors())
+    assert empty.matches([])
+    assert not empty.matches(events[:1])
+
+
+def test_engine_rebuilds_when_a_restore_changes_the_middle_of_the_window():
+    engine = EnhancedBeliefEngine({"engine": "enhanced", "extraction_interval": 1, "event_window": 20})
+    events = [_event(i, ["criticism", "failure", "success"][i % 3]) for i in range(20)]
+    for event in events:
+        engine.observe_event(event)
+    engine.extract_beliefs(events, 1)
+    assert engine.pattern_window_rebuilds == 0
+
+    # Same length, same ends, different middle.
+    restored = copy.deepcopy(events)
+    for event in restored[5:15]:
+        event["metadata"] = {"category": "threat_detected"}
+    engine.extract_beliefs(restored, 2)
+    assert engine.pattern_window_rebuilds == 1
+    assert engine.pattern_window.results() == _batch(engine.pattern_detectors, restored)
+
+    engine.extract_beliefs(copy.deepcopy(restored), 3)
+    assert engine.pattern_window_rebuilds == 1
@@ -0,0 +1,202 @@
+import json
+import os
+
+import pytest
+
+from conftest import build_brain, run_stream
+from core.snapshot import FrozenDict, FrozenList
+from memory import binary_checkpoint
+from memory.sections import SectionStorage
+from memory.storage import MemoryStorage
+
+SEGMENT = 4
+
+
+def _plain(state):
+    return json.loads(json.dumps(state))
+
+
+def _state(step, window=18, frozen=None):
+    """A growing state: a record list trimmed to ``window`` items, a
+    snapshot section that changes every third step and a core counter."""
+    events = [{"seq": i, "description": f"event {i}", "level": i / 4} for i in range(max(0, step - window), step)]
+    return {
+        "step_counter": step,
+        "autobiographical_memory": events,
+        "q_table": frozen if frozen is not None else FrozenDict({"rest": step // 3, "play": 1.5}),
+        "recent": [],
+    }
+
+
+def _storage(path, **options):
+    return SectionStorage(str(path), segment_size=SEGMENT, **options)
+
+
+def _files(storage):
+    return sorted(os.listdir(storage.section_dir))
+
+
+@pytest.mark.parametrize("window", [3, 4, 7, 18])
+def test_reopen_matches_every_save_across_segment_windows(tmp_path, window):
+    path = tmp_path / "store.json"
+    storage = _storage(path)
+    for step in range(1, 40):
+        state = _state(step, window)
+        storage.update_all(state)
+        reopened = _storage(path)
+        assert _plain(reopened.get_all()) == _plain(state), step
+        assert _files(reopened) == _files(storage)
+        manifest = reopened._manifest["windows"]["autobiographical_memory"]
+        assert all(segment["count"] <= SEGMENT for segment in manifest["segments"])
+        assert manifest["skip"] < manifest["segments"][0]["count"]
+
+
+def test_appends_only_rewrite_the_tail_segments(tmp_path):
+    storage = _storage(tmp_path / "store.json")
+    storage.update_all(_state(18))
+    written = storage.sections_written
+    storage.update_all(_state(19))
+    # The window's last segment, and the core for the new counter.
+    assert storage.sections_written - written == 2
+
+
+def test_a_reopened_store_keeps_saving_incrementally(tmp_path):
+    path = tmp_path / "store.json"
+    first = _storage(path)
+    for step in range(1, 20):
+        first.update_all(_state(step))
+
+    second = _storage(path)
+    for step in range(20, 40):
+        written = second.sections_written
+        second.update_all(_state(step))
+        # Core, the window's tail (plus a new segment) and the Q-table at most.
+        assert second.sections_written - written <= 4
+        assert _plain(_storage(path).get_all()) == _plain(_state(step))
+
+
+def test_frozen_sections_are_skipped_by_identity(tmp_path):
+    storage = _storage(tmp_path / "store.json")
+    q_table = FrozenDict({"rest": 1.0})
+    storage.update_all(_state(5, frozen=q_table))
+    entry = storage._manifest["sections"]["q_table"]
+    storage.update_all(_state(6, frozen=q_table))
+    assert storage._manifest["sections"]["q_table"] is entry
+
+    storage.update_all(_state(7, frozen=FrozenDict({"rest": 2.0})))
+    assert storage._manifest["sections"]["q_table"]["file"] != entry["file"]
+    assert _storage(tmp_path / "store.json").get_all()["q_table"] == {"rest": 2.0}
+
+
+def test_a_crash_before_the_manifest_swap_keeps_the_previous_checkpoint(tmp_path, monkeypatch):
+    path = tmp_path / "store.json"
+    storage = _storage(path)
+    storage.update_all(_state(10))
+    kept = _files(storage)
+
+    # The next save dies after writing some section files.
+    calls = []
+    write = SectionStorage._write
+
+    def failing_write(self, name, raw):
+        calls.append(name)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return write(self, name, raw)
+
+    monkeypatch.setattr(SectionStorage, "_write", failing_write)
+    with pytest.raises(OSError):
+        storage.update_all(_state(20))
+    # A torn section file and a half-written manifest are left behind too.
+    with open(os.path.join(storage.section_dir, "autobiographical_memory.99.1.json"), "wb") as f:
+        f.write(b'[{"seq": 1')
+    with open(f"{path}.tmp", "wb") as f:
+        f.write(b'{"layout": "sec')
+    monkeypatch.setattr(SectionStorage, "_write", write)
+
+    reopened = _storage(path)
+    assert _plain(reopened.get_all()) == _plain(_state(10))
+    assert _files(reopened) == kept
+
+    # The writer that failed recovers on its next save.
+    storage.update_all(_state(21))
+    assert _plain(_storage(path).get_all()) == _plain(_state(21))
+
+
+@pytest.mark.parametrize("damage", ["missing", "torn"])
+def test_a_damaged_segment_is_not_loaded(tmp_path, damage):
+    path = tmp_path / "store.json"
+    storage = _storage(path)
+    storage.update_all(_state(12))
+    manifest_bytes = path.read_bytes()
+    files = _files(storage)
+    segment = os.path.join(storage.section_dir, storage._manifest["windows"]["autobiographical_memory"]["segments"][1]["file"])
+    if damage == "missing":
+        os.remove(segment)
+    else:
+        with open(segment, "r+b") as f:
+            f.truncate(os.path.getsize(segment) // 2)
+
+    reopened = _storage(path)
+    assert reopened.get_all() == []
+    # Nothing is deleted until the next save replaces the manifest.
+    assert path.read_bytes() == manifest_bytes
+    assert _files(reopened) == [name for name in files if damage == "torn" or name != os.path.basename(segment)]
+
+    reopened.update_all(_state(13))
+    assert _plain(_storage(path).get_all()) == _plain(_state(13))
+
+
+def test_a_corrupt_section_with_a_valid_length_fails_its_checksum(tmp_path):
+    path = tmp_path / "store.json"
+    storage = _storage(path)
+    storage.update_all(_state(12))
+    section = os.path.join(storage.section_dir, storage._manifest["core"]["file"])
+    raw = bytearray(open(section, "rb").read())
+    raw[-2] ^= 0x01
+    with open(section, "wb") as f:
+        f.write(raw)
+    assert _storage(path).get_all() == []
+
+
+@pytest.mark.parametrize("first, second", [("json", "binary"), ("binary", "json")])
+def test_switching_format_on_an_existing_store(tmp_path, first, second):
+    path = tmp_path / "store.json"
+    storage = _storage(path, format=first)
+    for step in range(1, 15):
+        storage.update_all(_state(step))
+
+    switched = _storage(path, format=second)
+    assert _plain(switched.get_all()) == _plain(_state(14))
+    for step in range(15, 25):
+        switched.update_all(_state(step))
+        reopened = _storage(path, format=first)
+        assert _plain(reopened.get_all()) == _plain(_state(step))
+        # Every file is in the new format.
+        for name in _files(switched):
+            with open(os.path.join(switched.section_dir, name), "rb") as f:
+                assert binary_checkpoint.is_binary(f.read()) == (second == "binary"), name
+            assert name.endswith(".ckpt" if second == "binary" else ".json")
+        assert reopened._manifest["format"] == second
+
+
+def test_a_plain_checkpoint_is_split_on_the_first_save(tmp_path):
+    path = tmp_path / "store.json"
+    MemoryStorage(str(path), format="binary").update_all(_plain(_state(9)))
+    storage = _storage(path)
+    assert storage.get_all() == _plain(_state(9))
+    storage.update_all(_state(10))
+    assert _plain(_storage(path).get_all()) == _plain(_state(10))
+    assert storage._manifest["windows"]
+
+
+def test_brain_state_round_trips_through_sections(tmp_path):
+    brain = build_brain(tmp_path / "brain", seed=3)
+    path = tmp_path / "store.json"
+    storage = _storage(path)
+    for _ in range(6):
+        run_stream(brain, 5)
+        state = brain.get_state()
+        storage.update_all(state)
+        assert _plain(_storage(path).get_all()) == _plain(state)
+    assert isinstance(state["autobiographical_memory"], FrozenList)
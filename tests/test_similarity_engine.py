@@ -0,0 +1,206 @@
+import math
+import random
+from collections import defaultdict
+
+import pytest
+
+from learning.similarity_engine import SimilarityEngine
+
+CHEMICALS = ["dopamine", "cortisol", "oxytocin", "serotonin", "norepinephrine"]
+TRAITS = ["competence", "social_value", "resilience", "intelligence"]
+
+
+class LegacySimilarityEngine:
+    """The per-profile dict scan the rings replaced."""
+
+    def __init__(self, capacity=300):
+        self.event_profiles = defaultdict(list)
+        self.max_profiles_per_event = capacity
+        self.similarity_threshold = 0.4
+        self.identity_weight = 0.6
+        self.chemical_weight = 0.4
+
+    def record_event_profile(self, event_type, chemical_delta, identity_snapshot):
+        self.event_profiles[event_type].append({"chemicals": chemical_delta.copy(), "identity": identity_snapshot.copy()})
+        if len(self.event_profiles[event_type]) > self.max_profiles_per_event:
+            self.event_profiles[event_type].pop(0)
+
+    @staticmethod
+    def _vector_distance(v1, v2):
+        return math.sqrt(sum((v1.get(k, 0) - v2.get(k, 0)) ** 2 for k in set(v1) | set(v2)))
+
+    def _compute_similarity(self, profile, current_state):
+        chemical_state = {k: current_state.get(k, 0) for k in profile["chemicals"]}
+        identity_state = {k: current_state.get(f"identity_{k}", 0) for k in profile["identity"]}
+        chem_sim = 1 / (1 + self._vector_distance(chemical_state, profile["chemicals"]))
+        id_sim = 1 / (1 + self._vector_distance(identity_state, profile["identity"]))
+        return chem_sim * self.chemical_weight + id_sim * self.identity_weight
+
+    def find_similar_profiles(self, event_type, current_state, top_k=5):
+        scored = []
+        for profile in self.event_profiles.get(event_type, []):
+            sim = self._compute_similarity(profile, current_state)
+            if sim >= self.similarity_threshold:
+                scored.append((sim, profile))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [p for _, p in scored[:top_k]]
+
+    def blended_emotional_prediction(self, event_type, current_state):
+        similar = self.find_similar_profiles(event_type, current_state)
+        blended = defaultdict(float)
+        total_weight = 0
+        for profile in similar:
+            sim = self._compute_similarity(profile, current_state)
+            for chem, value in profile["chemicals"].items():
+                blended[chem] += value * sim
+            total_weight += sim
+        if not similar or total_weight == 0:
+            return {}
+        return {chem: value / total_weight for chem, value in blended.items()}
+
+
+def _grid(rng, low=-1.0, high=1.0, step=0.5):
+    # Coarse grid values make exact similarity ties common.
+    return low + step * rng.randint(0, int((high - low) / step))
+
+
+def _profile(rng, sparse=False, grid=True):
+    value = (lambda lo, hi: _grid(rng, lo, hi)) if grid else rng.uniform
+    chemicals = {chem: value(-1.0, 1.0) for chem in CHEMICALS if not sparse or rng.random() < 0.6}
+    identity = {trait: value(0.0, 1.0) for trait in TRAITS if not sparse or rng.random() < 0.6}
+    if sparse and rng.random() < 0.2:
+        chemicals["adrenaline"] = value(-1.0, 1.0)
+    return chemicals, identity
+
+
+def _state(rng, sparse=False, grid=True):
+    chemicals, identity = _profile(rng, sparse, grid)
+    state = dict(chemicals)
+    state.update({f"identity_{trait}": value for trait, value in identity.items()})
+    return state
+
+
+def _assert_blend(actual, expected):
+    assert actual.keys() == expected.keys()
+    for chem in expected:
+        assert actual[chem] == pytest.approx(expected[chem], rel=1e-12, abs=1e-12)
+
+
+def _pair(capacity=300):
+    engine = SimilarityEngine()
+    engine.max_profiles_per_event = capacity
+    return engine, LegacySimilarityEngine(capacity)
+
+
+@pytest.mark.parametrize("grid", [True, False], ids=["ties", "continuous"])
+@pytest.mark.parametrize("sparse", [False, True], ids=["dense", "sparse"])
+def test_queries_match_the_dict_scan(grid, sparse):
+    rng = random.Random(f"{grid}-{sparse}")
+    engine, legacy = _pair()
+    for step in range(240):
+        args = _profile(rng, sparse, grid)
+        for target in (engine, legacy):
+            target.record_event_profile("event", *args)
+        if step % 12 == 0:
+            for _ in range(6):
+                state = _state(rng, sparse or rng.random() < 0.3, grid)
+                for top_k in (1, 5, 50):
+                    assert engine.find_similar_profiles("event", state, top_k) == legacy.find_similar_profiles("event", state, top_k)
+                _assert_blend(engine.blended_emotional_prediction("event", state), legacy.blended_emotional_prediction("event", state))
+
+
+def test_ties_keep_the_oldest_profile_first():
+    engine, legacy = _pair()
+    state = {"dopamine": 0.5, "identity_competence": 0.5}
+    # Mirrored around the state: every profile is equally similar.
+    for dopamine in [0.0, 1.0, 0.0, 1.0, 0.25, 0.75]:
+        for target in (engine, legacy):
+            target.record_event_profile("event", {"dopamine": dopamine, "cortisol": 0.0}, {"competence": 0.5})
+    found = engine.find_similar_profiles("event", state, top_k=3)
+    assert found == legacy.find_similar_profiles("event", state, top_k=3)
+    assert [p["chemicals"]["dopamine"] for p in found] == [0.25, 0.75, 0.0]
+    assert [p["chemicals"]["dopamine"] for p in engine.find_similar_profiles("event", state, top_k=10)] == [
+        0.25, 0.75, 0.0, 1.0, 0.0, 1.0]
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 7])
+def test_ring_wraparound_matches_popping_the_oldest(capacity):
+    rng = random.Random(capacity)
+    engine, legacy = _pair(capacity)
+    for step in range(5 * capacity + 3):
+        # A key first seen after the ring has wrapped adds a column.
+        args = _profile(rng, sparse=step > 2 * capacity)
+        for target in (engine, legacy):
+            target.record_event_profile("event", *args)
+        assert engine.event_profiles == dict(legacy.event_profiles)
+        assert engine.get_memory_snapshot() == {"event": min(step + 1, capacity)}
+        ring = engine._rings["event"]
+        assert ring.count == min(step + 1, capacity)
+        assert ring.version == step + 1
+        for _ in range(3):
+            state = _state(rng, sparse=True)
+            assert engine.find_similar_profiles("event", state, 10) == legacy.find_similar_profiles("event", state, 10)
+            _assert_blend(engine.blended_emotional_prediction("event", state), legacy.blended_emotional_prediction("event", state))
+
+
+def test_presence_mask_ignores_keys_a_profile_lacks():
+    engine, legacy = _pair()
+    profiles = [
+        ({"dopamine": 1.0}, {"competence": 0.5}),
+        ({"cortisol": -1.0}, {"resilience": 0.2}),
+        ({"dopamine": 1.0, "cortisol": 0.0}, {}),
+        ({}, {"competence": 0.5}),
+    ]
+    for args in profiles:
+        for target in (engine, legacy):
+            target.record_event_profile("event", *args)
+    ring = engine._rings["event"]
+    assert not ring.complete
+    assert ring.state_keys == ["dopamine", "identity_competence", "cortisol", "identity_resilience"]
+    assert ring.present[:4].tolist() == [
+        [True, True, False, False],
+        [False, False, True, True],
+        [True, False, True, False],
+        [False, True, False, False],
+    ]
+    # A stored 0 and a missing key differ for the profile, not for the state.
+    for state in ({"dopamine": 1.0, "cortisol": 5.0}, {"cortisol": 0.0}, {}, {"identity_competence": 0.5, "unrelated": 9.0}):
+        for top_k in (1, 2, 10):
+            assert engine.find_similar_profiles("event", state, top_k) == legacy.find_similar_profiles("event", state, top_k)
+        blended = engine.blended_emotional_prediction("event", state)
+        _assert_blend(blended, legacy.blended_emotional_prediction("event", state))
+
+    # Only chemicals some match recorded are blended.
+    engine.similarity_threshold = legacy.similarity_threshold = 0.0
+    assert set(engine.blended_emotional_prediction("event", {"identity_resilience": 0.2})) == {"dopamine", "cortisol"}
+
+
+def test_batch_queries_match_single_queries():
+    rng = random.Random(12)
+    engine, _ = _pair(capacity=40)
+    for _ in range(90):
+        engine.record_event_profile("event", *_profile(rng, sparse=True))
+    states = [_state(rng, sparse=rng.random() < 0.5) for _ in range(9)]
+    states.append(states[0])
+    for top_k in (1, 5, 100):
+        assert engine.find_similar_profiles_many("event", states, top_k) == [
+            engine.find_similar_profiles("event", state, top_k) for state in states
+        ]
+    assert engine.blended_emotional_prediction_many("event", states) == [
+        engine.blended_emotional_prediction("event", state) for state in states
+    ]
+    assert engine.find_similar_profiles_many("event", []) == []
+    assert engine.find_similar_profiles_many("unseen", states[:2]) == [[], []]
+    assert engine.blended_emotional_prediction_many("unseen", states[:2]) == [{}, {}]
+
+
+def test_event_profiles_is_a_read_only_view():
+    engine, _ = _pair(capacity=3)
+    for i in range(4):
+        engine.record_event_profile("event", {"dopamine": float(i)}, {})
+    view = engine.event_profiles
+    view["event"].clear()
+    view["other"] = []
+    assert [p["chemicals"]["dopamine"] for p in engine.event_profiles["event"]] == [1.0, 2.0, 3.0]
+    assert "other" not in engine.event_profiles
+    assert engine.get_event_confidence("event") == 3 / 50.0
@@ -0,0 +1,178 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from conftest import EVENT_STREAM, build_brain, run_stream, strip_time_fields
+from core.snapshot import FrozenDict, FrozenList, StateSnapshots, freeze, thaw
+
+CACHED = ["q_table", "hopfield_weights", "concept_memory", "learned_concepts", "autobiographical_memory",
+          "known_languages", "language_cortex", "user_profile", "user_memory"]
+
+
+def _plain(state):
+    return json.loads(json.dumps(state))
+
+
+def _cold_state(brain):
+    """``get_state()`` with every section rebuilt from scratch."""
+    warm = brain._snapshots
+    brain._snapshots = StateSnapshots()
+    try:
+        return brain.get_state()
+    finally:
+        brain._snapshots = warm
+
+
+def _walk(value):
+    yield value
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _walk(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _walk(item)
+
+
+@pytest.fixture
+def warm(tmp_path):
+    brain = build_brain(tmp_path, seed=42)
+    run_stream(brain, 2 * len(EVENT_STREAM))
+    brain.get_state()
+    return brain
+
+
+def _changed(brain, key, mutate):
+    before = brain.get_state()[key]
+    assert brain.get_state()[key] is before
+    mutate(brain)
+    after = brain.get_state()
+    assert after[key] is not before
+    assert _plain(after[key]) == _plain(_cold_state(brain)[key])
+    return before, after[key]
+
+
+def test_q_table_follows_the_decision_engine_version(warm):
+    before, after = _changed(warm, "q_table", lambda b: b.decision_engine.update_q_value("brand_new_tone", "support", 1.0))
+    assert "brand_new_tone" not in before and "brand_new_tone" in after
+
+
+def test_concept_memory_follows_touched_concepts(warm):
+    before, after = _changed(
+        warm, "concept_memory", lambda b: b._learn_from_perception("vision", "hello purple giraffe", "simulated")
+    )
+    assert "giraffe" in after and "giraffe" not in before
+    assert after["hello"] is not before["hello"]
+    assert after["hello"]["count"] == before["hello"]["count"] + 1
+    # Untouched concepts are shared with the previous view.
+    assert all(after[key] is before[key] for key in before if key != "hello")
+
+
+def test_autobiography_follows_recorded_events(warm):
+    before, after = _changed(
+        warm, "autobiographical_memory",
+        lambda b: b.autobiography.record_event("snapshot test", {"dopamine": 50.0}, {"competence": 0.5}, {"category": "test"}),
+    )
+    assert after[-1]["description"] == "snapshot test"
+    # Events that were already frozen are shared, not copied again.
+    assert after[-2] is before[-1]
+
+
+def test_language_cortex_follows_learning(warm):
+    before, after = _changed(warm, "language_cortex", lambda b: b.language_cortex.learn("klingon", "nuqneH"))
+    assert warm.get_state()["known_languages"] == _cold_state(warm)["known_languages"]
+    assert "klingon" in warm.get_state()["known_languages"]
+
+
+def test_hopfield_weights_follow_learning_and_assignment(warm):
+    chemicals = {"dopamine": 90.0, "cortisol": 5.0, "oxytocin": 90.0, "serotonin": 5.0, "norepinephrine": 90.0}
+    identity = {"competence": 0.9, "social_value": 0.1, "resilience": 0.9, "intelligence": 0.1}
+    _changed(warm, "hopfield_weights", lambda b: b._project_hebbian_learning(chemicals, identity))
+    _changed(warm, "hopfield_weights", lambda b: setattr(b, "hopfield_weights", [[0.0] * len(row) for row in b.hopfield_weights]))
+
+
+def test_unchanged_sections_are_shared_between_calls(warm):
+    first, second = warm.get_state(), warm.get_state()
+    for key in CACHED:
+        assert second[key] is first[key], key
+    # Cheap fields are rebuilt every call.
+    assert second["decision_debug"] is not first["decision_debug"]
+
+
+def test_cached_sections_are_read_only(warm):
+    state = warm.get_state()
+    for key in CACHED:
+        for value in _walk(state[key]):
+            if isinstance(value, dict):
+                assert isinstance(value, FrozenDict), key
+            elif isinstance(value, list):
+                assert isinstance(value, FrozenList), key
+
+    q_table = state["q_table"]
+    tone = next(iter(q_table))
+    with pytest.raises(TypeError):
+        q_table[tone] = {}
+    with pytest.raises(TypeError):
+        q_table[tone]["support"] = 9.0
+    with pytest.raises(TypeError):
+        q_table.update({})
+    with pytest.raises(TypeError):
+        state["autobiographical_memory"].append({})
+    with pytest.raises(TypeError):
+        state["hopfield_weights"][0][0] = 1.0
+    with pytest.raises(TypeError):
+        state["autobiographical_memory"][0]["metadata"]["category"] = "x"
+
+    # The copies callers are told to make are plain and independent.
+    for plain in (copy.deepcopy(q_table), thaw(q_table), pickle.loads(pickle.dumps(q_table))):
+        assert type(plain) is dict and type(plain[tone]) is dict
+        plain[tone]["support"] = 9.0
+    shallow = q_table.copy()
+    assert type(shallow) is dict
+    shallow["extra"] = {}
+    assert "extra" not in q_table and q_table[tone]["support"] != 9.0
+    assert warm.decision_engine.q_table[tone]["support"] != 9.0
+    assert freeze(q_table) is q_table
+    assert type(state["autobiographical_memory"].copy()) is list
+
+
+def test_decision_view_equals_the_matching_state_keys(warm):
+    for _ in range(5):
+        run_stream(warm, 3)
+        view = warm.get_decision_view()
+        state = warm.get_state()
+        assert set(view) < set(state)
+        for key, value in view.items():
+            assert state[key] == value, key
+        # A fresh plain dict each call, so callers may annotate it.
+        assert type(view) is dict
+        view["decision_action_bias"] = {"support": 0.1}
+        assert "decision_action_bias" not in warm.get_decision_view()
+
+
+def test_400_tick_run_matches_uncached_snapshots(tmp_path):
+    cached = build_brain(tmp_path / "cached", seed=42)
+    uncached = build_brain(tmp_path / "uncached", seed=42)
+    for step in range(400):
+        for brain in (cached, uncached):
+            if step % 3 == 0:
+                brain.perceive(EVENT_STREAM[(step // 3) % len(EVENT_STREAM)])
+            brain.tick()
+        state = cached.get_state()
+        # A fresh cache every call, i.e. every section rebuilt as before.
+        uncached._snapshots = StateSnapshots()
+        reference = uncached.get_state()
+        if step % 20 == 0 or step == 399:
+            assert strip_time_fields(_plain(state)) == strip_time_fields(_plain(reference)), step
+            # The warm cache agrees with a cold rebuild of the same brain.
+            assert _plain(state) == _plain(_cold_state(cached)), step
+    assert cached._snapshots.hits > 0
+
+    # A set_state round trip gives back the same state. The decision debug
+    # record describes the last tick and is not restored.
+    restored = build_brain(tmp_path / "restored", seed=42)
+    restored.set_state(_plain(cached.get_state()))
+    expected, actual = _plain(cached.get_state()), _plain(restored.get_state())
+    del expected["decision_debug"], actual["decision_debug"]
+    assert strip_time_fields(actual) == strip_time_fields(expected)
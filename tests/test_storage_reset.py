@@ -0,0 +1,42 @@
+import pytest
+
+from memory.memory_manager import MemoryManager
+
+
+STATE = {
+    "step_counter": 3,
+    "autobiographical_memory": [{"seq": i, "description": f"event {i}"} for i in range(10)],
+    "chemicals": {"dopamine": 50.0},
+}
+
+
+@pytest.mark.parametrize("mode", ["snapshot", "wal", "sections"])
+def test_reset_deletes_every_file_the_storage_owns(tmp_path, mode):
+    path = tmp_path / "memory_store.json"
+    manager = MemoryManager(storage_path=str(path), persistence={"mode": mode, "section_segment_size": 4})
+    manager.save(STATE)
+    manager.save(dict(STATE, step_counter=4))
+    # WAL mode has only written its log until the first compaction.
+    assert path.exists() or (tmp_path / "memory_store.json.wal").exists()
+    (tmp_path / "unrelated.txt").write_text("kept")
+
+    manager.storage.reset()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["unrelated.txt"]
+    assert manager.storage.get_all() == []
+    reopened = MemoryManager(storage_path=str(path), persistence={"mode": mode})
+    assert reopened.storage.get_all() == []
+
+
+@pytest.mark.parametrize("mode", ["snapshot", "wal", "sections"])
+def test_storage_saves_again_after_reset(tmp_path, mode):
+    path = tmp_path / "memory_store.json"
+    manager = MemoryManager(storage_path=str(path), persistence={"mode": mode, "section_segment_size": 4})
+    manager.save(STATE)
+    manager.storage.reset()
+
+    manager.save(dict(STATE, step_counter=9))
+    manager.save(dict(STATE, step_counter=10))
+
+    reopened = MemoryManager(storage_path=str(path), persistence={"mode": mode})
+    assert reopened.storage.get_all() == dict(STATE, step_counter=10)
@@ -0,0 +1,105 @@
+import pytest
+
+from conftest import build_brain, run_stream, strip_time_fields
+from core.tick_batch import TickBatch
+
+
+def _simulated_state(brain):
+    return strip_time_fields({
+        "chemicals": {name: chem["value"] for name, chem in brain.chemicals.items()},
+        "q_table": brain.decision_engine.q_table,
+        "identity": brain.identity.get_snapshot(),
+        "step_counter": brain.step_counter,
+        "sleeping": brain.sleeping,
+    })
+
+
+def _memory_count(brain):
+    brain.memory_manager.flush_pending()
+    return len(brain.memory_manager.vector_store)
+
+
+def _twins(tmp_path, warmup):
+    # Separate directories: the vector store lives next to the checkpoint.
+    twins = []
+    for name in ("loop", "batch"):
+        (tmp_path / name).mkdir()
+        twins.append(run_stream(build_brain(tmp_path / name, seed=42), warmup))
+    return twins
+
+
+@pytest.mark.parametrize("ticks", [0, 1, 60])
+def test_tick_many_matches_tick_loop(tmp_path, ticks):
+    looped, batched = _twins(tmp_path, 20)
+    assert _simulated_state(looped) == _simulated_state(batched)
+
+    for _ in range(ticks):
+        looped.tick()
+    summary = batched.tick_many(ticks)
+
+    assert summary["ticks"] == ticks
+    assert _simulated_state(batched) == _simulated_state(looped)
+    assert _memory_count(batched) == _memory_count(looped)
+
+
+def test_tick_many_defers_flush_to_end_of_batch(tmp_path):
+    brain = run_stream(build_brain(tmp_path, seed=42), 10)
+    brain.memory_manager.flush_pending()
+    stored = len(brain.memory_manager.vector_store)
+
+    summary = brain.tick_many(40)
+
+    assert not brain.memory_manager.pending_memories
+    assert len(brain.memory_manager.vector_store) == stored + summary["memories_flushed"]
+
+
+def test_tick_many_rejects_negative_count(brain):
+    with pytest.raises(ValueError):
+        brain.tick_many(-1)
+
+
+def test_tick_many_coalesces_cycle_memories_and_replay_searches(tmp_path):
+    looped, batched = _twins(tmp_path, 20)
+    for brain in (looped, batched):
+        brain.sleep_manager.should_sleep = lambda brain: False
+        brain.memory_manager.flush_pending()
+    created = []
+    create_memories = batched.memory_manager.create_memories
+
+    def record(memory_type, contents, metadata=None):
+        created.append((memory_type, len(contents)))
+        create_memories(memory_type, contents, metadata)
+
+    batched.memory_manager.create_memories = record
+
+    for _ in range(80):
+        looped.tick()
+    summary = batched.tick_many(80)
+
+    # One bulk call for the cycle memories instead of one per tick.
+    assert [count for kind, count in created if kind == "autobiography_cycle"] == [80]
+    assert summary["replay_reuses"] > 0
+    assert batched.tick_batch is None
+    assert _simulated_state(batched) == _simulated_state(looped)
+    assert batched.current_focus.content == looped.current_focus.content
+    assert len(batched.autobiography.events) == len(looped.autobiography.events)
+    assert _memory_count(batched) == _memory_count(looped)
+
+
+def test_replay_reuse_ends_when_the_hopfield_weights_learn(tmp_path):
+    brain = run_stream(build_brain(tmp_path, seed=42), 10)
+    batch = TickBatch()
+    calls = []
+
+    def search():
+        calls.append(1)
+        return len(calls)
+
+    recent = [1, 2, 3]
+    assert batch.replay(brain.hopfield, recent, [1, -1], search) == 1
+    assert batch.replay(brain.hopfield, recent, [1, -1], search) == 1
+    assert batch.replay(brain.hopfield, recent, [-1, -1], search) == 2
+    brain.hopfield.learn([1] * brain.hopfield.size)
+    assert batch.replay(brain.hopfield, recent, [1, -1], search) == 3
+    assert batch.replay(brain.hopfield, recent + [4], [1, -1], search) == 4
+    assert (batch.replay_searches, batch.replay_reuses) == (4, 1)
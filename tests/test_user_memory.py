@@ -0,0 +1,173 @@
+import datetime
+import random
+import uuid
+
+from conftest import build_brain
+from memory import user_memory
+from memory.user_memory import UserMemory
+
+WORDS = "garden plan trains noise hallway task coffee music rain friend river kitchen puzzle story".split()
+TYPES = ["preference", "relationship", "history", "trait", "general"]
+
+
+def _fact(rng, now):
+    return {
+        "id": uuid.UUID(int=rng.getrandbits(128)).hex[:12],
+        "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))),
+        "fact_type": rng.choice(TYPES),
+        "importance": round(rng.uniform(0.16, 1.0), 3),
+        "timestamp": (now - datetime.timedelta(days=rng.uniform(0, 120))).isoformat(timespec="seconds"),
+    }
+
+
+def _store_profile(memory):
+    facts = memory.store.items
+    types = {}
+    for f in facts:
+        types[f.get("fact_type", "general")] = types.get(f.get("fact_type", "general"), 0) + 1
+    return {
+        "user_name": memory.user_name,
+        "total_facts": len(facts),
+        "fact_types": types,
+        "last_updated": facts[0]["timestamp"] if facts else None,
+    }
+
+
+def _store_state(memory):
+    return {
+        "user_name": memory.user_name,
+        "facts": [
+            {
+                "id": f.get("id"),
+                "content": f.get("content"),
+                "fact_type": f.get("fact_type", "general"),
+                "importance": f.get("importance"),
+                "timestamp": f.get("timestamp"),
+            }
+            for f in memory.store.items
+        ],
+    }
+
+
+def _assert_consistent(memory, fresh, step):
+    # Name and half-life are settings of the instance, not stored facts.
+    fresh.user_name = memory.user_name
+    fresh.half_life_days = memory.half_life_days
+    fresh.invalidate()
+    assert memory.facts() == memory._retained(memory.store.items), step
+    assert memory.profile() == _store_profile(memory), step
+    assert memory.to_state() == _store_state(memory), step
+    assert fresh.profile() == memory.profile(), step
+    assert fresh.to_state() == memory.to_state(), step
+
+
+def _operation(rng, memory, now):
+    kind = rng.choice(["remember", "remember", "forget", "consolidate", "decay", "load_state", "external"])
+    if kind == "remember":
+        memory.remember(" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))),
+                        fact_type=rng.choice(TYPES), importance=round(rng.uniform(0.2, 0.95), 2))
+    elif kind == "forget":
+        facts = memory.facts()
+        if facts:
+            target = rng.choice(facts)
+            memory.forget(fact_type=target["fact_type"], fact=target["content"])
+    elif kind == "consolidate":
+        memory.consolidate()
+    elif kind == "decay":
+        memory.decay(half_life_days=rng.choice([90, 180, 365]))
+    elif kind == "load_state":
+        state = memory.to_state()
+        kept = rng.sample(state["facts"], min(len(state["facts"]), 5))
+        memory.load_state({"user_name": rng.choice(["ada", "lin", None]),
+                           "facts": kept + [_fact(rng, now) for _ in range(3)]})
+    else:
+        # Written behind the mirror's back; it must notice and reload.
+        items = memory.store.items
+        if items and rng.random() < 0.5:
+            memory.store.delete(rng.choice(items)["id"])
+        else:
+            memory.store.store(_fact(rng, now))
+    return kind
+
+
+def test_mirror_matches_store_after_random_operations(tmp_path):
+    # Chroma, because the second reader must see the first one's writes;
+    # the numpy backend keeps its collection in the process that opened it.
+    rng = random.Random(7)
+    now = datetime.datetime.now()
+    path = str(tmp_path / "user_db")
+    memory = UserMemory(path=path, user_name="Ada")
+    memory.load_state({"user_name": "ada", "facts": [_fact(rng, now) for _ in range(150)]})
+    fresh = UserMemory(path=path)
+    _assert_consistent(memory, fresh, "initial load")
+
+    for step in range(60):
+        kind = _operation(rng, memory, now)
+        _assert_consistent(memory, fresh, f"{step}: {kind}")
+
+    # Snapshots read the mirror, never the whole store.
+    loads = memory.mirror_loads
+    memory.profile()
+    memory.to_state()
+    assert memory.mirror_loads == loads
+
+
+class _Clock:
+    """Stands in for the ``datetime`` module with ``now()`` moved ahead."""
+
+    timedelta = datetime.timedelta
+
+    def __init__(self, days):
+        shift = datetime.timedelta(days=days)
+
+        class _Datetime(datetime.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.datetime.now(tz) + shift
+
+        self.datetime = _Datetime
+
+
+FACTS = [
+    {"id": "faded", "content": "liked trains once", "fact_type": "history", "importance": 0.2},
+    {"id": "kept", "content": "likes coffee", "fact_type": "preference", "importance": 0.8},
+    {"id": "core", "content": "named Ada", "fact_type": "trait", "importance": 1.0},
+]
+
+
+def test_profile_counts_stored_facts_until_decay(tmp_path, monkeypatch):
+    memory = UserMemory(path=str(tmp_path / "user_db"), vector_backend="numpy")
+    memory.load_state({"facts": FACTS})
+    profile = memory.profile()
+    assert profile["total_facts"] == 3
+    assert profile["fact_types"] == {"history": 1, "preference": 1, "trait": 1}
+
+    # Four months later the low-importance fact has faded below the floor.
+    monkeypatch.setattr(user_memory, "datetime", _Clock(120))
+    assert [f["id"] for f in memory.facts()] == ["kept", "core"]
+    assert memory.profile() == profile
+
+    # Compaction deletes it, and the counts follow.
+    assert memory.decay() == 1
+    assert memory.profile()["total_facts"] == 2
+    assert memory.profile()["fact_types"] == {"preference": 1, "trait": 1}
+    assert memory.profile() == _store_profile(memory)
+
+
+def test_snapshot_profile_stays_valid_as_facts_age(tmp_path, monkeypatch):
+    brain = build_brain(tmp_path, seed=42)
+    brain.user_memory.load_state({"facts": FACTS})
+    before = brain.get_state()["user_profile"]
+    assert before == brain.user_memory.profile() == _store_profile(brain.user_memory)
+
+    monkeypatch.setattr(user_memory, "datetime", _Clock(120))
+    for _ in range(2):
+        state = brain.get_state()
+        assert state["user_profile"] == brain.user_memory.profile() == before
+        assert len(state["user_memory"]["facts"]) == 3
+
+    brain.user_memory.decay()
+    state = brain.get_state()
+    assert state["user_profile"] == _store_profile(brain.user_memory)
+    assert state["user_profile"]["fact_types"] == {"preference": 1, "trait": 1}
+    assert len(state["user_memory"]["facts"]) == 2
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from conftest import EVENT_STREAM, build_brain, run_stream
+
+
+def _engine_brain(tmp_path, brain_config, engine):
+    config = dict(brain_config, chemistry={"engine": engine})
+    return build_brain(tmp_path, name=engine, brain_config=config, seed=42)
+
+
+def _values(brain):
+    return np.array([brain.chemicals[name]["value"] for name in brain.chemicals])
+
+
+def _sensitivities(brain):
+    return np.array([brain.chemicals[name]["sensitivity"] for name in brain.chemicals])
+
+
+def test_vector_brain_uses_vector_engine(tmp_path, brain_config):
+    from core.engine import BrainEngine
+    from core.vector_engine import VectorBrainEngine
+
+    assert type(_engine_brain(tmp_path, brain_config, "dict")._engine) is BrainEngine
+    assert type(_engine_brain(tmp_path, brain_config, "vector")._engine) is VectorBrainEngine
+
+
+@pytest.mark.parametrize("cortisol", [40.0, 95.0, 180.0])
+def test_chemistry_matches_dict_engine_every_tick(tmp_path, brain_config, cortisol):
+    reference = _engine_brain(tmp_path, brain_config, "dict")
+    vector = _engine_brain(tmp_path, brain_config, "vector")
+    assert list(reference.chemicals) == list(vector.chemicals)
+
+    # Start away from baseline; 180 sits above cortisol's max, so the first
+    # tick goes through the clamp and the cortisol excess decay.
+    for brain in (reference, vector):
+        brain.chemicals["cortisol"]["value"] = cortisol
+        brain.chemicals["dopamine"]["value"] = 3.0
+        brain.chemicals["adrenaline"]["value"] = 70.0
+        brain._step_perception_valences = [-0.4]
+
+    for _ in range(300):
+        for brain in (reference, vector):
+            brain._apply_chemistry()
+            brain._engine.update_receptor_dynamics()
+        np.testing.assert_allclose(_values(vector), _values(reference), rtol=0, atol=1e-9)
+        np.testing.assert_allclose(_sensitivities(vector), _sensitivities(reference), rtol=0, atol=1e-9)
+        assert vector.chemicals["cortisol"]["value"] <= 100.0
+
+
+def test_staged_calls_match_fused_tick(tmp_path, brain_config):
+    fused = _engine_brain(tmp_path, brain_config, "vector")
+    staged = _engine_brain(tmp_path, brain_config, "vector")
+    for brain in (fused, staged):
+        brain.chemicals["cortisol"]["value"] = 180.0
+
+    for _ in range(50):
+        fused._engine.tick()
+        staged._engine.apply_interactions()
+        staged._engine.apply_homeostasis()
+        staged._engine.apply_noise()
+        staged._engine.clamp()
+        np.testing.assert_allclose(_values(staged), _values(fused), rtol=0, atol=1e-12)
+
+
+def test_full_ticks_match_dict_engine(tmp_path, brain_config):
+    reference = _engine_brain(tmp_path, brain_config, "dict")
+    vector = _engine_brain(tmp_path, brain_config, "vector")
+    for brain in (reference, vector):
+        brain.chemicals["cortisol"]["value"] = 99.0
+
+    for i in range(30):
+        event = EVENT_STREAM[i % len(EVENT_STREAM)]
+        run_stream(reference, 1, stream=[event])
+        run_stream(vector, 1, stream=[event])
+        np.testing.assert_allclose(_values(vector), _values(reference), rtol=0, atol=1e-9)
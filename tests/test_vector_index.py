@@ -0,0 +1,215 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+from memory import vector_index
+from memory.vector_index import IVF_MIN_PER_LIST, NumpyCollection
+from memory.vector_store import HashedEmbeddingFunction, VectorStore
+
+WORDS = "garden plan trains noise hallway task coffee music rain friend river kitchen puzzle story".split()
+
+ITEMS = [
+    {"id": "a", "content": "garden plan", "count": 1, "score": 1.5, "kind": "p", "flag": True},
+    {"id": "b", "content": "trains noise", "count": 2, "kind": "q"},
+    {"id": "c", "content": "coffee music", "score": 0.5, "flag": False},
+    {"id": "d", "content": "rain friend", "count": 0, "kind": "1"},
+    {"id": "e", "content": "river kitchen", "count": 3, "score": 3.0, "kind": "p", "flag": True},
+    {"id": "f", "content": "puzzle story", "count": 2, "score": 2.0},
+]
+
+WHERES = [
+    {"count": 1},
+    {"count": 1.0},
+    {"count": True},
+    {"flag": 1},
+    {"kind": "p"},
+    {"kind": 1},
+    {"count": {"$eq": 2}},
+    {"count": {"$ne": 2}},
+    {"flag": {"$ne": True}},
+    {"kind": {"$ne": "p"}},
+    {"count": {"$gt": 1}},
+    {"score": {"$gte": 1.5}},
+    {"count": {"$lt": 2}},
+    {"score": {"$lte": 2}},
+    {"count": {"$in": [0, 3]}},
+    {"kind": {"$in": ["p", "1"]}},
+    {"count": {"$in": [True]}},
+    {"count": {"$nin": [2]}},
+    {"kind": {"$nin": ["p"]}},
+    {"missing": "x"},
+    {"missing": {"$ne": "x"}},
+    {"$and": [{"count": {"$gte": 1}}, {"kind": {"$ne": "q"}}]},
+    {"$or": [{"count": 2}, {"flag": False}]},
+    {"$or": [{"$and": [{"flag": True}, {"count": {"$gt": 1}}]}, {"kind": "1"}]},
+]
+
+
+def _collection(path, **options):
+    return NumpyCollection(str(path), "test", HashedEmbeddingFunction(cache_size=0), **options)
+
+
+def _documents(rng, count):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))) for _ in range(count)]
+
+
+def _contents(collection):
+    result = collection.get()
+    return list(zip(result["ids"], result["documents"], result["metadatas"]))
+
+
+def _queries(collection, texts):
+    return [collection.query(query_texts=[text], n_results=5) for text in texts]
+
+
+def test_empty_collection_answers_queries_with_no_rows(tmp_path):
+    collection = _collection(tmp_path)
+    result = collection.query(query_texts=["garden"], n_results=3)
+    assert result["ids"] == [[]] and result["distances"] == [[]]
+
+    collection.add(ids=["a"], documents=["garden plan"])
+    collection.delete(ids=["a"])
+    assert collection.query(query_texts=["garden"], n_results=3)["ids"] == [[]]
+
+    collection.reset()
+    assert collection.query(query_texts=["garden"], n_results=3)["ids"] == [[]]
+
+    store = VectorStore(path=str(tmp_path / "store"), collection="empty_test", backend="numpy")
+    assert store._collection.query(query_texts=["garden"], n_results=3)["ids"] == [[]]
+    assert store.search("garden") == []
+
+
+def test_reopen_after_adds_updates_deletes_and_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_index, "CHECKPOINT_MIN_LINES", 8)
+    rng = random.Random(1)
+    collection = _collection(tmp_path)
+    texts = _documents(rng, 5)
+    live = {}
+    for step in range(12):
+        ids = [f"m{step}_{i}" for i in range(10)]
+        documents = _documents(rng, 10)
+        collection.add(ids=ids, documents=documents, metadatas=[{"step": step, "i": i} for i in range(10)])
+        live.update(zip(ids, documents))
+        changed = rng.sample(sorted(live), 3)
+        collection.update(ids=changed, documents=_documents(rng, 3), metadatas=[{"edited": True}] * 3)
+        gone = rng.sample(sorted(live), 4)
+        collection.delete(ids=gone)
+        for item_id in gone:
+            del live[item_id]
+
+        reopened = _collection(tmp_path)
+        assert _contents(reopened) == _contents(collection), step
+        assert _queries(reopened, texts) == _queries(collection, texts), step
+        assert sorted(reopened.get()["ids"]) == sorted(live)
+
+    # Deleting most rows rewrites the matrix under a new generation.
+    generation = collection._vector_generation
+    collection.delete(ids=sorted(live)[: len(live) - 5])
+    assert collection._vector_generation > generation
+    assert collection.count() == len(collection._ids) == 5
+    reopened = _collection(tmp_path)
+    assert _contents(reopened) == _contents(collection)
+    assert _queries(reopened, texts) == _queries(collection, texts)
+
+    # Only the current generation's files are left behind.
+    assert sorted(os.listdir(collection.directory)) == sorted([
+        "index.json",
+        f"vectors.{collection._vector_generation}.f32",
+        f"rows.{collection._generation}.json",
+        f"records.{collection._generation}.jsonl",
+    ])
+
+
+@pytest.mark.parametrize("tail", [b'["add","torn","garden', b"not json\n"])
+def test_torn_log_tail_is_dropped_on_load(tmp_path, tail):
+    collection = _collection(tmp_path)
+    collection.add(ids=["a", "b"], documents=["garden plan", "trains noise"], metadatas=[{"n": 1}, {"n": 2}])
+    collection.delete(ids=["a"])
+    expected = _contents(collection)
+    log_path = collection._file("records")
+    size = os.path.getsize(log_path)
+    with open(log_path, "ab") as f:
+        f.write(tail)
+
+    reopened = _collection(tmp_path)
+    assert _contents(reopened) == expected
+    assert os.path.getsize(log_path) == size
+
+    # The log keeps appending from the valid prefix.
+    reopened.add(ids=["c"], documents=["coffee music"])
+    assert _collection(tmp_path).get()["ids"] == ["b", "c"]
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    root = tmp_path_factory.mktemp("where")
+    pair = {}
+    for backend in ("chroma", "numpy"):
+        store = VectorStore(path=str(root / backend), collection="where_test", backend=backend)
+        store.store_many([dict(item) for item in ITEMS])
+        pair[backend] = store
+    return pair
+
+
+@pytest.mark.parametrize("where", WHERES, ids=repr)
+def test_where_filters_match_chroma(stores, where):
+    def ids(store):
+        return sorted(item["id"] for item in store.head(limit=100, where=where))
+
+    def hits(store):
+        return sorted(item["id"] for item in store.search("garden plan trains coffee river puzzle", limit=6,
+                                                          where=where, overfetch=1.0))
+
+    assert ids(stores["numpy"]) == ids(stores["chroma"])
+    assert hits(stores["numpy"]) == hits(stores["chroma"])
+
+
+def test_ordering_operators_reject_non_numbers(tmp_path):
+    collection = _collection(tmp_path)
+    collection.add(ids=["a"], documents=["garden"], metadatas=[{"kind": "p"}])
+    with pytest.raises(ValueError):
+        collection.get(where={"kind": {"$gte": "p"}})
+    with pytest.raises(ValueError):
+        collection.get(where={"kind": {"$regex": "p"}})
+
+
+def _clustered(rng, count, dim, centers):
+    means = rng.normal(size=(centers, dim))
+    labels = rng.integers(0, centers, size=count)
+    return (means[labels] + 0.35 * rng.normal(size=(count, dim))).astype(np.float32)
+
+
+def test_ivf_recall_against_exact_scan(tmp_path):
+    rng = np.random.default_rng(4)
+    dim, lists = 24, 8
+    vectors = _clustered(rng, lists * IVF_MIN_PER_LIST * 8, dim, 12)
+    ids = [f"v{i}" for i in range(len(vectors))]
+    queries = _clustered(rng, 40, dim, 12)
+
+    exact = NumpyCollection(str(tmp_path / "exact"), "test", None, dim=dim)
+    probed = NumpyCollection(str(tmp_path / "ivf"), "test", None, dim=dim, ivf_lists=lists, ivf_probes=3)
+    every = NumpyCollection(str(tmp_path / "all"), "test", None, dim=dim, ivf_lists=lists, ivf_probes=lists)
+    for collection in (exact, probed, every):
+        collection.add(ids=ids, embeddings=vectors)
+
+    def top(collection, where=None):
+        return collection.query(query_embeddings=queries, n_results=10, where=where)["ids"]
+
+    truth = top(exact)
+    # Probing every list is the exact scan.
+    assert top(every) == truth
+    recall = np.mean([len(set(a) & set(b)) / 10 for a, b in zip(top(probed), truth)])
+    assert recall >= 0.9
+
+    # Rows added after training join their nearest list.
+    extra = _clustered(rng, 64, dim, 12)
+    for collection in (exact, every):
+        collection.add(ids=[f"x{i}" for i in range(len(extra))], embeddings=extra)
+    assert top(every) == top(exact)
+
+    # A filter too narrow for the probed lists falls back to the exact scan.
+    for collection in (exact, probed):
+        collection.update(ids=ids[:5], metadatas=[{"rare": True}] * 5)
+    assert top(probed, {"rare": True}) == top(exact, {"rare": True})
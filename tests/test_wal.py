@@ -0,0 +1,145 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import EVENT_STREAM, build_brain, run_stream, strip_time_fields
+from memory.memory_manager import MemoryManager
+from memory.wal import WalStorage
+
+
+def _plain(state):
+    return json.loads(json.dumps(state))
+
+
+@pytest.fixture
+def saved(tmp_path):
+    """A WAL checkpoint holding several saves of a growing brain, plus that brain's last state."""
+    brain = build_brain(tmp_path, name="brain", seed=42)
+    path = tmp_path / "wal" / "store.json"
+    manager = MemoryManager(storage_path=str(path), persistence={"mode": "wal"})
+    state = None
+    for i in range(12):
+        run_stream(brain, 1, stream=[EVENT_STREAM[i % len(EVENT_STREAM)]])
+        state = brain.get_state()
+        manager.save(state)
+    assert manager.storage.stats()["log_records"] > 0
+    return path, _plain(state)
+
+
+def _clone(path, target_dir):
+    target_dir.mkdir()
+    target = target_dir / "store.json"
+    shutil.copy(path, target)
+    shutil.copy(f"{path}.wal", f"{target}.wal")
+    return target
+
+
+def test_clean_reopen_replays_log(saved, tmp_path):
+    path, expected = saved
+    storage = WalStorage(str(_clone(path, tmp_path / "clean")))
+    assert _plain(storage.get_all()) == expected
+    assert storage.replayed > 0
+    assert storage.discarded_bytes == 0
+
+
+def test_torn_tail_is_dropped(saved, tmp_path):
+    path, expected = saved
+    target = _clone(path, tmp_path / "torn")
+    with open(f"{target}.wal", "rb") as f:
+        last = f.read().splitlines(keepends=True)[-1]
+    with open(f"{target}.wal", "ab") as f:
+        f.write(last[: len(last) // 2])
+    size = os.path.getsize(f"{target}.wal")
+
+    storage = WalStorage(str(target))
+    assert _plain(storage.get_all()) == expected
+    assert storage.discarded_bytes == len(last) // 2
+    assert os.path.getsize(f"{target}.wal") == size - len(last) // 2
+
+
+def test_corrupt_tail_is_dropped(saved, tmp_path):
+    path, expected = saved
+    target = _clone(path, tmp_path / "corrupt")
+    with open(f"{target}.wal", "ab") as f:
+        f.write(b'00000000 [["set","step_counter",0]]\n')
+
+    storage = WalStorage(str(target))
+    assert _plain(storage.get_all()) == expected
+    assert storage.discarded_bytes > 0
+
+    # New records go after the last good one, not after the garbage.
+    storage.update_all(dict(storage.get_all(), step_counter=-1))
+    assert WalStorage(str(target)).get_all()["step_counter"] == -1
+
+
+def test_crash_between_swaps_discards_stale_log(saved, tmp_path):
+    path, expected = saved
+    target = _clone(path, tmp_path / "compaction")
+    with open(f"{target}.wal", "rb") as f:
+        old_log = f.read()
+    WalStorage(str(target)).save()
+    # The snapshot was swapped in but the old log was not replaced.
+    with open(f"{target}.wal", "wb") as f:
+        f.write(old_log)
+
+    storage = WalStorage(str(target))
+    assert _plain(storage.get_all()) == expected
+    assert storage.replayed == 0
+    assert storage.discarded_bytes == len(old_log)
+
+
+def test_recovered_state_restores_into_brain(saved, tmp_path):
+    path, expected = saved
+    recovered = WalStorage(str(_clone(path, tmp_path / "restore"))).get_all()
+    (tmp_path / "fresh").mkdir()
+    fresh = build_brain(tmp_path / "fresh", seed=7)
+    fresh.set_state(recovered)
+    restored = strip_time_fields(_plain(fresh.get_state()))
+    expected = strip_time_fields(expected)
+    # decision_debug describes the last decision and is not restored;
+    # learned_concepts is a top-8 summary of concept_memory whose ties may
+    # break differently, while concept_memory itself is compared in full.
+    for state in (restored, expected):
+        state.pop("decision_debug")
+        state.pop("learned_concepts")
+    assert restored == expected
+
+
+def test_compaction_syncs_files_and_directory_around_swaps(tmp_path, monkeypatch):
+    storage = WalStorage(str(tmp_path / "store.json"), fsync=True)
+    storage.update_all({"step_counter": 1})
+
+    calls = []
+    real_fsync, real_replace, real_open = os.fsync, os.replace, os.open
+    directories = set()
+
+    def fsync(fd):
+        calls.append("dir" if fd in directories else "file")
+        real_fsync(fd)
+
+    def replace(src, dst):
+        calls.append("replace")
+        real_replace(src, dst)
+
+    def open_(path, flags, *args):
+        fd = real_open(path, flags, *args)
+        if os.path.isdir(path):
+            directories.add(fd)
+        return fd
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    monkeypatch.setattr(os, "replace", replace)
+    monkeypatch.setattr(os, "open", open_)
+    storage.save()
+
+    assert calls == ["file", "file", "dir", "replace", "replace", "dir"]
+    assert WalStorage(str(tmp_path / "store.json")).get_all() == {"step_counter": 1}
+
+
+def test_compaction_without_fsync_never_syncs(tmp_path, monkeypatch):
+    storage = WalStorage(str(tmp_path / "store.json"))
+    monkeypatch.setattr(os, "fsync", lambda fd: pytest.fail("fsync called with fsync=False"))
+    storage.update_all({"step_counter": 1})
+    storage.save()